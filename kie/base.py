@@ -31,26 +31,31 @@ class RechartsConfig:
             "subtitle": self.subtitle,
         }
 
-    def to_json(self, path: Path | None = None, indent: int = 2) -> str:
+    def to_json(self, path: Path | None = None, indent: int = 2, writer: Any = None) -> str:
         """
         Convert to JSON string.
 
         Args:
             path: Optional path to save JSON file
             indent: JSON indentation level
+            writer: Optional ArtifactWriter to save the file in the background
 
         Returns:
             JSON string
         """
-        json_str = json.dumps(self.to_dict(), indent=indent)
+        from kie.utils.json_codec import dumps_bytes
 
-        if path:
+        json_bytes = dumps_bytes(self.to_dict(), indent=indent)
+
+        if path and writer is not None:
+            writer.write_bytes(path, json_bytes)
+        elif path:
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json_str)
+            path.write_bytes(json_bytes)
 
-        return json_str
+        return json_bytes.decode("utf-8")
 
-    def to_svg(self, output_path: Path | str) -> Path:
+    def to_svg(self, output_path: Path | str, writer: Any = None) -> Path:
         """
         Render chart to SVG using Pygal (pure Python).
 
@@ -58,6 +63,7 @@ class RechartsConfig:
 
         Args:
             output_path: Path to save SVG file
+            writer: Optional ArtifactWriter to save files in the background
 
         Returns:
             Path to saved file (SVG if successful, JSON if fallback)
@@ -66,15 +72,15 @@ class RechartsConfig:
 
         # First save JSON (for backward compatibility and debugging)
         json_path = output_path.with_suffix('.json')
-        self.to_json(json_path)
+        self.to_json(json_path, writer=writer)
 
         # Render using Pygal (pure Python - no Node.js needed)
         try:
             from kie.charts.svg_renderer import to_svg as pygal_to_svg
 
-            svg_path = pygal_to_svg(self, output_path)
+            svg_path = pygal_to_svg(self, output_path, writer=writer)
 
-            if svg_path.exists():
+            if svg_path.exists() or (writer is not None and writer.is_pending(svg_path)):
                 # print(f"✓ Rendered chart to {svg_path}")  # Commented to reduce noise
                 return svg_path
             else:
@@ -0,0 +1,45 @@
+"""
+KIE Benchmarks - Performance harness for the end-to-end pipeline.
+
+Run with `python scripts/run_benchmarks.py`.
+"""
+
+from kie.benchmarks.cases import ALL_CASES, PIPELINE_CASES, STAGE_CASES, prepare_project, run_shape
+from kie.benchmarks.datasets import (
+    QUICK_SHAPES,
+    SHAPES,
+    DatasetShape,
+    generate_dataset,
+    write_dataset,
+)
+from kie.benchmarks.harness import (
+    CaseResult,
+    Regression,
+    compare_results,
+    format_report,
+    load_results,
+    results_document,
+    save_results,
+    time_case,
+)
+
+__all__ = [
+    "ALL_CASES",
+    "PIPELINE_CASES",
+    "QUICK_SHAPES",
+    "SHAPES",
+    "STAGE_CASES",
+    "CaseResult",
+    "DatasetShape",
+    "Regression",
+    "compare_results",
+    "format_report",
+    "generate_dataset",
+    "load_results",
+    "prepare_project",
+    "results_document",
+    "run_shape",
+    "save_results",
+    "time_case",
+    "write_dataset",
+]
@@ -0,0 +1,234 @@
+"""
+Pipeline Benchmark Cases
+
+Stage-level cases (load, EDA, insight extraction) time one component on an
+in-memory dataset. Pipeline cases (/go --full, chart rendering, skills,
+PPTX build) run on a project workspace: /go --full is timed first and the
+later cases re-run their stage on the project it produced.
+"""
+
+import contextlib
+import io
+import json
+import shutil
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from kie.benchmarks.datasets import DEFAULT_SEED, DatasetShape, write_dataset
+from kie.benchmarks.harness import DEFAULT_REPEAT, CaseResult, time_case
+
+STAGE_CASES = ["data_load", "eda_analyze", "insight_extract"]
+PIPELINE_CASES = ["go_full", "chart_render", "skills_analyze", "pptx_build"]
+ALL_CASES = STAGE_CASES + PIPELINE_CASES
+
+# Pipeline cases on larger datasets take minutes per run
+DEFAULT_PIPELINE_MAX_ROWS = 1_000_000
+
+
+def prepare_project(project_root: Path, data_path: Path) -> Path:
+    """
+    Create a project ready for /go --full (spec, intent, theme, data and charts).
+
+    /build requires rendered charts, so the project is analyzed and its
+    charts rendered once; the rails are then rewound to the spec stage so
+    /go --full runs every stage from EDA to preview.
+
+    Args:
+        project_root: Project directory (recreated)
+        data_path: CSV file to copy into data/
+
+    Returns:
+        Project root
+
+    Raises:
+        RuntimeError: If the project renders no charts
+    """
+    from kie.commands.handler import CommandHandler
+    from kie.preferences import OutputPreferences
+    from kie.state.intent import capture_intent
+
+    if project_root.exists():
+        shutil.rmtree(project_root)
+    for d in ["data", "outputs", "project_state", "exports"]:
+        (project_root / d).mkdir(parents=True)
+
+    shutil.copy(data_path, project_root / "data" / data_path.name)
+    (project_root / "project_state" / "spec.yaml").write_text(yaml.dump({
+        "project_name": "Benchmark",
+        "client_name": "Benchmark Client",
+        "objective": "Grow revenue",
+        "project_type": "analytics",
+        "data_source": data_path.name,
+        # Synthetic metrics are near-unique, which the insight engine would
+        # otherwise skip as ID columns; map them the way an analyst would
+        "column_mapping": {"revenue": "revenue", "category": "region"},
+    }))
+    _write_rails_state(project_root)
+    capture_intent(project_root, "Grow revenue")
+    OutputPreferences(project_root).set_theme("light")
+
+    handler = CommandHandler(project_root)
+    _quiet(lambda: _require_success(handler.handle_eda()))()
+    _quiet(lambda: _require_success(handler.handle_analyze()))()
+    _quiet(lambda: _require_success(handler.handle_build(target="charts")))()
+    _write_rails_state(project_root)
+    return project_root
+
+
+def _write_rails_state(project_root: Path) -> None:
+    (project_root / "project_state" / "rails_state.json").write_text(json.dumps({
+        "completed_stages": ["startkie", "spec"],
+        "current_stage": "spec",
+        "workflow_started": True,
+        "last_updated": datetime.now().isoformat(),
+    }))
+
+
+def _quiet(func: Callable[[], Any]) -> Callable[[], Any]:
+    """Suppress console output of pipeline commands while timing them."""
+    def run() -> Any:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return run
+
+
+def _require_success(result: dict[str, Any]) -> dict[str, Any]:
+    """Raise if a command failed, stopped at a stage, or rendered no charts."""
+    if not result.get("success", True):
+        raise RuntimeError(result.get("message") or result.get("errors") or "command failed")
+    if result.get("blocked_at") is not None:
+        raise RuntimeError(f"blocked at {result['blocked_at']}: {result.get('message')}")
+    if result.get("charts_rendered", 1) == 0:
+        raise RuntimeError("no charts rendered")
+    return result
+
+
+def run_shape(
+    shape: DatasetShape,
+    workspace: Path,
+    cases: list[str] | None = None,
+    repeat: int = DEFAULT_REPEAT,
+    pipeline_max_rows: int = DEFAULT_PIPELINE_MAX_ROWS,
+    seed: int = DEFAULT_SEED,
+) -> list[CaseResult]:
+    """
+    Run benchmark cases on one dataset shape.
+
+    Args:
+        shape: Dataset shape
+        workspace: Directory for generated data and projects (reused across runs)
+        cases: Case names to run (default: all)
+        repeat: Timed runs per case
+        pipeline_max_rows: Skip pipeline cases on datasets larger than this
+        seed: Dataset seed
+
+    Returns:
+        Case results in execution order
+    """
+    from kie.data import EDA, DataLoader
+    from kie.insights import InsightEngine
+
+    selected = [case for case in ALL_CASES if cases is None or case in cases]
+    data_path = write_dataset(shape, Path(workspace) / "data" / f"{shape.name}.csv", seed=seed)
+    results: list[CaseResult] = []
+
+    def key(case: str) -> str:
+        return f"{shape.name}/{case}"
+
+    loader = DataLoader()
+    df = loader.load(data_path)
+
+    if "data_load" in selected:
+        results.append(time_case(key("data_load"), lambda: DataLoader().load(data_path), repeat=repeat))
+
+    if "eda_analyze" in selected:
+        results.append(time_case(key("eda_analyze"), lambda: EDA().analyze(df), repeat=repeat))
+
+    if "insight_extract" in selected:
+        numeric = df.select_dtypes(include="number").columns
+        categorical = df.select_dtypes(exclude=["number", "datetime"]).columns
+        time_column = "date" if "date" in df.columns else None
+        results.append(time_case(
+            key("insight_extract"),
+            lambda: InsightEngine().auto_extract_comprehensive(
+                df,
+                value_column=numeric[0],
+                group_column=categorical[0] if len(categorical) else None,
+                time_column=time_column,
+                objective="Grow revenue",
+            ),
+            repeat=repeat,
+        ))
+
+    pipeline = [case for case in selected if case in PIPELINE_CASES]
+    if not pipeline:
+        return results
+    if shape.rows > pipeline_max_rows:
+        reason = f"{shape.rows:,} rows exceeds pipeline limit of {pipeline_max_rows:,}"
+        results.extend(CaseResult(name=key(case), status="skipped", error=reason) for case in pipeline)
+        return results
+
+    results.extend(_run_pipeline(shape, Path(workspace) / "projects" / shape.name, data_path, pipeline, repeat, key))
+    return results
+
+
+def _run_pipeline(
+    shape: DatasetShape,
+    project_root: Path,
+    data_path: Path,
+    pipeline: list[str],
+    repeat: int,
+    key: Callable[[str], str],
+) -> list[CaseResult]:
+    from kie.charts.renderer import ChartRenderer
+    from kie.commands.handler import CommandHandler
+    from kie.skills import SkillContext, get_registry
+
+    results = []
+
+    # Each /go --full run starts from a fresh project; the last one is kept for later cases
+    go_full = time_case(
+        key("go_full"),
+        _quiet(lambda: _require_success(CommandHandler(project_root).handle_go(full=True))),
+        repeat=repeat if "go_full" in pipeline else 1,
+        setup=lambda: prepare_project(project_root, data_path),
+    )
+    if "go_full" in pipeline:
+        results.append(go_full)
+    if go_full.status != "ok":
+        reason = f"/go --full failed: {go_full.error}"
+        results.extend(
+            CaseResult(name=key(case), status="skipped", error=reason) for case in pipeline if case != "go_full"
+        )
+        return results
+
+    if "chart_render" in pipeline:
+        results.append(time_case(
+            key("chart_render"),
+            _quiet(lambda: _require_success(ChartRenderer(project_root).render_charts())),
+            repeat=repeat,
+        ))
+
+    if "skills_analyze" in pipeline:
+        results.append(time_case(
+            key("skills_analyze"),
+            _quiet(lambda: get_registry().execute_skills_for_stage(
+                "analyze", SkillContext(project_root=project_root, current_stage="analyze")
+            )),
+            repeat=repeat,
+        ))
+
+    if "pptx_build" in pipeline:
+        handler = CommandHandler(project_root)
+        spec = yaml.safe_load((project_root / "project_state" / "spec.yaml").read_text())
+        results.append(time_case(
+            key("pptx_build"),
+            _quiet(lambda: handler._build_presentation(spec, theme="light")),
+            repeat=repeat,
+        ))
+
+    return results
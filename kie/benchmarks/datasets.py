@@ -0,0 +1,131 @@
+"""
+Synthetic Benchmark Datasets
+
+Deterministic generators for the dataset shapes the pipeline is measured on:
+row counts from 1k to 10M, 10 or 300 columns, high-cardinality categoricals
+and daily datetime series. Columns use business-like names so the insight
+engine and column mapping behave as they do on client data.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SEED = 42
+
+# Leading numeric columns (remaining ones are metric_NNN)
+_NUMERIC_NAMES = ["revenue", "cost", "units", "margin", "discount", "satisfaction", "headcount"]
+_CATEGORICAL_NAMES = ["region", "product", "channel", "segment"]
+_REGIONS = ["North", "South", "East", "West", "Central"]
+
+
+@dataclass(frozen=True)
+class DatasetShape:
+    """
+    Shape of a synthetic dataset.
+
+    Attributes:
+        name: Shape identifier (used in result keys and file names)
+        rows: Number of rows
+        columns: Total number of columns (including categorical and date columns)
+        categorical: Number of categorical columns
+        cardinality: Distinct values per categorical column (first one is low-cardinality)
+        datetime: Include a daily "date" column
+    """
+    name: str
+    rows: int
+    columns: int = 10
+    categorical: int = 2
+    cardinality: int = 12
+    datetime: bool = False
+
+    @property
+    def numeric(self) -> int:
+        """Number of numeric columns."""
+        return max(1, self.columns - self.categorical - int(self.datetime))
+
+
+SHAPES: dict[str, DatasetShape] = {
+    shape.name: shape
+    for shape in [
+        DatasetShape("1k_10", rows=1_000),
+        DatasetShape("1k_300", rows=1_000, columns=300, categorical=4),
+        DatasetShape("1m_10", rows=1_000_000),
+        DatasetShape("10m_10", rows=10_000_000),
+        DatasetShape("1m_high_cardinality", rows=1_000_000, categorical=3, cardinality=250_000),
+        DatasetShape("1k_timeseries", rows=1_000, datetime=True),
+        DatasetShape("1m_timeseries", rows=1_000_000, datetime=True),
+    ]
+}
+
+# Shapes that run in a few seconds (CI and local smoke runs)
+QUICK_SHAPES = ["1k_10", "1k_300", "1k_timeseries"]
+
+
+def generate_dataset(shape: DatasetShape, seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    """
+    Generate a synthetic dataset.
+
+    Args:
+        shape: Dataset shape
+        seed: Random seed (same seed and shape give identical data)
+
+    Returns:
+        DataFrame with categorical, optional date and numeric columns
+    """
+    rng = np.random.default_rng(seed)
+    n = shape.rows
+    columns: dict[str, np.ndarray] = {}
+    region_codes = rng.integers(0, len(_REGIONS), n)
+
+    for i in range(shape.categorical):
+        name = _CATEGORICAL_NAMES[i] if i < len(_CATEGORICAL_NAMES) else f"category_{i:03d}"
+        if i == 0:
+            columns[name] = np.array(_REGIONS, dtype=object)[region_codes]
+        else:
+            codes = rng.integers(0, shape.cardinality, n)
+            labels = np.char.add(f"{name.title()} ", np.arange(shape.cardinality).astype(str)).astype(object)
+            columns[name] = labels[codes]
+
+    if shape.datetime:
+        start = np.datetime64("2020-01-01")
+        columns["date"] = start + np.arange(n) % 3650
+
+    # Revenue carries a regional signal so comparisons and outliers have something to find
+    region_effect = rng.normal(1.0, 0.25, len(_REGIONS))
+    base = rng.lognormal(mean=8.0, sigma=0.6, size=n) * region_effect[region_codes]
+    for i in range(shape.numeric):
+        name = _NUMERIC_NAMES[i] if i < len(_NUMERIC_NAMES) else f"metric_{i:03d}"
+        if i == 0:
+            values = base
+        elif i == 1:
+            values = base * rng.uniform(0.4, 0.8, n)
+        else:
+            values = rng.normal(100.0 * (i + 1), 15.0 * (i + 1), n)
+        columns[name] = np.round(values, 2)
+
+    return pd.DataFrame(columns)
+
+
+def write_dataset(shape: DatasetShape, path: Path, seed: int = DEFAULT_SEED) -> Path:
+    """
+    Write a synthetic dataset to CSV (reusing an existing file).
+
+    Args:
+        shape: Dataset shape
+        path: Destination CSV file
+        seed: Random seed
+
+    Returns:
+        Path to the CSV file
+    """
+    path = Path(path)
+    if path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    generate_dataset(shape, seed=seed).to_csv(tmp_path, index=False)
+    tmp_path.replace(path)
+    return path
@@ -0,0 +1,236 @@
+"""
+Benchmark Harness
+
+Times benchmark cases, saves results as JSON and compares them with a
+stored baseline. A case regresses when its best time exceeds the baseline
+best time by more than the threshold (and by more than a small absolute
+noise floor, so millisecond-scale cases don't flap).
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+RESULTS_VERSION = 1
+
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.20  # 20% slower than baseline
+DEFAULT_NOISE_FLOOR_S = 0.005
+
+
+@dataclass
+class CaseResult:
+    """
+    Timing of one benchmark case on one dataset shape.
+
+    Attributes:
+        name: Result key ("<shape>/<case>")
+        status: "ok", "error" or "skipped"
+        timings: Wall-clock seconds of each run
+        error: Error or skip reason
+    """
+    name: str
+    status: str = "ok"
+    timings: list[float] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def best(self) -> float | None:
+        """Fastest run in seconds."""
+        return min(self.timings) if self.timings else None
+
+    @property
+    def median(self) -> float | None:
+        """Median run in seconds."""
+        return statistics.median(self.timings) if self.timings else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        data = asdict(self)
+        data["best"] = self.best
+        data["median"] = self.median
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CaseResult":
+        """Create from dict."""
+        return cls(
+            name=data["name"],
+            status=data.get("status", "ok"),
+            timings=list(data.get("timings", [])),
+            error=data.get("error"),
+        )
+
+
+@dataclass
+class Regression:
+    """A case that got slower than its baseline."""
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current time relative to baseline."""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def time_case(
+    name: str,
+    func: Callable[[], Any],
+    repeat: int = DEFAULT_REPEAT,
+    setup: Callable[[], Any] | None = None,
+) -> CaseResult:
+    """
+    Time a case, recording failures instead of raising.
+
+    Args:
+        name: Result key
+        func: Code to time
+        repeat: Number of timed runs
+        setup: Untimed code run before each timed run
+
+    Returns:
+        CaseResult with one timing per run
+    """
+    result = CaseResult(name=name)
+    for _ in range(max(repeat, 1)):
+        try:
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            result.timings.append(time.perf_counter() - start)
+        except Exception as e:
+            result.status = "error"
+            result.error = f"{type(e).__name__}: {e}"
+            break
+    return result
+
+
+def results_document(results: list[CaseResult], metadata: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    Build the JSON document for a benchmark run.
+
+    Args:
+        results: Case results
+        metadata: Extra run metadata (e.g. selected shapes, repeat count)
+
+    Returns:
+        JSON-serializable results document
+    """
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "metadata": metadata or {},
+        "results": {result.name: result.to_dict() for result in results},
+    }
+
+
+def save_results(document: dict[str, Any], path: Path) -> Path:
+    """
+    Save a results document as JSON.
+
+    Args:
+        document: Results document
+        path: Destination file
+
+    Returns:
+        Path to saved file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2))
+    return path
+
+
+def load_results(path: Path) -> dict[str, CaseResult]:
+    """
+    Load case results from a saved results document.
+
+    Args:
+        path: Results or baseline JSON file
+
+    Returns:
+        Dict of result key to CaseResult
+
+    Raises:
+        ValueError: If the file was written by an incompatible harness version
+    """
+    document = json.loads(Path(path).read_text())
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version: {document.get('version')}")
+    return {name: CaseResult.from_dict(data) for name, data in document["results"].items()}
+
+
+def compare_results(
+    current: dict[str, CaseResult],
+    baseline: dict[str, CaseResult],
+    threshold: float = DEFAULT_THRESHOLD,
+    noise_floor: float = DEFAULT_NOISE_FLOOR_S,
+) -> list[Regression]:
+    """
+    Find cases slower than their baseline.
+
+    Only cases that succeeded in both runs are compared.
+
+    Args:
+        current: Results of this run
+        baseline: Stored baseline results
+        threshold: Allowed relative slowdown (0.2 = 20%)
+        noise_floor: Minimum absolute slowdown in seconds to count
+
+    Returns:
+        Regressions, worst first
+    """
+    regressions = []
+    for name, result in current.items():
+        reference = baseline.get(name)
+        if reference is None or result.best is None or reference.best is None:
+            continue
+        if result.best > reference.best * (1 + threshold) and result.best - reference.best > noise_floor:
+            regressions.append(Regression(name=name, baseline=reference.best, current=result.best))
+    regressions.sort(key=lambda r: r.ratio, reverse=True)
+    return regressions
+
+
+def format_report(
+    current: dict[str, CaseResult],
+    baseline: dict[str, CaseResult] | None = None,
+) -> str:
+    """
+    Format results (and baseline deltas) as a plain-text table.
+
+    Args:
+        current: Results of this run
+        baseline: Optional baseline results
+
+    Returns:
+        Report text
+    """
+    lines = [f"{'case':<44} {'best':>10} {'median':>10} {'baseline':>10} {'delta':>8}"]
+    for name, result in current.items():
+        if result.best is None:
+            lines.append(f"{name:<44} {result.status.upper():>10}  {result.error or ''}")
+            continue
+        reference = baseline.get(name) if baseline else None
+        if reference is not None and reference.best:
+            delta = f"{(result.best / reference.best - 1) * 100:+.0f}%"
+            lines.append(
+                f"{name:<44} {result.best:>9.3f}s {result.median:>9.3f}s {reference.best:>9.3f}s {delta:>8}"
+            )
+        else:
+            lines.append(f"{name:<44} {result.best:>9.3f}s {result.median:>9.3f}s {'-':>10} {'-':>8}")
+    return "\n".join(lines)
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from kie.brand.colors import KDSColors, meets_wcag_aa
+from kie.charts.index import ChartSummary, get_chart_index, summarize_chart
 from kie.exceptions import ForbiddenColorError
 
 
@@ -34,20 +35,33 @@ class BrandValidator:
         Returns:
             Validation result dictionary
         """
-        violations = []
-        warnings = []
-
         # Load config
         with open(config_path) as f:
             config = json.load(f)
+        if not isinstance(config, dict):
+            raise ValueError(f"Chart config is not a JSON object: {config_path}")
+
+        return self.validate_chart_summary(summarize_chart(config, Path(config_path).name, str(config_path)))
+
+    def validate_chart_summary(self, summary: ChartSummary) -> dict[str, Any]:
+        """
+        Validate an indexed chart config.
+
+        Args:
+            summary: Chart summary from the chart index
+
+        Returns:
+            Validation result dictionary
+        """
+        violations = []
+        warnings = []
+        chart_config = summary.config
 
         # Check 1: No gridlines
-        if config.get("config", {}).get("gridLines", False):
+        if chart_config.get("gridLines", False):
             violations.append("Gridlines detected (must be False for KDS compliance)")
 
         # Check 2: Axis lines disabled (check xAxis/yAxis for new structure)
-        chart_config = config.get("config", {})
-
         # Check xAxis
         x_axis = chart_config.get("xAxis", {})
         if x_axis.get("axisLine", True):
@@ -62,67 +76,32 @@ class BrandValidator:
         if y_axis.get("tickLine", True):
             violations.append("Y-axis tick lines enabled (should be False for clean KDS look)")
 
-        # Check 3: Colors from KDS palette (check bars/lines/areas arrays)
-        colors = []
-
-        # Extract colors from bar configs
-        for bar in chart_config.get("bars", []):
-            if "fill" in bar:
-                colors.append(bar["fill"])
-
-        # Extract colors from line configs
-        for line in chart_config.get("lines", []):
-            if "stroke" in line:
-                colors.append(line["stroke"])
-
-        # Extract colors from area configs
-        for area in chart_config.get("areas", []):
-            if "fill" in area:
-                colors.append(area["fill"])
-
-        # Extract colors from pie configs
-        pie_config = chart_config.get("pie", {})
-        if "colors" in chart_config:
-            colors.extend(chart_config["colors"])
-
-        # Also check legacy colors field for backwards compatibility
-        colors.extend(chart_config.get("colors", []))
-
-        # Validate colors
-        for color in colors:
+        # Check 3: Colors from KDS palette (bars/lines/areas and the colors list)
+        kds_palette = {c.upper() for c in KDSColors.CHART_PALETTE}
+        for color in summary.palette:
             if KDSColors.is_forbidden(color):
                 violations.append(f"Forbidden color detected: {color}")
                 if self.strict:
                     raise ForbiddenColorError(
                         f"Forbidden color {color} violates KDS guidelines",
-                        details={"color": color, "file": str(config_path)}
+                        details={"color": color, "file": summary.path}
                     )
 
-            if color.upper() not in [c.upper() for c in KDSColors.CHART_PALETTE]:
+            if color.upper() not in kds_palette:
                 warnings.append(f"Non-KDS color: {color} (not in official palette)")
 
         # Check 4: Data labels present (check bars/lines for label config)
-        has_data_labels = False
-
-        # Check bars for labels
-        for bar in chart_config.get("bars", []):
-            if bar.get("label") is not None:
-                has_data_labels = True
-                break
-
-        # Check lines for labels
-        if not has_data_labels:
-            for line in chart_config.get("lines", []):
-                if line.get("label") is not None:
-                    has_data_labels = True
-                    break
+        has_data_labels = any(
+            series.get("label") is not None
+            for series in chart_config.get("bars", []) + chart_config.get("lines", [])
+        )
 
         # Legacy check
         if not has_data_labels and not chart_config.get("dataLabels"):
             warnings.append("Data labels not configured (recommended for KDS charts)")
 
         # Check 5: Typography
-        font_family = config.get("config", {}).get("fontFamily", "")
+        font_family = chart_config.get("fontFamily", "")
         if "Inter" not in font_family and "Arial" not in font_family:
             warnings.append(f"Font family '{font_family}' not Inter or Arial")
 
@@ -130,13 +109,16 @@ class BrandValidator:
             "compliant": len(violations) == 0,
             "violations": violations,
             "warnings": warnings,
-            "file": str(config_path),
+            "file": summary.path,
         }
 
     def validate_directory(self, directory: Path) -> dict[str, Any]:
         """
         Validate all chart configs in a directory.
 
+        Configs come from the shared chart index, so charts parsed for
+        validation are not parsed again by visual QC or the story manifest.
+
         Args:
             directory: Path to directory containing chart JSONs
 
@@ -147,19 +129,15 @@ class BrandValidator:
         all_warnings = []
         files_checked = 0
 
-        # Find all JSON files
-        for json_file in directory.rglob("*.json"):
-            try:
-                result = self.validate_chart_config(json_file)
-                files_checked += 1
-                all_violations.extend(
-                    [f"{json_file.name}: {v}" for v in result["violations"]]
-                )
-                all_warnings.extend(
-                    [f"{json_file.name}: {w}" for w in result["warnings"]]
-                )
-            except json.JSONDecodeError:
-                all_warnings.append(f"{json_file.name}: Invalid JSON")
+        for summary in get_chart_index(directory).summaries():
+            name = Path(summary.path).name
+            if summary.error is not None:
+                all_warnings.append(f"{name}: Invalid JSON")
+                continue
+            result = self.validate_chart_summary(summary)
+            files_checked += 1
+            all_violations.extend([f"{name}: {v}" for v in result["violations"]])
+            all_warnings.extend([f"{name}: {w}" for w in result["warnings"]])
 
         return {
             "compliant": len(all_violations) == 0,
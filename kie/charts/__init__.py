@@ -45,10 +45,14 @@ from kie.charts.factory import ChartFactory, create_chart
 from kie.charts.formatting import (
     calculate_percentages,
     format_axis_label,
+    format_axis_labels,
     format_change,
+    format_currencies,
     format_currency,
     format_number,
+    format_numbers,
     format_percentage,
+    format_percentages,
     generate_label,
     smart_round,
 )
@@ -96,10 +100,14 @@ __all__ = [
     "format_currency",
     "format_percentage",
     "format_change",
+    "format_numbers",
+    "format_currencies",
+    "format_percentages",
     "generate_label",
     "calculate_percentages",
     "smart_round",
     "format_axis_label",
+    "format_axis_labels",
     # Schema
     "RechartsSchema",
     "AxisConfig",
@@ -19,6 +19,7 @@ from kie.charts.schema import (
     LegendConfig,
     TooltipConfig,
 )
+from kie.charts.templates import chart_config, model_fragment
 
 
 class AreaChartBuilder(ChartBuilder):
@@ -106,13 +107,15 @@ class AreaChartBuilder(ChartBuilder):
         stack_id = "stack1" if self.stacked else None
 
         for i, y_key in enumerate(y_keys):
-            area_config = AreaConfig(
+            area_config = model_fragment(
+                AreaConfig,
                 dataKey=y_key,
                 fill=colors[i],
                 stroke=colors[i],
                 strokeWidth=self.stroke_width,
                 fillOpacity=self.fill_opacity,
-                label=DataLabelConfig(
+                label=model_fragment(
+                    DataLabelConfig,
                     position="top",
                     fill=colors[i],
                     fontSize=11,
@@ -122,29 +125,32 @@ class AreaChartBuilder(ChartBuilder):
             areas.append(area_config)
 
         # Build axis configs
-        x_axis = AxisConfig(dataKey=x_key)
-        y_axis = AxisConfig(dataKey="value")
-
-        # Build chart config
-        chart_config = AreaChartConfig(
+        x_axis = model_fragment(AxisConfig, dataKey=x_key)
+        y_axis = model_fragment(AxisConfig, dataKey="value")
+
+        # Build chart config (template compiled once per stack/legend variant)
+        config_dict = chart_config(
+            AreaChartConfig,
+            static={
+                "stackId": stack_id,
+                "legend": LegendConfig() if self.show_legend and len(y_keys) > 1 else None,
+                "tooltip": TooltipConfig(),
+                "gridLines": False,
+                "fontFamily": "Inter, sans-serif",
+                "interactive": True,
+            },
             title=title,
             subtitle=subtitle,
             xAxis=x_axis,
             yAxis=y_axis,
             areas=areas,
-            stackId=stack_id,
-            legend=LegendConfig() if self.show_legend and len(y_keys) > 1 else None,
-            tooltip=TooltipConfig(),
-            gridLines=False,
-            fontFamily="Inter, sans-serif",
-            interactive=True,
         )
 
         # Create Recharts config
         recharts_config = RechartsConfig(
             chart_type="area",
             data=data_list,
-            config=chart_config.model_dump(exclude_none=True),
+            config=config_dict,
             title=title,
             subtitle=subtitle,
         )
@@ -19,6 +19,7 @@ from kie.charts.schema import (
     LegendConfig,
     TooltipConfig,
 )
+from kie.charts.templates import chart_config, display_records, model_fragment
 from kie.formatting.field_registry import FieldRegistry
 
 
@@ -81,12 +82,6 @@ class BarChartBuilder(ChartBuilder):
         Returns:
             RechartsConfig ready for JSON serialization
         """
-        # Normalize data to list of dicts
-        if isinstance(data, pd.DataFrame):
-            data_list = data.to_dict("records")
-        else:
-            data_list = data
-
         # Normalize y_keys to list
         if isinstance(y_keys, str):
             y_keys = [y_keys]
@@ -96,17 +91,7 @@ class BarChartBuilder(ChartBuilder):
         y_labels = {y_key: FieldRegistry.beautify(y_key) for y_key in y_keys}
 
         # Rename columns in data for client-friendly display
-        beautified_data = []
-        for row in data_list:
-            new_row = {}
-            for key, value in row.items():
-                if key == x_key:
-                    new_row[x_label] = value
-                elif key in y_labels:
-                    new_row[y_labels[key]] = value
-                else:
-                    new_row[key] = value
-            beautified_data.append(new_row)
+        beautified_data = display_records(data, {**y_labels, x_key: x_label})
 
         # Get colors
         if colors is None:
@@ -119,11 +104,13 @@ class BarChartBuilder(ChartBuilder):
         bars = []
 
         for i, y_key in enumerate(y_keys):
-            bar_config = BarConfig(
+            bar_config = model_fragment(
+                BarConfig,
                 dataKey=y_labels[y_key],  # Use beautified name
                 fill=colors[i],
                 radius=[4, 4, 0, 0] if self.layout == "horizontal" else [0, 4, 4, 0],
-                label=DataLabelConfig(
+                label=model_fragment(
+                    DataLabelConfig,
                     position="top" if self.layout == "horizontal" else "right",
                     fill="currentColor",
                     fontSize=12,
@@ -134,33 +121,33 @@ class BarChartBuilder(ChartBuilder):
 
         # Build axis configs (using beautified keys)
         if self.layout == "horizontal":
-            x_axis = AxisConfig(dataKey=x_label)
-            y_axis = AxisConfig(dataKey="value")
+            x_axis = model_fragment(AxisConfig, dataKey=x_label)
+            y_axis = model_fragment(AxisConfig, dataKey="value")
         else:
-            x_axis = AxisConfig(dataKey="value")
-            y_axis = AxisConfig(dataKey=x_label)
+            x_axis = model_fragment(AxisConfig, dataKey="value")
+            y_axis = model_fragment(AxisConfig, dataKey=x_label)
 
         # Detect formatters for smart number formatting
         formatters = self._detect_formatters(data, y_keys)
 
-        # Build chart config
-        chart_config = BarChartConfig(
+        # Build chart config (template compiled once per layout/legend variant)
+        config_dict = chart_config(
+            BarChartConfig,
+            static={
+                "layout": self.layout,
+                "legend": LegendConfig() if self.show_legend and len(y_keys) > 1 else None,
+                "tooltip": TooltipConfig(),
+                "gridLines": False,
+                "fontFamily": KDSColors.__dict__.get("FONT_FAMILY", "Inter, sans-serif"),
+                "interactive": True,
+            },
             title=title,
             subtitle=subtitle,
             xAxis=x_axis,
             yAxis=y_axis,
             bars=bars,
-            layout=self.layout,
-            legend=LegendConfig() if self.show_legend and len(y_keys) > 1 else None,
-            tooltip=TooltipConfig(),
-            gridLines=False,
-            fontFamily=KDSColors.__dict__.get("FONT_FAMILY", "Inter, sans-serif"),
-            interactive=True,
         )
 
-        # Create Recharts config (using beautified data)
-        config_dict = chart_config.model_dump(exclude_none=True)
-
         # Add formatters to config for frontend consumption
         if formatters:
             config_dict["formatters"] = formatters
@@ -20,6 +20,7 @@ from kie.charts.schema import (
     LineConfig,
     TooltipConfig,
 )
+from kie.charts.templates import chart_config, model_fragment
 
 
 class ComboChartBuilder(ChartBuilder):
@@ -100,11 +101,13 @@ class ComboChartBuilder(ChartBuilder):
         # Build bar configs
         bars = []
         for i, bar_key in enumerate(bar_keys):
-            bar_config = BarConfig(
+            bar_config = model_fragment(
+                BarConfig,
                 dataKey=bar_key,
                 fill=colors[i],
                 radius=[4, 4, 0, 0],
-                label=DataLabelConfig(
+                label=model_fragment(
+                    DataLabelConfig,
                     position="top",
                     fill="currentColor",
                     fontSize=12,
@@ -117,13 +120,15 @@ class ComboChartBuilder(ChartBuilder):
         lines = []
         color_offset = len(bar_keys)
         for i, line_key in enumerate(line_keys):
-            line_config = LineConfig(
+            line_config = model_fragment(
+                LineConfig,
                 dataKey=line_key,
                 stroke=colors[color_offset + i],
                 strokeWidth=3,
                 dot={"r": 5, "fill": colors[color_offset + i]},
                 activeDot={"r": 7, "fill": colors[color_offset + i]},
-                label=DataLabelConfig(
+                label=model_fragment(
+                    DataLabelConfig,
                     position="top",
                     fill=colors[color_offset + i],
                     fontSize=12,
@@ -133,29 +138,32 @@ class ComboChartBuilder(ChartBuilder):
             lines.append(line_config)
 
         # Build axis configs
-        x_axis = AxisConfig(dataKey=x_key)
-        y_axis = AxisConfig(dataKey="value")
+        x_axis = model_fragment(AxisConfig, dataKey=x_key)
+        y_axis = model_fragment(AxisConfig, dataKey="value")
 
         # Build chart config
-        chart_config = ComboChartConfig(
+        config_dict = chart_config(
+            ComboChartConfig,
+            static={
+                "legend": LegendConfig() if self.show_legend else None,
+                "tooltip": TooltipConfig(),
+                "gridLines": False,
+                "fontFamily": "Inter, sans-serif",
+                "interactive": True,
+            },
             title=title,
             subtitle=subtitle,
             xAxis=x_axis,
             yAxis=y_axis,
             bars=bars,
             lines=lines,
-            legend=LegendConfig() if self.show_legend else None,
-            tooltip=TooltipConfig(),
-            gridLines=False,
-            fontFamily="Inter, sans-serif",
-            interactive=True,
         )
 
         # Create Recharts config
         recharts_config = RechartsConfig(
             chart_type="combo",
             data=data_list,
-            config=chart_config.model_dump(exclude_none=True),
+            config=config_dict,
             title=title,
             subtitle=subtitle,
         )
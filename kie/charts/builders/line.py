@@ -19,6 +19,7 @@ from kie.charts.schema import (
     LineConfig,
     TooltipConfig,
 )
+from kie.charts.templates import chart_config, display_records, model_fragment
 from kie.formatting.field_registry import FieldRegistry
 
 
@@ -83,12 +84,6 @@ class LineChartBuilder(ChartBuilder):
         Returns:
             RechartsConfig ready for JSON serialization
         """
-        # Normalize data to list of dicts
-        if isinstance(data, pd.DataFrame):
-            data_list = data.to_dict("records")
-        else:
-            data_list = data
-
         # Normalize y_keys to list
         if isinstance(y_keys, str):
             y_keys = [y_keys]
@@ -98,17 +93,7 @@ class LineChartBuilder(ChartBuilder):
         y_labels = {y_key: FieldRegistry.beautify(y_key) for y_key in y_keys}
 
         # Rename columns in data for client-friendly display
-        beautified_data = []
-        for row in data_list:
-            new_row = {}
-            for key, value in row.items():
-                if key == x_key:
-                    new_row[x_label] = value
-                elif key in y_labels:
-                    new_row[y_labels[key]] = value
-                else:
-                    new_row[key] = value
-            beautified_data.append(new_row)
+        beautified_data = display_records(data, {**y_labels, x_key: x_label})
 
         # Get colors
         if colors is None:
@@ -119,13 +104,15 @@ class LineChartBuilder(ChartBuilder):
         # Build line configs (using beautified keys)
         lines = []
         for i, y_key in enumerate(y_keys):
-            line_config = LineConfig(
+            line_config = model_fragment(
+                LineConfig,
                 dataKey=y_labels[y_key],  # Use beautified name
                 stroke=colors[i],
                 strokeWidth=self.stroke_width,
                 dot={"r": 4, "fill": colors[i]} if self.show_dots else False,
                 activeDot={"r": 6, "fill": colors[i]},
-                label=DataLabelConfig(
+                label=model_fragment(
+                    DataLabelConfig,
                     position="top",
                     fill=colors[i],
                     fontSize=11,
@@ -135,29 +122,29 @@ class LineChartBuilder(ChartBuilder):
             lines.append(line_config)
 
         # Build axis configs (using beautified keys)
-        x_axis = AxisConfig(dataKey=x_label)
-        y_axis = AxisConfig(dataKey="value")
+        x_axis = model_fragment(AxisConfig, dataKey=x_label)
+        y_axis = model_fragment(AxisConfig, dataKey="value")
 
         # Detect formatters for smart number formatting
         formatters = self._detect_formatters(data, y_keys)
 
-        # Build chart config
-        chart_config = LineChartConfig(
+        # Build chart config (template compiled once per legend variant)
+        config_dict = chart_config(
+            LineChartConfig,
+            static={
+                "legend": LegendConfig() if self.show_legend and len(y_keys) > 1 else None,
+                "tooltip": TooltipConfig(),
+                "gridLines": False,
+                "fontFamily": "Inter, sans-serif",
+                "interactive": True,
+            },
             title=title,
             subtitle=subtitle,
             xAxis=x_axis,
             yAxis=y_axis,
             lines=lines,
-            legend=LegendConfig() if self.show_legend and len(y_keys) > 1 else None,
-            tooltip=TooltipConfig(),
-            gridLines=False,
-            fontFamily="Inter, sans-serif",
-            interactive=True,
         )
 
-        # Create Recharts config (using beautified data)
-        config_dict = chart_config.model_dump(exclude_none=True)
-
         # Add formatters to config for frontend consumption
         if formatters:
             config_dict["formatters"] = formatters
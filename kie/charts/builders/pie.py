@@ -17,6 +17,7 @@ from kie.charts.schema import (
     PieConfig,
     TooltipConfig,
 )
+from kie.charts.templates import chart_config, model_fragment
 
 
 class PieChartBuilder(ChartBuilder):
@@ -103,7 +104,8 @@ class PieChartBuilder(ChartBuilder):
                 item["percentage"] = round((item[value_key] / total) * 100, 1)
 
         # Build pie config
-        pie_config = PieConfig(
+        pie_config = model_fragment(
+            PieConfig,
             dataKey=value_key,
             nameKey=name_key,
             cx="50%",
@@ -118,27 +120,30 @@ class PieChartBuilder(ChartBuilder):
             } if self.show_labels else None,
         )
 
-        # Build chart config
-        chart_config = PieChartConfig(
+        # Build chart config (template compiled once per legend variant)
+        config_dict = chart_config(
+            PieChartConfig,
+            static={
+                "legend": LegendConfig(
+                    verticalAlign="bottom",
+                    align="center",
+                ) if self.show_legend else None,
+                "tooltip": TooltipConfig(),
+                "gridLines": False,
+                "fontFamily": "Inter, sans-serif",
+                "interactive": True,
+            },
             title=title,
             subtitle=subtitle,
             pie=pie_config,
-            colors=colors,
-            legend=LegendConfig(
-                verticalAlign="bottom",
-                align="center",
-            ) if self.show_legend else None,
-            tooltip=TooltipConfig(),
-            gridLines=False,
-            fontFamily="Inter, sans-serif",
-            interactive=True,
+            colors=list(colors),
         )
 
         # Create Recharts config
         recharts_config = RechartsConfig(
             chart_type="pie",
             data=data_list,
-            config=chart_config.model_dump(exclude_none=True),
+            config=config_dict,
             title=title,
             subtitle=subtitle,
         )
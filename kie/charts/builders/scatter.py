@@ -16,6 +16,7 @@ from kie.charts.schema import (
     ScatterChartConfig,
     TooltipConfig,
 )
+from kie.charts.templates import chart_config, model_fragment
 
 
 class ScatterPlotBuilder(ChartBuilder):
@@ -104,33 +105,38 @@ class ScatterPlotBuilder(ChartBuilder):
         }
 
         # Build axis configs
-        x_axis = AxisConfig(
+        x_axis = model_fragment(
+            AxisConfig,
             dataKey=x_key,
             label={"value": x_key.replace("_", " ").title(), "position": "bottom"}
         )
-        y_axis = AxisConfig(
+        y_axis = model_fragment(
+            AxisConfig,
             dataKey=y_key,
             label={"value": y_key.replace("_", " ").title(), "angle": -90, "position": "left"}
         )
 
         # Build chart config
-        chart_config = ScatterChartConfig(
+        config_dict = chart_config(
+            ScatterChartConfig,
+            static={
+                "tooltip": TooltipConfig(),
+                "gridLines": False,
+                "fontFamily": "Inter, sans-serif",
+                "interactive": True,
+            },
             title=title,
             subtitle=subtitle,
             xAxis=x_axis,
             yAxis=y_axis,
             scatter=scatter_config,
-            tooltip=TooltipConfig(),
-            gridLines=False,
-            fontFamily="Inter, sans-serif",
-            interactive=True,
         )
 
         # Create Recharts config
         recharts_config = RechartsConfig(
             chart_type="scatter",
             data=data_list,
-            config=chart_config.model_dump(exclude_none=True),
+            config=config_dict,
             title=title,
             subtitle=subtitle,
         )
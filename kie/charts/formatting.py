@@ -2,9 +2,36 @@
 Smart Formatting Utilities for Charts
 
 Automatic number formatting, label generation, and data transformations.
+
+Scalar formatters memoize hot values (axis ticks, repeated table cells).
+The plural variants (format_numbers, format_currencies, format_percentages,
+format_axis_labels) take a list, array or Series and format each distinct
+value once, bucketing magnitudes with NumPy.
 """
 
 import re
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Cached distinct scalar values per formatter
+FORMAT_CACHE_SIZE = 8192
+
+# K/M/B thresholds and unit letters, indexed by magnitude bucket
+_MAGNITUDES = np.array([1.0, 1_000.0, 1_000_000.0, 1_000_000_000.0])
+_UNITS = ("", "K", "M", "B")
+
+
+# Only types whose arithmetic matches Python floats can share cache entries
+# (1 == 1.0 == np.float64(1) all hash alike; np.float16 would not multiply alike)
+_CACHEABLE_TYPES = frozenset({int, float, np.float64})
+
+
+def _is_cacheable(value: Any) -> bool:
+    # -0.0 == 0.0 (same cache key) but formats as "-0"; NaN never hits the cache
+    return type(value) in _CACHEABLE_TYPES and value == value and value != 0
 
 
 def format_number(
@@ -37,6 +64,12 @@ def format_number(
         >>> format_number(42, abbreviate=False)
         '42'
     """
+    if _is_cacheable(value):
+        return _format_number_cached(value, precision, prefix, suffix, abbreviate)
+    return _format_number(value, precision, prefix, suffix, abbreviate)
+
+
+def _format_number(value: int | float, precision: int, prefix: str, suffix: str, abbreviate: bool) -> str:
     if not abbreviate:
         return f"{prefix}{value:,.0f}{suffix}"
 
@@ -55,6 +88,9 @@ def format_number(
     return f"{sign}{prefix}{formatted}{suffix}"
 
 
+_format_number_cached = lru_cache(maxsize=FORMAT_CACHE_SIZE)(_format_number)
+
+
 def format_currency(
     value: int | float,
     currency: str = "$",
@@ -104,11 +140,138 @@ def format_percentage(
         >>> format_percentage(0.155, multiply_by_100=True)
         '15.5%'
     """
+    if _is_cacheable(value):
+        return _format_percentage_cached(value, precision, multiply_by_100)
+    return _format_percentage(value, precision, multiply_by_100)
+
+
+def _format_percentage(value: int | float, precision: int, multiply_by_100: bool) -> str:
     if multiply_by_100:
         value = value * 100
     return f"{value:.{precision}f}%"
 
 
+_format_percentage_cached = lru_cache(maxsize=FORMAT_CACHE_SIZE)(_format_percentage)
+
+
+def _distinct(values: Any) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Distinct float values and the inverse index that restores the input order.
+
+    Uniqueness is by bit pattern, so -0.0 and 0.0 stay distinct (they format
+    differently) and NaNs collapse to one entry.
+    """
+    if isinstance(values, pd.Series):
+        array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        array = np.asarray(values, dtype=np.float64).ravel()
+    array = np.where(np.isnan(array), np.nan, array)  # one canonical NaN
+    keys, inverse = np.unique(array.view(np.int64), return_inverse=True)
+    return keys.view(np.float64), inverse.ravel()
+
+
+def _expand(labels: list[str], inverse: np.ndarray, values: Any) -> list[str] | pd.Series:
+    expanded = [labels[i] for i in inverse.tolist()]
+    if isinstance(values, pd.Series):
+        return pd.Series(expanded, index=values.index, name=values.name, dtype=object)
+    return expanded
+
+
+def format_numbers(
+    values: Any,
+    precision: int = 1,
+    prefix: str = "",
+    suffix: str = "",
+    abbreviate: bool = True,
+) -> list[str] | pd.Series:
+    """
+    Vectorized format_number: one label per value, identical to the scalar output.
+
+    Each distinct value is formatted once; magnitude buckets (K/M/B) are
+    computed for all of them in a single NumPy pass.
+
+    Args:
+        values: List, array or Series of numbers (missing values format as "nan", like the scalar)
+        precision: Decimal places for abbreviated numbers
+        prefix: Prefix (e.g., "$" for currency)
+        suffix: Suffix (e.g., "%" for percentages)
+        abbreviate: Whether to use K/M/B abbreviations
+
+    Returns:
+        List of labels (a Series with the same index if values is a Series)
+
+    Examples:
+        >>> format_numbers([1234, 1234567, 42])
+        ['1.2K', '1.2M', '42.0']
+    """
+    distinct, inverse = _distinct(values)
+    if not abbreviate:
+        labels = [f"{prefix}{value:,.0f}{suffix}" for value in distinct.tolist()]
+        return _expand(labels, inverse, values)
+
+    abs_values = np.abs(distinct)
+    # NaN compares False everywhere, so it stays in the unabbreviated bucket
+    buckets = (
+        (abs_values >= 1_000).astype(np.intp)
+        + (abs_values >= 1_000_000)
+        + (abs_values >= 1_000_000_000)
+    )
+    scaled = abs_values / _MAGNITUDES[buckets]
+    negative = distinct < 0
+
+    pattern = f"%.{precision}f"
+    labels = [
+        f"{'-' if neg else ''}{prefix}{pattern % scale}{_UNITS[bucket]}{suffix}"
+        for scale, bucket, neg in zip(scaled.tolist(), buckets.tolist(), negative.tolist(), strict=True)
+    ]
+    return _expand(labels, inverse, values)
+
+
+def format_currencies(
+    values: Any,
+    currency: str = "$",
+    precision: int = 1,
+    abbreviate: bool = True,
+) -> list[str] | pd.Series:
+    """
+    Vectorized format_currency.
+
+    Args:
+        values: List, array or Series of amounts
+        currency: Currency symbol
+        precision: Decimal places
+        abbreviate: Use K/M/B abbreviations
+
+    Returns:
+        List of labels (a Series with the same index if values is a Series)
+    """
+    return format_numbers(values, precision=precision, prefix=currency, abbreviate=abbreviate)
+
+
+def format_percentages(
+    values: Any,
+    precision: int = 1,
+    multiply_by_100: bool = False,
+) -> list[str] | pd.Series:
+    """
+    Vectorized format_percentage.
+
+    Args:
+        values: List, array or Series of values
+        precision: Decimal places
+        multiply_by_100: If True, multiply by 100 (for decimal values like 0.15 → 15%)
+
+    Returns:
+        List of labels (a Series with the same index if values is a Series)
+    """
+    distinct, inverse = _distinct(values)
+    if multiply_by_100:
+        distinct = distinct * 100
+    pattern = f"%.{precision}f%%"
+    labels = [pattern % value for value in distinct.tolist()]
+    return _expand(labels, inverse, values)
+
+
 def format_change(
     value: int | float,
     precision: int = 1,
@@ -267,3 +430,26 @@ def format_axis_label(
         return format_number(value)
     else:
         return str(value)
+
+
+def format_axis_labels(values: Any, axis_type: str = "numeric") -> list[str] | pd.Series:
+    """
+    Vectorized format_axis_label (e.g. for a full set of axis ticks).
+
+    Args:
+        values: List, array or Series of tick values
+        axis_type: "numeric", "currency", "percentage", "time"
+
+    Returns:
+        List of labels (a Series with the same index if values is a Series)
+    """
+    if axis_type == "currency":
+        return format_currencies(values)
+    elif axis_type == "percentage":
+        return format_percentages(values, multiply_by_100=True)
+    elif axis_type == "numeric":
+        return format_numbers(values)
+    elif isinstance(values, pd.Series):
+        return values.map(str)
+    else:
+        return [str(value) for value in values]
@@ -0,0 +1,314 @@
+"""
+Chart Config Index
+
+Rendered charts (outputs/charts/*.json) are inspected by KDS validation,
+visual QC and story manifest assembly. The index parses each chart config
+once and keeps a summary of it (point counts, per-series value stats, label
+lengths, palette) so every consumer reads the summary instead of parsing
+and walking the chart data again:
+
+- Entries are validated against the file's (size, mtime_ns, inode) on every
+  refresh; re-rendered charts are re-summarized
+- Large chart sets are summarized across a process pool
+
+Example:
+    >>> index = get_chart_index(project_root / "outputs" / "charts")
+    >>> for summary in index.summaries():
+    ...     print(summary.chart_id, summary.data_points, summary.value_max)
+"""
+
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Data keys holding category labels rather than values
+LABEL_KEYS = ("x", "name", "category")
+
+# Below this many changed charts a process pool costs more than it saves
+MIN_PARALLEL_CHARTS = 64
+
+_Signature = tuple[int, int, int]
+
+
+@dataclass
+class SeriesStats:
+    """Numeric values of one data key across all data points."""
+    count: int
+    minimum: float
+    maximum: float
+    total: float
+
+
+@dataclass
+class ChartSummary:
+    """Parsed chart config and the statistics consumers need from its data."""
+    chart_id: str
+    path: str
+    chart_type: str = "unknown"
+    config: dict[str, Any] = field(default_factory=dict)
+    data_points: int = 0
+    data_keys: frozenset[str] = frozenset()
+    series: dict[str, SeriesStats] = field(default_factory=dict)
+    max_label_length: int = 0
+    palette: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def value_count(self) -> int:
+        """Number of numeric values over all value series."""
+        return sum(stats.count for stats in self.series.values())
+
+    @property
+    def value_min(self) -> float | None:
+        """Smallest numeric value over all value series."""
+        return min((stats.minimum for stats in self.series.values()), default=None)
+
+    @property
+    def value_max(self) -> float | None:
+        """Largest numeric value over all value series."""
+        return max((stats.maximum for stats in self.series.values()), default=None)
+
+    @property
+    def value_mean(self) -> float | None:
+        """Mean numeric value over all value series."""
+        count = self.value_count
+        return sum(stats.total for stats in self.series.values()) / count if count else None
+
+
+def chart_palette(chart_config: dict[str, Any]) -> list[str]:
+    """
+    Colors a chart config uses (series fills/strokes, then the colors list).
+
+    Args:
+        chart_config: The "config" section of a chart JSON
+
+    Returns:
+        Colors in config order
+    """
+    colors = [bar["fill"] for bar in chart_config.get("bars", []) if "fill" in bar]
+    colors.extend(line["stroke"] for line in chart_config.get("lines", []) if "stroke" in line)
+    colors.extend(area["fill"] for area in chart_config.get("areas", []) if "fill" in area)
+    colors.extend(chart_config.get("colors", []))
+    return colors
+
+
+def summarize_chart(chart: dict[str, Any], chart_id: str, path: str = "") -> ChartSummary:
+    """
+    Summarize a parsed chart JSON in one pass over its data.
+
+    Args:
+        chart: Parsed chart JSON ({"type", "data", "config"})
+        chart_id: Chart ID (path relative to the charts directory)
+        path: Chart file path
+
+    Returns:
+        ChartSummary
+    """
+    if not isinstance(chart, dict):
+        return ChartSummary(chart_id=chart_id, path=path, error="Chart JSON is not an object")
+
+    data = chart.get("data", [])
+    config = chart.get("config", {})
+    data_keys: set[str] = set()
+    series: dict[str, SeriesStats] = {}
+    max_label_length = 0
+
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        data_keys.update(item)
+        for key, value in item.items():
+            if key in LABEL_KEYS:
+                max_label_length = max(max_label_length, len(str(value)))
+            elif isinstance(value, (int, float)):
+                stats = series.get(key)
+                if stats is None:
+                    series[key] = SeriesStats(1, value, value, value)
+                else:
+                    stats.count += 1
+                    stats.total += value
+                    if value < stats.minimum:
+                        stats.minimum = value
+                    elif value > stats.maximum:
+                        stats.maximum = value
+
+    return ChartSummary(
+        chart_id=chart_id,
+        path=path,
+        chart_type=chart.get("type", "unknown"),
+        config=config,
+        data_points=len(data),
+        data_keys=frozenset(data_keys),
+        series=series,
+        max_label_length=max_label_length,
+        palette=chart_palette(config) if isinstance(config, dict) else [],
+    )
+
+
+def _summarize_file(job: tuple[str, str]) -> ChartSummary:
+    """Parse and summarize one chart file (load errors are recorded, not raised)."""
+    path, chart_id = job
+    try:
+        with open(path, "rb") as f:
+            chart = json.load(f)
+    except Exception as e:
+        return ChartSummary(chart_id=chart_id, path=path, error=str(e))
+    return summarize_chart(chart, chart_id, path)
+
+
+def _signature(path: str) -> _Signature | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+class ChartIndex:
+    """
+    Chart ID -> ChartSummary for every chart JSON under a charts directory.
+
+    Chart IDs are paths relative to the directory (the file name for charts
+    at the top level), matching the chart_ref used by storyboards and QC.
+    """
+
+    def __init__(self, charts_dir: Path, workers: int | None = None):
+        """
+        Initialize an empty index (refresh() builds it).
+
+        Args:
+            charts_dir: Charts directory (outputs/charts)
+            workers: Processes for summarizing large chart sets
+                (None: one per CPU, 1: summarize serially)
+        """
+        self.charts_dir = Path(charts_dir)
+        self.workers = workers
+        self.parsed = 0
+        self._entries: dict[str, tuple[_Signature, ChartSummary]] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self) -> "ChartIndex":
+        """
+        Sync the index with the directory (only new or changed charts are parsed).
+
+        Returns:
+            self
+        """
+        with self._lock:
+            current: dict[str, tuple[str, _Signature]] = {}
+            for path in self._scan():
+                signature = _signature(path)
+                if signature is not None:
+                    chart_id = Path(os.path.relpath(path, self.charts_dir)).as_posix()
+                    current[chart_id] = (path, signature)
+
+            for chart_id in list(self._entries):
+                if chart_id not in current:
+                    del self._entries[chart_id]
+
+            stale = [
+                (chart_id, path, signature)
+                for chart_id, (path, signature) in sorted(current.items())
+                if chart_id not in self._entries or self._entries[chart_id][0] != signature
+            ]
+            summaries = self._summarize([(path, chart_id) for chart_id, path, _ in stale])
+            for (chart_id, _, signature), summary in zip(stale, summaries, strict=True):
+                self._entries[chart_id] = (signature, summary)
+            self.parsed += len(stale)
+        return self
+
+    def get(self, chart_id: str) -> ChartSummary | None:
+        """
+        Summary of one chart (as of the last refresh).
+
+        Args:
+            chart_id: Chart ID, e.g. "insight_1__bar.json"
+
+        Returns:
+            ChartSummary, or None if the chart isn't indexed
+        """
+        entry = self._entries.get(chart_id)
+        return entry[1] if entry else None
+
+    def summaries(self, recursive: bool = True) -> list[ChartSummary]:
+        """
+        Summaries ordered by chart ID (as of the last refresh).
+
+        Args:
+            recursive: Include charts in subdirectories
+
+        Returns:
+            Chart summaries
+        """
+        return [
+            summary for chart_id, (_, summary) in sorted(self._entries.items())
+            if recursive or "/" not in chart_id
+        ]
+
+    def __contains__(self, chart_id: object) -> bool:
+        return chart_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _scan(self) -> list[str]:
+        """Paths of all chart JSON files below the charts directory."""
+        paths = []
+        pending = [str(self.charts_dir)]
+        while pending:
+            try:
+                entries = list(os.scandir(pending.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    paths.append(entry.path)
+        return paths
+
+    def _summarize(self, jobs: list[tuple[str, str]]) -> list[ChartSummary]:
+        """Summarize charts, across a process pool for large chart sets."""
+        workers = self.workers if self.workers is not None else (os.cpu_count() or 1)
+        if workers <= 1 or len(jobs) < MIN_PARALLEL_CHARTS:
+            return [_summarize_file(job) for job in jobs]
+
+        mp_context: multiprocessing.context.BaseContext
+        if "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+        else:
+            mp_context = multiprocessing.get_context()
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=mp_context) as executor:
+            return list(executor.map(_summarize_file, jobs, chunksize=16))
+
+
+# Chart indexes by charts directory (shared by renderer, validator and skills)
+MAX_CHART_INDEXES = 32
+_indexes: dict[str, ChartIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_chart_index(charts_dir: Path, refresh: bool = True) -> ChartIndex:
+    """
+    Get the shared chart index of a charts directory.
+
+    Args:
+        charts_dir: Charts directory (outputs/charts)
+        refresh: Sync the index with the directory before returning it
+
+    Returns:
+        ChartIndex for the directory
+    """
+    key = os.path.abspath(charts_dir)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            if len(_indexes) >= MAX_CHART_INDEXES:
+                _indexes.pop(next(iter(_indexes)))
+            index = _indexes[key] = ChartIndex(Path(key))
+    return index.refresh() if refresh else index
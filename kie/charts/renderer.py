@@ -8,13 +8,48 @@ Reads visualization specifications and generates charts deterministically.
 """
 
 import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
-from kie.charts.formatting import format_number
+from kie.charts.formatting import format_numbers
+from kie.data.aggregation import (
+    AggregationCache,
+    get_aggregation_cache,
+    set_aggregation_cache,
+)
+
+# Visualization types whose data is a groupby(x).sum() over the source frame
+AGGREGATE_VIZ_TYPES = {"bar", "pareto", "map"}
+
+# Render state shared with worker processes. Populated in the parent before
+# the pool starts so fork-based workers inherit the DataFrame (and the warm
+# global aggregation cache) copy-on-write instead of receiving a pickle.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_render_worker(
+    project_root: Path, df: pd.DataFrame, aggregation_cache: AggregationCache
+) -> None:
+    """Worker initializer for start methods that cannot inherit memory (spawn)."""
+    _WORKER_STATE["project_root"] = project_root
+    _WORKER_STATE["df"] = df
+    set_aggregation_cache(aggregation_cache)
+
+
+def _render_job_in_worker(job: tuple[str, dict[str, Any], dict[str, Any] | None]) -> dict[str, Any]:
+    """Render one chart job using the worker's shared DataFrame."""
+    renderer = _WORKER_STATE.get("renderer")
+    if renderer is None:
+        renderer = ChartRenderer(_WORKER_STATE["project_root"])
+        _WORKER_STATE["renderer"] = renderer
+    return renderer._run_render_job(job, _WORKER_STATE["df"])
 
 
 class ChartRenderer:
@@ -42,7 +77,10 @@ class ChartRenderer:
         self.data_dir = project_root / "data"
 
     def render_charts(
-        self, data_file: Path | None = None, validate: bool = True
+        self,
+        data_file: Path | None = None,
+        validate: bool = True,
+        workers: int | None = None,
     ) -> dict[str, Any]:
         """
         Render all charts from visualization plan.
@@ -50,9 +88,13 @@ class ChartRenderer:
         Args:
             data_file: Data file to use for charts (optional, will auto-detect)
             validate: If True, validate charts for KDS compliance (default: True)
+            workers: Render charts across this many processes (None or 1 renders
+                serially; 0 uses one per CPU). Workers share one read-only
+                DataFrame and aggregations are computed once up front.
 
         Returns:
-            Dictionary with success status and rendered charts info
+            Dictionary with success status and rendered charts info. Each chart
+            entry includes its render_seconds.
 
         Raises:
             FileNotFoundError: If visualization_plan.json is missing
@@ -96,28 +138,19 @@ class ChartRenderer:
         self.charts_dir.mkdir(parents=True, exist_ok=True)
 
         # Render charts for each spec where visualization_required == true
-        rendered_charts = []
-        for spec in specs:
-            if not spec.get("visualization_required", False):
-                # Skip - no chart for this insight
-                continue
+        jobs = self._collect_render_jobs(specs)
+        aggregation_misses = get_aggregation_cache().misses
 
-            # Check if spec has multiple visuals (Visual Pattern Library)
-            if "visuals" in spec:
-                # Multi-visual pattern - render each visual
-                for visual_spec in spec["visuals"]:
-                    chart_info = self._render_chart_from_visual(spec, visual_spec, df)
-                    rendered_charts.append(chart_info)
-            # Chart Excellence Plan: Check if spec has multiple chart versions
-            elif "chart_versions" in spec:
-                # Multiple chart versions - render each version
-                for version_spec in spec["chart_versions"]:
-                    chart_info = self._render_chart_version(spec, version_spec, df)
-                    rendered_charts.append(chart_info)
-            else:
-                # Single visualization (original behavior)
-                chart_info = self._render_chart(spec, df)
-                rendered_charts.append(chart_info)
+        if workers == 0:
+            workers = os.cpu_count() or 1
+
+        render_start = time.perf_counter()
+        if workers and workers > 1 and len(jobs) > 1:
+            rendered_charts = self._render_jobs_parallel(jobs, df, workers)
+        else:
+            workers = 1
+            rendered_charts = [self._run_render_job(job, df) for job in jobs]
+        render_seconds = time.perf_counter() - render_start
 
         # PR #1: RENDER-TIME KDS VALIDATION
         # Validate all rendered chart configs for KDS compliance
@@ -132,8 +165,155 @@ class ChartRenderer:
             "visualizations_planned": len([s for s in specs if s.get("visualization_required", False)]),
             "visualizations_skipped": len([s for s in specs if not s.get("visualization_required", False)]),
             "kds_validated": validate,
+            "render_timings": {
+                "workers": workers,
+                "total_seconds": round(render_seconds, 4),
+                "aggregations_computed": get_aggregation_cache().misses - aggregation_misses,
+            },
         }
 
+    def _collect_render_jobs(
+        self, specs: list[dict[str, Any]]
+    ) -> list[tuple[str, dict[str, Any], dict[str, Any] | None]]:
+        """
+        Flatten the visualization plan into render jobs, in output order.
+
+        Args:
+            specs: Visualization specifications
+
+        Returns:
+            List of (kind, spec, sub_spec) tuples where kind is "visual",
+            "version" or "chart"
+        """
+        jobs = []
+        for spec in specs:
+            if not spec.get("visualization_required", False):
+                # Skip - no chart for this insight
+                continue
+
+            # Check if spec has multiple visuals (Visual Pattern Library)
+            if "visuals" in spec:
+                for visual_spec in spec["visuals"]:
+                    jobs.append(("visual", spec, visual_spec))
+            # Chart Excellence Plan: Check if spec has multiple chart versions
+            elif "chart_versions" in spec:
+                for version_spec in spec["chart_versions"]:
+                    jobs.append(("version", spec, version_spec))
+            else:
+                # Single visualization (original behavior)
+                jobs.append(("chart", spec, None))
+        return jobs
+
+    def _run_render_job(
+        self, job: tuple[str, dict[str, Any], dict[str, Any] | None], df: pd.DataFrame
+    ) -> dict[str, Any]:
+        """
+        Render one job and record how long it took.
+
+        Args:
+            job: (kind, spec, sub_spec) from _collect_render_jobs
+            df: Source data (never modified)
+
+        Returns:
+            Chart info dictionary with render_seconds
+        """
+        kind, spec, sub_spec = job
+        start = time.perf_counter()
+
+        if sub_spec is None:
+            chart_info = self._render_chart(spec, df)
+        elif kind == "visual":
+            chart_info = self._render_chart_from_visual(spec, sub_spec, df)
+        else:
+            chart_info = self._render_chart_version(spec, sub_spec, df)
+
+        chart_info["render_seconds"] = round(time.perf_counter() - start, 4)
+        return chart_info
+
+    def _render_jobs_parallel(
+        self,
+        jobs: list[tuple[str, dict[str, Any], dict[str, Any] | None]],
+        df: pd.DataFrame,
+        workers: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Render jobs across a process pool that shares one DataFrame.
+
+        Distinct aggregations are computed once in the parent first, so two
+        visuals needing the same groupby(x).sum() do not each recompute it.
+        With the fork start method, workers inherit the DataFrame and the
+        aggregations without pickling; otherwise they are sent once per
+        worker through the pool initializer.
+
+        Args:
+            jobs: Render jobs
+            df: Source data
+            workers: Number of worker processes
+
+        Returns:
+            Chart info dictionaries in job order
+        """
+        self._prefetch_aggregations(jobs, df)
+
+        context: multiprocessing.context.BaseContext
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+            _WORKER_STATE.clear()
+            _WORKER_STATE.update(project_root=self.project_root, df=df)
+            pool_kwargs: dict[str, Any] = {}
+        else:
+            context = multiprocessing.get_context()
+            pool_kwargs = {
+                "initializer": _init_render_worker,
+                "initargs": (self.project_root, df, get_aggregation_cache()),
+            }
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(jobs)), mp_context=context, **pool_kwargs
+            ) as executor:
+                return list(executor.map(_render_job_in_worker, jobs))
+        finally:
+            _WORKER_STATE.clear()
+
+    def _prefetch_aggregations(
+        self, jobs: list[tuple[str, dict[str, Any], dict[str, Any] | None]], df: pd.DataFrame
+    ) -> None:
+        """
+        Compute each distinct groupby(x).sum() needed by the render jobs once.
+
+        Only jobs whose axes resolve to two distinct existing columns are
+        prefetched; anything else is left to the chart generator.
+
+        Args:
+            jobs: Render jobs
+            df: Source data
+        """
+        for _kind, _spec, sub_spec in jobs:
+            if sub_spec is None:
+                continue
+            if sub_spec.get("visualization_type", "bar") not in AGGREGATE_VIZ_TYPES:
+                continue
+
+            x_col = self._find_column(df, sub_spec.get("x_axis"))
+            y_col = self._find_column(df, sub_spec.get("y_axis"))
+            if x_col and y_col and x_col != y_col:
+                self._aggregate_sum(df, x_col, y_col)
+
+    def _aggregate_sum(self, df: pd.DataFrame, x_col: str, y_col: str) -> pd.DataFrame:
+        """
+        Return df.groupby(x_col)[y_col].sum().reset_index() via the shared cache.
+
+        Args:
+            df: Source data
+            x_col: Group column
+            y_col: Value column
+
+        Returns:
+            Aggregated frame (a copy; callers may modify it)
+        """
+        return get_aggregation_cache().aggregate(df, x_col, y_col, "sum").reset_index()
+
     def _auto_detect_data_file(self) -> Path | None:
         """Auto-detect data file from data/ directory."""
         if not self.data_dir.exists():
@@ -680,8 +860,8 @@ class ChartRenderer:
                 # Single column dataset - return distribution instead
                 return [{"category": str(i), "value": float(v)} for i, v in enumerate(df[y_col].dropna())]
 
-        # Group by x_col and aggregate y_col
-        grouped = df.groupby(x_col)[y_col].sum().reset_index()
+        # Group by x_col and aggregate y_col (shared aggregation cache)
+        grouped = self._aggregate_sum(df, x_col, y_col)
 
         # Filter out suppressed categories
         suppress_lower = [s.lower() for s in suppress]
@@ -780,14 +960,14 @@ class ChartRenderer:
         hist, bin_edges = pd.cut(values, bins=10, retbins=True, duplicates="drop")
         counts = hist.value_counts().sort_index()
 
-        chart_data = []
-        for interval, count in counts.items():
-            chart_data.append({
-                "bin": f"{format_number(interval.left, precision=1)}-{format_number(interval.right, precision=1)}",
-                "count": int(count),
-            })
+        intervals = pd.IntervalIndex(counts.index)
+        lefts = format_numbers(intervals.left, precision=1)
+        rights = format_numbers(intervals.right, precision=1)
 
-        return chart_data
+        return [
+            {"bin": f"{left}-{right}", "count": int(count)}
+            for left, right, count in zip(lefts, rights, counts.tolist(), strict=True)
+        ]
 
     def _generate_scatter_data(
         self,
@@ -847,8 +1027,8 @@ class ChartRenderer:
             numeric_cols = df.select_dtypes(include=["number"]).columns
             value_col = numeric_cols[0] if len(numeric_cols) > 0 else df.columns[1] if len(df.columns) > 1 else df.columns[0]
 
-        # Group by location
-        grouped = df.groupby(location_col)[value_col].sum().reset_index()
+        # Group by location (shared aggregation cache)
+        grouped = self._aggregate_sum(df, location_col, value_col)
 
         # Filter suppressed
         suppress_lower = [s.lower() for s in suppress]
@@ -920,8 +1100,8 @@ class ChartRenderer:
                     })
                 return chart_data
 
-        # Group by x_col and aggregate y_col
-        grouped = df.groupby(x_col)[y_col].sum().reset_index()
+        # Group by x_col and aggregate y_col (shared aggregation cache)
+        grouped = self._aggregate_sum(df, x_col, y_col)
 
         # Filter out suppressed categories
         suppress_lower = [s.lower() for s in suppress]
@@ -153,13 +153,14 @@ def svg_to_png(svg_path: Path, png_path: Path, dpi: int = 300) -> Path:
     return png_path
 
 
-def to_svg(config: RechartsConfig, output_path: Path) -> Path:
+def to_svg(config: RechartsConfig, output_path: Path, writer: Any = None) -> Path:
     """
     Convert RechartsConfig to SVG using Pygal.
 
     Args:
         config: Recharts chart configuration
         output_path: Path to save SVG file
+        writer: Optional ArtifactWriter to save the file in the background
 
     Returns:
         Path to saved SVG file
@@ -209,6 +210,10 @@ def to_svg(config: RechartsConfig, output_path: Path) -> Path:
         raise ValueError(f"Unsupported chart type: {chart_type}")
 
     # Render to file
+    if writer is not None:
+        writer.write_bytes(output_path, chart.render(is_unicode=True).encode("utf-8"))
+        return output_path
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
     chart.render_to_file(str(output_path))
 
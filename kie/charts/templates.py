@@ -0,0 +1,149 @@
+"""
+Chart Config Templates
+
+Precompiled, cached Recharts config fragments for chart builders.
+
+Builders describe each config part as a Pydantic model class plus field
+values. The first call for a given shape validates through the model and
+caches the dumped dict; later calls clone the cached dict instead of
+re-validating and re-serializing, so decks with hundreds of charts pay the
+Pydantic cost once per chart variant rather than once per chart.
+"""
+
+from typing import Any
+
+import pandas as pd
+from pydantic import BaseModel
+
+# Cached templates are small dicts; the cap only guards against unbounded
+# growth from per-chart values such as data keys and colors.
+_MAX_TEMPLATES = 4096
+
+_fragment_cache: dict[tuple, dict[str, Any]] = {}
+_chart_cache: dict[tuple, dict[str, Any]] = {}
+
+
+def clone(value: Any) -> Any:
+    """
+    Copy nested dicts/lists (leaf values are immutable JSON scalars).
+
+    Args:
+        value: Dumped config value
+
+    Returns:
+        Independent copy safe for the caller to mutate
+    """
+    if isinstance(value, dict):
+        return {key: clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [clone(item) for item in value]
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    """Convert field values into a hashable cache key."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, BaseModel):
+        return (type(value), _freeze(value.model_dump(exclude_none=True)))
+    return value
+
+
+def _remember(cache: dict[tuple, dict[str, Any]], key: tuple, template: dict[str, Any]) -> None:
+    if len(cache) >= _MAX_TEMPLATES:
+        cache.clear()
+    cache[key] = template
+
+
+def model_fragment(model_cls: type[BaseModel], **fields: Any) -> dict[str, Any]:
+    """
+    Return the dumped dict for model_cls(**fields), cached by field values.
+
+    Args:
+        model_cls: Pydantic config model (e.g. BarConfig, AxisConfig)
+        **fields: Model fields
+
+    Returns:
+        model_dump(exclude_none=True) of the model (a fresh copy)
+
+    Example:
+        >>> model_fragment(AxisConfig, dataKey="Region")
+        {'dataKey': 'Region', 'axisLine': False, ...}
+    """
+    key = (model_cls, _freeze(fields))
+    template = _fragment_cache.get(key)
+    if template is None:
+        template = model_cls(**fields).model_dump(exclude_none=True)
+        _remember(_fragment_cache, key, template)
+    return {name: clone(value) for name, value in template.items()}
+
+
+def chart_config(
+    model_cls: type[BaseModel], static: dict[str, Any], **dynamic: Any
+) -> dict[str, Any]:
+    """
+    Dump a chart-level config from a template compiled per static shape.
+
+    Static fields (layout, legend, tooltip, fonts, ...) identify the
+    template. Dynamic fields (title, axes, series) change per chart; they
+    are validated on the template's first build and afterwards patched in
+    as-is, so they must already be dumped values (see model_fragment).
+
+    Args:
+        model_cls: Pydantic chart config model (e.g. BarChartConfig)
+        static: Fields shared by every chart of this variant
+        **dynamic: Per-chart fields
+
+    Returns:
+        Config dict equivalent to model_cls(**static, **dynamic).model_dump(exclude_none=True)
+    """
+    key = (model_cls, _freeze(static), tuple(sorted(dynamic)))
+    template = _chart_cache.get(key)
+    if template is None:
+        config = model_cls(**static, **dynamic).model_dump(exclude_none=True)
+        _remember(_chart_cache, key, config)
+        return {name: clone(value) for name, value in config.items()}
+
+    config = {
+        name: dynamic[name] if name in dynamic else clone(value)
+        for name, value in template.items()
+        if name not in dynamic or dynamic[name] is not None
+    }
+    for name, value in dynamic.items():
+        if name not in config and value is not None:
+            config[name] = value
+    return config
+
+
+def display_records(
+    data: pd.DataFrame | list[dict[str, Any]], rename: dict[str, str]
+) -> list[dict[str, Any]]:
+    """
+    Convert chart data to records with display-friendly keys.
+
+    DataFrames are renamed column-wise before conversion; lists of dicts are
+    renamed row by row.
+
+    Args:
+        data: Input data
+        rename: Raw key -> display label
+
+    Returns:
+        List of row dicts keyed by display labels
+    """
+    if isinstance(data, pd.DataFrame):
+        renamed = data.rename(columns=rename)
+        if not renamed.columns.has_duplicates:
+            records: list[dict[str, Any]] = renamed.to_dict("records")
+            return records
+        data = data.to_dict("records")
+
+    return [{rename.get(key, key): value for key, value in row.items()} for row in data]
+
+
+def clear_template_cache() -> None:
+    """Drop all compiled templates (e.g. after changing schema defaults)."""
+    _fragment_cache.clear()
+    _chart_cache.clear()
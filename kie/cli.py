@@ -9,9 +9,6 @@ from pathlib import Path
 
 try:
     from rich.console import Console
-    from rich.markdown import Markdown
-    from rich.panel import Panel
-    from rich.table import Table
     HAS_RICH = True
 except ImportError:
     HAS_RICH = False
@@ -68,6 +65,10 @@ class KIEClient:
 
 Type a command to get started!
 """
+            # Markdown pulls in markdown-it and pygments; only import when rendering
+            from rich.markdown import Markdown
+            from rich.panel import Panel
+
             self.console.print(Panel(Markdown(welcome_text), title="KIE v3", border_style="purple"))
         else:
             print("=" * 60)
@@ -127,6 +128,8 @@ Type a command to get started!
                 self.console.print(f"[green]✓ {result.get('message', 'Success')}[/green]")
 
             # Print structured data
+            from rich.table import Table
+
             table = Table(show_header=True, header_style="bold purple")
             table.add_column("Key", style="cyan")
             table.add_column("Value")
@@ -498,6 +501,9 @@ def main() -> None:
             print("  kie analyze      - Run analysis and exit")
             print("  kie doctor       - Check workspace health and exit")
             print("  ... (any KIE command)")
+            print("\nBatch mode:")
+            print("  kie batch <dirs|globs> [-c COMMAND] [-j WORKERS] [--timeout S]")
+            print("                   - Run commands (default: go --full) across many projects")
             print("\nInteractive mode:")
             print("  kie              - Start REPL in current directory")
             print("  kie <directory>  - Start REPL in specified directory")
@@ -512,6 +518,11 @@ def main() -> None:
             install_commands()
             sys.exit(0)
 
+        # Batch mode: run commands across many projects
+        if arg == "batch":
+            from kie.commands.batch import batch_cli
+            sys.exit(batch_cli(sys.argv[2:]))
+
         # Check if it's a known command (without slash prefix for CLI)
         known_commands = ["go", "startkie", "status", "intent", "spec", "interview", "eda",
                         "analyze", "map", "validate", "build", "preview", "doctor", "template", "help", "railscheck", "rails", "theme", "freeform", "sampledata", "simplify"]
@@ -0,0 +1,372 @@
+"""
+batch command - run KIE commands across many projects concurrently.
+
+Refreshing a portfolio of client projects after a data drop means running
+`/go --full` in each of them. The batch runner does that across a pool of
+worker processes:
+
+- Every project runs in its own freshly spawned process, so the global
+  SkillRegistry, run context and chart indexes are never shared between
+  projects (and a crash only takes down that project)
+- Per-project resource limits: wall-clock timeout, address space and CPU time
+- Each project's console output goes to its own log file
+- An aggregated report records outcome and timing per project and command
+
+Example:
+    >>> runner = BatchRunner(commands=["go --full"], workers=4, limits=ResourceLimits(timeout_seconds=1800))
+    >>> report = runner.run(resolve_project_roots(["clients/*"]))
+    >>> print(format_report(report))
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+DEFAULT_COMMANDS = ("go --full",)
+
+# Log file inside each project (when no log directory is given)
+PROJECT_LOG_NAME = "batch_run.log"
+
+
+@dataclass
+class ResourceLimits:
+    """Per-project limits (None: unlimited)."""
+    timeout_seconds: float | None = None
+    memory_mb: int | None = None
+    cpu_seconds: int | None = None
+
+
+@dataclass
+class ProjectOutcome:
+    """Outcome of one project's commands."""
+    project_root: str
+    status: str  # "succeeded", "failed", "timeout" or "crashed"
+    seconds: float = 0.0
+    commands: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+    log_path: str | None = None
+    max_rss_mb: float | None = None
+
+
+def resolve_project_roots(patterns: list[str]) -> list[Path]:
+    """
+    Expand project directories and glob patterns.
+
+    Args:
+        patterns: Directories or glob patterns (e.g. "clients/*")
+
+    Returns:
+        Unique, resolved project directories in pattern order
+    """
+    roots: list[Path] = []
+    seen: set[Path] = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            path = Path(match).resolve()
+            if path.is_dir() and path not in seen:
+                seen.add(path)
+                roots.append(path)
+    return roots
+
+
+def _apply_limits(limits: ResourceLimits) -> None:
+    """Apply address-space and CPU-time limits to the current process."""
+    if not HAS_RESOURCE:
+        return
+    if limits.memory_mb:
+        memory = limits.memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    if limits.cpu_seconds:
+        resource.setrlimit(resource.RLIMIT_CPU, (limits.cpu_seconds, limits.cpu_seconds + 5))
+
+
+def _project_worker(project_root: str, commands: list[str], limits: ResourceLimits, log_path: str, conn) -> None:
+    """
+    Run commands in one project (entry point of a spawned worker process).
+
+    Sends a ProjectOutcome dict through conn. Output (including subprocess
+    output) is redirected to log_path.
+    """
+    started = time.perf_counter()
+    outcome = ProjectOutcome(project_root=project_root, status="succeeded", log_path=log_path)
+    try:
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "a", encoding="utf-8") as log:
+            os.dup2(log.fileno(), 1)
+            os.dup2(log.fileno(), 2)
+            _apply_limits(limits)
+            os.chdir(project_root)
+
+            from kie.cli import KIEClient
+
+            client = KIEClient(project_root=Path(project_root))
+            for command in commands:
+                print(f"\n=== [{datetime.now().isoformat()}] /{command} ===", flush=True)
+                command_started = time.perf_counter()
+                _, succeeded = client.process_command("/" + command.lstrip("/"))
+                outcome.commands.append({
+                    "command": command,
+                    "success": succeeded,
+                    "seconds": round(time.perf_counter() - command_started, 3),
+                })
+                if not succeeded:
+                    outcome.status = "failed"
+                    outcome.error = f"/{command} failed"
+                    break
+    except BaseException as e:
+        outcome.status = "failed"
+        outcome.error = f"{type(e).__name__}: {e}"
+
+    outcome.seconds = round(time.perf_counter() - started, 3)
+    if HAS_RESOURCE:
+        outcome.max_rss_mb = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    conn.send(asdict(outcome))
+    conn.close()
+
+
+class BatchRunner:
+    """Run KIE commands across many projects in isolated worker processes."""
+
+    def __init__(
+        self,
+        commands: list[str] | tuple[str, ...] = DEFAULT_COMMANDS,
+        workers: int | None = None,
+        limits: ResourceLimits | None = None,
+        log_dir: Path | None = None,
+    ):
+        """
+        Initialize batch runner.
+
+        Args:
+            commands: Commands to run in each project, in order, without the
+                leading slash (e.g. "go --full"); a project stops at its first
+                failing command
+            workers: Projects run concurrently (None: one per CPU)
+            limits: Per-project resource limits
+            log_dir: Directory for per-project logs
+                (None: project_state/batch_run.log in each project)
+        """
+        self.commands = list(commands)
+        self.workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
+        self.limits = limits or ResourceLimits()
+        self.log_dir = Path(log_dir) if log_dir else None
+
+    def run(self, project_roots: list[Path]) -> dict[str, Any]:
+        """
+        Run the commands in every project.
+
+        Args:
+            project_roots: Project directories
+
+        Returns:
+            Aggregated report (see build_report())
+        """
+        started_at = datetime.now()
+        started = time.perf_counter()
+        # Spawned (not forked) workers start from a clean interpreter: no
+        # registry, caches or run context inherited from this process
+        mp_context = multiprocessing.get_context("spawn")
+
+        pending = deque(enumerate(project_roots))
+        running: dict[Any, tuple[int, Path, Any, float]] = {}
+        outcomes: list[ProjectOutcome | None] = [None] * len(project_roots)
+
+        while pending or running:
+            while pending and len(running) < self.workers:
+                index, root = pending.popleft()
+                parent_conn, child_conn = mp_context.Pipe(duplex=False)
+                process = mp_context.Process(
+                    target=_project_worker,
+                    args=(str(root), self.commands, self.limits, str(self._log_path(index, root)), child_conn),
+                    daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                running[parent_conn] = (index, root, process, time.perf_counter())
+
+            ready = wait(list(running), timeout=self._next_deadline(running))
+            now = time.perf_counter()
+            for conn in list(running):
+                index, root, process, project_started = running[conn]
+                if conn in ready:
+                    try:
+                        outcome = ProjectOutcome(**conn.recv())
+                    except EOFError:
+                        process.join()
+                        outcome = ProjectOutcome(
+                            project_root=str(root),
+                            status="crashed",
+                            error=f"Worker exited with code {process.exitcode}",
+                        )
+                elif self.limits.timeout_seconds and now - project_started >= self.limits.timeout_seconds:
+                    process.terminate()
+                    outcome = ProjectOutcome(
+                        project_root=str(root),
+                        status="timeout",
+                        error=f"Exceeded {self.limits.timeout_seconds}s",
+                    )
+                else:
+                    continue
+
+                process.join()
+                conn.close()
+                if outcome.log_path is None:
+                    outcome.log_path = str(self._log_path(index, root))
+                if not outcome.seconds:
+                    outcome.seconds = round(now - project_started, 3)
+                outcomes[index] = outcome
+                del running[conn]
+
+        return build_report(
+            [outcome for outcome in outcomes if outcome is not None],
+            commands=self.commands,
+            workers=self.workers,
+            started_at=started_at,
+            wall_seconds=time.perf_counter() - started,
+        )
+
+    def _log_path(self, index: int, root: Path) -> Path:
+        if self.log_dir is None:
+            return root / "project_state" / PROJECT_LOG_NAME
+        return self.log_dir / f"{index:03d}_{root.name}.log"
+
+    def _next_deadline(self, running: dict[Any, tuple[int, Path, Any, float]]) -> float | None:
+        """Seconds until the earliest running project times out (None: no timeout)."""
+        if not self.limits.timeout_seconds:
+            return None
+        now = time.perf_counter()
+        return max(0.0, min(
+            started + self.limits.timeout_seconds - now for _, _, _, started in running.values()
+        ))
+
+
+def build_report(
+    outcomes: list[ProjectOutcome],
+    commands: list[str],
+    workers: int,
+    started_at: datetime,
+    wall_seconds: float,
+) -> dict[str, Any]:
+    """
+    Aggregate project outcomes into a batch report.
+
+    Args:
+        outcomes: Outcome per project
+        commands: Commands that were run
+        workers: Concurrent workers used
+        started_at: Batch start time
+        wall_seconds: Batch wall-clock duration
+
+    Returns:
+        Report dict with per-project outcomes, status counts and per-command timings
+    """
+    statuses = {"succeeded": 0, "failed": 0, "timeout": 0, "crashed": 0}
+    command_timings: dict[str, dict[str, Any]] = {}
+    for outcome in outcomes:
+        statuses[outcome.status] = statuses.get(outcome.status, 0) + 1
+        for entry in outcome.commands:
+            timing = command_timings.setdefault(
+                entry["command"], {"runs": 0, "failures": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            timing["runs"] += 1
+            timing["failures"] += 0 if entry["success"] else 1
+            timing["total_seconds"] = round(timing["total_seconds"] + entry["seconds"], 3)
+            timing["max_seconds"] = max(timing["max_seconds"], entry["seconds"])
+
+    project_seconds = sum(outcome.seconds for outcome in outcomes)
+    return {
+        "started_at": started_at.isoformat(),
+        "commands": list(commands),
+        "workers": workers,
+        "projects": len(outcomes),
+        "success": statuses["succeeded"] == len(outcomes),
+        "statuses": statuses,
+        "wall_seconds": round(wall_seconds, 3),
+        "project_seconds": round(project_seconds, 3),
+        "speedup": round(project_seconds / wall_seconds, 2) if wall_seconds else None,
+        "command_timings": command_timings,
+        "outcomes": [asdict(outcome) for outcome in outcomes],
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Format a batch report as a human-readable summary."""
+    symbols = {"succeeded": "✓", "failed": "✗", "timeout": "⏱", "crashed": "💥"}
+    lines = ["\n" + "=" * 60, "KIE BATCH RUN", "=" * 60]
+    for outcome in report["outcomes"]:
+        line = f"{symbols.get(outcome['status'], '?')} {Path(outcome['project_root']).name:<36} {outcome['seconds']:>8.1f}s"
+        if outcome["error"]:
+            line += f"\n  └─ {outcome['error']} (log: {outcome['log_path']})"
+        lines.append(line)
+    lines.append("=" * 60)
+    counts = ", ".join(f"{count} {status}" for status, count in report["statuses"].items() if count)
+    lines.append(f"{report['projects']} projects: {counts or 'none run'}")
+    lines.append(
+        f"Wall time {report['wall_seconds']:.1f}s with {report['workers']} workers "
+        f"(project time {report['project_seconds']:.1f}s)"
+    )
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def batch_cli(argv: list[str]) -> int:
+    """
+    CLI entrypoint for batch command.
+
+    Args:
+        argv: Arguments after "batch"
+
+    Returns:
+        Exit code (0 = every project succeeded, 1 = otherwise)
+    """
+    parser = argparse.ArgumentParser(prog="kie batch", description="Run KIE commands across many projects")
+    parser.add_argument("projects", nargs="+", help="Project directories or glob patterns")
+    parser.add_argument(
+        "--command", "-c", action="append", dest="commands",
+        help='Command to run in each project (repeatable, default: "go --full")',
+    )
+    parser.add_argument("--workers", "-j", type=int, default=None, help="Concurrent projects (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=None, help="Wall-clock seconds per project")
+    parser.add_argument("--memory-mb", type=int, default=None, help="Address-space limit per project")
+    parser.add_argument("--cpu-seconds", type=int, default=None, help="CPU-time limit per project")
+    parser.add_argument("--log-dir", type=Path, default=None, help="Directory for per-project logs")
+    parser.add_argument("--report", type=Path, default=None, help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    project_roots = resolve_project_roots(args.projects)
+    if not project_roots:
+        print("No project directories matched")
+        return 1
+
+    runner = BatchRunner(
+        commands=args.commands or DEFAULT_COMMANDS,
+        workers=args.workers,
+        limits=ResourceLimits(
+            timeout_seconds=args.timeout, memory_mb=args.memory_mb, cpu_seconds=args.cpu_seconds
+        ),
+        log_dir=args.log_dir,
+    )
+    report = runner.run(project_roots)
+    print(format_report(report))
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2))
+        print(f"Report: {args.report}")
+
+    return 0 if report["success"] else 1
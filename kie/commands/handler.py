@@ -12,11 +12,7 @@ from typing import Any
 
 import yaml
 
-from kie.data import EDA, DataLoader
-from kie.insights import InsightCatalog, InsightEngine
 from kie.paths import ArtifactPaths
-from kie.powerpoint import SlideBuilder
-from kie.validation import ValidationConfig, ValidationPipeline
 
 # Observability imports (STEP 1: OBSERVABILITY)
 try:
@@ -1198,6 +1194,8 @@ class CommandHandler:
         Returns:
             Validation results
         """
+        from kie.validation import ValidationConfig, ValidationPipeline
+
         pipeline = ValidationPipeline(
             ValidationConfig(
                 strict=True,
@@ -1674,6 +1672,8 @@ class CommandHandler:
                         current_stage="build",
                         artifacts=artifacts_pass2,
                         evidence_ledger_id=None,
+                        # Pass 2 reads what Pass 1 published without re-parsing it
+                        artifact_cache=skill_context_pass1.artifact_cache,
                     )
                     # Pass build context to Pass 2 skills as well
                     skill_context_pass2.metadata["build_context"] = build_context
@@ -2073,6 +2073,8 @@ class CommandHandler:
             manifest = json.load(f)
 
         # Create presentation (theme is loaded internally via get_theme())
+        from kie.powerpoint import SlideBuilder
+
         builder = SlideBuilder(title=manifest.get("project_name", "Analysis"))
 
         # SLIDE 1: TITLE
@@ -2486,8 +2488,9 @@ class CommandHandler:
         data_path = selected_file
 
         # PHASE 3+4+5: Apply FULL INTELLIGENCE (same as handle_analyze)
-        loader = DataLoader()
-        loader.load(data_path)  # Auto-infers schema
+        from kie.run_context import load_data
+
+        loader, _ = load_data(data_path)  # Auto-infers schema
         schema = loader.schema
 
         # Read spec for overrides and objective
@@ -2623,8 +2626,12 @@ class CommandHandler:
         # Run EDA
         try:
             log("Running EDA analysis...")
+            from kie.data import EDA
+            from kie.run_context import get_run_context, load_data
+
             eda = EDA()
-            profile = eda.analyze(data_file)
+            _, df = load_data(data_file)
+            profile = eda.analyze(df)
             log(f"Analysis complete: {profile.rows} rows, {profile.columns} columns")
 
             # Save profile (both YAML and JSON for compatibility)
@@ -2634,20 +2641,21 @@ class CommandHandler:
             profile_path = paths.eda_profile_yaml(create_dirs=True)
             json_path = paths.eda_profile_json(create_dirs=True)
 
-            import yaml
+            from kie.run_context import write_artifact
             profile_dict = profile.to_dict()
 
-            # Save YAML
-            with open(profile_path, "w") as f:
-                yaml.dump(profile_dict, f, default_flow_style=False)
+            # Save YAML (written in the background during /go --full)
+            write_artifact(profile_path, profile_dict, fmt="yaml")
             log(f"Profile saved to: {profile_path}")
 
             # Also save JSON (for better compatibility with skills)
-            import json
-            with open(json_path, "w") as f:
-                json.dump(profile_dict, f, indent=2, default=str)
+            write_artifact(json_path, profile_dict, fmt="json", indent=2)
             log(f"Profile also saved as JSON: {json_path}")
 
+            run_ctx = get_run_context()
+            if run_ctx is not None:
+                run_ctx.profile = profile
+
             # Get suggestions
             suggestions = eda.suggest_analysis()
             log(f"Generated {len(suggestions)} analysis suggestions")
@@ -2918,8 +2926,11 @@ class CommandHandler:
         try:
             # CENTRALIZED INTELLIGENCE: Use DataLoader as the single source of truth
             from pathlib import Path
-            loader = DataLoader()
-            df = loader.load(Path(data_file))  # This auto-infers schema
+
+            from kie.insights import InsightEngine
+            from kie.run_context import load_data
+
+            loader, df = load_data(Path(data_file))  # This auto-infers schema (reused during /go --full)
 
             # Get schema from loader (already inferred during load)
             schema = loader.schema
@@ -3021,14 +3032,27 @@ class CommandHandler:
             catalog_path_yaml = paths.insights_yaml(create_dirs=True)
             catalog_path_json = paths.insights_catalog(create_dirs=True)
 
+            from kie.insights.table import remember_catalog
+            from kie.run_context import get_run_context, write_artifact
+            catalog_dict = catalog.to_dict()
+
             # Save as YAML (primary format)
-            catalog.save(str(catalog_path_yaml))
+            write_artifact(catalog_path_yaml, catalog_dict, fmt="yaml", sort_keys=False)
 
             # ALSO save as JSON for skill compatibility
-            # Skills expect insights_catalog.json, so write both formats
-            import json
-            with open(catalog_path_json, 'w', encoding='utf-8') as f:
-                json.dump(catalog.to_dict(), f, indent=2, ensure_ascii=False)
+            # Skills expect insights_catalog.json, so write both formats.
+            # Downstream skills in this run reuse the in-memory catalog.
+            write_artifact(
+                catalog_path_json,
+                catalog_dict,
+                fmt="json",
+                indent=2,
+                on_written=lambda path: remember_catalog(path, catalog),
+            )
+
+            run_ctx = get_run_context()
+            if run_ctx is not None:
+                run_ctx.catalog = catalog
 
             # Maps must be created explicitly via /map command
             # Auto-map generation removed to avoid incoherent outputs
@@ -3601,6 +3625,7 @@ To regenerate deliverables:
             ])
 
         return {
+            "success": True,
             **previews,
             "dashboard_url": dashboard_url,
             "total_outputs": total_count,
@@ -3850,8 +3875,9 @@ To regenerate deliverables:
 
         try:
             # Load data with intelligence
-            loader = DataLoader()
-            df = loader.load(Path(data_file))
+            from kie.run_context import load_data
+
+            loader, df = load_data(Path(data_file))
 
             # Detect geo columns explicitly (don't use suggest_column_mapping for geo!)
             # For geo columns, we need exact/fuzzy name matches, not semantic intelligence
@@ -4169,6 +4195,24 @@ To regenerate deliverables:
         Returns:
             Result dict with stages_executed list
         """
+        from kie.run_context import run_context
+
+        # Stages share loaded data and live artifacts instead of round-tripping through disk
+        with run_context(self.project_root):
+            return self._execute_full_stages(completed, workflow_started)
+
+    def _execute_full_stages(self, completed: list[str], workflow_started: bool) -> dict[str, Any]:
+        """
+        Run the full-mode stage loop inside an active run context.
+
+        Args:
+            completed: List of completed stages from rails_state
+            workflow_started: Whether workflow has started
+
+        Returns:
+            Result dict with stages_executed list
+        """
+        from kie.run_context import flush_run_context
         from kie.state import load_rails_state
 
         stages_executed = []
@@ -4231,6 +4275,9 @@ To regenerate deliverables:
                 elif stage == "preview":
                     result = self.handle_preview()
 
+                # Stage artifacts are on disk before the next stage starts
+                flush_run_context()
+
                 # Check if stage succeeded
                 if not result.get("success", False):
                     # BLOCKED: Stage failed
@@ -4734,8 +4781,8 @@ project_state/  - Project tracking
                 "total_versions": 0,
             }
 
-        with open(viz_plan_path) as f:
-            viz_plan = json.load(f)
+        from kie.run_context import read_artifact
+        viz_plan = read_artifact(viz_plan_path)
 
         specs = viz_plan.get("specifications", [])
 
@@ -4936,8 +4983,8 @@ project_state/  - Project tracking
         if not viz_plan_path.exists():
             raise FileNotFoundError("visualization_plan.json not found")
 
-        with open(viz_plan_path) as f:
-            viz_plan = json.load(f)
+        from kie.run_context import read_artifact
+        viz_plan = read_artifact(viz_plan_path)
 
         specs = viz_plan.get("specifications", [])
 
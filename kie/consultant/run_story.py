@@ -16,6 +16,8 @@ from typing import Any
 
 import yaml
 
+from kie.observability.ledger_store import get_ledger_store
+
 
 class RunStoryGenerator:
     """
@@ -90,22 +92,8 @@ class RunStoryGenerator:
         if not self.evidence_dir.exists():
             return []
 
-        entries = []
-        for ledger_file in sorted(self.evidence_dir.glob("*.yaml")):
-            with open(ledger_file) as f:
-                entry = yaml.safe_load(f)
-
-            # Filter by timestamp if requested
-            if since:
-                entry_time = entry.get("timestamp", "")
-                if entry_time < since:
-                    continue
-
-            entries.append(entry)
-
-        # Sort by timestamp
-        entries.sort(key=lambda e: e.get("timestamp", ""))
-        return entries
+        # Indexed store: filtered and ordered by timestamp without parsing every ledger
+        return get_ledger_store(self.evidence_dir).query(since=since)
 
     def _load_spec(self) -> dict[str, Any] | None:
         """Load project spec."""
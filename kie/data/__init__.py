@@ -5,14 +5,37 @@ Data loading, profiling, and exploratory data analysis.
 """
 
 from .loader import DataLoader, load_data
+from .compact import CompactOptions, CompactReport, compact_dtypes
+from .excel import read_excel
 from .profile import DataProfile, ColumnProfile
 from .eda import EDA, run_eda
+from .aggregation import AggregationCache, get_aggregation_cache
+from .sampling import (
+    ReservoirSampler,
+    SampleInfo,
+    SamplingPolicy,
+    get_sampling_policy,
+    set_sampling_policy,
+    stratified_sample,
+)
 
 __all__ = [
     "DataLoader",
     "load_data",
+    "CompactOptions",
+    "CompactReport",
+    "compact_dtypes",
+    "read_excel",
     "DataProfile",
     "ColumnProfile",
     "EDA",
     "run_eda",
+    "AggregationCache",
+    "get_aggregation_cache",
+    "ReservoirSampler",
+    "SampleInfo",
+    "SamplingPolicy",
+    "get_sampling_policy",
+    "set_sampling_policy",
+    "stratified_sample",
 ]
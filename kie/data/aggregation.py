@@ -0,0 +1,205 @@
+"""
+Shared Aggregation Cache
+
+Memoizes groupby aggregations so chart and insight generators that ask for
+the same (group keys, metric, aggregator, filters) over the same data only
+compute it once. Entries are keyed on a content fingerprint of the frame,
+evicted least-recently-used, and can optionally be persisted to disk so
+repeated commands over an unchanged dataset skip the groupby entirely.
+"""
+
+import hashlib
+import pickle
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Aggregators accepted by AggregationCache.aggregate (pandas groupby method names)
+SUPPORTED_AGGREGATIONS = {"sum", "mean", "median", "min", "max", "count", "nunique", "std"}
+
+
+class AggregationCache:
+    """
+    LRU cache of groupby results keyed on data fingerprint.
+
+    Example:
+        >>> cache = AggregationCache()
+        >>> revenue_by_region = cache.aggregate(df, "region", "revenue", "sum")
+    """
+
+    def __init__(self, max_entries: int = 256, persist_dir: Path | None = None):
+        """
+        Initialize aggregation cache.
+
+        Args:
+            max_entries: Maximum in-memory results before LRU eviction
+            persist_dir: Optional directory for on-disk results (pickle files)
+        """
+        self.max_entries = max_entries
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[tuple, pd.Series] = OrderedDict()
+        # id(df) -> fingerprint, dropped when the frame is garbage collected
+        self._fingerprints: dict[int, str] = {}
+
+    def fingerprint(self, df: pd.DataFrame) -> str:
+        """
+        Compute (or reuse) a content fingerprint for a DataFrame.
+
+        The fingerprint hashes columns, dtypes, index and every value, and is
+        remembered for the lifetime of the frame object. Frames must not be
+        mutated in place after they have been aggregated through the cache.
+
+        Args:
+            df: DataFrame
+
+        Returns:
+            Hex digest identifying the frame contents
+        """
+        frame_id = id(df)
+        cached = self._fingerprints.get(frame_id)
+        if cached is not None:
+            return cached
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((list(df.columns), [str(t) for t in df.dtypes], df.shape)).encode())
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+        except TypeError:
+            # Unhashable cell values (lists, dicts) - fall back to string form
+            row_hashes = pd.util.hash_pandas_object(df.astype(str), index=True).to_numpy()
+        digest.update(np.ascontiguousarray(row_hashes).tobytes())
+        fingerprint = digest.hexdigest()
+
+        self._fingerprints[frame_id] = fingerprint
+        weakref.finalize(df, self._fingerprints.pop, frame_id, None)
+        return fingerprint
+
+    def aggregate(
+        self,
+        df: pd.DataFrame,
+        by: str | list[str],
+        metric: str,
+        agg: str = "sum",
+        filters: dict[str, list[Any]] | None = None,
+    ) -> pd.Series:
+        """
+        Return df[filters].groupby(by)[metric].agg(agg), memoized.
+
+        Args:
+            df: Source data (treated as read-only)
+            by: Group column(s)
+            metric: Value column
+            agg: Aggregator name (see SUPPORTED_AGGREGATIONS)
+            filters: Optional column -> allowed values, applied before grouping
+
+        Returns:
+            Aggregated Series (a copy; safe to modify)
+
+        Raises:
+            ValueError: If agg is not supported
+        """
+        if agg not in SUPPORTED_AGGREGATIONS:
+            raise ValueError(
+                f"Unsupported aggregation '{agg}'. "
+                f"Use one of: {', '.join(sorted(SUPPORTED_AGGREGATIONS))}"
+            )
+
+        group_keys = (by,) if isinstance(by, str) else tuple(by)
+        # Typed keys: 1 and '1' select different rows
+        filter_key = tuple(
+            (col, tuple(sorted((type(value).__name__, repr(value)) for value in values)))
+            for col, values in sorted((filters or {}).items())
+        )
+        key = (self.fingerprint(df), group_keys, metric, agg, filter_key)
+
+        result = self._entries.get(key)
+        if result is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return result.copy()
+
+        result = self._load_persisted(key)
+        if result is None:
+            self.misses += 1
+            source = df
+            for col, values in (filters or {}).items():
+                source = source[source[col].isin(values)]
+            grouping = list(group_keys) if len(group_keys) > 1 else group_keys[0]
+            result = getattr(source.groupby(grouping)[metric], agg)()
+            self._persist(key, result)
+        else:
+            self.hits += 1
+
+        self._entries[key] = result
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result.copy()
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset statistics (disk entries are kept)."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counts and current size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def _persist_path(self, key: tuple) -> Path | None:
+        if self.persist_dir is None:
+            return None
+        name = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return self.persist_dir / f"{name}.pkl"
+
+    def _load_persisted(self, key: tuple) -> pd.Series | None:
+        path = self._persist_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Corrupt or incompatible entry - recompute
+            return None
+
+    def _persist(self, key: tuple, result: pd.Series) -> None:
+        path = self._persist_path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+
+
+# Global aggregation cache
+_global_cache = AggregationCache()
+
+
+def get_aggregation_cache() -> AggregationCache:
+    """
+    Get global aggregation cache instance.
+
+    Returns:
+        Global AggregationCache
+    """
+    return _global_cache
+
+
+def set_aggregation_cache(cache: AggregationCache) -> None:
+    """
+    Replace the global aggregation cache (e.g. to enable disk persistence).
+
+    Args:
+        cache: AggregationCache to use globally
+    """
+    global _global_cache
+    _global_cache = cache
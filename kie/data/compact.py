@@ -0,0 +1,206 @@
+"""
+Compact Dtypes
+
+Pandas infers wide dtypes at load time: int64/float64 for every number and
+plain strings for every text column, dates included. For analysis that is
+often 5-10x the memory the data needs, and groupbys on string keys are slow.
+
+compact_dtypes() rewrites a freshly loaded frame without changing its values:
+
+- Low-cardinality text becomes `category`
+- Date-like text is parsed with one format per value shape (cached)
+- Optionally, numbers are downcast (integers to the smallest type holding
+  them, floats to float32 when every value survives the round trip)
+- Optionally, remaining text uses the string dtype and numbers the pyarrow
+  backend
+
+Numeric downcasting is off by default: arithmetic on narrow columns
+(price * units on int16) overflows or loses precision.
+
+Compact loading is opt-in: DataLoader.load(path, compact=True), or
+KIE_COMPACT_LOAD=1 in the environment.
+
+Example:
+    >>> df, report = compact_dtypes(df)
+    >>> report.saved_bytes
+"""
+
+import os
+import re
+import warnings
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+@dataclass
+class CompactOptions:
+    """Which conversions compact_dtypes applies."""
+    # Narrow int/float dtypes (derived arithmetic can overflow; opt-in)
+    downcast_numeric: bool = False
+    # Text columns with at most this share of distinct values become categories
+    category_ratio: float = 0.5
+    max_categories: int = 10_000
+    parse_dates: bool = True
+    # Remaining text columns: None keeps them, "python"/"pyarrow" use pd.StringDtype
+    string_storage: str | None = None
+    # "pyarrow": numeric columns use pyarrow-backed dtypes (needs pyarrow)
+    dtype_backend: str | None = None
+
+
+@dataclass
+class CompactReport:
+    """Memory before/after a compact load and the conversions applied."""
+    memory_before: int
+    memory_after: int
+    # Column -> (dtype before, dtype after), changed columns only
+    conversions: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes saved by the conversions."""
+        return self.memory_before - self.memory_after
+
+    @property
+    def saved_ratio(self) -> float:
+        """Share of the original memory saved."""
+        return self.saved_bytes / self.memory_before if self.memory_before else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "memory_before_mb": round(self.memory_before / (1024 * 1024), 3),
+            "memory_after_mb": round(self.memory_after / (1024 * 1024), 3),
+            "saved_mb": round(self.saved_bytes / (1024 * 1024), 3),
+            "saved_ratio": round(self.saved_ratio, 4),
+            "conversions": {col: list(dtypes) for col, dtypes in self.conversions.items()},
+        }
+
+
+# Value shape (digits -> 9, letters -> a) -> datetime format (None: not a date)
+_date_format_cache: dict[str, str | None] = {}
+
+_DIGITS = re.compile(r"\d")
+_LETTERS = re.compile(r"[^\W\d_]")
+
+
+def _value_shape(value: str) -> str:
+    return _LETTERS.sub("a", _DIGITS.sub("9", value))
+
+
+def _date_format(value: str) -> str | None:
+    """Datetime format of a value, cached by the value's shape."""
+    shape = _value_shape(value)
+    if shape not in _date_format_cache:
+        fmt = None
+        # Dates need digits and a separator; bare numbers are not dates
+        if "9" in shape and re.search(r"[-/.:\s]", shape):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                fmt = guess_datetime_format(value)
+        _date_format_cache[shape] = fmt
+    return _date_format_cache[shape]
+
+
+def _is_text(series: pd.Series) -> bool:
+    return (
+        series.dtype == object or pd.api.types.is_string_dtype(series.dtype)
+    ) and not isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def _parse_dates(series: pd.Series) -> pd.Series | None:
+    """Parse a text column as datetimes if every value matches one format."""
+    values = series.dropna()
+    if values.empty or not isinstance(values.iloc[0], str):
+        return None
+    fmt = _date_format(values.iloc[0])
+    if fmt is None:
+        return None
+    parsed = pd.to_datetime(series, format=fmt, errors="coerce")
+    if parsed.notna().sum() != len(values):
+        return None
+    return parsed
+
+
+def _downcast(series: pd.Series) -> pd.Series:
+    """Smallest numeric dtype that holds every value exactly."""
+    if pd.api.types.is_bool_dtype(series.dtype) or not isinstance(series.dtype, np.dtype):
+        return series
+    if pd.api.types.is_signed_integer_dtype(series.dtype):
+        return pd.to_numeric(series, downcast="integer")
+    if series.dtype == np.float64:
+        narrow = series.astype(np.float32)
+        same = (narrow.astype(np.float64) == series) | series.isna()
+        if same.all():
+            return narrow
+    return series
+
+
+def compact_dtypes(df: pd.DataFrame, options: CompactOptions | None = None) -> tuple[pd.DataFrame, CompactReport]:
+    """
+    Convert a DataFrame to compact dtypes without changing its values.
+
+    Args:
+        df: DataFrame to convert (not modified)
+        options: Conversions to apply (default: CompactOptions())
+
+    Returns:
+        (compact DataFrame, CompactReport)
+    """
+    options = options or CompactOptions()
+    memory_before = int(df.memory_usage(deep=True).sum())
+    use_pyarrow = options.dtype_backend == "pyarrow"
+    if use_pyarrow and not HAS_PYARROW:
+        warnings.warn("dtype_backend='pyarrow' requires pyarrow; keeping numpy dtypes", stacklevel=2)
+        use_pyarrow = False
+
+    columns = {}
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            if options.downcast_numeric:
+                series = _downcast(series)
+            if use_pyarrow and not pd.api.types.is_bool_dtype(series.dtype):
+                series = series.convert_dtypes(dtype_backend="pyarrow")
+        elif _is_text(series):
+            parsed = _parse_dates(series) if options.parse_dates else None
+            if parsed is not None:
+                series = parsed
+            else:
+                distinct = series.nunique()
+                if distinct <= options.max_categories and distinct <= options.category_ratio * len(series):
+                    series = series.astype("category")
+                elif options.string_storage is not None:
+                    series = series.astype(pd.StringDtype(options.string_storage))
+        columns[position] = series
+
+    compact = pd.concat(columns, axis=1) if columns else df.copy()
+    compact.columns = df.columns
+    compact.index = df.index
+
+    conversions = {
+        str(col): (str(before), str(after))
+        for col, before, after in zip(df.columns, df.dtypes, compact.dtypes, strict=True)
+        if str(before) != str(after)
+    }
+    report = CompactReport(memory_before, int(compact.memory_usage(deep=True).sum()), conversions)
+    return compact, report
+
+
+def compact_from_environment() -> CompactOptions | None:
+    """Default compact options for DataLoader.load (KIE_COMPACT_LOAD=1 turns them on)."""
+    if os.getenv("KIE_COMPACT_LOAD", "").strip().lower() in ("1", "true", "yes"):
+        return CompactOptions()
+    return None
@@ -0,0 +1,212 @@
+"""
+Excel Ingestion
+
+Parsing a large workbook's XML dominates load time, and /eda, /analyze and
+/build each reload the same file. This module reads a sheet once and keeps
+the result as a cached columnar file keyed on the workbook's content hash:
+
+- Uses the calamine reader when python-calamine is installed (much faster
+  than openpyxl), otherwise pandas' default engine
+- Reads only the requested sheet (and optional A1-style cell range), so
+  workbooks with dozens of tabs don't parse every tab
+- Caches each (workbook, sheet, range, options) conversion as parquet when
+  pyarrow is available, pickle otherwise
+
+Caching is on for workbooks inside a KIE project (the cache lives in that
+project's project_state/excel_cache, whatever the working directory) or
+with an explicit cache_dir.
+
+Example:
+    >>> df = read_excel("data/client.xlsx", sheet="Sales", cell_range="B3:H500")
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+try:
+    import python_calamine  # noqa: F401
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Cache directory, relative to the project root
+EXCEL_CACHE_DIR = Path("project_state") / "excel_cache"
+
+_CELL_RANGE = re.compile(r"^([A-Z]+)(\d+)(?::([A-Z]+)(\d+)?)?$")
+
+# Resolved path -> ((mtime_ns, size), content hash); skips rehashing unchanged files
+_workbook_hashes: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def excel_engine() -> str | None:
+    """Fastest available Excel engine (None: pandas default)."""
+    return "calamine" if HAS_CALAMINE else None
+
+
+def parse_cell_range(cell_range: str) -> dict[str, Any]:
+    """
+    Translate an A1-style range into pandas read_excel arguments.
+
+    The first row of the range is the header row. "B3:H500" reads columns
+    B-H from row 3 (header) to row 500; "B3:H" and "B3" are open-ended.
+
+    Args:
+        cell_range: Range like "B3:H500"
+
+    Returns:
+        Dict of usecols/skiprows/nrows for pd.read_excel
+
+    Raises:
+        ValueError: If the range is malformed
+    """
+    match = _CELL_RANGE.match(cell_range.replace("$", "").strip().upper())
+    if match is None:
+        raise ValueError(f"Invalid cell range: {cell_range!r} (expected e.g. 'B3:H500')")
+    first_col, first_row, last_col, last_row = match.groups()
+    first_row = int(first_row)
+    if first_row < 1 or (last_row is not None and int(last_row) < first_row):
+        raise ValueError(f"Invalid cell range: {cell_range!r}")
+
+    args: dict[str, Any] = {"skiprows": first_row - 1}
+    if last_col is not None:
+        args["usecols"] = f"{first_col}:{last_col}"
+    if last_row is not None:
+        args["nrows"] = int(last_row) - first_row
+    return args
+
+
+def workbook_hash(path: Path | str) -> str:
+    """
+    Content hash of a workbook, reused while its mtime and size are unchanged.
+
+    Args:
+        path: Workbook path
+
+    Returns:
+        Hex digest of the file contents
+    """
+    path = Path(path)
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = str(path.resolve())
+    cached = _workbook_hashes.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    _workbook_hashes[key] = (signature, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def project_cache_dir(path: Path | str) -> Path | None:
+    """
+    Excel cache directory of the KIE project a workbook belongs to.
+
+    Args:
+        path: Workbook path (e.g. <project>/data/client.xlsx)
+
+    Returns:
+        <project>/project_state/excel_cache, or None if the workbook is not
+        inside a KIE project (no ancestor has a project_state/ directory)
+    """
+    for directory in Path(path).resolve().parents:
+        if (directory / EXCEL_CACHE_DIR.parent).is_dir():
+            return directory / EXCEL_CACHE_DIR
+    return None
+
+
+def _cache_path(cache_dir: Path, path: Path, options: dict[str, Any]) -> Path:
+    key = repr((workbook_hash(path), sorted(options.items()), pd.__version__))
+    name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return cache_dir / f"{path.stem}-{name}.{'parquet' if HAS_PYARROW else 'pkl'}"
+
+
+def _read_cached(cache_path: Path) -> pd.DataFrame | None:
+    if not cache_path.exists():
+        return None
+    try:
+        if cache_path.suffix == ".parquet":
+            return pd.read_parquet(cache_path)
+        return pd.read_pickle(cache_path)
+    except Exception:
+        # Corrupt or incompatible entry - convert again
+        return None
+
+
+def _write_cached(cache_path: Path, df: pd.DataFrame) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    if cache_path.suffix == ".parquet":
+        try:
+            df.to_parquet(tmp_path)
+        except Exception:
+            # Mixed-type object columns can't be stored as parquet
+            tmp_path.unlink(missing_ok=True)
+            return
+    else:
+        df.to_pickle(tmp_path)
+    tmp_path.replace(cache_path)
+
+
+def read_excel(
+    path: Path | str,
+    sheet: str | int = 0,
+    cell_range: str | None = None,
+    cache_dir: Path | str | None = None,
+    use_cache: bool = True,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Read one sheet of a workbook, through the columnar cache.
+
+    Args:
+        path: Workbook path (.xlsx or .xls)
+        sheet: Sheet name or 0-based position (only this sheet is parsed)
+        cell_range: Optional A1-style range (see parse_cell_range)
+        cache_dir: Cache directory (default: the workbook's project cache,
+            see project_cache_dir; no cache outside a KIE project)
+        use_cache: Set False to always parse the workbook
+        **kwargs: Additional arguments passed to pd.read_excel (sheet_name is
+            accepted as an alias for sheet)
+
+    Returns:
+        DataFrame with the sheet contents
+    """
+    path = Path(path)
+    sheet = kwargs.pop("sheet_name", sheet)
+    if sheet is None or isinstance(sheet, list):
+        raise ValueError("read_excel reads a single sheet; pass a sheet name or position")
+    if cell_range is not None:
+        kwargs.update(parse_cell_range(cell_range))
+    kwargs.setdefault("engine", excel_engine())
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else project_cache_dir(path)
+    cache_path = None
+    if use_cache and cache_dir is not None:
+        try:
+            cache_path = _cache_path(cache_dir, path, {"sheet": sheet, **kwargs})
+        except TypeError:
+            # Unorderable/unrepresentable options (e.g. callables mixed with strings)
+            cache_path = None
+        if cache_path is not None:
+            cached = _read_cached(cache_path)
+            if cached is not None:
+                return cached
+
+    df = pd.read_excel(path, sheet_name=sheet, **kwargs)
+    if cache_path is not None:
+        _write_cached(cache_path, df)
+    return df
@@ -8,10 +8,31 @@ Implements 4-Tier Semantic Scoring for robust metric selection.
 from pathlib import Path
 from typing import Optional, Union, List, Dict
 from dataclasses import dataclass
+import logging
 import pandas as pd
 import numpy as np
 import re
 
+from kie.data.compact import CompactOptions, CompactReport, compact_dtypes, compact_from_environment
+from kie.data.excel import read_excel
+from kie.utils.keyword_classifier import KeywordClassifier
+
+logger = logging.getLogger(__name__)
+
+# Column name tiers for numeric metric scoring (substring match on the lowercased name)
+COLUMN_NAME_TIERS = {
+    # Tier 1: Semantic Match
+    "is_percentage": ['rate', 'percent', 'margin', 'share', 'ratio', 'pct', '%'],
+    "is_growth": ['revenue', 'sales', 'profit', 'income', 'earnings', 'gain'],
+    "is_spend": ['cost', 'expense', 'spend', 'overhead', 'opex', 'capex'],
+    "is_monetary": ['price', 'amount', 'value', 'million', 'dollar', 'usd', 'budget'],
+    "is_count": ['count', 'number', 'quantity', 'qty', 'volume'],
+    # Tier 2: ID/ZipCode Avoidance
+    "is_id": ['id', 'code', 'zip', 'postal', 'ssn', 'key', 'index'],
+}
+
+_column_name_classifier = KeywordClassifier(COLUMN_NAME_TIERS)
+
 
 def extract_domain_keywords(objective: str) -> list[str]:
     """
@@ -112,11 +133,19 @@ class DataLoader:
         self.last_format: Optional[str] = None
         self.schema: Optional[DataSchema] = None
         self.encoding: Optional[str] = None
+        # Memory saved by the last compact load (None: not compacted)
+        self.compact_report: CompactReport | None = None
+        # Per-column features for column mapping (built with the schema)
+        self.column_features: pd.DataFrame | None = None
+        self._features_hash: int | None = None
+        # (schema hash, request, objective, overrides) -> mapping
+        self._mapping_memo: dict = {}
 
     def load(
         self,
         path: Union[str, Path],
         format: Optional[str] = None,
+        compact: bool | CompactOptions | None = None,
         **kwargs,
     ) -> pd.DataFrame:
         """
@@ -125,7 +154,11 @@ class DataLoader:
         Args:
             path: Path to data file
             format: Force specific format (csv, excel, json, parquet, tsv)
-            **kwargs: Additional arguments passed to pandas reader
+            compact: Convert to compact dtypes after loading (True, or
+                CompactOptions; None: KIE_COMPACT_LOAD environment default).
+                See kie.data.compact.
+            **kwargs: Additional arguments passed to pandas reader (Excel also
+                takes sheet, cell_range and cache_dir; see kie.data.excel)
 
         Returns:
             DataFrame with loaded data
@@ -165,7 +198,7 @@ class DataLoader:
                 self.encoding = kwargs['encoding']
                 df = pd.read_csv(path, **kwargs)
         elif format == "excel":
-            df = pd.read_excel(path, **kwargs)
+            df = read_excel(path, **kwargs)
         elif format == "json":
             df = pd.read_json(path, **kwargs)
         elif format == "parquet":
@@ -175,6 +208,14 @@ class DataLoader:
         else:
             raise ValueError(f"Unsupported format: {format}")
 
+        # Opt-in compact dtypes (downcast numerics, categories, parsed dates)
+        if compact is None:
+            compact = compact_from_environment()
+        if compact:
+            df, self.compact_report = compact_dtypes(df, compact if isinstance(compact, CompactOptions) else None)
+        else:
+            self.compact_report = None
+
         # Store for reference
         self.last_loaded = df
         self.last_path = path
@@ -189,15 +230,18 @@ class DataLoader:
         """Infer schema from loaded data."""
         if self.last_loaded is None:
             self.schema = None
+            self.column_features = None
             return
 
         df = self.last_loaded
 
         # Categorize columns by type
         numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+        categorical_cols = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
         datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
 
+        self._build_column_features(df, numeric_cols, categorical_cols)
+
         # Generate intelligent suggestions (inline, without calling suggest_column_mapping)
         # Suggest entity/category column (categorical with reasonable cardinality)
         suggested_entity = None
@@ -206,7 +250,7 @@ class DataLoader:
         category_candidates = []
 
         for col in categorical_cols:
-            unique_count = df[col].nunique()
+            unique_count = self.column_features.at[col, "cardinality"]
             total_rows = len(df)
             uniqueness_ratio = unique_count / total_rows if total_rows > 0 else 0
             col_lower = col.lower()
@@ -264,6 +308,75 @@ class DataLoader:
             suggested_metric_columns=suggested_metrics if suggested_metrics else None
         )
 
+    @staticmethod
+    def _schema_hash(df: pd.DataFrame) -> int:
+        """Hash of a frame's column names, dtypes and row count."""
+        return hash((tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes), len(df)))
+
+    def _build_column_features(
+        self, df: pd.DataFrame, numeric_cols: list[str], categorical_cols: list[str]
+    ) -> pd.DataFrame:
+        """
+        Precompute the per-column feature table used by suggest_column_mapping.
+
+        One row per column: lowercased name, name tier hits (COLUMN_NAME_TIERS),
+        mean/std/CV (numeric columns), cardinality (categorical columns),
+        null ratio, and the error raised while computing statistics (if any).
+
+        Returns:
+            The feature table (also kept as self.column_features)
+        """
+        names = [str(col) for col in df.columns]
+        tier_hits = _column_name_classifier.classify_batch(names)
+        null_ratio = df.isna().mean().to_numpy() if len(df) > 0 else np.zeros(len(df.columns))
+        duplicated = df.columns.duplicated(keep=False)
+        numeric = set(numeric_cols)
+        categorical = set(categorical_cols)
+
+        rows = []
+        for position, (col, name, hits) in enumerate(zip(df.columns, names, tier_hits, strict=True)):
+            row = {
+                "name_lower": name.lower(),
+                **{tier: tier in hits for tier in COLUMN_NAME_TIERS},
+                "mean": np.nan,
+                "std": np.nan,
+                "cv": 0.0,
+                "cardinality": np.nan,
+                "null_ratio": float(null_ratio[position]),
+                "error": None,
+            }
+            try:
+                if duplicated[position]:
+                    raise ValueError(f"duplicate column name '{col}'")
+                if col in numeric:
+                    mean = df[col].mean()
+                    std = df[col].std()
+                    row["mean"], row["std"] = float(mean), float(std)
+                    row["cv"] = float(std / mean) if mean > 0 and not pd.isna(std) else 0.0
+                if col in categorical:
+                    row["cardinality"] = df[col].nunique()
+            except Exception as e:
+                row["error"] = str(e)
+            rows.append(row)
+
+        # Duplicate names share one row (first occurrence); it carries the error
+        features = pd.DataFrame(rows, index=df.columns)
+        features = features[~features.index.duplicated()]
+        self.column_features = features
+        self._features_hash = self._schema_hash(df)
+        self._mapping_memo = {}
+        return features
+
+    def _get_column_features(self) -> pd.DataFrame:
+        """Feature table of the loaded frame (rebuilt if its schema changed since load)."""
+        if self.last_loaded is None or self.schema is None:
+            raise ValueError("No data loaded. Call load() first.")
+        if self.column_features is None or self._features_hash != self._schema_hash(self.last_loaded):
+            return self._build_column_features(
+                self.last_loaded, self.schema.numeric_columns, self.schema.categorical_columns
+            )
+        return self.column_features
+
     def suggest_column_mapping(
         self,
         required_columns: List[str],
@@ -290,13 +403,48 @@ class DataLoader:
 
         Returns:
             Dict mapping required names to actual column names (or None if not found)
+
+        Scoring reads the feature table built at load time (no per-request
+        statistics), and results are memoized per (schema, request, objective,
+        overrides).
         """
         if self.last_loaded is None or self.schema is None:
             raise ValueError("No data loaded. Call load() first.")
 
-        mapping = {}
-        used_columns = set()
         overrides = overrides or {}
+        features = self._get_column_features()
+        try:
+            memo_key = (
+                self._features_hash,
+                tuple(required_columns),
+                objective_text,
+                tuple(sorted(overrides.items())),
+            )
+            hash(memo_key)
+        except TypeError:
+            memo_key = None
+        if memo_key is not None and memo_key in self._mapping_memo:
+            return dict(self._mapping_memo[memo_key])
+
+        mapping = self._map_columns(required_columns, overrides, objective_text, features)
+        if memo_key is not None:
+            self._mapping_memo[memo_key] = dict(mapping)
+        return mapping
+
+    def _map_columns(
+        self,
+        required_columns: list[str],
+        overrides: dict[str, str],
+        objective_text: str | None,
+        features: pd.DataFrame,
+    ) -> dict[str, str | None]:
+        """Map required columns to actual columns (see suggest_column_mapping)."""
+        if self.last_loaded is None or self.schema is None:
+            raise ValueError("No data loaded. Call load() first.")
+
+        mapping: dict[str, str | None] = {}
+        used_columns = set()
+        names_lower = features["name_lower"]
 
         for req_col in required_columns:
             # PHASE 5: HUMAN OVERRIDE - God Mode
@@ -318,7 +466,7 @@ class DataLoader:
 
             # Try exact match first (case-insensitive)
             for actual_col in self.schema.columns:
-                if actual_col.lower() == req_lower and actual_col not in used_columns:
+                if names_lower[actual_col] == req_lower and actual_col not in used_columns:
                     mapping[req_col] = actual_col
                     used_columns.add(actual_col)
                     break
@@ -326,7 +474,7 @@ class DataLoader:
                 # Try fuzzy match (contains)
                 for actual_col in self.schema.columns:
                     if actual_col not in used_columns:
-                        if req_lower in actual_col.lower() or actual_col.lower() in req_lower:
+                        if req_lower in names_lower[actual_col] or names_lower[actual_col] in req_lower:
                             mapping[req_col] = actual_col
                             used_columns.add(actual_col)
                             break
@@ -350,7 +498,7 @@ class DataLoader:
                     spend_terms = ['spend', 'cost', 'expense', 'budget', 'overhead']
                     prefer_spend = any(term in req_lower for term in spend_terms)
 
-                    candidate = None
+                    candidate: str | None = None
                     unused_numeric = [c for c in self.schema.numeric_columns if c not in used_columns]
                     unused_categorical = [c for c in self.schema.categorical_columns if c not in used_columns]
 
@@ -360,7 +508,7 @@ class DataLoader:
                         best_cat = None
                         best_score = -1
                         for cat_col in unused_categorical:
-                            cardinality = self.last_loaded[cat_col].nunique()
+                            cardinality = features.at[cat_col, "cardinality"]
                             total_rows = len(self.last_loaded)
 
                             # Prefer moderate cardinality (2-20 unique values)
@@ -381,109 +529,16 @@ class DataLoader:
 
                     # If requesting numeric - Apply 5-Tier Scoring (with Tier 0: Objective Keywords)
                     elif unused_numeric:
-                        # Extract objective keywords if provided
-                        objective_keywords = extract_domain_keywords(objective_text) if objective_text else []
-
-                        scores = {}
-                        for col in unused_numeric:
-                            try:
-                                col_lower = col.lower()
-                                mean = self.last_loaded[col].mean()
-                                std = self.last_loaded[col].std()
-                                cv = (std / mean) if mean > 0 and not pd.isna(std) else 0
-
-                                # TIER 0: OBJECTIVE KEYWORD MATCH (HIGHEST PRIORITY)
-                                # If user's objective mentions specific terms, STRONGLY boost those columns
-                                objective_match = False
-                                if objective_keywords:
-                                    for keyword in objective_keywords:
-                                        if keyword in col_lower:
-                                            objective_match = True
-                                            break
-
-                                # TIER 1: Semantic Match
-                                percentage_keywords = ['rate', 'percent', 'margin', 'share', 'ratio', 'pct', '%']
-                                is_percentage = any(kw in col_lower for kw in percentage_keywords)
-
-                                growth_keywords = ['revenue', 'sales', 'profit', 'income', 'earnings', 'gain']
-                                is_growth = any(kw in col_lower for kw in growth_keywords)
-
-                                spend_keywords = ['cost', 'expense', 'spend', 'overhead', 'opex', 'capex']
-                                is_spend = any(kw in col_lower for kw in spend_keywords)
-
-                                monetary_keywords = ['price', 'amount', 'value', 'million', 'dollar', 'usd', 'budget']
-                                is_monetary = any(kw in col_lower for kw in monetary_keywords)
-
-                                count_keywords = ['count', 'number', 'quantity', 'qty', 'volume']
-                                is_count = any(kw in col_lower for kw in count_keywords)
-
-                                # TIER 2: ID/ZipCode Avoidance
-                                id_keywords = ['id', 'code', 'zip', 'postal', 'ssn', 'key', 'index']
-                                is_id = any(kw in col_lower for kw in id_keywords)
-
-                                if is_id:
-                                    scores[col] = 0.0001  # Nearly zero
-                                    continue
-
-                                # Statistical ID detection: High mean + low variance
-                                if mean > 10000 and cv < 0.01:
-                                    scores[col] = 0.001  # Likely ID/ZipCode
-                                    continue
-
-                                # Low variance = constant/boring
-                                if cv < 0.05:
-                                    scores[col] = 0.01
-                                    continue
-
-                                # TIER 3 & 4: Score by CV + Semantic Boosts
-                                base_score = cv if cv > 0 else 0.01
-
-                                # TIER 3: Percentage/Ratio Handling
-                                if prefer_percentage and is_percentage:
-                                    # Massive boost - even if mean is 0.15, it's the RIGHT metric
-                                    base_score *= 10.0
-
-                                # Directional Semantics (Growth vs Spend)
-                                elif prefer_growth:
-                                    if is_growth:
-                                        base_score *= 8.0
-                                    elif is_spend:
-                                        base_score *= 0.3  # Penalize cost when seeking growth
-
-                                elif prefer_spend:
-                                    if is_spend:
-                                        base_score *= 8.0
-                                    elif is_growth:
-                                        base_score *= 0.3  # Penalize revenue when seeking spend
-
-                                # Legacy revenue boost
-                                elif prefer_revenue:
-                                    if is_growth or is_spend or is_monetary:
-                                        base_score *= 5.0
-                                    elif is_count:
-                                        base_score *= 0.5
-
-                                # TIER 4: Magnitude handling (tie-breaker only)
-                                # DO NOT penalize small percentages!
-                                if not is_percentage and mean > 100:
-                                    base_score *= 1.1  # Tiny nudge for larger values
-
-                                # TIER 0 BOOST: Apply MASSIVE multiplier if column matches objective keywords
-                                if objective_match:
-                                    base_score *= 50.0  # DOMINATES all other scoring
-
-                                scores[col] = base_score
-
-                            except Exception as e:
-                                # ISSUE #2 FIX: Log exception instead of silent failure
-                                import logging
-                                logger = logging.getLogger(__name__)
-                                logger.warning(f"Column scoring failed for '{col}': {e}")
-                                scores[col] = 0.1  # Minimal fallback score instead of zero
-
-                        # Pick column with highest score
-                        if scores:
-                            candidate = max(scores, key=scores.get)
+                        scores = self._score_numeric_columns(
+                            features.loc[unused_numeric],
+                            objective_text,
+                            prefer_percentage=prefer_percentage,
+                            prefer_growth=prefer_growth,
+                            prefer_spend=prefer_spend,
+                            prefer_revenue=prefer_revenue,
+                        )
+                        # Pick column with highest score (first on ties)
+                        candidate = unused_numeric[int(np.argmax(scores))]
 
                     elif unused_categorical:
                         candidate = unused_categorical[0]
@@ -494,6 +549,71 @@ class DataLoader:
 
         return mapping
 
+    def _score_numeric_columns(
+        self,
+        table: pd.DataFrame,
+        objective_text: str | None,
+        prefer_percentage: bool,
+        prefer_growth: bool,
+        prefer_spend: bool,
+        prefer_revenue: bool,
+    ) -> np.ndarray:
+        """
+        Score candidate numeric columns for one request, vectorized over the feature table.
+
+        Args:
+            table: Feature table rows of the candidate columns
+            objective_text: Optional user objective (Tier 0 keywords)
+            prefer_*: Semantic hints parsed from the request
+
+        Returns:
+            Score per candidate, in table order
+        """
+        mean = table["mean"].to_numpy(dtype=float)
+        cv = table["cv"].to_numpy(dtype=float)
+        is_percentage = table["is_percentage"].to_numpy(dtype=bool)
+        is_growth = table["is_growth"].to_numpy(dtype=bool)
+        is_spend = table["is_spend"].to_numpy(dtype=bool)
+        is_monetary = table["is_monetary"].to_numpy(dtype=bool)
+        is_count = table["is_count"].to_numpy(dtype=bool)
+
+        # TIER 3 & 4: Score by CV + Semantic Boosts
+        scores = np.where(cv > 0, cv, 0.01)
+
+        # Directional Semantics (Growth vs Spend), then legacy revenue boost
+        if prefer_growth:
+            directional = np.where(is_growth, 8.0, np.where(is_spend, 0.3, 1.0))
+        elif prefer_spend:
+            directional = np.where(is_spend, 8.0, np.where(is_growth, 0.3, 1.0))
+        elif prefer_revenue:
+            directional = np.where(is_growth | is_spend | is_monetary, 5.0, np.where(is_count, 0.5, 1.0))
+        else:
+            directional = np.ones(len(table))
+
+        # TIER 3: Percentage/Ratio Handling - massive boost, even if mean is 0.15
+        scores = scores * np.where(prefer_percentage & is_percentage, 10.0, directional)
+
+        # TIER 4: Magnitude handling (tie-breaker only) - DO NOT penalize small percentages
+        scores = scores * np.where(~is_percentage & (mean > 100), 1.1, 1.0)
+
+        # TIER 0: OBJECTIVE KEYWORD MATCH - DOMINATES all other scoring
+        objective_keywords = extract_domain_keywords(objective_text) if objective_text else []
+        if objective_keywords:
+            objective_match = np.array([
+                any(keyword in name for keyword in objective_keywords) for name in table["name_lower"]
+            ], dtype=bool)
+            scores = scores * np.where(objective_match, 50.0, 1.0)
+
+        # ID-like (TIER 2 names, or high mean + low variance) and constant columns
+        failed = table["error"].notna().to_numpy()
+        for col, error in table["error"][failed].items():
+            logger.warning(f"Column scoring failed for '{col}': {error}")
+        return np.select(
+            [failed, table["is_id"].to_numpy(dtype=bool), (mean > 10000) & (cv < 0.01), cv < 0.05],
+            [0.1, 0.0001, 0.001, 0.01],
+            scores,
+        )
+
     def info(self) -> dict:
         """Get info about last loaded data."""
         if self.last_loaded is None:
@@ -515,6 +635,9 @@ class DataLoader:
                 "datetime_columns": self.schema.datetime_columns,
             })
 
+        if self.compact_report:
+            info_dict["compact"] = self.compact_report.to_dict()
+
         return info_dict
 
     def get_summary(self) -> str:
@@ -530,6 +653,13 @@ class DataLoader:
         if self.encoding:
             summary_lines.append(f"Encoding: {self.encoding}")
 
+        if self.compact_report:
+            report = self.compact_report
+            summary_lines.append(
+                f"Compact dtypes: {report.memory_after / (1024 * 1024):.1f} MB "
+                f"(saved {report.saved_bytes / (1024 * 1024):.1f} MB, {report.saved_ratio:.0%})"
+            )
+
         return "\n".join(summary_lines)
 
 
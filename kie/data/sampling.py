@@ -0,0 +1,356 @@
+"""
+Deterministic Sampling
+
+Coarse analyses (distributions, group comparisons, correlations) don't need
+every row of a 100M-row table. This module builds seeded, reproducible
+samples and the error bounds that go with them:
+
+- Stratified samples keyed by group columns (every group keeps at least
+  min_per_stratum rows, so small groups aren't lost)
+- Reservoir sampling for streaming sources (chunked reads), independent of
+  chunk sizes
+- Confidence intervals for means and totals, with finite population correction
+
+Sampling is opt-in: analyses declare that they tolerate it with
+@tolerates_sampling and only sample when a SamplingPolicy is active
+(set_sampling_policy(), or KIE_SAMPLE_ROWS=<max rows> in the environment).
+
+Example:
+    >>> sample, info = stratified_sample(df, 100_000, strata=["region"], seed=7)
+    >>> mean, low, high = mean_confidence_interval(sample["revenue"], info.population_rows)
+"""
+
+import math
+import os
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from statistics import NormalDist
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SEED = 0
+
+# Rows kept per stratum even when its proportional share is smaller
+MIN_ROWS_PER_STRATUM = 30
+
+
+@dataclass
+class SamplingPolicy:
+    """When and how tolerant analyses sample their input."""
+    max_rows: int = 1_000_000  # Inputs with more rows than this are sampled down to it
+    seed: int = DEFAULT_SEED
+    confidence: float = 0.95
+    min_per_stratum: int = MIN_ROWS_PER_STRATUM
+
+    def applies_to(self, n_rows: int) -> bool:
+        """Whether an input of n_rows rows should be sampled."""
+        return n_rows > self.max_rows
+
+
+@dataclass
+class SampleInfo:
+    """How a sample was drawn (recorded alongside results computed from it)."""
+    method: str  # "stratified", "random", "reservoir" or "full"
+    population_rows: int
+    sample_rows: int
+    seed: int
+    strata: list[str] = field(default_factory=list)
+    # Stratum key -> (population rows, sample rows); kept out of to_dict()
+    stratum_sizes: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def fraction(self) -> float:
+        """Sampled fraction of the population."""
+        return self.sample_rows / self.population_rows if self.population_rows else 1.0
+
+    @property
+    def is_sampled(self) -> bool:
+        """Whether the sample is smaller than the population."""
+        return self.sample_rows < self.population_rows
+
+    def weight(self, stratum: str | None = None) -> float:
+        """
+        Population rows each sampled row stands for.
+
+        Args:
+            stratum: Stratum key (None: overall)
+
+        Returns:
+            Expansion weight (1.0 for unsampled data)
+        """
+        if stratum is not None and stratum in self.stratum_sizes:
+            population, sample = self.stratum_sizes[stratum]
+            return population / sample if sample else 1.0
+        return 1 / self.fraction if self.sample_rows else 1.0
+
+    def to_dict(self) -> dict[str, Any]:
+        info = asdict(self)
+        # One entry per stratum can be as large as the sample itself
+        del info["stratum_sizes"]
+        info["n_strata"] = len(self.stratum_sizes)
+        info["fraction"] = round(self.fraction, 6)
+        return info
+
+
+def _stratum_keys(first_rows: pd.DataFrame) -> list[str]:
+    """Key of each stratum from its first row ("North | Retail" for two strata columns)."""
+    keys = first_rows.iloc[:, 0].astype(str)
+    for position in range(1, first_rows.shape[1]):
+        keys = keys + " | " + first_rows.iloc[:, position].astype(str)
+    return list(keys)
+
+
+def _allocate(sizes: np.ndarray, n: int, floors: np.ndarray) -> np.ndarray:
+    """
+    Proportional allocation of n rows with per-stratum floors (sum(floors) < n).
+
+    Strata whose proportional share is below their floor get the floor; the
+    remaining rows are shared proportionally (largest remainders rounded up)
+    among the other strata, so the total is exactly n.
+    """
+    fixed = np.zeros(len(sizes), dtype=bool)
+    while True:
+        budget = n - int(floors[fixed].sum())
+        free_population = int(sizes[~fixed].sum())
+        quotas = np.where(fixed, 0.0, budget * sizes / max(free_population, 1))
+        below = ~fixed & (quotas < floors)
+        if not below.any():
+            break
+        fixed |= below
+
+    allocation = np.where(fixed, floors, np.floor(quotas)).astype(np.int64)
+    shortfall = n - int(allocation.sum())
+    if shortfall > 0:
+        remainders = np.where(fixed, -1.0, quotas - np.floor(quotas))
+        allocation[np.argsort(-remainders, kind="stable")[:shortfall]] += 1
+    np.minimum(allocation, sizes, out=allocation)
+    return allocation
+
+
+def stratified_sample(
+    df: pd.DataFrame,
+    n: int,
+    strata: list[str] | None = None,
+    seed: int = DEFAULT_SEED,
+    min_per_stratum: int = MIN_ROWS_PER_STRATUM,
+) -> tuple[pd.DataFrame, SampleInfo]:
+    """
+    Draw a seeded sample with proportional allocation across strata.
+
+    Each stratum gets at least min_per_stratum rows (or all of its rows);
+    the rest of n is shared proportionally, so the sample has exactly n
+    rows. When the floors alone would reach n (too many strata), a simple
+    random sample is drawn instead (method "random"). Sampled rows keep
+    their original order.
+
+    Args:
+        df: DataFrame to sample
+        n: Target sample size
+        strata: Columns whose value combinations are sampled separately
+            (None: simple random sample)
+        seed: Random seed (same seed and data -> same sample)
+        min_per_stratum: Minimum rows per stratum
+
+    Returns:
+        (sample, SampleInfo); the full DataFrame if it has at most n rows
+    """
+    strata = list(strata or [])
+    population = len(df)
+    if population <= n:
+        return df, SampleInfo("full", population, population, seed, strata)
+
+    codes = np.zeros(population, dtype=np.int64)
+    if strata:
+        codes = df.groupby(strata, sort=False, dropna=False).ngroup().to_numpy()
+        if np.minimum(np.bincount(codes), min_per_stratum).sum() >= n:
+            # Too many strata to honour the floors within n rows
+            strata, codes = [], np.zeros(population, dtype=np.int64)
+    sizes = np.bincount(codes)
+    allocation = _allocate(sizes, n, np.minimum(sizes, min_per_stratum) if strata else np.zeros_like(sizes))
+
+    # Within each stratum keep the rows with the smallest random keys
+    rng = np.random.default_rng(seed)
+    order = np.lexsort((rng.random(population), codes))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    sorted_codes = codes[order]
+    position = np.arange(population) - starts[sorted_codes]
+    chosen = np.sort(order[position < allocation[sorted_codes]])
+    sample = df.iloc[chosen]
+
+    stratum_sizes = {}
+    if strata:
+        first_rows = np.unique(codes, return_index=True)[1]
+        keys = _stratum_keys(df[strata].iloc[first_rows])
+        stratum_sizes = dict(zip(keys, zip(sizes.tolist(), allocation.tolist(), strict=True), strict=True))
+
+    method = "stratified" if strata else "random"
+    return sample, SampleInfo(method, population, len(sample), seed, strata, stratum_sizes)
+
+
+class ReservoirSampler:
+    """
+    Fixed-size uniform sample of a stream of DataFrame chunks (Algorithm R).
+
+    The sample depends only on the seed and the rows seen, not on how the
+    stream was chunked.
+    """
+
+    def __init__(self, size: int, seed: int = DEFAULT_SEED):
+        """
+        Initialize an empty reservoir.
+
+        Args:
+            size: Rows to keep
+            seed: Random seed
+        """
+        self.size = size
+        self.seed = seed
+        self.seen = 0
+        self._rng = np.random.default_rng(seed)
+        self._rows: pd.DataFrame | None = None  # Reservoir slots, in slot order
+        self._arrival = np.empty(0, dtype=np.int64)  # Stream position of each slot
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        """
+        Offer the next chunk of the stream.
+
+        Args:
+            chunk: Rows in stream order
+        """
+        n = len(chunk)
+        if n == 0:
+            return
+        arrival = np.arange(self.seen, self.seen + n)
+        rows, slots_arrival = self._rows, self._arrival
+
+        # Fill phase: the first `size` rows of the stream go straight in
+        fill = min(n, self.size - len(slots_arrival))
+        if fill > 0:
+            head = chunk.iloc[:fill]
+            rows = head if rows is None else pd.concat([rows, head])
+            slots_arrival = np.concatenate([slots_arrival, arrival[:fill]])
+
+        # Replacement phase: stream row i replaces slot j ~ U[0, i] if j < size
+        if fill < n:
+            positions = arrival[fill:]
+            slots = (self._rng.random(len(positions)) * (positions + 1)).astype(np.int64)
+            hits = np.flatnonzero(slots < self.size)
+            if len(hits):
+                # A slot hit twice within the chunk keeps the later row
+                reversed_hits = hits[::-1]
+                _, last = np.unique(slots[reversed_hits], return_index=True)
+                keep = reversed_hits[last]
+                targets = slots[keep]
+                combined = pd.concat([rows, chunk.iloc[fill:].iloc[keep]])
+                indexer = np.arange(self.size)
+                indexer[targets] = self.size + np.arange(len(keep))
+                rows = combined.iloc[indexer]
+                slots_arrival = slots_arrival.copy()
+                slots_arrival[targets] = positions[keep]
+
+        self._rows, self._arrival = rows, slots_arrival
+        self.seen += n
+
+    def sample(self) -> tuple[pd.DataFrame, SampleInfo]:
+        """
+        Current sample, in stream order.
+
+        Returns:
+            (sample, SampleInfo)
+        """
+        if self._rows is None:
+            return pd.DataFrame(), SampleInfo("reservoir", 0, 0, self.seed)
+        sample = self._rows.iloc[np.argsort(self._arrival, kind="stable")]
+        method = "reservoir" if self.seen > self.size else "full"
+        return sample, SampleInfo(method, self.seen, len(sample), self.seed)
+
+
+def mean_confidence_interval(
+    values: pd.Series,
+    population_size: int | None = None,
+    confidence: float = 0.95,
+) -> tuple[float, float, float]:
+    """
+    Normal-approximation confidence interval of a sample mean.
+
+    Args:
+        values: Sampled values (NaN ignored)
+        population_size: Population rows (applies the finite population
+            correction; a sample covering the population has zero width)
+        confidence: Confidence level
+
+    Returns:
+        (mean, low, high)
+    """
+    clean = values.dropna()
+    n = len(clean)
+    if n == 0:
+        return (math.nan, math.nan, math.nan)
+    mean = float(clean.mean())
+    if n < 2:
+        return (mean, mean, mean)
+
+    standard_error = float(clean.std()) / math.sqrt(n)
+    if population_size is not None:
+        if population_size <= n:
+            return (mean, mean, mean)
+        standard_error *= math.sqrt((population_size - n) / (population_size - 1))
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * standard_error
+    return (mean, mean - half_width, mean + half_width)
+
+
+def total_confidence_interval(
+    values: pd.Series,
+    population_size: int,
+    confidence: float = 0.95,
+) -> tuple[float, float, float]:
+    """
+    Estimated population total of sampled values, with its confidence interval.
+
+    Missing values count as zero (like a sum over the population).
+
+    Args:
+        values: Sampled values
+        population_size: Population rows the sample was drawn from
+        confidence: Confidence level
+
+    Returns:
+        (total, low, high)
+    """
+    mean, low, high = mean_confidence_interval(values.fillna(0), population_size, confidence)
+    return (mean * population_size, low * population_size, high * population_size)
+
+
+def tolerates_sampling(func: Callable) -> Callable:
+    """Mark an analysis as valid on a representative sample of its input."""
+    func.tolerates_sampling = True  # type: ignore[attr-defined]
+    return func
+
+
+def is_sampling_tolerant(func: Callable) -> bool:
+    """Whether an analysis was marked with @tolerates_sampling."""
+    return getattr(func, "tolerates_sampling", False)
+
+
+def _policy_from_environment() -> SamplingPolicy | None:
+    max_rows = os.getenv("KIE_SAMPLE_ROWS", "").strip()
+    if not max_rows or not max_rows.isdigit() or int(max_rows) == 0:
+        return None
+    return SamplingPolicy(max_rows=int(max_rows), seed=int(os.getenv("KIE_SAMPLE_SEED", DEFAULT_SEED)))
+
+
+# Global sampling policy (None: analyses use every row)
+_policy: SamplingPolicy | None = _policy_from_environment()
+
+
+def get_sampling_policy() -> SamplingPolicy | None:
+    """Get the active sampling policy (None when sampling is off)."""
+    return _policy
+
+
+def set_sampling_policy(policy: SamplingPolicy | None) -> None:
+    """Set the active sampling policy (None turns sampling off)."""
+    global _policy
+    _policy = policy
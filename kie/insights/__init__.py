@@ -14,6 +14,7 @@ from .schema import (
     InsightType,
 )
 from .statistical import StatisticalAnalyzer
+from .table import InsightTable, load_catalog
 
 __all__ = [
     "Insight",
@@ -24,4 +25,6 @@ __all__ = [
     "InsightCatalog",
     "StatisticalAnalyzer",
     "InsightEngine",
+    "InsightTable",
+    "load_catalog",
 ]
@@ -7,7 +7,7 @@ presentation-ready content with evidence linkage.
 
 import logging
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 import pandas as pd
 
@@ -20,12 +20,18 @@ from kie.insights.schema import (
     InsightType,
 )
 from kie.insights.statistical import StatisticalAnalyzer
+from kie.insights.table import InsightTable
 from kie.insights.intelligence import InsightIntelligenceEngine
 from kie.formatting.field_registry import FieldRegistry
 from kie.charts.formatting import format_number, format_currency, format_percentage, format_change
 
 logger = logging.getLogger(__name__)
 
+# Per-group confidence intervals recorded on a sampled insight
+MAX_SAMPLED_INTERVALS = 10
+
+_MaybeInsight = TypeVar("_MaybeInsight", bound=Insight | None)
+
 
 class InsightEngine:
     """
@@ -72,6 +78,40 @@ class InsightEngine:
         self._insight_counter += 1
         return f"insight_{self._insight_counter:03d}"
 
+    def _record_sample(self, insight: _MaybeInsight, result: dict[str, Any]) -> _MaybeInsight:
+        """
+        Record the sample an insight's statistics were estimated from.
+
+        Args:
+            insight: Insight built from the result (None passes through)
+            result: StatisticalAnalyzer result ("sample" present when sampled)
+
+        Returns:
+            The insight, with sampling (sample size and confidence intervals) set
+        """
+        if insight is None or "sample" not in result:
+            return insight
+
+        intervals = {}
+        if "mean_ci" in result:
+            intervals["mean"] = result["mean_ci"]
+        # Largest groups only: high-cardinality comparisons have thousands
+        groups = sorted(result.get("groups", {}).items(), key=lambda item: item[1]["sum"], reverse=True)
+        for name, group in groups[:MAX_SAMPLED_INTERVALS]:
+            if "sum_ci" in group:
+                intervals[f"{name} sum"] = group["sum_ci"]
+
+        sample = result["sample"]
+        insight.sampling = {
+            "method": sample["method"],
+            "sample_rows": sample["sample_rows"],
+            "population_rows": sample["population_rows"],
+            "seed": sample["seed"],
+            "confidence": self.stats.sampling.confidence if self.stats.sampling else None,
+            "intervals": intervals,
+        }
+        return insight
+
     def _is_id_column(self, df: pd.DataFrame, col_name: str) -> bool:
         """
         Check if a column is likely an ID/identifier column.
@@ -782,7 +822,7 @@ class InsightEngine:
                 # Beautify field name for client-facing output
                 display_column = FieldRegistry.beautify(value_column)
 
-                insights.append(
+                insights.append(self._record_sample(
                     self.create_insight(
                         headline=f"{display_column} is Highly Concentrated",
                         supporting_text=(
@@ -791,8 +831,9 @@ class InsightEngine:
                         ),
                         insight_type=InsightType.DISTRIBUTION,
                         tags=["distribution", value_column.lower()],
-                    )
-                )
+                    ),
+                    dist,
+                ))
 
         # Group comparison
         if group_column:
@@ -801,7 +842,9 @@ class InsightEngine:
                 values_dict = {
                     name: stats["sum"] for name, stats in comparison["groups"].items()
                 }
-                comparison_insight = self.create_comparison_insight(value_column, values_dict)
+                comparison_insight = self._record_sample(
+                    self.create_comparison_insight(value_column, values_dict), comparison
+                )
                 if comparison_insight:  # Skip None insights
                     insights.append(comparison_insight)
 
@@ -810,11 +853,14 @@ class InsightEngine:
                     # Beautify dimension for client-friendly output
                     value_display = FieldRegistry.beautify(value_column)
                     group_display = FieldRegistry.beautify(group_column)
-                    concentration_insight = self.create_concentration_insight(
-                        dimension=f"{value_display} by {group_display}",
-                        top_item=comparison["leader"],
-                        top_share=comparison["leader_share"],
-                        total_items=comparison["n_groups"],
+                    concentration_insight = self._record_sample(
+                        self.create_concentration_insight(
+                            dimension=f"{value_display} by {group_display}",
+                            top_item=comparison["leader"],
+                            top_share=comparison["leader_share"],
+                            total_items=comparison["n_groups"],
+                        ),
+                        comparison,
                     )
                     if concentration_insight:  # Skip None insights
                         insights.append(concentration_insight)
@@ -900,7 +946,7 @@ class InsightEngine:
                     # Check for interesting patterns
                     display_col = FieldRegistry.beautify(col)
                     if dist.get("is_concentrated"):
-                        insights.append(
+                        insights.append(self._record_sample(
                             self.create_insight(
                                 headline=f"{display_col} Shows Concentrated Distribution",
                                 supporting_text=(
@@ -910,12 +956,13 @@ class InsightEngine:
                                 insight_type=InsightType.DISTRIBUTION,
                                 severity=InsightSeverity.SUPPORTING,
                                 tags=["distribution", col.lower()],
-                            )
-                        )
+                            ),
+                            dist,
+                        ))
 
                     # High variance insight
                     if stats.get('std', 0) > stats.get('mean', 1):
-                        insights.append(
+                        insights.append(self._record_sample(
                             self.create_insight(
                                 headline=f"{display_col} Exhibits High Variability",
                                 supporting_text=(
@@ -926,8 +973,9 @@ class InsightEngine:
                                 insight_type=InsightType.DISTRIBUTION,
                                 severity=InsightSeverity.SUPPORTING,
                                 tags=["volatility", col.lower()],
-                            )
-                        )
+                            ),
+                            stats,
+                        ))
 
             # Group comparison for additional columns
             if group_column and col in df.columns:
@@ -936,7 +984,7 @@ class InsightEngine:
                     values_dict = {
                         name: stats["sum"] for name, stats in comparison["groups"].items()
                     }
-                    comp_insight = self.create_comparison_insight(col, values_dict)
+                    comp_insight = self._record_sample(self.create_comparison_insight(col, values_dict), comparison)
                     if comp_insight:  # Skip None insights
                         insights.append(comp_insight)
 
@@ -1117,29 +1165,7 @@ class InsightEngine:
 
         Considers: severity, category, confidence, statistical significance
         """
-
-        def score(insight: Insight) -> float:
-            severity_scores = {
-                InsightSeverity.KEY: 3,
-                InsightSeverity.SUPPORTING: 2,
-                InsightSeverity.CONTEXT: 1,
-            }
-            category_scores = {
-                InsightCategory.FINDING: 1.2,
-                InsightCategory.IMPLICATION: 1.1,
-                InsightCategory.RECOMMENDATION: 1.0,
-            }
-
-            base = severity_scores.get(insight.severity, 1)
-            multiplier = category_scores.get(insight.category, 1.0)
-            confidence = insight.confidence
-
-            # Bonus for statistical significance
-            sig_bonus = 1.1 if insight.is_statistically_significant else 1.0
-
-            return base * multiplier * confidence * sig_bonus
-
-        return sorted(insights, key=score, reverse=True)
+        return InsightTable(insights).ranked()
 
     def to_slide_sequence(self, catalog: InsightCatalog) -> list[dict[str, Any]]:
         """
@@ -1149,6 +1175,7 @@ class InsightEngine:
         """
         slides = []
         arc = catalog.narrative_arc
+        table = catalog.table()
 
         # Key findings section
         key_findings = arc.get("key_findings", [])
@@ -1161,7 +1188,7 @@ class InsightEngine:
                 }
             )
             for insight_id in key_findings:
-                insight = next((i for i in catalog.insights if i.id == insight_id), None)
+                insight = table.get(insight_id)
                 if insight:
                     slides.append(self._insight_to_slide_spec(insight))
 
@@ -1176,7 +1203,7 @@ class InsightEngine:
                 }
             )
             for insight_id in supporting[:3]:  # Limit to top 3
-                insight = next((i for i in catalog.insights if i.id == insight_id), None)
+                insight = table.get(insight_id)
                 if insight:
                     slides.append(self._insight_to_slide_spec(insight))
 
@@ -1191,7 +1218,7 @@ class InsightEngine:
                 }
             )
             for insight_id in implications:
-                insight = next((i for i in catalog.insights if i.id == insight_id), None)
+                insight = table.get(insight_id)
                 if insight:
                     slides.append(self._insight_to_slide_spec(insight))
 
@@ -1206,7 +1233,7 @@ class InsightEngine:
                 }
             )
             for insight_id in recommendations:
-                insight = next((i for i in catalog.insights if i.id == insight_id), None)
+                insight = table.get(insight_id)
                 if insight:
                     slides.append(self._insight_to_slide_spec(insight))
 
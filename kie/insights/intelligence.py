@@ -18,6 +18,7 @@ import pandas as pd
 
 from kie.insights.schema import Insight
 from kie.charts.formatting import format_number, format_percentage
+from kie.utils.keyword_classifier import KeywordClassifier
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,9 @@ class MetricSemantics:
     def __init__(self):
         """Initialize semantic understanding rules."""
         self.patterns = self._build_semantic_patterns()
+        self.classifier = KeywordClassifier(
+            {metric_type: rules["keywords"] for metric_type, rules in self.patterns.items()}
+        )
 
     def _build_semantic_patterns(self) -> dict[MetricType, dict[str, Any]]:
         """Build pattern matching rules for metric types."""
@@ -142,29 +146,23 @@ class MetricSemantics:
 
     def classify_metric(self, metric_name: str) -> MetricContext:
         """Classify metric and provide rich context."""
-        metric_lower = metric_name.lower()
-
-        # Match against patterns
-        for metric_type, rules in self.patterns.items():
-            if any(kw in metric_lower for kw in rules["keywords"]):
-                return MetricContext(
-                    metric_name=metric_name,
-                    metric_type=metric_type,
-                    typical_range=rules.get("typical_range"),
-                    interpretation_rules=rules.get("interpretation", {}),
-                    benchmark_context=None,
-                    unit=rules.get("format")
-                )
-
-        # Default to unknown
-        return MetricContext(
-            metric_name=metric_name,
-            metric_type=MetricType.UNKNOWN,
-            typical_range=None,
-            interpretation_rules={},
-            benchmark_context=None,
-            unit=None
-        )
+        return self.classify_metrics([metric_name])[0]
+
+    def classify_metrics(self, metric_names: list[str]) -> list[MetricContext]:
+        """Classify many metrics in one keyword scan (first matching pattern wins)."""
+        contexts = []
+        for metric_name, scores in zip(metric_names, self.classifier.classify_batch(metric_names), strict=True):
+            metric_type = next((t for t in self.patterns if t in scores), MetricType.UNKNOWN)
+            rules = self.patterns.get(metric_type, {})
+            contexts.append(MetricContext(
+                metric_name=metric_name,
+                metric_type=metric_type,
+                typical_range=rules.get("typical_range"),
+                interpretation_rules=rules.get("interpretation", {}),
+                benchmark_context=None,
+                unit=rules.get("format")
+            ))
+        return contexts
 
     def interpret_value(
         self,
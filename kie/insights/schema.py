@@ -7,10 +7,13 @@ Core data structures for insights, evidence, and catalogs.
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
+if TYPE_CHECKING:
+    from kie.insights.table import InsightTable
+
 
 class InsightType(Enum):
     """Types of insights that can be generated."""
@@ -88,9 +91,10 @@ class Insight:
     tags: list[str] = field(default_factory=list)
     confidence: float = 0.8  # Overall confidence 0-1
     statistical_significance: float | None = None  # p-value if applicable
+    sampling: dict[str, Any] | None = None  # Sample and confidence intervals, if estimated from a sample
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        data: dict[str, Any] = {
             "id": self.id,
             "headline": self.headline,
             "supporting_text": self.supporting_text,
@@ -103,6 +107,9 @@ class Insight:
             "confidence": self.confidence,
             "statistical_significance": self.statistical_significance,
         }
+        if self.sampling is not None:
+            data["sampling"] = self.sampling
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Insight":
@@ -118,6 +125,7 @@ class Insight:
             tags=data.get("tags", []),
             confidence=data.get("confidence", 0.8),
             statistical_significance=data.get("statistical_significance"),
+            sampling=data.get("sampling"),
         )
 
     @property
@@ -136,6 +144,7 @@ class InsightCatalog:
     insights: list[Insight]
     narrative_arc: dict[str, Any] = field(default_factory=dict)
     data_summary: dict[str, Any] = field(default_factory=dict)
+    _table: "tuple[tuple[int, int], InsightTable] | None" = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -156,6 +165,11 @@ class InsightCatalog:
             data_summary=data.get("data_summary", {}),
         )
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_table"] = None  # Indexes are rebuilt on demand
+        return state
+
     def save(self, path: str) -> Path:
         """Save catalog to YAML file."""
         path = Path(path)
@@ -171,6 +185,28 @@ class InsightCatalog:
             data = yaml.safe_load(f)
         return cls.from_dict(data)
 
+    def table(self) -> "InsightTable":
+        """
+        Get the indexed columnar view of the insights (built once, rebuilt if the list changes).
+
+        Returns:
+            InsightTable
+        """
+        from kie.insights.table import InsightTable
+
+        signature = (id(self.insights), len(self.insights))
+        if self._table is None or self._table[0] != signature:
+            self._table = (signature, InsightTable(self.insights))
+        return self._table[1]
+
+    def get_by_id(self, insight_id: str) -> Insight | None:
+        """Get insight by ID (indexed)."""
+        return self.table().get(insight_id)
+
+    def get_by_tag(self, tag: str) -> list[Insight]:
+        """Get insights carrying a tag (indexed)."""
+        return self.table().by_tag(tag)
+
     def get_key_insights(self) -> list[Insight]:
         """Get insights marked as key."""
         return [i for i in self.insights if i.severity == InsightSeverity.KEY]
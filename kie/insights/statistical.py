@@ -7,11 +7,21 @@ outliers, correlations, and significant differences.
 
 import logging
 from dataclasses import dataclass
+from statistics import NormalDist
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from kie.data.sampling import (
+    SampleInfo,
+    SamplingPolicy,
+    get_sampling_policy,
+    mean_confidence_interval,
+    stratified_sample,
+    tolerates_sampling,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,17 +47,51 @@ class StatisticalAnalyzer:
     - Correlation analysis
     - Distribution analysis
     - Variance analysis
+
+    Analyses marked @tolerates_sampling run on a seeded sample of large
+    inputs when a sampling policy is active, and report the sample
+    ("sample") and confidence intervals alongside their estimates.
     """
 
-    def __init__(self, significance_level: float = 0.05):
+    def __init__(self, significance_level: float = 0.05, sampling: SamplingPolicy | None = None):
         """
         Initialize analyzer.
 
         Args:
             significance_level: P-value threshold for significance (default 0.05)
+            sampling: Sampling policy for tolerant analyses
+                (default: the global policy, see set_sampling_policy())
         """
         self.significance_level = significance_level
+        self.sampling = sampling if sampling is not None else get_sampling_policy()
+
+    def _sample(
+        self,
+        data: pd.DataFrame,
+        strata: list[str] | None = None,
+        columns: list[str] | None = None,
+    ) -> tuple[pd.DataFrame, SampleInfo | None]:
+        """Sample data (only the given columns) for a tolerant analysis; unchanged if no policy applies."""
+        if self.sampling is None or not self.sampling.applies_to(len(data)):
+            return data, None
+        if columns is not None:
+            data = data[list(dict.fromkeys(columns))]
+        return stratified_sample(
+            data,
+            self.sampling.max_rows,
+            strata=strata,
+            seed=self.sampling.seed,
+            min_per_stratum=self.sampling.min_per_stratum,
+        )
 
+    def _sample_series(self, series: pd.Series) -> tuple[pd.Series, SampleInfo | None]:
+        """Sample a series for a tolerant analysis; unchanged if no policy applies."""
+        if self.sampling is None or not self.sampling.applies_to(len(series)):
+            return series, None
+        sample, sample_info = self._sample(series.to_frame())
+        return sample.iloc[:, 0], sample_info
+
+    @tolerates_sampling
     def describe(self, series: pd.Series) -> dict[str, Any]:
         """
         Get comprehensive descriptive statistics.
@@ -64,9 +108,11 @@ class StatisticalAnalyzer:
         clean = series.dropna()
         if len(clean) == 0:
             return {"error": "No valid data"}
+        population_count = len(clean)
+        clean, sample_info = self._sample_series(clean)
 
-        stats = {
-            "count": len(clean),
+        stats: dict[str, Any] = {
+            "count": population_count,
             "mean": float(clean.mean()),
             "median": float(clean.median()),
             "std": float(clean.std()),
@@ -89,6 +135,11 @@ class StatisticalAnalyzer:
         else:
             stats["distribution"] = "left-skewed (negative)"
 
+        if sample_info is not None and self.sampling is not None:
+            _, low, high = mean_confidence_interval(clean, population_count, self.sampling.confidence)
+            stats["mean_ci"] = [low, high]
+            stats["sample"] = sample_info.to_dict()
+
         return stats
 
     def detect_outliers(
@@ -321,6 +372,7 @@ class StatisticalAnalyzer:
             else "no meaningful correlation",
         }
 
+    @tolerates_sampling
     def analyze_distribution(
         self,
         series: pd.Series,
@@ -343,6 +395,8 @@ class StatisticalAnalyzer:
 
         # Basic stats
         stats = self.describe(series)
+        n_observations = len(clean)
+        clean = self._sample_series(clean)[0]
 
         # Histogram
         counts, bin_edges = np.histogram(clean, bins=n_bins)
@@ -360,7 +414,7 @@ class StatisticalAnalyzer:
         top_3_pct = sum(frequencies[i] for i in top_3_bins)
 
         return {
-            "n_observations": len(clean),
+            "n_observations": n_observations,
             "n_bins": n_bins,
             "bin_edges": [float(e) for e in bin_edges],
             "frequencies": frequencies,
@@ -370,6 +424,7 @@ class StatisticalAnalyzer:
             **stats,
         }
 
+    @tolerates_sampling
     def compare_groups(
         self,
         data: pd.DataFrame,
@@ -385,19 +440,45 @@ class StatisticalAnalyzer:
             group_column: Column with group labels
 
         Returns:
-            Dict with group comparison
+            Dict with group comparison (sampled inputs: counts are exact,
+            sums are estimated per group with a "sum_ci" interval)
         """
-        groups = data.groupby(group_column)[value_column]
-
-        group_stats = {}
-        for name, group in groups:
-            group_stats[str(name)] = {
-                "count": len(group),
-                "mean": float(group.mean()),
-                "median": float(group.median()),
-                "std": float(group.std()),
-                "sum": float(group.sum()),
+        sampled, sample_info = self._sample(data, strata=[group_column], columns=[group_column, value_column])
+        if sample_info is not None and sample_info.method != "stratified":
+            # Too many groups to keep each one in the sample: use every row
+            sampled, sample_info = data, None
+        values = sampled[value_column]
+        grouped = values.groupby(sampled[group_column])
+        table = grouped.agg(["size", "mean", "median", "std", "sum"])
+        table.index = table.index.astype(str)
+
+        if sample_info is not None and self.sampling is not None:
+            # Expand each stratum sample to its population (missing values count as zero)
+            filled = values.fillna(0).groupby(sampled[group_column]).agg(["mean", "std"])
+            n = table["size"].to_numpy(dtype=float)
+            stratum_rows = pd.Series({key: sizes[0] for key, sizes in sample_info.stratum_sizes.items()}, dtype=float)
+            population = stratum_rows.reindex(table.index).fillna(table["size"]).to_numpy()
+            correction = np.sqrt(np.clip(population - n, 0, None) / np.maximum(population - 1, 1))
+            standard_error = filled["std"].fillna(0).to_numpy() / np.sqrt(n) * correction
+            standard_error[(n < 2) | (population <= n)] = 0.0
+            half_width = NormalDist().inv_cdf(0.5 + self.sampling.confidence / 2) * standard_error * population
+            estimate = filled["mean"].to_numpy() * population
+            table["size"] = population.astype(int)
+            table["sum"] = estimate
+            table["sum_low"] = estimate - half_width
+            table["sum_high"] = estimate + half_width
+
+        group_stats: dict[str, dict[str, Any]] = {}
+        for name, row in zip(table.index, table.to_dict("records"), strict=True):
+            group_stats[name] = {
+                "count": int(row["size"]),
+                "mean": float(row["mean"]),
+                "median": float(row["median"]),
+                "std": float(row["std"]),
+                "sum": float(row["sum"]),
             }
+            if sample_info is not None:
+                group_stats[name]["sum_ci"] = [float(row["sum_low"]), float(row["sum_high"])]
 
         # Calculate totals and shares
         total = sum(s["sum"] for s in group_stats.values())
@@ -427,6 +508,7 @@ class StatisticalAnalyzer:
             else "moderate"
             if hhi > 1500
             else "low",
+            **({"sample": sample_info.to_dict()} if sample_info is not None else {}),
         }
 
     def detect_significant_changes(
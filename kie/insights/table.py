@@ -0,0 +1,329 @@
+"""
+Columnar Insight Table
+
+Indexed, read-only view over an InsightCatalog for downstream consumers:
+- O(1) lookup by insight ID
+- Precomputed type / severity / category / tag indexes
+- Vectorized importance scores and ranking
+- Pandas frames of insight attributes and evidence for bulk analysis
+
+Catalogs are loaded once per process through load_catalog(), which memoizes
+the parsed catalog by file signature and can persist a binary (pickle) copy
+so later processes skip JSON parsing entirely.
+"""
+
+import json
+import pickle
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from kie.insights.schema import (
+    Insight,
+    InsightCatalog,
+    InsightCategory,
+    InsightSeverity,
+    InsightType,
+)
+
+# Bump when the pickled layout changes; stale binary caches are rebuilt
+BINARY_FORMAT_VERSION = 1
+
+SEVERITY_SCORES = {
+    InsightSeverity.KEY: 3,
+    InsightSeverity.SUPPORTING: 2,
+    InsightSeverity.CONTEXT: 1,
+}
+
+CATEGORY_SCORES = {
+    InsightCategory.FINDING: 1.2,
+    InsightCategory.IMPLICATION: 1.1,
+    InsightCategory.RECOMMENDATION: 1.0,
+}
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if hasattr(value, "value") else value
+
+
+class InsightTable:
+    """
+    Indexed columnar view of a list of insights.
+
+    The table reflects the insights at construction time; rebuild it (or
+    call InsightCatalog.table() again) after adding or removing insights.
+
+    Example:
+        >>> table = InsightTable(catalog.insights)
+        >>> table.get("insight_042")
+        >>> table.select(severity=InsightSeverity.KEY, tag="revenue")
+        >>> table.frame.groupby("insight_type")["confidence"].mean()
+    """
+
+    def __init__(self, insights: list[Insight]):
+        """
+        Build indexes in a single pass.
+
+        Args:
+            insights: Insights to index (order is preserved)
+        """
+        self.insights = list(insights)
+
+        self._by_id: dict[str, int] = {}
+        self._by_type: dict[str, list[int]] = {}
+        self._by_severity: dict[str, list[int]] = {}
+        self._by_category: dict[str, list[int]] = {}
+        self._by_tag: dict[str, list[int]] = {}
+
+        for pos, insight in enumerate(self.insights):
+            self._by_id.setdefault(insight.id, pos)  # first occurrence wins, like next()
+            self._by_type.setdefault(insight.insight_type.value, []).append(pos)
+            self._by_severity.setdefault(insight.severity.value, []).append(pos)
+            self._by_category.setdefault(insight.category.value, []).append(pos)
+            for tag in dict.fromkeys(insight.tags):
+                self._by_tag.setdefault(tag, []).append(pos)
+
+        self._frame: pd.DataFrame | None = None
+        self._evidence: pd.DataFrame | None = None
+
+    def __len__(self) -> int:
+        return len(self.insights)
+
+    def __contains__(self, insight_id: str) -> bool:
+        return insight_id in self._by_id
+
+    def get(self, insight_id: str) -> Insight | None:
+        """
+        Look up an insight by ID.
+
+        Args:
+            insight_id: Insight ID
+
+        Returns:
+            Insight, or None if not found
+        """
+        pos = self._by_id.get(insight_id)
+        return self.insights[pos] if pos is not None else None
+
+    def by_type(self, insight_type: InsightType | str) -> list[Insight]:
+        """Get insights of a type (catalog order)."""
+        return self._take(self._by_type.get(_enum_value(insight_type), []))
+
+    def by_severity(self, severity: InsightSeverity | str) -> list[Insight]:
+        """Get insights of a severity (catalog order)."""
+        return self._take(self._by_severity.get(_enum_value(severity), []))
+
+    def by_category(self, category: InsightCategory | str) -> list[Insight]:
+        """Get insights of a category (catalog order)."""
+        return self._take(self._by_category.get(_enum_value(category), []))
+
+    def by_tag(self, tag: str) -> list[Insight]:
+        """Get insights carrying a tag (catalog order)."""
+        return self._take(self._by_tag.get(tag, []))
+
+    def select(
+        self,
+        insight_type: InsightType | str | None = None,
+        severity: InsightSeverity | str | None = None,
+        category: InsightCategory | str | None = None,
+        tag: str | None = None,
+    ) -> list[Insight]:
+        """
+        Get insights matching every given filter.
+
+        Args:
+            insight_type: Optional type filter
+            severity: Optional severity filter
+            category: Optional category filter
+            tag: Optional tag filter
+
+        Returns:
+            Matching insights in catalog order
+        """
+        candidates = []
+        if insight_type is not None:
+            candidates.append(self._by_type.get(_enum_value(insight_type), []))
+        if severity is not None:
+            candidates.append(self._by_severity.get(_enum_value(severity), []))
+        if category is not None:
+            candidates.append(self._by_category.get(_enum_value(category), []))
+        if tag is not None:
+            candidates.append(self._by_tag.get(tag, []))
+
+        if not candidates:
+            return list(self.insights)
+
+        candidates.sort(key=len)
+        positions = set(candidates[0])
+        for other in candidates[1:]:
+            positions.intersection_update(other)
+        return self._take(sorted(positions))
+
+    @property
+    def tags(self) -> list[str]:
+        """All tags in first-seen order."""
+        return list(self._by_tag)
+
+    def importance_scores(self) -> np.ndarray:
+        """
+        Importance score per insight (severity x category x confidence x significance bonus).
+
+        Returns:
+            float64 array aligned with self.insights
+        """
+        n = len(self.insights)
+        base = np.fromiter((SEVERITY_SCORES.get(i.severity, 1) for i in self.insights), dtype=np.float64, count=n)
+        multiplier = np.fromiter((CATEGORY_SCORES.get(i.category, 1.0) for i in self.insights), dtype=np.float64, count=n)
+        confidence = np.fromiter((i.confidence for i in self.insights), dtype=np.float64, count=n)
+        sig_bonus = np.fromiter(
+            (1.1 if i.is_statistically_significant else 1.0 for i in self.insights), dtype=np.float64, count=n
+        )
+        return base * multiplier * confidence * sig_bonus
+
+    def ranked(self) -> list[Insight]:
+        """
+        Insights ordered by importance score, highest first (ties keep catalog order).
+
+        Returns:
+            Ranked insights
+        """
+        order = np.argsort(-self.importance_scores(), kind="stable")
+        return self._take(order.tolist())
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """One row per insight with scalar attributes (built on first access)."""
+        if self._frame is None:
+            self._frame = pd.DataFrame({
+                "id": [i.id for i in self.insights],
+                "headline": [i.headline for i in self.insights],
+                "insight_type": pd.Categorical([i.insight_type.value for i in self.insights]),
+                "severity": pd.Categorical([i.severity.value for i in self.insights]),
+                "category": pd.Categorical([i.category.value for i in self.insights]),
+                "suggested_slide_type": [i.suggested_slide_type for i in self.insights],
+                "confidence": np.array([i.confidence for i in self.insights], dtype=np.float64),
+                "statistical_significance": np.array(
+                    [np.nan if i.statistical_significance is None else i.statistical_significance
+                     for i in self.insights],
+                    dtype=np.float64,
+                ),
+                "evidence_count": np.array([len(i.evidence) for i in self.insights], dtype=np.int32),
+                "tags": [list(i.tags) for i in self.insights],
+            })
+        return self._frame
+
+    @property
+    def evidence(self) -> pd.DataFrame:
+        """One row per evidence item, keyed by insight_id (built on first access)."""
+        if self._evidence is None:
+            rows = [
+                (insight.id, ev.evidence_type, ev.reference, ev.label, ev.confidence, ev.value)
+                for insight in self.insights
+                for ev in insight.evidence
+            ]
+            self._evidence = pd.DataFrame(
+                rows, columns=["insight_id", "evidence_type", "reference", "label", "confidence", "value"]
+            )
+        return self._evidence
+
+    def _take(self, positions: list[int]) -> list[Insight]:
+        insights = self.insights
+        return [insights[pos] for pos in positions]
+
+
+# Parsed catalogs by resolved path: (file signature, catalog)
+_catalog_cache: dict[str, tuple[tuple[int, int, int], InsightCatalog]] = {}
+
+
+def _file_signature(path: Path) -> tuple[int, int, int]:
+    stat = path.stat()
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def load_catalog(path: Path | str, binary_cache: Path | str | None = None) -> InsightCatalog:
+    """
+    Load an insight catalog (JSON or YAML) once per process.
+
+    Repeated loads of an unchanged file return the same InsightCatalog object,
+    so callers must treat it as read-only. When binary_cache is given, the
+    parsed catalog is also persisted there and reused by later processes
+    while the source file is unchanged.
+
+    Args:
+        path: insights_catalog.json or insights.yaml
+        binary_cache: Optional path for the persisted binary copy
+
+    Returns:
+        InsightCatalog
+
+    Raises:
+        FileNotFoundError: If the catalog file does not exist
+    """
+    path = Path(path)
+    signature = _file_signature(path)
+    key = str(path.resolve())
+
+    cached = _catalog_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    catalog = _read_binary_cache(binary_cache, signature) if binary_cache else None
+    if catalog is None:
+        if path.suffix in (".yaml", ".yml"):
+            catalog = InsightCatalog.load(str(path))
+        else:
+            catalog = InsightCatalog.from_dict(json.loads(path.read_bytes()))
+        if binary_cache:
+            _write_binary_cache(Path(binary_cache), signature, catalog)
+
+    _catalog_cache[key] = (signature, catalog)
+    return catalog
+
+
+def remember_catalog(path: Path | str, catalog: InsightCatalog) -> None:
+    """
+    Register a catalog that was just written to path, so the next load_catalog() skips parsing.
+
+    Args:
+        path: File the catalog was saved to
+        catalog: The saved catalog
+    """
+    path = Path(path)
+    _catalog_cache[str(path.resolve())] = (_file_signature(path), catalog)
+
+
+def clear_catalog_cache() -> None:
+    """Forget all in-process parsed catalogs."""
+    _catalog_cache.clear()
+
+
+def _read_binary_cache(cache_path: Path | str, signature: tuple[int, int, int]) -> InsightCatalog | None:
+    try:
+        with open(cache_path, "rb") as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != BINARY_FORMAT_VERSION
+        or tuple(payload.get("source", ())) != signature
+    ):
+        return None
+    return payload.get("catalog")
+
+
+def _write_binary_cache(cache_path: Path, signature: tuple[int, int, int], catalog: InsightCatalog) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                {"version": BINARY_FORMAT_VERSION, "source": signature, "catalog": catalog},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        tmp_path.replace(cache_path)
+    except (OSError, pickle.PicklingError):
+        pass  # Cache is best-effort
@@ -9,14 +9,41 @@ CRITICAL: Ledger creation NEVER fails a run. Missing data is recorded as null.
 
 import hashlib
 import json
+import mmap
+import os
 import platform
 import sys
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# Optional fast hashes (opt-in via KIE_LEDGER_HASH=blake3|xxh3)
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+# Read size for hashing; files at or above MMAP_MIN_SIZE are hashed via mmap
+HASH_CHUNK_SIZE = 1024 * 1024
+MMAP_MIN_SIZE = 64 * 1024 * 1024
+
+# Thread pool size for hashing many artifacts at once
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+# Fingerprint cache file, relative to project root
+FINGERPRINT_CACHE_PATH = Path("project_state") / "fingerprint_cache.json"
+
 
 @dataclass
 class EvidenceLedger:
@@ -78,17 +105,27 @@ class EvidenceLedger:
         """
         Save ledger to disk.
 
+        The entry is appended to the indexed ledger store; the per-run YAML
+        file is a human-readable export (disable with KIE_LEDGER_YAML=0).
+
         CRITICAL: This method NEVER raises exceptions. If saving fails,
         it logs the error but does not interrupt the command flow.
 
         Returns:
             Path to saved ledger file, or None if save failed
         """
+        from kie.observability.ledger_store import get_ledger_store, yaml_export_enabled
+
         try:
             ledger_dir.mkdir(parents=True, exist_ok=True)
             ledger_path = ledger_dir / f"{self.run_id}.yaml"
-            ledger_path.write_text(self.to_yaml())
-            return ledger_path
+            export = yaml_export_enabled()
+            if export:
+                ledger_path.write_text(self.to_yaml())
+
+            store = get_ledger_store(ledger_dir)
+            store.append(self.to_dict(), yaml_name=ledger_path.name if export else None)
+            return ledger_path if export else store.db_path
         except Exception as e:
             # Log error but do not fail
             print(f"Warning: Could not save evidence ledger: {e}")
@@ -179,25 +216,172 @@ def read_rails_stage(project_root: Path) -> str | None:
         return None
 
 
+def _hash_algorithm() -> str:
+    """Resolve the ledger hash algorithm (SHA-256 unless a fast hash is requested and installed)."""
+    requested = os.getenv("KIE_LEDGER_HASH", "sha256").lower()
+    if requested == "blake3" and HAS_BLAKE3:
+        return "blake3"
+    if requested == "xxh3" and HAS_XXHASH:
+        return "xxh3"
+    return "sha256"
+
+
+def _hash_contents(file_path: Path, size: int, algorithm: str) -> str:
+    """
+    Hash file contents with large reads (mmap for very large files).
+
+    SHA-256 digests are returned bare for compatibility with existing ledgers;
+    other algorithms are prefixed, e.g. "blake3:<hex>".
+    """
+    if algorithm == "blake3":
+        hasher = blake3.blake3()
+    elif algorithm == "xxh3":
+        hasher = xxhash.xxh3_128()
+    else:
+        hasher = hashlib.sha256()
+
+    with open(file_path, "rb") as f:
+        if size >= MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while n := f.readinto(buffer):
+                hasher.update(view[:n])
+
+    digest = hasher.hexdigest()
+    return digest if algorithm == "sha256" else f"{algorithm}:{digest}"
+
+
+class FileFingerprintCache:
+    """
+    Cache of file hashes keyed on (path, size, mtime_ns, inode).
+
+    Unchanged files are not re-read. Thread-safe; entries can be persisted
+    so consecutive commands over the same project reuse them.
+    """
+
+    def __init__(self, max_entries: int = 20000):
+        """
+        Initialize fingerprint cache.
+
+        Args:
+            max_entries: Maximum cached files (oldest entries dropped first)
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # abs path -> [size, mtime_ns, inode, algorithm, digest]
+        self._entries: dict[str, list] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def get_hash(self, file_path: Path) -> str | None:
+        """
+        Return the hash of a file, re-reading it only if it changed.
+
+        Returns None if the file doesn't exist or can't be read.
+        NEVER raises exceptions.
+        """
+        try:
+            key = os.path.abspath(file_path)
+            stat = os.stat(key)
+            algorithm = _hash_algorithm()
+            signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino, algorithm]
+
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[:4] == signature:
+                    self.hits += 1
+                    return entry[4]
+
+            digest = _hash_contents(Path(key), stat.st_size, algorithm)
+
+            with self._lock:
+                self.misses += 1
+                self._entries.pop(key, None)
+                self._entries[key] = signature + [digest]
+                if len(self._entries) > self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+                self._dirty = True
+            return digest
+        except Exception:
+            return None
+
+    def hash_many(self, file_paths: list[Path]) -> list[str | None]:
+        """
+        Hash several files, in parallel when more than one needs hashing.
+
+        Args:
+            file_paths: Files to hash
+
+        Returns:
+            Hashes in the same order (None for missing/unreadable files)
+        """
+        if len(file_paths) <= 1:
+            return [self.get_hash(path) for path in file_paths]
+
+        with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(file_paths))) as pool:
+            return list(pool.map(self.get_hash, file_paths))
+
+    def load(self, cache_path: Path) -> None:
+        """Merge persisted entries from disk. NEVER raises exceptions."""
+        try:
+            with open(cache_path) as f:
+                entries = json.load(f)
+            with self._lock:
+                for key, entry in entries.items():
+                    self._entries.setdefault(key, entry)
+        except Exception:
+            pass
+
+    def save(self, cache_path: Path) -> None:
+        """Persist entries to disk if anything changed. NEVER raises exceptions."""
+        try:
+            with self._lock:
+                if not self._dirty:
+                    return
+                payload = json.dumps(self._entries)
+                self._dirty = False
+
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_text(payload)
+            tmp_path.replace(cache_path)
+        except Exception:
+            pass
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self._dirty = False
+
+
+# Global fingerprint cache
+_fingerprint_cache = FileFingerprintCache()
+
+
+def get_fingerprint_cache() -> FileFingerprintCache:
+    """Get the global file fingerprint cache."""
+    return _fingerprint_cache
+
+
 def compute_file_hash(file_path: Path) -> str | None:
     """
     Compute SHA-256 hash of a file.
 
+    Unchanged files (same path, size, mtime and inode) are served from the
+    fingerprint cache. Set KIE_LEDGER_HASH=blake3 or xxh3 to use a faster
+    hash when the package is installed.
+
     Returns None if file doesn't exist or can't be read.
     NEVER raises exceptions.
     """
-    try:
-        if not file_path.exists():
-            return None
-
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
-
-        return sha256.hexdigest()
-    except Exception:
-        return None
+    return _fingerprint_cache.get_hash(file_path)
 
 
 def record_artifacts(
@@ -218,16 +402,14 @@ def record_artifacts(
     """
     target_list = ledger.inputs if artifact_type == "input" else ledger.outputs
 
-    for path in artifact_paths:
-        try:
-            file_hash = compute_file_hash(path)
-            target_list.append({
-                "path": str(path),
-                "hash": file_hash,
-            })
-        except Exception:
-            # Record the path with null hash
-            target_list.append({
-                "path": str(path),
-                "hash": None,
-            })
+    try:
+        hashes = _fingerprint_cache.hash_many(list(artifact_paths))
+    except Exception:
+        hashes = [None] * len(artifact_paths)
+
+    for path, file_hash in zip(artifact_paths, hashes, strict=True):
+        # Missing/unreadable files are recorded with null hash
+        target_list.append({
+            "path": str(path),
+            "hash": file_hash,
+        })
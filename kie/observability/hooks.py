@@ -11,7 +11,13 @@ it logs the issue but allows execution to continue.
 from pathlib import Path
 from typing import Any
 
-from kie.observability.evidence_ledger import EvidenceLedger, read_rails_stage, record_artifacts
+from kie.observability.evidence_ledger import (
+    FINGERPRINT_CACHE_PATH,
+    EvidenceLedger,
+    get_fingerprint_cache,
+    read_rails_stage,
+    record_artifacts,
+)
 from kie.paths import ArtifactPaths
 
 
@@ -32,6 +38,9 @@ class ObservabilityHooks:
         """
         self.project_root = project_root
 
+        # Reuse artifact hashes from previous commands in this project
+        get_fingerprint_cache().load(self.project_root / FINGERPRINT_CACHE_PATH)
+
     def pre_command(
         self,
         ledger: EvidenceLedger,
@@ -119,6 +128,10 @@ class ObservabilityHooks:
             # PRIME-TIME STEP 3: Generate Recovery Plan (if needed)
             self._generate_recovery_plan(ledger, result)
 
+            # Persist artifact hashes for the next command
+            if (self.project_root / "project_state").exists():
+                get_fingerprint_cache().save(self.project_root / FINGERPRINT_CACHE_PATH)
+
         except Exception as e:
             # Log but do not fail
             ledger.warnings.append(f"Post-command observation warning: {e}")
@@ -0,0 +1,305 @@
+"""
+Evidence Ledger Store
+
+Indexed, append-only store for evidence ledger entries, kept next to the
+per-run YAML files in project_state/evidence_ledger/:
+
+- One SQLite database (ledger.sqlite3) with indexes on run_id, timestamp
+  and command, so lookups and time-range queries don't parse every ledger
+  ever written
+- Per-run YAML files are a human-readable export (KIE_LEDGER_YAML=0 turns
+  them off; export_yaml()/export_all() write them on demand)
+- YAML ledgers written by older versions or by hand are imported once, the
+  first time the store sees them
+
+CRITICAL: Like the ledger itself, the store never fails a run. Writers
+swallow errors; readers return empty results.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+DB_NAME = "ledger.sqlite3"
+
+# Directory mtimes newer than this may hide same-tick writes; rescan next time
+_RACY_MTIME_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL DEFAULT '',
+    command TEXT NOT NULL DEFAULT '',
+    success INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs (timestamp);
+CREATE INDEX IF NOT EXISTS runs_command ON runs (command, timestamp);
+CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def yaml_export_enabled() -> bool:
+    """Whether per-run YAML files are written alongside the store (KIE_LEDGER_YAML, default on)."""
+    return os.getenv("KIE_LEDGER_YAML", "1").lower() not in ("0", "false", "no")
+
+
+class LedgerStore:
+    """
+    Evidence ledger entries of one project, indexed by run_id, timestamp and command.
+
+    Example:
+        >>> store = LedgerStore(project_root / "project_state" / "evidence_ledger")
+        >>> store.append(ledger.to_dict())
+        >>> entry = store.get(run_id)
+        >>> recent = store.query(since="2026-01-01T00:00:00Z", command="analyze")
+    """
+
+    def __init__(self, ledger_dir: Path):
+        """
+        Initialize ledger store (the database is created on first write).
+
+        Args:
+            ledger_dir: Evidence ledger directory
+        """
+        self.ledger_dir = Path(ledger_dir)
+        self.db_path = self.ledger_dir / DB_NAME
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def append(self, entry: dict[str, Any], yaml_name: str | None = None) -> bool:
+        """
+        Add a ledger entry (re-saving a run_id replaces its entry).
+
+        NEVER raises exceptions.
+
+        Args:
+            entry: Ledger dict (must contain run_id)
+            yaml_name: Name of the YAML export written for this entry, if any
+
+        Returns:
+            True if the entry was stored
+        """
+        try:
+            with self._lock:
+                conn = self._connect(create=True)
+                assert conn is not None  # create=True always connects
+                with conn:
+                    self._insert(conn, entry, replace=True)
+                    if yaml_name:
+                        conn.execute("INSERT OR IGNORE INTO files (name) VALUES (?)", (yaml_name,))
+            return True
+        except Exception as e:
+            print(f"Warning: Could not store evidence ledger entry: {e}")
+            return False
+
+    def get(self, run_id: str) -> dict[str, Any] | None:
+        """
+        Look up one ledger entry.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Ledger dict, or None if unknown
+        """
+        rows = self._select("SELECT data FROM runs WHERE run_id = ?", (run_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def query(
+        self,
+        since: str | None = None,
+        until: str | None = None,
+        command: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Ledger entries in timestamp order.
+
+        Args:
+            since: Only entries at or after this ISO timestamp
+            until: Only entries before this ISO timestamp
+            command: Only entries of this command
+            limit: Return at most this many (oldest first)
+
+        Returns:
+            Ledger dicts
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if command:
+            clauses.append("command = ?")
+            params.append(command)
+
+        sql = "SELECT data FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp, run_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [json.loads(data) for (data,) in self._select(sql, tuple(params))]
+
+    def run_ids(self) -> list[str]:
+        """All run IDs in timestamp order."""
+        return [run_id for (run_id,) in self._select("SELECT run_id FROM runs ORDER BY timestamp, run_id")]
+
+    def __len__(self) -> int:
+        rows = self._select("SELECT COUNT(*) FROM runs")
+        return rows[0][0] if rows else 0
+
+    def export_yaml(self, run_id: str, path: Path | None = None) -> Path | None:
+        """
+        Write the human-readable YAML of one entry.
+
+        Args:
+            run_id: Run ID
+            path: Destination (default: <ledger_dir>/<run_id>.yaml)
+
+        Returns:
+            Path to the YAML file, or None if the run is unknown
+        """
+        entry = self.get(run_id)
+        if entry is None:
+            return None
+        path = Path(path) if path else self.ledger_dir / f"{run_id}.yaml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(yaml.dump(entry, default_flow_style=False, sort_keys=False))
+        return path
+
+    def export_all(self, dest_dir: Path) -> list[Path]:
+        """
+        Write YAML files for every entry.
+
+        Args:
+            dest_dir: Destination directory
+
+        Returns:
+            Paths of written files
+        """
+        return [
+            path for run_id in self.run_ids()
+            if (path := self.export_yaml(run_id, Path(dest_dir) / f"{run_id}.yaml")) is not None
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _select(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a read query after importing new YAML ledgers. NEVER raises exceptions."""
+        try:
+            with self._lock:
+                conn = self._connect(create=False)
+                if conn is None:
+                    return []
+                self._import_yaml_ledgers(conn)
+                return conn.execute(sql, params).fetchall()
+        except Exception:
+            return []
+
+    def _connect(self, create: bool) -> sqlite3.Connection | None:
+        if self._conn is not None and self.db_path.exists():
+            return self._conn
+        if self._conn is not None:  # Database removed underneath us
+            self._conn.close()
+            self._conn = None
+        if not self.ledger_dir.exists():
+            if not create:
+                return None
+            self.ledger_dir.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, entry: dict[str, Any], replace: bool) -> None:
+        success = entry.get("success")
+        conn.execute(
+            f"INSERT OR {'REPLACE' if replace else 'IGNORE'} INTO runs "
+            "(run_id, timestamp, command, success, data) VALUES (?, ?, ?, ?, ?)",
+            (
+                str(entry["run_id"]),
+                str(entry.get("timestamp") or ""),
+                str(entry.get("command") or ""),
+                None if success is None else int(bool(success)),
+                json.dumps(entry, default=str),
+            ),
+        )
+
+    def _import_yaml_ledgers(self, conn: sqlite3.Connection) -> None:
+        """Import YAML ledgers the store hasn't seen (older versions, hand-written)."""
+        try:
+            dir_mtime = os.stat(self.ledger_dir).st_mtime_ns
+        except OSError:
+            return
+        row = conn.execute("SELECT value FROM meta WHERE key = 'synced_dir_mtime'").fetchone()
+        if row is not None and row[0] == str(dir_mtime):
+            return
+
+        known = {name for (name,) in conn.execute("SELECT name FROM files")}
+        with conn:
+            for item in os.scandir(self.ledger_dir):
+                if not item.name.endswith(".yaml") or item.name in known:
+                    continue
+                try:
+                    with open(item.path) as f:
+                        entry = yaml.safe_load(f)
+                    # Only ledger entries (skips e.g. intent_capture_events.yaml)
+                    if isinstance(entry, dict) and ("run_id" in entry or "command" in entry):
+                        entry.setdefault("run_id", item.name[:-5])
+                        self._insert(conn, entry, replace=False)
+                except Exception:
+                    pass
+                conn.execute("INSERT OR IGNORE INTO files (name) VALUES (?)", (item.name,))
+
+            # Recently modified directories may still receive same-tick writes
+            if time.time_ns() - dir_mtime > _RACY_MTIME_NS:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_dir_mtime', ?)", (str(dir_mtime),)
+                )
+
+
+# Open stores by ledger directory (connections are reused across commands)
+MAX_OPEN_STORES = 32
+_stores: dict[str, LedgerStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_ledger_store(ledger_dir: Path) -> LedgerStore:
+    """
+    Get the ledger store of an evidence ledger directory.
+
+    Args:
+        ledger_dir: Evidence ledger directory (project_state/evidence_ledger)
+
+    Returns:
+        LedgerStore for the directory
+    """
+    key = os.path.abspath(ledger_dir)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if len(_stores) >= MAX_OPEN_STORES:
+                _stores.pop(next(iter(_stores))).close()
+            store = _stores[key] = LedgerStore(Path(key))
+        return store
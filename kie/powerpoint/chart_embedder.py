@@ -5,17 +5,82 @@ Embeds native, editable charts in PowerPoint slides (not images).
 Charts remain fully editable after generation.
 """
 
-from typing import Any
+from collections.abc import Iterator, Mapping
+from typing import Any, TypeAlias
+from xml.sax.saxutils import escape
 
+import numpy as np
+import pandas as pd
 from pptx import Presentation
 from pptx.chart.data import CategoryChartData
 from pptx.dml.color import RGBColor
 from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION, XL_LEGEND_POSITION
-from pptx.util import Inches, Pt
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Emu, Inches, Pt
 
 from kie.brand.colors import KDSColors
 from kie.brand.theme import get_theme
 
+# Chart/table data may be records, a DataFrame, a NumPy (structured) array,
+# or a mapping of column name -> sequence.
+TabularData: TypeAlias = list[dict[str, Any]] | pd.DataFrame | np.ndarray | Mapping[str, Any]
+
+# Rows per table slide before appendix tables are split across slides
+DEFAULT_TABLE_ROWS_PER_SLIDE = 15
+
+
+def to_frame(data: TabularData) -> pd.DataFrame:
+    """
+    Normalize chart/table input into a DataFrame.
+
+    DataFrames are returned as-is (no copy); records, structured arrays and
+    column mappings are converted once so series can be bound column-wise.
+
+    Args:
+        data: Records, DataFrame, NumPy array or column mapping
+
+    Returns:
+        DataFrame view of the data
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+    return pd.DataFrame(data)
+
+
+def iter_table_pages(
+    data: TabularData, rows_per_page: int = DEFAULT_TABLE_ROWS_PER_SLIDE
+) -> Iterator[pd.DataFrame]:
+    """
+    Split table data into slide-sized pages.
+
+    Args:
+        data: Table data
+        rows_per_page: Maximum data rows per page
+
+    Yields:
+        DataFrame slices of at most rows_per_page rows
+    """
+    if rows_per_page < 1:
+        raise ValueError(f"rows_per_page must be >= 1, got {rows_per_page}")
+
+    frame = to_frame(data)
+    if frame.empty:
+        yield frame
+        return
+
+    for start in range(0, len(frame), rows_per_page):
+        yield frame.iloc[start : start + rows_per_page]
+
+
+def _column_values(frame: pd.DataFrame, key: str) -> list[Any]:
+    """Return a column as a Python list with missing values mapped to None."""
+    column = frame[key]
+    if column.hasnans:
+        column = column.astype(object).where(column.notna(), None)
+    values: list[Any] = column.tolist()
+    return values
+
 
 class PowerPointChartEmbedder:
     """
@@ -33,7 +98,7 @@ class PowerPointChartEmbedder:
     def embed_bar_chart(
         self,
         slide,
-        data: list[dict[str, Any]],
+        data: TabularData,
         x_key: str,
         y_keys: list[str],
         title: str | None = None,
@@ -45,7 +110,7 @@ class PowerPointChartEmbedder:
 
         Args:
             slide: PowerPoint slide object
-            data: List of data dicts
+            data: List of data dicts, DataFrame or NumPy array
             x_key: Key for x-axis (categories)
             y_keys: Keys for y-axis (series)
             title: Chart title
@@ -64,14 +129,7 @@ class PowerPointChartEmbedder:
         # Determine chart type
         chart_type = XL_CHART_TYPE.COLUMN_STACKED if stacked else XL_CHART_TYPE.COLUMN_CLUSTERED
 
-        # Create chart data
-        chart_data = CategoryChartData()
-        chart_data.categories = [item[x_key] for item in data]
-
-        # Add series
-        for _i, y_key in enumerate(y_keys):
-            values = [item[y_key] for item in data]
-            chart_data.add_series(y_key, values)
+        chart_data = self._build_category_data(data, x_key, y_keys)
 
         # Add chart to slide
         chart = slide.shapes.add_chart(chart_type, left, top, width, height, chart_data).chart
@@ -84,7 +142,7 @@ class PowerPointChartEmbedder:
     def embed_line_chart(
         self,
         slide,
-        data: list[dict[str, Any]],
+        data: TabularData,
         x_key: str,
         y_keys: list[str],
         title: str | None = None,
@@ -96,7 +154,7 @@ class PowerPointChartEmbedder:
 
         Args:
             slide: PowerPoint slide object
-            data: List of data dicts
+            data: List of data dicts, DataFrame or NumPy array
             x_key: Key for x-axis (categories)
             y_keys: Keys for y-axis (series)
             title: Chart title
@@ -114,14 +172,7 @@ class PowerPointChartEmbedder:
         # Chart type
         chart_type = XL_CHART_TYPE.LINE if smooth else XL_CHART_TYPE.LINE
 
-        # Create chart data
-        chart_data = CategoryChartData()
-        chart_data.categories = [item[x_key] for item in data]
-
-        # Add series
-        for _i, y_key in enumerate(y_keys):
-            values = [item[y_key] for item in data]
-            chart_data.add_series(y_key, values)
+        chart_data = self._build_category_data(data, x_key, y_keys)
 
         # Add chart
         chart = slide.shapes.add_chart(chart_type, left, top, width, height, chart_data).chart
@@ -139,7 +190,7 @@ class PowerPointChartEmbedder:
     def embed_pie_chart(
         self,
         slide,
-        data: list[dict[str, Any]],
+        data: TabularData,
         label_key: str,
         value_key: str,
         title: str | None = None,
@@ -151,7 +202,7 @@ class PowerPointChartEmbedder:
 
         Args:
             slide: PowerPoint slide object
-            data: List of data dicts
+            data: List of data dicts, DataFrame or NumPy array
             label_key: Key for labels
             value_key: Key for values
             title: Chart title
@@ -169,19 +220,17 @@ class PowerPointChartEmbedder:
         # Chart type
         chart_type = XL_CHART_TYPE.DOUGHNUT if donut else XL_CHART_TYPE.PIE
 
-        # Create chart data
+        # Create chart data (pie only has one series)
+        frame = to_frame(data)
         chart_data = CategoryChartData()
-        chart_data.categories = [item[label_key] for item in data]
-
-        # Add series (pie only has one)
-        values = [item[value_key] for item in data]
-        chart_data.add_series("Values", values)
+        chart_data.categories = _column_values(frame, label_key)
+        chart_data.add_series("Values", _column_values(frame, value_key))
 
         # Add chart
         chart = slide.shapes.add_chart(chart_type, left, top, width, height, chart_data).chart
 
         # Style
-        self._style_chart(chart, title, len(data))
+        self._style_chart(chart, title, len(frame))
 
         # Show data labels with percentages
         chart.has_legend = True
@@ -199,7 +248,7 @@ class PowerPointChartEmbedder:
     def embed_area_chart(
         self,
         slide,
-        data: list[dict[str, Any]],
+        data: TabularData,
         x_key: str,
         y_keys: list[str],
         title: str | None = None,
@@ -211,7 +260,7 @@ class PowerPointChartEmbedder:
 
         Args:
             slide: PowerPoint slide object
-            data: List of data dicts
+            data: List of data dicts, DataFrame or NumPy array
             x_key: Key for x-axis
             y_keys: Keys for y-axis
             title: Chart title
@@ -229,13 +278,7 @@ class PowerPointChartEmbedder:
         # Chart type
         chart_type = XL_CHART_TYPE.AREA_STACKED if stacked else XL_CHART_TYPE.AREA
 
-        # Create data
-        chart_data = CategoryChartData()
-        chart_data.categories = [item[x_key] for item in data]
-
-        for y_key in y_keys:
-            values = [item[y_key] for item in data]
-            chart_data.add_series(y_key, values)
+        chart_data = self._build_category_data(data, x_key, y_keys)
 
         # Add chart
         chart = slide.shapes.add_chart(chart_type, left, top, width, height, chart_data).chart
@@ -245,6 +288,30 @@ class PowerPointChartEmbedder:
 
         return chart
 
+    def _build_category_data(
+        self, data: TabularData, x_key: str, y_keys: list[str]
+    ) -> CategoryChartData:
+        """
+        Bind categories and series column-wise.
+
+        Args:
+            data: Chart data
+            x_key: Column holding categories
+            y_keys: Columns holding series values
+
+        Returns:
+            CategoryChartData ready for add_chart
+        """
+        frame = to_frame(data)
+
+        chart_data = CategoryChartData()
+        chart_data.categories = _column_values(frame, x_key)
+
+        for y_key in y_keys:
+            chart_data.add_series(y_key, _column_values(frame, y_key))
+
+        return chart_data
+
     def _style_chart(self, chart, title: str | None, num_series: int):
         """
         Apply KDS styling to chart.
@@ -339,16 +406,21 @@ class PowerPointChartEmbedder:
     def embed_table(
         self,
         slide,
-        data: list[dict[str, Any]],
+        data: TabularData,
         columns: list[str],
         position: tuple[float, float, float, float] = None,
     ):
         """
         Embed native table in slide.
 
+        The header row is styled through python-pptx; data rows are rendered
+        as a single XML fragment and appended in bulk, so large tables do not
+        pay per-cell proxy overhead. Use iter_table_pages() (or
+        SlideBuilder.add_table_slides) to split long tables across slides.
+
         Args:
             slide: PowerPoint slide object
-            data: List of data dicts
+            data: List of data dicts, DataFrame or NumPy array
             columns: Column keys to include
             position: Position tuple
 
@@ -360,17 +432,24 @@ class PowerPointChartEmbedder:
 
         left, top, width, height = [Inches(x) for x in position]
 
-        # Create table
-        rows = len(data) + 1  # +1 for header
+        # Records keep their original cell values (an int next to a missing cell stays an int)
+        if isinstance(data, (pd.DataFrame, np.ndarray)):
+            frame = to_frame(data)
+        else:
+            frame = pd.DataFrame(data, dtype=object)
+
+        # Create table with header row only; data rows are appended below
+        rows = len(frame) + 1  # +1 for header
         cols = len(columns)
+        row_height = Emu(height // rows)
 
-        table_shape = slide.shapes.add_table(rows, cols, left, top, width, height)
+        table_shape = slide.shapes.add_table(1, cols, left, top, width, row_height)
         table = table_shape.table
 
         # Header row
         for col_idx, col_key in enumerate(columns):
             cell = table.cell(0, col_idx)
-            cell.text = col_key.replace("_", " ").title()
+            cell.text = str(col_key).replace("_", " ").title()
 
             # Style header
             cell.fill.solid()
@@ -383,35 +462,64 @@ class PowerPointChartEmbedder:
             para.font.color.rgb = RGBColor(255, 255, 255)  # White text
 
         # Data rows
-        for row_idx, item in enumerate(data, start=1):
-            for col_idx, col_key in enumerate(columns):
-                cell = table.cell(row_idx, col_idx)
-                value = item.get(col_key, "")
-                cell.text = str(value)
-
-                # Style data cell
-                para = cell.text_frame.paragraphs[0]
-                para.font.size = Pt(10)
-                para.font.name = "Inter"
-                para.font.color.rgb = RGBColor.from_string(
-                    self.theme.get_text().lstrip("#")
-                )
-
-                # Alternating row colors
-                if row_idx % 2 == 0:
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = RGBColor.from_string(
-                        self.theme.get_background("secondary").lstrip("#")
-                    )
+        if len(frame):
+            tbl = table._tbl
+            for tr in self._build_table_rows(frame, columns, row_height):
+                tbl.append(tr)
+            table_shape.height = Emu(row_height * rows)
 
         return table
 
+    def _build_table_rows(self, frame: pd.DataFrame, columns: list[str], row_height: int):
+        """
+        Render data rows as <a:tr> elements in one parse.
+
+        Args:
+            frame: Table data
+            columns: Column keys to include (missing columns render empty)
+            row_height: Row height in EMU
+
+        Returns:
+            List of <a:tr> elements
+        """
+        text_color = self.theme.get_text().lstrip("#")
+        stripe_color = self.theme.get_background("secondary").lstrip("#")
+
+        # Stringify and escape column-wise (missing keys and None/NaN render empty)
+        cells = frame.reindex(columns=columns).astype(object).fillna("").astype(str)
+        escaped = [cells[col].map(escape).tolist() for col in cells.columns]
+
+        para_props = (
+            f'<a:pPr><a:defRPr sz="1000"><a:solidFill><a:srgbClr val="{text_color}"/></a:solidFill>'
+            '<a:latin typeface="Inter"/></a:defRPr></a:pPr>'
+        )
+        plain_tc_pr = "<a:tcPr/>"
+        stripe_tc_pr = (
+            f'<a:tcPr><a:solidFill><a:srgbClr val="{stripe_color}"/></a:solidFill></a:tcPr>'
+        )
+
+        parts = [f"<a:tbl {nsdecls('a')}>"]
+        for row_offset in range(len(cells)):
+            # Alternating row colors (header is row 0)
+            tc_pr = stripe_tc_pr if (row_offset + 1) % 2 == 0 else plain_tc_pr
+            parts.append(f'<a:tr h="{int(row_height)}">')
+            for column_text in escaped:
+                parts.append(
+                    "<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p>"
+                    f"{para_props}<a:r><a:t>{column_text[row_offset]}</a:t></a:r>"
+                    f"</a:p></a:txBody>{tc_pr}</a:tc>"
+                )
+            parts.append("</a:tr>")
+        parts.append("</a:tbl>")
+
+        return list(parse_xml("".join(parts)))
+
 
 def embed_chart_in_slide(
     prs: Presentation,
     slide_idx: int,
     chart_type: str,
-    data: list[dict[str, Any]],
+    data: TabularData,
     **kwargs,
 ):
     """
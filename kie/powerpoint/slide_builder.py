@@ -13,7 +13,12 @@ from pptx.enum.text import PP_ALIGN
 from pptx.util import Inches, Pt
 
 from kie.brand.theme import get_theme
-from kie.powerpoint.chart_embedder import PowerPointChartEmbedder
+from kie.powerpoint.chart_embedder import (
+    DEFAULT_TABLE_ROWS_PER_SLIDE,
+    PowerPointChartEmbedder,
+    TabularData,
+    iter_table_pages,
+)
 
 
 class SlideBuilder:
@@ -221,7 +226,7 @@ class SlideBuilder:
         self,
         title: str,
         chart_type: str,
-        data: list[dict[str, Any]],
+        data: TabularData,
         notes: str | None = None,
         **chart_kwargs,
     ):
@@ -274,6 +279,54 @@ class SlideBuilder:
 
         return slide
 
+    def add_table_slides(
+        self,
+        title: str,
+        data: TabularData,
+        columns: list[str],
+        rows_per_slide: int = DEFAULT_TABLE_ROWS_PER_SLIDE,
+        notes: str | None = None,
+    ) -> list:
+        """
+        Add one or more slides with a native table, paginating long tables.
+
+        Args:
+            title: Slide title (continuation slides get a "(cont. n/N)" suffix)
+            data: Table data (records, DataFrame or NumPy array)
+            columns: Column keys to include
+            rows_per_slide: Maximum data rows per slide
+            notes: Speaker notes (added to the first slide)
+
+        Returns:
+            List of slide objects
+        """
+        pages = list(iter_table_pages(data, rows_per_slide))
+        slides = []
+
+        for page_idx, page in enumerate(pages):
+            slide_layout = self.prs.slide_layouts[6]
+            slide = self.prs.slides.add_slide(slide_layout)
+
+            self._set_slide_background(slide)
+            page_title = title
+            if len(pages) > 1 and page_idx > 0:
+                page_title = f"{title} (cont. {page_idx + 1}/{len(pages)})"
+            self._add_slide_title(slide, page_title)
+
+            self.chart_embedder.embed_table(
+                slide, page, columns, position=(1, 2, 11.333, 4.5)
+            )
+
+            if notes and page_idx == 0:
+                notes_slide = slide.notes_slide
+                notes_slide.notes_text_frame.text = notes
+
+            self._add_branding(slide)
+            self._add_slide_number(slide)
+            slides.append(slide)
+
+        return slides
+
     def add_image_slide(
         self,
         title: str,
@@ -0,0 +1,355 @@
+"""
+In-Process Run Context
+
+Keeps live objects between the stages of one `/go --full` run so later
+stages don't reload data or re-parse artifacts written seconds earlier:
+
+- Loaded DataFrame and DataLoader (schema included) per data file
+- EDA profile, insight catalog and visualization plan objects
+- Parsed JSON/YAML artifacts by path
+- Background artifact writes (disk copies are kept for auditability)
+
+Outside a full run no context is active and every helper falls back to
+plain disk I/O, so single commands behave exactly as before.
+
+Example:
+    >>> with run_context(project_root) as ctx:
+    ...     loader, df = ctx.load_data(data_path)
+    ...     ctx.write_artifact(profile_path, profile_dict)
+"""
+
+import copy
+import json
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from kie.skills.artifact_cache import ArtifactCache
+from kie.utils.artifact_writer import ArtifactWriter, serialize_artifact
+
+# File identity used to detect edits made outside the run
+_Signature = tuple[int, int, int]
+
+
+def _signature(path: Path) -> _Signature | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def _parse(path: Path, fmt: str) -> Any:
+    if fmt == "json":
+        return json.loads(path.read_bytes())
+    if fmt == "yaml":
+        with open(path, encoding="utf-8") as f:
+            return yaml.safe_load(f)
+    if fmt == "text":
+        return path.read_text(encoding="utf-8")
+    raise ValueError(f"Unsupported artifact format: {fmt}")
+
+
+class RunContext:
+    """
+    Live state shared by the stages of one full-mode run.
+
+    Objects handed out by read_artifact() are shared between consumers and
+    must be treated as read-only. DataFrames from load_data() are copies.
+    """
+
+    def __init__(self, project_root: Path, writer: ArtifactWriter | None = None):
+        """
+        Initialize run context.
+
+        Args:
+            project_root: Project root directory
+            writer: Background artifact writer (default: a private ArtifactWriter,
+                shut down by close())
+        """
+        self.project_root = Path(project_root)
+
+        # Live stage outputs
+        self.profile: Any = None
+        self.catalog: Any = None
+        self.visualization_plan: dict[str, Any] | None = None
+
+        # Parsed artifacts shared by every SkillContext of the run
+        self.artifact_cache = ArtifactCache()
+
+        self._frames: dict[str, tuple[_Signature | None, Any, Any]] = {}
+        self._artifacts: dict[str, tuple[str, Any, _Signature | None]] = {}
+        self._lock = threading.Lock()
+        self._writer = writer or ArtifactWriter()
+        self._owns_writer = writer is None
+        self._stats = {"data_loads": 0, "data_hits": 0, "artifact_reads": 0, "artifact_hits": 0, "writes": 0}
+
+    def load_data(self, path: Path | str, loader_factory: Callable[[], Any] | None = None) -> tuple[Any, Any]:
+        """
+        Load a data file once per run.
+
+        Args:
+            path: Data file
+            loader_factory: Creates the loader on a miss (default: kie.data.DataLoader)
+
+        Returns:
+            Tuple of (loader, DataFrame); both are private copies for the caller
+        """
+        path = Path(path)
+        key = str(path.resolve())
+        signature = _signature(path)
+
+        with self._lock:
+            cached = self._frames.get(key)
+        if cached is None or cached[0] != signature:
+            if loader_factory is None:
+                from kie.data import DataLoader
+                loader_factory = DataLoader
+            loader = loader_factory()
+            df = loader.load(path)
+            with self._lock:
+                self._frames[key] = (signature, loader, df)
+                self._stats["data_loads"] += 1
+        else:
+            with self._lock:
+                self._stats["data_hits"] += 1
+            _, loader, df = cached
+
+        # Stages may add or coerce columns; never let that leak into the next stage
+        df = df.copy()
+        loader_copy = copy.copy(loader)
+        if hasattr(loader_copy, "last_loaded"):
+            loader_copy.last_loaded = df
+        if getattr(loader_copy, "schema", None) is not None:
+            loader_copy.schema = copy.deepcopy(loader_copy.schema)
+        return loader_copy, df
+
+    def write_artifact(
+        self,
+        path: Path | str,
+        obj: Any,
+        fmt: str = "json",
+        indent: int | None = 2,
+        sort_keys: bool = True,
+        on_written: Callable[[Path], None] | None = None,
+    ) -> Path:
+        """
+        Register an artifact and write it to disk in the background.
+
+        The object is available to read_artifact() immediately.
+
+        Args:
+            path: Destination file
+            obj: Object to serialize (must not be mutated afterwards)
+            fmt: "json", "yaml" or "text"
+            indent: JSON indentation
+            sort_keys: Sort YAML mapping keys (yaml.dump default)
+            on_written: Called with the path once the file is on disk
+
+        Returns:
+            Destination path
+        """
+        path = Path(path)
+        key = str(path.resolve())
+
+        def written(path: Path) -> None:
+            with self._lock:
+                entry = self._artifacts.get(key)
+                if entry is not None and entry[1] is obj:
+                    self._artifacts[key] = (fmt, obj, _signature(path))
+            if on_written is not None:
+                on_written(path)
+
+        with self._lock:
+            self._artifacts[key] = (fmt, obj, None)
+            self._stats["writes"] += 1
+        self._writer.write_bytes(
+            path, lambda: serialize_artifact(obj, fmt, indent=indent, sort_keys=sort_keys), on_written=written
+        )
+        return path
+
+    def read_artifact(self, path: Path | str, fmt: str = "json") -> Any:
+        """
+        Read an artifact, preferring the live object from this run.
+
+        Args:
+            path: Artifact file
+            fmt: "json", "yaml" or "text"
+
+        Returns:
+            Parsed artifact (shared; treat as read-only)
+
+        Raises:
+            FileNotFoundError: If the artifact is neither registered nor on disk
+        """
+        path = Path(path)
+        key = str(path.resolve())
+
+        with self._lock:
+            entry = self._artifacts.get(key)
+            self._stats["artifact_reads"] += 1
+        if entry is not None and entry[0] == fmt:
+            _, obj, signature = entry
+            # Pending writes have no signature yet; finished ones must be unchanged on disk
+            if signature is None or signature == _signature(path):
+                with self._lock:
+                    self._stats["artifact_hits"] += 1
+                return obj
+
+        obj = _parse(path, fmt)
+        with self._lock:
+            self._artifacts[key] = (fmt, obj, _signature(path))
+        return obj
+
+    def flush(self) -> None:
+        """
+        Wait for all background writes.
+
+        Raises:
+            Exception: First write error, if any
+        """
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Flush pending writes and stop the private writer thread."""
+        try:
+            self.flush()
+        finally:
+            if self._owns_writer:
+                self._writer.shutdown()
+
+    def stats(self) -> dict[str, int]:
+        """Return load, read and write counters."""
+        with self._lock:
+            return dict(self._stats)
+
+
+# Active run context (None outside full-mode runs)
+_active_context: RunContext | None = None
+
+
+def get_run_context() -> RunContext | None:
+    """
+    Get the active run context.
+
+    Returns:
+        RunContext, or None when no full-mode run is in progress
+    """
+    return _active_context
+
+
+def set_run_context(context: RunContext | None) -> None:
+    """
+    Set the active run context (None deactivates it).
+
+    Args:
+        context: RunContext to activate
+    """
+    global _active_context
+    _active_context = context
+
+
+@contextmanager
+def run_context(project_root: Path) -> Iterator[RunContext]:
+    """
+    Activate a run context for the duration of a block.
+
+    Pending artifact writes are flushed when the block exits.
+
+    Args:
+        project_root: Project root directory
+
+    Yields:
+        Active RunContext
+    """
+    previous = get_run_context()
+    context = RunContext(project_root)
+    set_run_context(context)
+    try:
+        yield context
+    finally:
+        set_run_context(previous)
+        context.close()
+
+
+def flush_run_context() -> None:
+    """Flush pending artifact writes of the active run context (no-op outside a run)."""
+    context = get_run_context()
+    if context is not None:
+        context.flush()
+
+
+def load_data(path: Path | str) -> tuple[Any, Any]:
+    """
+    Load a data file through the active run context, or directly when none is active.
+
+    Args:
+        path: Data file
+
+    Returns:
+        Tuple of (DataLoader, DataFrame)
+    """
+    context = get_run_context()
+    if context is not None:
+        return context.load_data(path)
+
+    from kie.data import DataLoader
+
+    loader = DataLoader()
+    df = loader.load(Path(path))
+    return loader, df
+
+
+def write_artifact(
+    path: Path | str,
+    obj: Any,
+    fmt: str = "json",
+    indent: int | None = 2,
+    sort_keys: bool = True,
+    on_written: Callable[[Path], None] | None = None,
+) -> Path:
+    """
+    Write an artifact (in the background when a run context is active).
+
+    Args:
+        path: Destination file
+        obj: Object to serialize
+        fmt: "json", "yaml" or "text"
+        indent: JSON indentation
+        sort_keys: Sort YAML mapping keys (yaml.dump default)
+        on_written: Called with the path once the file is on disk
+
+    Returns:
+        Destination path
+    """
+    context = get_run_context()
+    if context is not None:
+        return context.write_artifact(path, obj, fmt=fmt, indent=indent, sort_keys=sort_keys, on_written=on_written)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(serialize_artifact(obj, fmt, indent=indent, sort_keys=sort_keys))
+    if on_written is not None:
+        on_written(path)
+    return path
+
+
+def read_artifact(path: Path | str, fmt: str = "json") -> Any:
+    """
+    Read an artifact (from the active run context's live objects when possible).
+
+    Args:
+        path: Artifact file
+        fmt: "json", "yaml" or "text"
+
+    Returns:
+        Parsed artifact
+    """
+    context = get_run_context()
+    if context is not None:
+        return context.read_artifact(path, fmt=fmt)
+    return _parse(Path(path), fmt)
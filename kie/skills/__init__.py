@@ -11,61 +11,72 @@ This module implements Skills as a first-class runtime primitive
 aligned with docs/SKILLS_AND_HOOKS_CONTRACT.md.
 """
 
+import importlib
+
 from kie.skills.base import Skill, SkillContext, SkillResult
-from kie.skills.registry import SkillRegistry, get_registry, register_skill
+from kie.skills.registry import (
+    LazySkillSpec,
+    SkillRegistry,
+    get_registry,
+    register_lazy_skill,
+    register_skill,
+)
+
+# Built-in skills: (skill_id, class name, module, stage scope).
+# Modules are imported on first dispatch so lightweight commands (/status,
+# /help) don't pay for pandas, python-pptx and friends. skill_id and
+# stage_scope must mirror the class attributes (tests/test_lazy_registry.py).
+_BUILTIN_SKILLS = [
+    ("actionability_scoring", "ActionabilityScoringSkill", "actionability_scoring", ["analyze", "build", "preview"]),
+    ("client_pack", "ClientPackSkill", "client_pack", ["preview"]),
+    ("client_readiness", "ClientReadinessSkill", "client_readiness", ["build", "preview"]),
+    ("consultant_voice", "ConsultantVoiceSkill", "consultant_voice", ["build", "preview"]),
+    ("decision_brief", "DecisionBriefSkill", "decision_brief", ["build", "preview"]),
+    ("eda_analysis_bridge", "EDAAnalysisBridgeSkill", "eda_analysis_bridge", ["eda"]),
+    ("eda_consultant_report", "EDAConsultantReport", "eda_consultant_report", ["eda"]),
+    ("eda_review", "EDAReviewSkill", "eda_review", ["eda"]),
+    ("eda_synthesis", "EDASynthesisSkill", "eda_synthesis", ["eda"]),
+    ("executive_summary", "ExecutiveSummarySkill", "executive_summary", ["analyze", "build", "preview"]),
+    ("freeform_bridge", "FreeformBridgeSkill", "freeform_bridge", ["analyze", "build"]),
+    ("insight_brief", "InsightBriefSkill", "insight_brief", ["analyze", "build", "preview"]),
+    ("insight_triage", "InsightTriageSkill", "insight_triage", ["analyze", "build", "preview"]),
+    ("narrative_synthesis", "NarrativeSynthesisSkill", "narrative_synthesis", ["analyze", "build", "preview"]),
+    ("run_story", "RunStorySkill", "run_story", ["build", "preview"]),
+    ("story_builder", "StoryBuilderSkill", "story_builder_skill", ["analyze"]),
+    ("story_manifest", "StoryManifestSkill", "story_manifest", ["build", "preview"]),
+    ("visual_qc", "VisualQCSkill", "visual_qc", ["build", "preview"]),
+    ("visualization_planner", "VisualizationPlannerSkill", "visualization_planner", ["analyze", "build", "preview"]),
+    ("visual_storyboard", "VisualStoryboardSkill", "visual_storyboard", ["analyze", "build", "preview"]),
+    ("code_simplifier", "CodeSimplifierSkill", "code_simplifier", ["build", "preview"]),
+]
+
+_SKILL_MODULES = {
+    class_name: f"kie.skills.{module}" for _, class_name, module, _ in _BUILTIN_SKILLS
+}
+
+# Auto-register skills (lazily)
+for _skill_id, _class_name, _module, _stage_scope in _BUILTIN_SKILLS:
+    register_lazy_skill(_skill_id, f"kie.skills.{_module}:{_class_name}", _stage_scope)
+
 
-# Import and register skills
-from kie.skills.actionability_scoring import ActionabilityScoringSkill
-from kie.skills.client_pack import ClientPackSkill
-from kie.skills.client_readiness import ClientReadinessSkill
-from kie.skills.consultant_voice import ConsultantVoiceSkill
-from kie.skills.decision_brief import DecisionBriefSkill
-from kie.skills.eda_analysis_bridge import EDAAnalysisBridgeSkill
-from kie.skills.eda_consultant_report import EDAConsultantReport
-from kie.skills.eda_review import EDAReviewSkill
-from kie.skills.eda_synthesis import EDASynthesisSkill
-from kie.skills.executive_summary import ExecutiveSummarySkill
-from kie.skills.freeform_bridge import FreeformBridgeSkill
-from kie.skills.insight_brief import InsightBriefSkill
-from kie.skills.insight_triage import InsightTriageSkill
-from kie.skills.narrative_synthesis import NarrativeSynthesisSkill
-from kie.skills.run_story import RunStorySkill
-from kie.skills.story_builder_skill import StoryBuilderSkill
-from kie.skills.story_manifest import StoryManifestSkill
-from kie.skills.visual_qc import VisualQCSkill
-from kie.skills.visualization_planner import VisualizationPlannerSkill
-from kie.skills.visual_storyboard import VisualStoryboardSkill
-from kie.skills.code_simplifier import CodeSimplifierSkill
+def __getattr__(name: str):
+    """Import skill classes on first attribute access (PEP 562)."""
+    module_path = _SKILL_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
 
-# Auto-register skills
-register_skill(ActionabilityScoringSkill())
-register_skill(ClientPackSkill())
-register_skill(ClientReadinessSkill())
-register_skill(ConsultantVoiceSkill())
-register_skill(DecisionBriefSkill())
-register_skill(EDAAnalysisBridgeSkill())
-register_skill(EDAConsultantReport())
-register_skill(EDAReviewSkill())
-register_skill(EDASynthesisSkill())
-register_skill(ExecutiveSummarySkill())
-register_skill(FreeformBridgeSkill())
-register_skill(InsightBriefSkill())
-register_skill(InsightTriageSkill())
-register_skill(NarrativeSynthesisSkill())
-register_skill(RunStorySkill())
-register_skill(StoryBuilderSkill())
-register_skill(StoryManifestSkill())
-register_skill(VisualQCSkill())
-register_skill(VisualizationPlannerSkill())
-register_skill(VisualStoryboardSkill())
-register_skill(CodeSimplifierSkill())
 
 __all__ = [
     "Skill",
     "SkillContext",
     "SkillResult",
+    "LazySkillSpec",
     "SkillRegistry",
     "get_registry",
+    "register_lazy_skill",
     "register_skill",
     "ActionabilityScoringSkill",
     "ClientPackSkill",
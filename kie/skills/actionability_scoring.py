@@ -127,17 +127,13 @@ class ActionabilityScoringSkill(Skill):
             )
 
         # Load inputs
-        with open(triage_path) as f:
-            triage_data = json.load(f)
+        triage_data = context.load_json(triage_path)
 
         # Load intent if available
         objective = ""
         if intent_path.exists():
-            import yaml
-
-            with open(intent_path) as f:
-                intent_data = yaml.safe_load(f)
-                objective = intent_data.get("objective", "")
+            intent_data = context.load_yaml(intent_path)
+            objective = intent_data.get("objective", "")
 
         # Score insights
         judged_insights = triage_data.get("judged_insights", [])
@@ -167,6 +163,7 @@ class ActionabilityScoringSkill(Skill):
         scores_json_path = outputs_dir / "internal" / "actionability_scores.json"
         with open(scores_json_path, "w") as f:
             json.dump(output, f, indent=2)
+        context.publish_artifact(scores_json_path, output)
 
         # Save Markdown
         scores_md_path = outputs_dir / "internal" / "actionability_scores.md"
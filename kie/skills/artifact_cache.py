@@ -0,0 +1,227 @@
+"""
+Parsed-Artifact Cache
+
+Skills of a stage read the same artifacts (insight_triage.json,
+visualization_plan.json, intent.yaml, spec.yaml, ...). The cache parses each
+file once and hands every skill the same read-only view:
+
+- Freshness is checked by (size, mtime_ns, inode); edited files are re-parsed
+- Views are dict/list subclasses that refuse mutation, so one skill can't
+  change what the next one sees (thaw() returns a mutable copy)
+- Upstream skills publish what they just wrote, so downstream skills get the
+  object without reading it back from disk
+
+Example:
+    >>> triage = context.load_json(internal_dir / "insight_triage.json")
+    >>> plan = thaw(context.load_json(viz_plan_path))  # mutable copy
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+_READ_ONLY_MESSAGE = "Artifact views are read-only; use thaw() for a mutable copy"
+
+_Signature = tuple[int, int, int]
+
+
+class ReadOnlyDict(dict):
+    """Dict that refuses mutation (JSON/YAML serializable, isinstance dict)."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {key: thaw(value) for key, value in self.items()}
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """List that refuses mutation (JSON/YAML serializable, isinstance list)."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(_READ_ONLY_MESSAGE)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [thaw(item) for item in self]
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__, (list(self),))
+
+
+_yaml_registered = False
+
+
+def _register_yaml_representers() -> None:
+    """Let yaml.dump/safe_dump write read-only views like plain dicts and lists."""
+    global _yaml_registered
+    if _yaml_registered:
+        return
+    import yaml
+
+    for dumper in (yaml.SafeDumper, yaml.Dumper):
+        yaml.add_representer(ReadOnlyDict, yaml.representer.SafeRepresenter.represent_dict, Dumper=dumper)
+        yaml.add_representer(ReadOnlyList, yaml.representer.SafeRepresenter.represent_list, Dumper=dumper)
+    _yaml_registered = True
+
+
+def freeze(obj: Any) -> Any:
+    """
+    Convert parsed JSON/YAML data into a read-only view.
+
+    Args:
+        obj: Parsed data
+
+    Returns:
+        Same data with dicts and lists replaced by read-only versions
+    """
+    _register_yaml_representers()
+    return _freeze(obj)
+
+
+def _freeze(obj: Any) -> Any:
+    if isinstance(obj, (ReadOnlyDict, ReadOnlyList)):
+        return obj
+    if isinstance(obj, dict):
+        return ReadOnlyDict((key, _freeze(value)) for key, value in obj.items())
+    if isinstance(obj, list):
+        return ReadOnlyList(_freeze(value) for value in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """
+    Mutable deep copy of a (possibly read-only) artifact.
+
+    Args:
+        obj: Artifact data
+
+    Returns:
+        Plain dicts and lists
+    """
+    if isinstance(obj, dict):
+        return {key: thaw(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(value) for value in obj]
+    return obj
+
+
+def _signature(path: Path) -> _Signature | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def _format_for(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        return "json"
+    if suffix in (".yaml", ".yml"):
+        return "yaml"
+    raise ValueError(f"Unsupported artifact type: {path.name}")
+
+
+class ArtifactCache:
+    """
+    Parsed artifacts keyed by path, validated against the file on every access.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: dict[str, tuple[_Signature, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Path | str) -> Any:
+        """
+        Parse a JSON or YAML artifact (once while the file is unchanged).
+
+        Args:
+            path: Artifact file (.json, .yaml or .yml)
+
+        Returns:
+            Read-only view of the parsed artifact
+
+        Raises:
+            FileNotFoundError: If the artifact doesn't exist
+            ValueError: If the file type isn't JSON or YAML
+        """
+        path = Path(path)
+        fmt = _format_for(path)
+        key = os.path.abspath(path)
+        signature = _signature(path)
+        if signature is None:
+            raise FileNotFoundError(f"Artifact not found: {path}")
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+
+        with open(path, "rb") as f:
+            if fmt == "json":
+                data = json.load(f)
+            else:
+                import yaml
+                data = yaml.safe_load(f)
+        view = freeze(data)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (signature, view)
+        return view
+
+    def publish(self, path: Path | str, obj: Any) -> Any:
+        """
+        Register an artifact a skill has just written (skips the re-read downstream).
+
+        The file must already be on disk; its current signature is what
+        later loads are validated against.
+
+        Args:
+            path: Artifact file
+            obj: Object that was serialized to path (not mutated afterwards)
+
+        Returns:
+            Read-only view of obj
+        """
+        path = Path(path)
+        view = freeze(obj)
+        signature = _signature(path)
+        if signature is not None:
+            with self._lock:
+                self._entries[os.path.abspath(path)] = (signature, view)
+        return view
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        """
+        Drop one artifact (or everything) from the cache.
+
+        Args:
+            path: Artifact file, or None for all
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
@@ -16,6 +16,16 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from kie.skills.artifact_cache import ArtifactCache
+
+
+def _default_artifact_cache() -> ArtifactCache:
+    """Share the active run's cache during /go --full, else start a fresh one."""
+    from kie.run_context import get_run_context
+
+    run = get_run_context()
+    return run.artifact_cache if run is not None else ArtifactCache()
+
 
 @dataclass
 class SkillContext:
@@ -29,6 +39,7 @@ class SkillContext:
     artifacts: dict[str, Any] = field(default_factory=dict)
     evidence_ledger_id: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    artifact_cache: ArtifactCache = field(default_factory=_default_artifact_cache, repr=False, compare=False)
 
     def get_artifact_path(self, artifact_name: str) -> Path | None:
         """Get path to an artifact if it exists."""
@@ -36,6 +47,49 @@ class SkillContext:
             return self.artifacts[artifact_name]
         return None
 
+    def load_json(self, path: Path | str) -> Any:
+        """
+        Parsed JSON artifact, shared by all skills of the run (read-only view).
+
+        Args:
+            path: Artifact file
+
+        Returns:
+            Parsed artifact (kie.skills.artifact_cache.thaw() gives a mutable copy)
+
+        Raises:
+            FileNotFoundError: If the artifact doesn't exist
+        """
+        return self.artifact_cache.load(path)
+
+    def load_yaml(self, path: Path | str) -> Any:
+        """
+        Parsed YAML artifact, shared by all skills of the run (read-only view).
+
+        Args:
+            path: Artifact file
+
+        Returns:
+            Parsed artifact (kie.skills.artifact_cache.thaw() gives a mutable copy)
+
+        Raises:
+            FileNotFoundError: If the artifact doesn't exist
+        """
+        return self.artifact_cache.load(path)
+
+    def publish_artifact(self, path: Path | str, obj: Any) -> Any:
+        """
+        Hand an artifact this skill just wrote to downstream skills in memory.
+
+        Args:
+            path: Artifact file (already on disk)
+            obj: Object serialized to path
+
+        Returns:
+            Read-only view of obj
+        """
+        return self.artifact_cache.publish(path, obj)
+
 
 @dataclass
 class SkillResult:
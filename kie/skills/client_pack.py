@@ -21,8 +21,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from kie.observability.ledger_store import get_ledger_store
 from kie.skills.base import Skill, SkillContext, SkillResult
 
 
@@ -195,13 +194,11 @@ class ClientPackSkill(Skill):
         if not ledger_id or not evidence_dir.exists():
             return {}
 
-        ledger_path = evidence_dir / f"{ledger_id}.yaml"
-        if not ledger_path.exists():
+        ledger_data = get_ledger_store(evidence_dir).get(ledger_id)
+        if ledger_data is None:
             return {}
 
         try:
-            with open(ledger_path) as f:
-                ledger_data = yaml.safe_load(f)
 
             hashes = {}
             for output in ledger_data.get("outputs", []):
@@ -25,8 +25,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from kie.observability.ledger_store import get_ledger_store
 from kie.paths import ArtifactPaths
 from kie.skills.base import Skill, SkillContext, SkillResult
 
@@ -82,7 +81,7 @@ class ClientReadinessSkill(Skill):
         candidate_artifacts = self._identify_candidates(outputs_dir)
 
         # Load evidence
-        trust_bundle = self._load_trust_bundle(trust_bundle_path)
+        trust_bundle = self._load_trust_bundle(context, trust_bundle_path)
         recovery_plan_exists = recovery_plan_path.exists()
         artifact_hashes = self._get_artifact_hashes(
             context.evidence_ledger_id, evidence_dir
@@ -92,6 +91,7 @@ class ClientReadinessSkill(Skill):
         classifications = []
         for artifact_path in candidate_artifacts:
             classification = self._classify_artifact(
+                context,
                 artifact_path,
                 trust_bundle,
                 recovery_plan_exists,
@@ -109,6 +109,7 @@ class ClientReadinessSkill(Skill):
         json_path = paths.client_readiness_json(create_dirs=True)
 
         markdown_content = self._generate_markdown(
+            context,
             overall_readiness,
             classifications,
             trust_bundle,
@@ -117,6 +118,7 @@ class ClientReadinessSkill(Skill):
         )
 
         json_data = self._generate_json(
+            context,
             overall_readiness,
             classifications,
             trust_bundle,
@@ -172,14 +174,13 @@ class ClientReadinessSkill(Skill):
 
         return candidates
 
-    def _load_trust_bundle(self, trust_bundle_path: Path) -> dict[str, Any]:
+    def _load_trust_bundle(self, context: SkillContext, trust_bundle_path: Path) -> dict[str, Any]:
         """Load trust bundle JSON."""
         if not trust_bundle_path.exists():
             return {}
 
         try:
-            with open(trust_bundle_path) as f:
-                return json.load(f)
+            return context.load_json(trust_bundle_path)
         except Exception:
             return {}
 
@@ -190,13 +191,11 @@ class ClientReadinessSkill(Skill):
         if not ledger_id or not evidence_dir.exists():
             return {}
 
-        ledger_path = evidence_dir / f"{ledger_id}.yaml"
-        if not ledger_path.exists():
+        ledger_data = get_ledger_store(evidence_dir).get(ledger_id)
+        if ledger_data is None:
             return {}
 
         try:
-            with open(ledger_path) as f:
-                ledger_data = yaml.safe_load(f)
 
             hashes = {}
             for output in ledger_data.get("outputs", []):
@@ -214,6 +213,7 @@ class ClientReadinessSkill(Skill):
 
     def _classify_artifact(
         self,
+        context: SkillContext,
         artifact_path: Path,
         trust_bundle: dict[str, Any],
         recovery_plan_exists: bool,
@@ -259,7 +259,7 @@ class ClientReadinessSkill(Skill):
             else:
                 # Not INTERNAL_ONLY - check for caveats
                 label, artifact_reasons, artifact_caveats = self._check_caveats(
-                    artifact_path, trust_bundle, outputs_dir
+                    context, artifact_path, trust_bundle, outputs_dir
                 )
                 reasons.extend(artifact_reasons)
                 caveats.extend(artifact_caveats)
@@ -290,6 +290,7 @@ class ClientReadinessSkill(Skill):
 
     def _check_caveats(
         self,
+        context: SkillContext,
         artifact_path: Path,
         trust_bundle: dict[str, Any],
         outputs_dir: Path,
@@ -308,8 +309,7 @@ class ClientReadinessSkill(Skill):
             triage_json_path = outputs_dir / "insight_triage.json"
             if triage_json_path.exists():
                 try:
-                    with open(triage_json_path) as f:
-                        triage_data = json.load(f)
+                    triage_data = context.load_json(triage_json_path)
 
                     # Check confidence levels of top insights
                     top_insights = triage_data.get("top_insights", [])
@@ -392,6 +392,7 @@ class ClientReadinessSkill(Skill):
 
     def _generate_markdown(
         self,
+        context: SkillContext,
         overall_readiness: ReadinessLabel,
         classifications: list[dict[str, Any]],
         trust_bundle: dict[str, Any],
@@ -453,7 +454,7 @@ class ClientReadinessSkill(Skill):
         if overall_readiness != ReadinessLabel.INTERNAL_ONLY:
             lines.append("## Approved Client Narrative")
             lines.append("")
-            narrative = self._generate_client_narrative(classifications, trust_bundle)
+            narrative = self._generate_client_narrative(context, classifications, trust_bundle)
             for bullet in narrative:
                 lines.append(f"- {bullet}")
             lines.append("")
@@ -483,6 +484,7 @@ class ClientReadinessSkill(Skill):
 
     def _generate_json(
         self,
+        context: SkillContext,
         overall_readiness: ReadinessLabel,
         classifications: list[dict[str, Any]],
         trust_bundle: dict[str, Any],
@@ -499,7 +501,7 @@ class ClientReadinessSkill(Skill):
             ),
             "artifact_classifications": classifications,
             "approved_client_narrative": (
-                self._generate_client_narrative(classifications, trust_bundle)
+                self._generate_client_narrative(context, classifications, trust_bundle)
                 if overall_readiness != ReadinessLabel.INTERNAL_ONLY
                 else []
             ),
@@ -534,7 +536,7 @@ class ClientReadinessSkill(Skill):
         return "All outputs have complete evidence chains and no material limitations"
 
     def _generate_client_narrative(
-        self, classifications: list[dict[str, Any]], trust_bundle: dict[str, Any]
+        self, context: SkillContext, classifications: list[dict[str, Any]], trust_bundle: dict[str, Any]
     ) -> list[str]:
         """Generate approved client narrative bullets."""
         narrative = []
@@ -548,8 +550,7 @@ class ClientReadinessSkill(Skill):
                         # Read the corresponding JSON
                         json_path = artifact_path.parent / "insight_triage.json"
                         if json_path.exists():
-                            with open(json_path) as f:
-                                triage_data = json.load(f)
+                            triage_data = context.load_json(json_path)
 
                             # Get top insights with High confidence
                             top_insights = triage_data.get("top_insights", [])
@@ -60,8 +60,16 @@ from kie.charts.formatting import (
     format_percentage,
     smart_round,
 )
+from kie.data.aggregation import get_aggregation_cache
+from kie.data.sampling import (
+    get_sampling_policy,
+    mean_confidence_interval,
+    stratified_sample,
+    tolerates_sampling,
+)
 from kie.skills.base import Skill, SkillContext, SkillResult
 from kie.formatting.field_registry import FieldRegistry
+from kie.utils.artifact_writer import ArtifactWriter, get_artifact_writer
 
 
 @dataclass
@@ -180,20 +188,26 @@ class EDASynthesisSkill(Skill):
         tables_dir.mkdir(parents=True, exist_ok=True)
         charts_dir.mkdir(parents=True, exist_ok=True)
 
+        # Artifacts are serialized and written in the background
+        writer = get_artifact_writer()
+
         # Generate tables
-        table_paths = self._generate_tables(df, eda_profile, synthesis, tables_dir)
+        table_paths = self._generate_tables(df, eda_profile, synthesis, tables_dir, writer)
 
         # Generate charts
-        chart_paths = self._generate_charts(df, eda_profile, synthesis, charts_dir)
+        chart_paths = self._generate_charts(df, eda_profile, synthesis, charts_dir, writer)
 
         # Generate markdown
         (outputs_dir / "internal").mkdir(parents=True, exist_ok=True)
         md_path = outputs_dir / "internal" / "eda_synthesis.md"
-        self._generate_markdown(synthesis, md_path)
+        self._generate_markdown(synthesis, md_path, writer)
 
         # Generate JSON
         json_path = outputs_dir / "internal" / "eda_synthesis.json"
-        self._generate_json(synthesis, json_path)
+        self._generate_json(synthesis, json_path, writer)
+
+        # Barrier: every artifact is on disk before the skill reports success
+        writer.flush()
 
         return SkillResult(
             success=True,
@@ -265,8 +279,23 @@ class EDASynthesisSkill(Skill):
         # Dominance analysis - what dominates the data?
         dominance_analysis = self._analyze_dominance(df, eda_profile)
 
+        # Distributions and correlations tolerate sampling (large tables only,
+        # when a sampling policy is active); the other analyses use every row
+        sampled_df = df
+        policy = get_sampling_policy()
+        if policy is not None and policy.applies_to(len(df)):
+            sampled_df, sample_info = stratified_sample(
+                df, policy.max_rows, seed=policy.seed, min_per_stratum=policy.min_per_stratum
+            )
+            dataset_overview["sample"] = sample_info.to_dict()
+
         # Distribution analysis - shape and skewness
-        distribution_analysis = self._analyze_distributions(df, eda_profile)
+        distribution_analysis = self._analyze_distributions(sampled_df, eda_profile)
+        if policy is not None and sampled_df is not df:
+            for col, distribution in distribution_analysis.items():
+                population = int(df[col].count())
+                _, low, high = mean_confidence_interval(sampled_df[col], population, policy.confidence)
+                distribution.update(total_count=population, mean_ci=[low, high])
 
         # Outlier analysis - unusual or risky
         outlier_analysis = self._analyze_outliers(df, eda_profile)
@@ -278,7 +307,7 @@ class EDASynthesisSkill(Skill):
         column_reduction = self._reduce_columns(df, eda_profile, intent_text)
 
         # Correlation analysis
-        correlation_analysis = self._analyze_correlations(df, eda_profile)
+        correlation_analysis = self._analyze_correlations(sampled_df, eda_profile)
 
         # Actionable insights
         actionable_insights = self._generate_actionable_insights(
@@ -305,25 +334,29 @@ class EDASynthesisSkill(Skill):
         """Choose appropriate aggregation based on metric type.
 
         This prevents nonsensical aggregations like summing percentage returns.
+        Results come from the shared aggregation cache, so the dominance
+        table and the contribution chart reuse one groupby.
         """
         metric_lower = metric.lower()
 
         # For percentage/ratio metrics (returns, rates, margins) - use MEAN
         # Summing percentages makes no sense!
         if any(kw in metric_lower for kw in ['return', 'rate', 'margin', 'ratio', 'pct', 'volatility', 'rsi']):
-            return df.groupby(category)[metric].mean()
+            agg = "mean"
 
         # For count metrics - use SUM
         elif any(kw in metric_lower for kw in ['count', 'number', 'quantity']):
-            return df.groupby(category)[metric].sum()
+            agg = "sum"
 
         # For currency/volume metrics - use SUM
         elif any(kw in metric_lower for kw in ['revenue', 'cost', 'value', 'volume', 'price', 'sales', 'income', 'inca', 'target', 'goal', 'total', 'amount']):
-            return df.groupby(category)[metric].sum()
+            agg = "sum"
 
         # Default: use MEDIAN (robust to outliers)
         else:
-            return df.groupby(category)[metric].median()
+            agg = "median"
+
+        return get_aggregation_cache().aggregate(df, category, metric, agg)
 
     def _is_id_column(self, df: pd.DataFrame, col: str) -> bool:
         """Check if a column is likely an ID/identifier."""
@@ -399,6 +432,7 @@ class EDASynthesisSkill(Skill):
 
         return dominance
 
+    @tolerates_sampling
     def _analyze_distributions(self, df: pd.DataFrame, eda_profile: dict) -> dict[str, Any]:
         """Analyze distributions and shape."""
         distributions = {}
@@ -629,6 +663,7 @@ class EDASynthesisSkill(Skill):
 
         return insights
 
+    @tolerates_sampling
     def _analyze_correlations(self, df: pd.DataFrame, eda_profile: dict) -> dict[str, Any]:
         """
         Analyze correlations between numeric columns.
@@ -693,9 +728,11 @@ class EDASynthesisSkill(Skill):
         df: pd.DataFrame,
         eda_profile: dict,
         synthesis: EDASynthesis,
-        tables_dir: Path
+        tables_dir: Path,
+        writer: ArtifactWriter | None = None,
     ) -> dict[str, Path]:
         """Generate all required CSV tables."""
+        writer = writer or get_artifact_writer()
         table_paths = {}
 
         # 1. Top contributors table
@@ -706,7 +743,7 @@ class EDASynthesisSkill(Skill):
                 for k, v in contrib_data.items()
             ])
             contrib_path = tables_dir / "top_contributors.csv"
-            contrib_df.to_csv(contrib_path, index=False)
+            writer.write_text(contrib_path, contrib_df.to_csv(index=False))
             table_paths["top_contributors"] = contrib_path
 
         # 2. Distribution summary table
@@ -725,7 +762,7 @@ class EDASynthesisSkill(Skill):
         if dist_rows:
             dist_df = pd.DataFrame(dist_rows)
             dist_path = tables_dir / "distribution_summary.csv"
-            dist_df.to_csv(dist_path, index=False)
+            writer.write_text(dist_path, dist_df.to_csv(index=False))
             table_paths["distribution_summary"] = dist_path
 
         # 3. Missingness summary table
@@ -739,7 +776,7 @@ class EDASynthesisSkill(Skill):
         if miss_rows:
             miss_df = pd.DataFrame(miss_rows)
             miss_path = tables_dir / "missingness_summary.csv"
-            miss_df.to_csv(miss_path, index=False)
+            writer.write_text(miss_path, miss_df.to_csv(index=False))
             table_paths["missingness_summary"] = miss_path
 
         # 4. Column reduction table
@@ -765,7 +802,7 @@ class EDASynthesisSkill(Skill):
         if red_rows:
             red_df = pd.DataFrame(red_rows)
             red_path = tables_dir / "column_reduction.csv"
-            red_df.to_csv(red_path, index=False)
+            writer.write_text(red_path, red_df.to_csv(index=False))
             table_paths["column_reduction"] = red_path
 
         return table_paths
@@ -775,11 +812,13 @@ class EDASynthesisSkill(Skill):
         df: pd.DataFrame,
         eda_profile: dict,
         synthesis: EDASynthesis,
-        charts_dir: Path
+        charts_dir: Path,
+        writer: ArtifactWriter | None = None,
     ) -> dict[str, Path]:
         """Generate chart JSON configs using ChartFactory for proper RechartsConfig structure."""
         from kie.charts import ChartFactory
 
+        writer = writer or get_artifact_writer()
         chart_paths = {}
 
         # Get first numeric and categorical columns for charts (excluding IDs)
@@ -816,8 +855,7 @@ class EDASynthesisSkill(Skill):
             )
 
             dist_path = charts_dir / f"distribution_{col}.json"
-            config.to_json(dist_path)
-            config.to_svg(dist_path.with_suffix('.svg'))
+            config.to_svg(dist_path.with_suffix('.svg'), writer=writer)
             chart_paths[f"distribution_{col}"] = dist_path
 
         # 2. Contribution chart (dominant metric by first categorical)
@@ -853,8 +891,7 @@ class EDASynthesisSkill(Skill):
                 )
 
                 contrib_path = charts_dir / f"contribution_{metric}.json"
-                config.to_json(contrib_path)
-                config.to_svg(contrib_path.with_suffix('.svg'))
+                config.to_svg(contrib_path.with_suffix('.svg'), writer=writer)
                 chart_paths[f"contribution_{metric}"] = contrib_path
 
         # 3. Missingness heatmap
@@ -880,8 +917,7 @@ class EDASynthesisSkill(Skill):
         )
 
         miss_path = charts_dir / "missingness_heatmap.json"
-        config.to_json(miss_path)
-        config.to_svg(miss_path.with_suffix('.svg'))
+        config.to_svg(miss_path.with_suffix('.svg'), writer=writer)
         chart_paths["missingness_heatmap"] = miss_path
 
         # 4. Correlation analysis + scatter plots for top correlations
@@ -936,8 +972,7 @@ class EDASynthesisSkill(Skill):
                             )
 
                             scatter_path = charts_dir / f"correlation_{col1}_{col2}.json"
-                            config.to_json(scatter_path)
-                            config.to_svg(scatter_path.with_suffix('.svg'))
+                            config.to_svg(scatter_path.with_suffix('.svg'), writer=writer)
                             chart_paths[f"correlation_{col1}_{col2}"] = scatter_path
 
         # 5. Time-series trend (if date column exists)
@@ -975,8 +1010,7 @@ class EDASynthesisSkill(Skill):
                             )
 
                             trend_path = charts_dir / f"timeseries_{metric}.json"
-                            config.to_json(trend_path)
-                            config.to_svg(trend_path.with_suffix('.svg'))
+                            config.to_svg(trend_path.with_suffix('.svg'), writer=writer)
                             chart_paths[f"timeseries_{metric}"] = trend_path
                     except Exception as e:
                         # Skip if date parsing fails
@@ -984,7 +1018,9 @@ class EDASynthesisSkill(Skill):
 
         return chart_paths
 
-    def _generate_markdown(self, synthesis: EDASynthesis, output_path: Path) -> None:
+    def _generate_markdown(
+        self, synthesis: EDASynthesis, output_path: Path, writer: ArtifactWriter | None = None
+    ) -> None:
         """Generate markdown synthesis report."""
         lines = []
 
@@ -1116,9 +1152,11 @@ class EDASynthesisSkill(Skill):
         lines.append("")
 
         # Write to file
-        output_path.write_text("\n".join(lines))
+        (writer or get_artifact_writer()).write_text(output_path, "\n".join(lines))
 
-    def _generate_json(self, synthesis: EDASynthesis, output_path: Path) -> None:
+    def _generate_json(
+        self, synthesis: EDASynthesis, output_path: Path, writer: ArtifactWriter | None = None
+    ) -> None:
         """Generate JSON synthesis data."""
         import datetime
 
@@ -1138,5 +1176,5 @@ class EDASynthesisSkill(Skill):
             }
         }
 
-        with open(output_path, "w") as f:
-            json.dump(json_data, f, indent=2, default=str)
+        # Stdlib encoding: statistics may be NaN and consumers expect NaN, not null
+        (writer or get_artifact_writer()).write_json(output_path, json_data, default=str, fast=False)
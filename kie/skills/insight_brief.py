@@ -18,9 +18,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from kie.insights import InsightCatalog, InsightSeverity, InsightCategory
+from kie.observability.ledger_store import get_ledger_store
 from kie.skills.base import Skill, SkillContext, SkillResult
 from kie.charts.formatting import format_number, format_percentage
 from kie.formatting.field_registry import FieldRegistry
@@ -360,13 +359,10 @@ class InsightBriefSkill(Skill):
         if not evidence_ledger_id:
             return hashes
 
-        ledger_path = evidence_dir / f"{evidence_ledger_id}.yaml"
-        if not ledger_path.exists():
+        ledger = get_ledger_store(evidence_dir).get(evidence_ledger_id)
+        if ledger is None:
             return hashes
 
-        with open(ledger_path) as f:
-            ledger = yaml.safe_load(f)
-
         # Extract hashes from outputs
         for output in ledger.get("outputs", []):
             path = output.get("path", "")
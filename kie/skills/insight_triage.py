@@ -23,9 +23,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import yaml
-
-from kie.insights import InsightCatalog, Insight
+from kie.insights import InsightCatalog, Insight, load_catalog
+from kie.observability.ledger_store import get_ledger_store
 from kie.skills.base import Skill, SkillContext, SkillResult
 
 
@@ -82,11 +81,13 @@ class InsightTriageSkill(Skill):
         insights_catalog_json = paths.insights_catalog()
         insights_catalog_yaml = paths.insights_yaml()
 
+        # Parsed once per run; a binary copy is kept alongside project state
+        project_state = context.project_root / "project_state"
+        binary_cache = project_state / "insights_catalog.pkl" if project_state.exists() else None
+
         if insights_catalog_json.exists():
             # Load JSON format
-            with open(insights_catalog_json) as f:
-                catalog_data = json.load(f)
-            catalog = InsightCatalog.from_dict(catalog_data)
+            catalog = load_catalog(insights_catalog_json, binary_cache=binary_cache)
         elif insights_catalog_yaml.exists():
             # Load YAML format
             catalog = InsightCatalog.load(str(insights_catalog_yaml))
@@ -124,6 +125,7 @@ class InsightTriageSkill(Skill):
         # Generate JSON output
         json_path = internal_dir / "insight_triage.json"
         json_path.write_text(json.dumps(triage_result, indent=2))
+        context.publish_artifact(json_path, triage_result)
 
         return SkillResult(
             success=True,
@@ -215,13 +217,10 @@ This may indicate:
         if not evidence_ledger_id:
             return hashes
 
-        ledger_path = evidence_dir / f"{evidence_ledger_id}.yaml"
-        if not ledger_path.exists():
+        ledger = get_ledger_store(evidence_dir).get(evidence_ledger_id)
+        if ledger is None:
             return hashes
 
-        with open(ledger_path) as f:
-            ledger = yaml.safe_load(f)
-
         # Extract hashes from outputs
         for output in ledger.get("outputs", []):
             path = output.get("path", "")
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any
 
 from kie.insights import InsightCatalog
+from kie.observability.ledger_store import get_ledger_store
 from kie.skills.base import Skill, SkillContext, SkillResult
 
 
@@ -211,15 +212,11 @@ class NarrativeSynthesisSkill(Skill):
         if not evidence_ledger_id or not evidence_dir.exists():
             return hashes
 
-        import yaml
-        ledger_path = evidence_dir / f"{evidence_ledger_id}.yaml"
-        if not ledger_path.exists():
+        ledger = get_ledger_store(evidence_dir).get(evidence_ledger_id)
+        if ledger is None:
             return hashes
 
         try:
-            with open(ledger_path) as f:
-                ledger = yaml.safe_load(f)
-
             for output in ledger.get("outputs", []):
                 path = output.get("path", "")
                 file_hash = output.get("hash")
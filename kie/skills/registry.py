@@ -5,17 +5,43 @@ Central registry for skill discovery, lifecycle, and metadata.
 
 Provides:
 - Auto-registration of skills
+- Lazy registration by module path (imported on first dispatch)
 - Stage-based lookup
 - Enable/disable via config
 - Metadata exposure for policy and hooks
 """
 
+import importlib
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from kie.skills.base import Skill, SkillContext
 
 
+@dataclass(frozen=True)
+class LazySkillSpec:
+    """
+    Declaration of a skill that is imported only when first needed.
+
+    Attributes:
+        skill_id: Skill ID (must match the class attribute)
+        target: "module.path:ClassName" of the Skill subclass
+        stage_scope: Stages the skill applies to (must match the class attribute)
+    """
+
+    skill_id: str
+    target: str
+    stage_scope: tuple[str, ...]
+
+    def load(self) -> Skill:
+        """Import the skill module and instantiate the skill."""
+        module_path, _, class_name = self.target.partition(":")
+        skill_cls = getattr(importlib.import_module(module_path), class_name)
+        skill: Skill = skill_cls()
+        return skill
+
+
 class SkillRegistry:
     """
     Central registry for all Skills.
@@ -26,6 +52,9 @@ class SkillRegistry:
     def __init__(self):
         """Initialize empty registry."""
         self._skills: dict[str, Skill] = {}
+        self._lazy_skills: dict[str, LazySkillSpec] = {}
+        # Registration order across eager and lazy skills (execution order)
+        self._order: list[str] = []
         self._disabled_skills: set[str] = set()
 
     def register(self, skill: Skill) -> None:
@@ -35,14 +64,49 @@ class SkillRegistry:
         Args:
             skill: Skill instance to register
         """
-        if skill.skill_id in self._skills:
+        if skill.skill_id in self._order:
             raise ValueError(f"Skill {skill.skill_id} already registered")
 
         self._skills[skill.skill_id] = skill
+        self._order.append(skill.skill_id)
+
+    def register_lazy(self, spec: LazySkillSpec) -> None:
+        """
+        Register a skill by module path without importing it.
+
+        The skill module is imported and instantiated the first time the
+        skill is looked up or dispatched for one of its stages.
+
+        Args:
+            spec: Lazy skill declaration
+        """
+        if spec.skill_id in self._order:
+            raise ValueError(f"Skill {spec.skill_id} already registered")
+
+        self._lazy_skills[spec.skill_id] = spec
+        self._order.append(spec.skill_id)
+
+    def _load(self, skill_id: str) -> Skill:
+        """Return a registered skill, importing it if it was registered lazily."""
+        skill = self._skills.get(skill_id)
+        if skill is None:
+            skill = self._lazy_skills.pop(skill_id).load()
+            if skill.skill_id != skill_id:
+                raise ValueError(
+                    f"Lazy skill {skill_id} resolved to skill_id {skill.skill_id}"
+                )
+            self._skills[skill_id] = skill
+        return skill
 
     def get_skill(self, skill_id: str) -> Skill | None:
         """Get a skill by ID."""
-        return self._skills.get(skill_id)
+        if skill_id not in self._order:
+            return None
+        return self._load(skill_id)
+
+    def is_loaded(self, skill_id: str) -> bool:
+        """Check if a skill's module has been imported and instantiated."""
+        return skill_id in self._skills
 
     def get_skills_for_stage(self, stage: str) -> list[Skill]:
         """
@@ -54,10 +118,17 @@ class SkillRegistry:
         Returns:
             List of applicable, enabled skills
         """
-        return [
-            skill for skill in self._skills.values()
-            if skill.is_applicable(stage) and skill.skill_id not in self._disabled_skills
-        ]
+        skills = []
+        for skill_id in self._order:
+            if skill_id in self._disabled_skills:
+                continue
+            spec = self._lazy_skills.get(skill_id)
+            if spec is not None and stage not in spec.stage_scope:
+                continue
+            skill = self._load(skill_id)
+            if skill.is_applicable(stage):
+                skills.append(skill)
+        return skills
 
     def list_skills(self) -> list[dict[str, Any]]:
         """
@@ -75,7 +146,7 @@ class SkillRegistry:
                 "produces_artifacts": skill.produces_artifacts,
                 "enabled": skill.skill_id not in self._disabled_skills,
             }
-            for skill in self._skills.values()
+            for skill in map(self._load, self._order)
         ]
 
     def disable_skill(self, skill_id: str) -> None:
@@ -110,6 +181,10 @@ class SkillRegistry:
         Returns:
             Dictionary with results from all skills
         """
+        # Skills read artifacts from disk; finish background writes of this run first
+        from kie.run_context import flush_run_context
+        flush_run_context()
+
         results = {
             "skills_executed": [],
             "artifacts_produced": {},
@@ -200,3 +275,16 @@ def register_skill(skill: Skill) -> None:
     """Register a skill in the global registry."""
     registry = get_registry()
     registry.register(skill)
+
+
+def register_lazy_skill(skill_id: str, target: str, stage_scope: list[str]) -> None:
+    """
+    Register a skill in the global registry without importing it.
+
+    Args:
+        skill_id: Skill ID
+        target: "module.path:ClassName" of the Skill subclass
+        stage_scope: Stages the skill applies to
+    """
+    registry = get_registry()
+    registry.register_lazy(LazySkillSpec(skill_id, target, tuple(stage_scope)))
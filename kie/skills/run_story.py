@@ -19,6 +19,7 @@ from typing import Any
 
 import yaml
 
+from kie.observability.ledger_store import get_ledger_store
 from kie.skills.base import Skill, SkillContext, SkillResult
 
 
@@ -105,22 +106,8 @@ class RunStorySkill(Skill):
         if not evidence_dir.exists():
             return []
 
-        entries = []
-        for ledger_file in sorted(evidence_dir.glob("*.yaml")):
-            with open(ledger_file) as f:
-                entry = yaml.safe_load(f)
-
-            # Filter by timestamp if requested
-            if since:
-                entry_time = entry.get("timestamp", "")
-                if entry_time < since:
-                    continue
-
-            entries.append(entry)
-
-        # Sort by timestamp
-        entries.sort(key=lambda e: e.get("timestamp", ""))
-        return entries
+        # Indexed store: filtered and ordered by timestamp without parsing every ledger
+        return get_ledger_store(evidence_dir).query(since=since)
 
     def _load_spec(self, project_state_dir: Path) -> dict[str, Any] | None:
         """Load project spec (LOGIC UNCHANGED)."""
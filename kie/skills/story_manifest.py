@@ -54,14 +54,15 @@ RULES:
 - No placeholders or unrendered charts
 """
 
-import json
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from kie.charts.index import get_chart_index
 from kie.skills.base import Skill, SkillContext, SkillResult
+from kie.utils.artifact_writer import get_artifact_writer
 
 
 @dataclass
@@ -250,8 +251,7 @@ class StoryManifestSkill(Skill):
             )
 
         # Load inputs
-        with open(triage_path) as f:
-            triage_data = json.load(f)
+        triage_data = context.load_json(triage_path)
 
         # Validate triage_data structure
         if not isinstance(triage_data, dict):
@@ -264,26 +264,15 @@ class StoryManifestSkill(Skill):
                 errors=errors,
             )
 
-        with open(actionability_path) as f:
-            actionability_data = json.load(f)
-
-        with open(visual_qc_path) as f:
-            visual_qc_data = json.load(f)
-
-        with open(storyboard_path) as f:
-            storyboard_data = json.load(f)
-
-        with open(viz_plan_path) as f:
-            viz_plan = json.load(f)
-
-        import yaml
-
-        with open(intent_path) as f:
-            intent_data = yaml.safe_load(f)
+        actionability_data = context.load_json(actionability_path)
+        visual_qc_data = context.load_json(visual_qc_path)
+        storyboard_data = context.load_json(storyboard_path)
+        viz_plan = context.load_json(viz_plan_path)
+        intent_data = context.load_yaml(intent_path)
 
         # Load executive summary
         exec_summary_content = self._load_executive_summary(
-            exec_summary_md, exec_summary_json
+            context, exec_summary_md, exec_summary_json
         )
 
         # Get project metadata
@@ -310,7 +299,7 @@ class StoryManifestSkill(Skill):
                     elements.append(element)
 
             # Update storyboard_data with converted elements for _build_manifest
-            storyboard_data["elements"] = elements
+            storyboard_data = {**storyboard_data, "elements": elements}
 
         if not elements:
             errors.append("visual_storyboard.json contains no visuals or elements")
@@ -322,13 +311,14 @@ class StoryManifestSkill(Skill):
                 errors=errors,
             )
 
-        # Validate all chart refs exist
+        # Validate all chart refs exist (chart JSONs are looked up in the shared
+        # chart index; anything else is checked on disk)
+        chart_index = get_chart_index(charts_dir)
         missing_charts = []
         for element in elements:
             chart_ref = element.get("chart_ref", "")
-            if chart_ref:
-                chart_path = charts_dir / chart_ref
-                if not chart_path.exists():
+            if chart_ref and chart_ref not in chart_index:
+                if not (charts_dir / chart_ref).exists():
                     missing_charts.append(chart_ref)
 
         if missing_charts:
@@ -360,20 +350,20 @@ class StoryManifestSkill(Skill):
         internal_dir.mkdir(parents=True, exist_ok=True)
         manifest_json_path = internal_dir / "story_manifest.json"
         manifest_dict = self._manifest_to_dict(manifest)
-        with open(manifest_json_path, "w") as f:
-            json.dump(manifest_dict, f, indent=2)
+        writer = get_artifact_writer()
+        writer.write_json(manifest_json_path, manifest_dict)
 
         # ALSO save JSON to outputs root for backward compatibility (dashboard expects it there)
         legacy_json_path = outputs_dir / "story_manifest.json"
-        with open(legacy_json_path, "w") as f:
-            json.dump(manifest_dict, f, indent=2)
+        writer.write_json(legacy_json_path, manifest_dict)
 
         # Save Markdown to deliverables/ (consultant-facing summary)
         deliverables_dir = outputs_dir / "deliverables"
         deliverables_dir.mkdir(parents=True, exist_ok=True)
         manifest_md_path = deliverables_dir / "story_manifest.md"
         manifest_md = self._generate_markdown(manifest)
-        manifest_md_path.write_text(manifest_md)
+        writer.write_text(manifest_md_path, manifest_md)
+        writer.flush()
 
         return SkillResult(
             success=True,
@@ -390,15 +380,14 @@ class StoryManifestSkill(Skill):
         )
 
     def _load_executive_summary(
-        self, md_path: Path, json_path: Path
+        self, context: SkillContext, md_path: Path, json_path: Path
     ) -> dict[str, Any]:
         """Load executive summary from markdown or JSON."""
         if md_path.exists():
             content = md_path.read_text()
             return {"markdown": content, "bullets": [], "caveats": []}
         elif json_path.exists():
-            with open(json_path) as f:
-                return json.load(f)
+            return context.load_json(json_path)
         return {}
 
     def _build_manifest(
@@ -488,6 +477,13 @@ class StoryManifestSkill(Skill):
             "Implications & Actions": "actions",
         }
 
+        # Index triage insights by title once (first match wins)
+        triage_by_title: dict[str, dict[str, Any]] = {}
+        for insight in triage_data.get("top_insights", []):
+            triage_title = insight.get("title", "")
+            if isinstance(triage_title, str):
+                triage_by_title.setdefault(triage_title.lower(), insight)
+
         sections = []
         for section_title in SECTION_ORDER:
             if section_title not in sections_dict:
@@ -538,24 +534,20 @@ class StoryManifestSkill(Skill):
                 element_title = element.get("insight_title", "")
 
                 if insight_id and element_title:
-                    # Find insight in triage data by matching titles
-                    for insight in triage_data.get("top_insights", []):
-                        triage_title = insight.get("title", "")
-
-                        # Match by title (exact match or very close match)
-                        if triage_title == element_title or triage_title.lower() == element_title.lower():
-                            actionability = actionability_lookup.get(insight_id, "informational")
-                            section_actionability_levels.append(actionability)
-
-                            evidence_index.append(
-                                {
-                                    "insight_id": insight_id,
-                                    "confidence": insight.get("confidence", "unknown"),
-                                    "headline": insight.get("title", ""),
-                                    "actionability": actionability,
-                                }
-                            )
-                            break
+                    # Find insight in triage data by matching titles (case-insensitive)
+                    insight = triage_by_title.get(element_title.lower())
+                    if insight is not None:
+                        actionability = actionability_lookup.get(insight_id, "informational")
+                        section_actionability_levels.append(actionability)
+
+                        evidence_index.append(
+                            {
+                                "insight_id": insight_id,
+                                "confidence": insight.get("confidence", "unknown"),
+                                "headline": insight.get("title", ""),
+                                "actionability": actionability,
+                            }
+                        )
 
             # Determine section-level actionability (highest level wins)
             if "decision_enabling" in section_actionability_levels:
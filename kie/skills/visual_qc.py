@@ -38,9 +38,9 @@ RULES:
 
 import json
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 
+from kie.charts.index import ChartSummary, get_chart_index
 from kie.skills.base import Skill, SkillContext, SkillResult
 
 
@@ -110,8 +110,7 @@ class VisualQCSkill(Skill):
         # story_manifest is optional - used for actionability lookup if available
         manifest_data = {}
         if manifest_path.exists():
-            with open(manifest_path) as f:
-                manifest_data = json.load(f)
+            manifest_data = context.load_json(manifest_path)
         else:
             warnings.append(
                 "story_manifest.json not found - proceeding without actionability context"
@@ -123,21 +122,17 @@ class VisualQCSkill(Skill):
             charts_dir.mkdir(parents=True, exist_ok=True)
 
         # Load inputs
-        with open(viz_plan_path) as f:
-            viz_plan = json.load(f)
+        viz_plan = context.load_json(viz_plan_path)
 
         # Build actionability lookup from manifest (if available)
         actionability_lookup = self._build_actionability_lookup(manifest_data)
 
-        # Evaluate all charts
-        chart_evaluations = []
-        chart_files = list(charts_dir.glob("*.json"))
-
-        for chart_file in chart_files:
-            evaluation = self._evaluate_chart(
-                chart_file, actionability_lookup.get(chart_file.name, "informational")
-            )
-            chart_evaluations.append(evaluation)
+        # Evaluate all charts (summaries come from the shared chart index, so
+        # charts already parsed by render-time validation aren't parsed again)
+        chart_evaluations = [
+            self._evaluate_chart(summary, actionability_lookup.get(summary.chart_id, "informational"))
+            for summary in get_chart_index(charts_dir).summaries(recursive=False)
+        ]
 
         # Calculate summary
         summary = {
@@ -161,6 +156,7 @@ class VisualQCSkill(Skill):
         qc_json_path = outputs_dir / "internal" / "visual_qc.json"
         with open(qc_json_path, "w") as f:
             json.dump(output, f, indent=2)
+        context.publish_artifact(qc_json_path, output)
 
         # Save Markdown
         qc_md_path = outputs_dir / "internal" / "visual_qc.md"
@@ -204,38 +200,33 @@ class VisualQCSkill(Skill):
         return lookup
 
     def _evaluate_chart(
-        self, chart_path: Path, actionability: str
+        self, summary: ChartSummary, actionability: str
     ) -> dict[str, Any]:
         """
         Evaluate a single chart for visual quality.
 
         Args:
-            chart_path: Path to chart JSON file
+            summary: Indexed chart config and data statistics
             actionability: Actionability level of associated insight
 
         Returns:
             Evaluation dict with classification and issues
         """
-        chart_ref = chart_path.name
+        chart_ref = summary.chart_id
         issues = []
         recommended_actions = []
 
-        # Load chart data
-        try:
-            with open(chart_path) as f:
-                chart_data = json.load(f)
-        except Exception as e:
+        if summary.error is not None:
             return {
                 "chart_ref": chart_ref,
                 "actionability": actionability,
                 "visual_quality": "internal_only",
-                "issues": [f"Failed to load chart: {e}"],
+                "issues": [f"Failed to load chart: {summary.error}"],
                 "recommended_action": "Fix chart rendering",
             }
 
-        data = chart_data.get("data", [])
-        config = chart_data.get("config", {})
-        chart_type = chart_data.get("type", "unknown")
+        config = summary.config
+        chart_type = summary.chart_type
 
         # 1) AXIS & LABEL CLARITY
         # Check for missing axis labels
@@ -251,7 +242,7 @@ class VisualQCSkill(Skill):
             recommended_actions.append("Add descriptive Y-axis label with units")
 
         # Check for overloaded categories
-        num_categories = len(data)
+        num_categories = summary.data_points
         if num_categories > self.MAX_CATEGORIES_WITH_CAVEATS:
             issues.append(f"Too many categories ({num_categories})")
             recommended_actions.append(
@@ -265,38 +256,30 @@ class VisualQCSkill(Skill):
 
         # 2) SCALE & PERCEPTION RISK
         # Check for potential truncated axes (heuristic: min value much larger than 0)
-        if chart_type in ["bar", "line", "area"] and data:
-            # Extract numeric values
-            numeric_values = []
-            for item in data:
-                for key, value in item.items():
-                    if isinstance(value, (int, float)) and key not in [
-                        "x",
-                        "name",
-                        "category",
-                    ]:
-                        numeric_values.append(value)
-
-            if numeric_values:
-                min_val = min(numeric_values)
-                max_val = max(numeric_values)
-                range_val = max_val - min_val
-
-                # If min is > 50% of max, axis might be truncated
-                if min_val > 0 and min_val > max_val * 0.5 and range_val > 0:
-                    issues.append("Potentially truncated Y-axis")
-                    recommended_actions.append(
-                        "Add annotation explaining scale or start from zero"
-                    )
-
-                # Check for extreme skew (one value >> others)
-                if numeric_values:
-                    avg_val = sum(numeric_values) / len(numeric_values)
-                    if max_val > avg_val * 10:
-                        issues.append("Extreme value skew detected")
-                        recommended_actions.append(
-                            "Consider log scale or separate chart for outlier"
-                        )
+        min_val = summary.value_min
+        max_val = summary.value_max
+        mean_val = summary.value_mean
+        if (
+            chart_type in ["bar", "line", "area"]
+            and min_val is not None
+            and max_val is not None
+            and mean_val is not None
+        ):
+            range_val = max_val - min_val
+
+            # If min is > 50% of max, axis might be truncated
+            if min_val > 0 and min_val > max_val * 0.5 and range_val > 0:
+                issues.append("Potentially truncated Y-axis")
+                recommended_actions.append(
+                    "Add annotation explaining scale or start from zero"
+                )
+
+            # Check for extreme skew (one value >> others)
+            if max_val > mean_val * 10:
+                issues.append("Extreme value skew detected")
+                recommended_actions.append(
+                    "Consider log scale or separate chart for outlier"
+                )
 
         # 3) EMPHASIS CONSISTENCY
         # Check if highlighted categories are actually present
@@ -309,9 +292,8 @@ class VisualQCSkill(Skill):
             if series.get("highlight") or series.get("emphasize"):
                 # Verify data exists for highlighted series
                 data_key = series.get("dataKey", "")
-                if data and data_key:
-                    has_data = any(data_key in item for item in data)
-                    if not has_data:
+                if summary.data_points and data_key:
+                    if data_key not in summary.data_keys:
                         issues.append(
                             f"Highlighted series '{data_key}' has no data"
                         )
@@ -33,13 +33,35 @@ VISUAL SELECTION RULES (STRICT):
 - If only bar charts exist, group and sequence them to avoid repetition
 """
 
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from kie.skills.base import Skill, SkillContext, SkillResult
+from kie.utils.artifact_writer import get_artifact_writer
+from kie.utils.keyword_classifier import KeywordClassifier
+
+# Storyboard section by visual purpose keywords, first matching section wins
+PURPOSE_SECTION_KEYWORDS = {
+    "context": ["baseline", "distribution", "aggregate"],
+    "dominance": ["leader", "comparison", "contrast", "gap"],
+    "drivers": ["driver", "breakdown", "structure", "relationship"],
+    "risk": ["risk", "outlier", "anomaly"],
+    "implications": ["implication", "action", "summary"],
+}
+
+# Section by visualization type when no purpose keyword matches
+VIZ_TYPE_SECTIONS = {
+    "bar": "dominance",
+    "column": "dominance",
+    "line": "drivers",
+    "area": "drivers",
+    "scatter": "risk",
+    "bubble": "risk",
+}
+
+_purpose_classifier = KeywordClassifier(PURPOSE_SECTION_KEYWORDS)
 
 
 @dataclass
@@ -139,14 +161,11 @@ class VisualStoryboardSkill(Skill):
             )
 
         # Load data
-        with open(triage_path) as f:
-            triage_data = json.load(f)
-
-        with open(viz_plan_path) as f:
-            viz_plan = json.load(f)
+        triage_data = context.load_json(triage_path)
+        viz_plan = context.load_json(viz_plan_path)
 
         # Load narrative (optional)
-        narrative_data = self._load_narrative(outputs_dir)
+        narrative_data = self._load_narrative(context, outputs_dir)
 
         # Get build context before generating storyboard
         build_context = context.metadata.get("build_context", "presentation")
@@ -173,8 +192,10 @@ class VisualStoryboardSkill(Skill):
         storyboard_json_path = internal_dir / "visual_storyboard.json"
         storyboard_md_path = deliverables_dir / "visual_storyboard.md"
 
-        self._generate_json(storyboard_elements, storyboard_json_path, viz_plan, build_context)
+        storyboard_json = self._generate_json(storyboard_elements, storyboard_json_path, viz_plan, build_context)
         self._generate_markdown(storyboard_elements, storyboard_md_path, viz_plan, build_context)
+        get_artifact_writer().flush()
+        context.publish_artifact(storyboard_json_path, storyboard_json)
 
         return SkillResult(
             success=True,
@@ -195,14 +216,13 @@ class VisualStoryboardSkill(Skill):
             }
         )
 
-    def _load_narrative(self, outputs_dir: Path) -> dict[str, Any] | None:
+    def _load_narrative(self, context: SkillContext, outputs_dir: Path) -> dict[str, Any] | None:
         """Load narrative data if available."""
         narrative_json_path = outputs_dir / "executive_narrative.json"
         narrative_md_path = outputs_dir / "executive_narrative.md"
 
         if narrative_json_path.exists():
-            with open(narrative_json_path) as f:
-                return json.load(f)
+            return context.load_json(narrative_json_path)
         elif narrative_md_path.exists():
             # If only markdown exists, return minimal structure
             return {"sections": {"executive_summary": narrative_md_path.read_text()}}
@@ -240,12 +260,7 @@ class VisualStoryboardSkill(Skill):
         # NOTE: max_visuals limit REMOVED per user request - ALL insights should be included
 
         # Categorize specs by their purpose
-        context_specs = []
-        dominance_specs = []
-        drivers_specs = []
-        risk_specs = []
-        implications_specs = []
-
+        routing = []
         for spec in viz_specs:
             # Extract purpose and viz_type from first visual in visuals array
             visuals = spec.get("visuals", [])
@@ -257,29 +272,25 @@ class VisualStoryboardSkill(Skill):
                 # Fallback to top-level fields (legacy support)
                 purpose = spec.get("purpose", "").lower()
                 viz_type = spec.get("visualization_type", "").lower()
-
-            insight_title = spec.get("insight_title", "").lower()
-
-            if "baseline" in purpose or "distribution" in purpose or "aggregate" in purpose:
-                context_specs.append(spec)
-            elif "leader" in purpose or "comparison" in purpose or "contrast" in purpose or "gap" in purpose:
-                dominance_specs.append(spec)
-            elif "driver" in purpose or "breakdown" in purpose or "structure" in purpose or "relationship" in purpose:
-                drivers_specs.append(spec)
-            elif "risk" in purpose or "outlier" in purpose or "caveat" in insight_title or "anomaly" in purpose:
-                risk_specs.append(spec)
-            elif "implication" in purpose or "action" in purpose or "summary" in purpose:
-                implications_specs.append(spec)
-            else:
+            routing.append((spec, purpose, viz_type))
+
+        section_specs: dict[str, list[dict[str, Any]]] = {label: [] for label in PURPOSE_SECTION_KEYWORDS}
+        purpose_scores = _purpose_classifier.classify_batch([purpose for _, purpose, _ in routing])
+        for (spec, _, viz_type), scores in zip(routing, purpose_scores, strict=True):
+            if "caveat" in spec.get("insight_title", "").lower():
+                # Caveat insights route like risk purposes
+                scores = {**scores, "risk": 1}
+            section = next((label for label in PURPOSE_SECTION_KEYWORDS if label in scores), None)
+            if section is None:
                 # Default categorization based on visualization type
-                if viz_type in ["bar", "column"]:
-                    dominance_specs.append(spec)
-                elif viz_type in ["line", "area"]:
-                    drivers_specs.append(spec)
-                elif viz_type in ["scatter", "bubble"]:
-                    risk_specs.append(spec)
-                else:
-                    context_specs.append(spec)
+                section = VIZ_TYPE_SECTIONS.get(viz_type, "context")
+            section_specs[section].append(spec)
+
+        context_specs = section_specs["context"]
+        dominance_specs = section_specs["dominance"]
+        drivers_specs = section_specs["drivers"]
+        risk_specs = section_specs["risk"]
+        implications_specs = section_specs["implications"]
 
         # Build storyboard sections
         order = 0
@@ -590,8 +601,8 @@ class VisualStoryboardSkill(Skill):
         output_path: Path,
         viz_plan: dict[str, Any],
         build_context: str = "presentation"
-    ) -> None:
-        """Generate JSON storyboard."""
+    ) -> dict[str, Any]:
+        """Generate JSON storyboard (returns the written document)."""
         storyboard_json = {
             "generated_at": datetime.now().isoformat(),
             "total_visuals": len(elements),
@@ -637,8 +648,8 @@ class VisualStoryboardSkill(Skill):
             }
             storyboard_json["sections"].append(section_data)
 
-        with open(output_path, "w") as f:
-            json.dump(storyboard_json, f, indent=2)
+        get_artifact_writer().write_json(output_path, storyboard_json)
+        return storyboard_json
 
     def _generate_markdown(
         self,
@@ -692,4 +703,4 @@ class VisualStoryboardSkill(Skill):
 
                 lines.append("")
 
-        output_path.write_text("\n".join(lines))
+        get_artifact_writer().write_text(output_path, "\n".join(lines))
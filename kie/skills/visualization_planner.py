@@ -15,6 +15,7 @@ from typing import Any
 from kie.insights.schema import InsightType
 from kie.skills.base import Skill, SkillContext, SkillResult
 from kie.charts.formatting import format_number
+from kie.utils.keyword_classifier import KeywordClassifier
 
 
 # Chart Excellence Plan: InsightType → ChartType Multi-Version Mapping
@@ -71,6 +72,49 @@ INSIGHT_TYPE_TO_CHART_TYPE = {
     ],
 }
 
+# Keyword taxonomy for insight text (title / why_it_matters), matched as
+# case-insensitive substrings by one shared classifier
+INSIGHT_KEYWORDS = {
+    # Visualization gate: comparative value at all
+    "comparative": [
+        "higher", "lower", "increased", "decreased", "more", "less", "growth",
+        "decline", "compared", "vs", "versus", "%", "percent", "share", "lead",
+        "top", "dominat", "driver", "impact", "affect", "influence",
+        "relationship", "correlat", "concentration", "concentrat",
+        "distribution", "across",
+    ],
+    # Visual Pattern Library triggers
+    "share_language": ["share", "lead", "top", "dominat"],
+    "plural_entities": ["regions", "products", "segments", "categories", "channels", "customers"],
+    "driver_language": ["driver", "impact", "affect", "influence", "relationship", "correlat"],
+    # Chart type fallback (no insight_type)
+    "trend": ["trend", "over time", "growth", "decline", "quarter", "year"],
+    "comparison": ["compare", "vs", "versus", "higher", "lower", "between", "share", "lead", "top", "dominat"],
+    "distribution": ["distribution", "spread", "range", "variance"],
+    "relationship": ["correlation", "relationship", "associated", "driver", "impact", "affect", "influence"],
+    "geographic": ["region", "location", "geographic", "area", "city", "state"],
+    "concentration": ["concentration", "concentrat"],
+    "segmentation": ["segment", "category", "group", "type"],
+    # Waterfall trigger
+    "sequential_change": [
+        "budget vs actual", "variance", "bridge", "contribution",
+        "starting", "ending", "what explains", "waterfall",
+    ],
+}
+
+# Keyword fallback chart types, first matching label wins (default: bar comparison)
+KEYWORD_FALLBACK_CHART_TYPE = [
+    ("trend", ("line", "trend", "primary")),
+    ("comparison", ("bar", "comparison", "primary")),
+    ("distribution", ("bar", "distribution", "primary")),
+    ("relationship", ("scatter", "risk", "primary")),
+    ("geographic", ("map", "concentration", "primary")),
+    ("concentration", ("bar", "concentration", "primary")),
+    ("segmentation", ("bar", "segmentation", "primary")),
+]
+
+_insight_classifier = KeywordClassifier(INSIGHT_KEYWORDS)
+
 
 class VisualizationPlannerSkill(Skill):
     """
@@ -91,6 +135,12 @@ class VisualizationPlannerSkill(Skill):
     - preview
     """
 
+    def __init__(self):
+        """Initialize skill."""
+        super().__init__()
+        # Keyword scores of the current run's insight texts (see _keyword_scores)
+        self._keyword_memo: dict[str, dict] = {}
+
     @property
     def skill_id(self) -> str:
         """Unique identifier for this skill."""
@@ -121,14 +171,13 @@ class VisualizationPlannerSkill(Skill):
             # No triage available yet - fail cleanly
             return self._handle_no_triage(outputs_dir)
 
-        with open(triage_json_path) as f:
-            triage_data = json.load(f)
+        triage_data = context.load_json(triage_json_path)
 
         # Load intent if available (for alignment)
-        intent_text = self._load_intent(project_state_dir)
+        intent_text = self._load_intent(context, project_state_dir)
 
         # Load narrative if available (for framing)
-        narrative_data = self._load_narrative(outputs_dir)
+        narrative_data = self._load_narrative(context, outputs_dir)
 
         # Generate visualization specs from triage
         viz_specs = self._generate_visualization_specs(triage_data)
@@ -157,6 +206,7 @@ class VisualizationPlannerSkill(Skill):
 
         viz_plan_json_path.write_text(json.dumps(viz_plan_json, indent=2))
         viz_plan_md_path.write_text(viz_plan_md)
+        context.publish_artifact(viz_plan_json_path, viz_plan_json)
 
         return SkillResult(
             success=True,
@@ -208,30 +258,26 @@ class VisualizationPlannerSkill(Skill):
             },
         )
 
-    def _load_intent(self, project_state_dir: Path) -> str | None:
+    def _load_intent(self, context: SkillContext, project_state_dir: Path) -> str | None:
         """Load project intent if available."""
         intent_path = project_state_dir / "intent.yaml"
         if not intent_path.exists():
             return None
 
-        import yaml
-
         try:
-            with open(intent_path) as f:
-                intent_data = yaml.safe_load(f)
-                return intent_data.get("intent_text", intent_data.get("intent"))
+            intent_data = context.load_yaml(intent_path)
+            return intent_data.get("intent_text", intent_data.get("intent"))
         except Exception:
             return None
 
-    def _load_narrative(self, outputs_dir: Path) -> dict[str, Any] | None:
+    def _load_narrative(self, context: SkillContext, outputs_dir: Path) -> dict[str, Any] | None:
         """Load executive narrative if available."""
         narrative_json_path = outputs_dir / "executive_narrative.json"
         if not narrative_json_path.exists():
             return None
 
         try:
-            with open(narrative_json_path) as f:
-                return json.load(f)
+            return context.load_json(narrative_json_path)
         except Exception:
             return None
 
@@ -249,6 +295,15 @@ class VisualizationPlannerSkill(Skill):
         guidance = triage_data.get("consultant_guidance", {})
         avoid_leading = guidance.get("avoid_leading_with", [])
 
+        # Classify every insight text the keyword checks below will see in one batch
+        texts = []
+        for insight in top_insights:
+            why_matters = insight.get("why_it_matters", "") or ""
+            texts.append(why_matters)
+            texts.append((insight.get("title", "Untitled insight") or "") + " " + why_matters)
+            texts.append((insight.get("title", "") or "") + " " + why_matters)
+        self._keyword_memo = dict(zip(texts, _insight_classifier.classify_batch(texts), strict=True))
+
         for insight in top_insights:
             title = insight.get("title", "Untitled insight")
             confidence_label = insight.get("confidence", "UNKNOWN")
@@ -296,6 +351,13 @@ class VisualizationPlannerSkill(Skill):
 
         return specs
 
+    def _keyword_scores(self, text: str) -> dict:
+        """Keyword label scores of an insight text (batch-classified per run)."""
+        scores = self._keyword_memo.get(text)
+        if scores is None:
+            scores = _insight_classifier.scores(text)
+        return scores
+
     def _confidence_to_numeric(self, confidence_label: str) -> float:
         """Convert confidence label to numeric value."""
         mapping = {
@@ -326,39 +388,7 @@ class VisualizationPlannerSkill(Skill):
             return False
 
         # Rule 3: Purely descriptive (check for comparison/trend keywords)
-        comparative_keywords = [
-            "higher",
-            "lower",
-            "increased",
-            "decreased",
-            "more",
-            "less",
-            "growth",
-            "decline",
-            "compared",
-            "vs",
-            "versus",
-            "%",
-            "percent",
-            "share",
-            "lead",
-            "top",
-            "dominat",
-            "driver",
-            "impact",
-            "affect",
-            "influence",
-            "relationship",
-            "correlat",
-            "concentration",
-            "concentrat",
-            "distribution",
-            "across",
-            "across",
-        ]
-
-        text_to_check = (why_matters or "").lower()
-        has_comparative = any(kw in text_to_check for kw in comparative_keywords)
+        has_comparative = "comparative" in self._keyword_scores(why_matters or "")
 
         if not has_comparative:
             return False
@@ -508,15 +538,15 @@ class VisualizationPlannerSkill(Skill):
         Returns:
             List of visualization specs (single item = no pattern, multiple = pattern applied)
         """
-        text = (title + " " + why_matters).lower()
+        labels = self._keyword_scores(title + " " + why_matters)
 
         # PATTERN 1: Comparison with many categories
         # Trigger when ANY:
         # - purpose is comparison OR concentration
         # - share/dominance language (share, lead, top, dominates)
         # - plural entity keywords (regions, products, segments, etc.)
-        share_language = any(kw in text for kw in ["share", "lead", "top", "dominat"])
-        entity_keywords = any(kw in text for kw in ["regions", "products", "segments", "categories", "channels", "customers"])
+        share_language = "share_language" in labels
+        entity_keywords = "plural_entities" in labels
 
         if (purpose in ["comparison", "concentration"]) or share_language or entity_keywords:
             # Emit 2 visuals: bar (top N) + pareto (cumulative)
@@ -585,7 +615,7 @@ class VisualizationPlannerSkill(Skill):
         # Trigger when ANY:
         # - purpose is risk, drivers, or relationship
         # - driver/impact/relationship keywords
-        driver_keywords = any(kw in text for kw in ["driver", "impact", "affect", "influence", "relationship", "correlat"])
+        driver_keywords = "driver_language" in labels
 
         if (purpose in ["risk", "drivers", "relationship"]) or driver_keywords:
             return [
@@ -666,28 +696,10 @@ class VisualizationPlannerSkill(Skill):
                 pass  # Fall back to keyword matching
 
         # Step 2: Keyword matching (fallback) - returns PRIMARY only
-        text = (title + " " + why_matters).lower()
-
-        if any(kw in text for kw in ["trend", "over time", "growth", "decline", "quarter", "year"]):
-            return [("line", "trend", "primary")]
-
-        if any(kw in text for kw in ["compare", "vs", "versus", "higher", "lower", "between", "share", "lead", "top", "dominat"]):
-            return [("bar", "comparison", "primary")]
-
-        if any(kw in text for kw in ["distribution", "spread", "range", "variance"]):
-            return [("bar", "distribution", "primary")]
-
-        if any(kw in text for kw in ["correlation", "relationship", "associated", "driver", "impact", "affect", "influence"]):
-            return [("scatter", "risk", "primary")]
-
-        if any(kw in text for kw in ["region", "location", "geographic", "area", "city", "state"]):
-            return [("map", "concentration", "primary")]
-
-        if any(kw in text for kw in ["concentration", "concentrat"]):
-            return [("bar", "concentration", "primary")]
-
-        if any(kw in text for kw in ["segment", "category", "group", "type"]):
-            return [("bar", "segmentation", "primary")]
+        labels = self._keyword_scores(title + " " + why_matters)
+        for label, version in KEYWORD_FALLBACK_CHART_TYPE:
+            if label in labels:
+                return [version]
 
         # Default to bar chart for comparison
         return [("bar", "comparison", "primary")]
@@ -747,13 +759,8 @@ class VisualizationPlannerSkill(Skill):
             has_dual_metrics = (max_val > 1000 and min_val < 10)
 
         # Detect sequential change pattern (waterfall triggers)
-        title_lower = insight.get("title", "").lower()
-        why_matters_lower = insight.get("why_it_matters", "").lower()
-        combined_text = title_lower + " " + why_matters_lower
-        is_sequential_change = any(kw in combined_text for kw in [
-            "budget vs actual", "variance", "bridge", "contribution",
-            "starting", "ending", "what explains", "waterfall"
-        ])
+        combined_text = insight.get("title", "") + " " + insight.get("why_it_matters", "")
+        is_sequential_change = "sequential_change" in self._keyword_scores(combined_text)
 
         return {
             "num_categories": num_categories,
@@ -28,6 +28,7 @@ from kie.story.narrative_synthesizer import NarrativeSynthesizer
 from kie.story.story_builder import StoryBuilder
 
 # LLM-powered components (domain-agnostic, works for ANY data)
+from kie.story.llm_backend import LLMBackend, LLMClient, LocalLLMBackend, get_llm_client
 from kie.story.llm_grouper import LLMSectionGrouper
 from kie.story.llm_chart_selector import LLMChartSelector
 from kie.story.llm_narrative_synthesizer import LLMNarrativeSynthesizer
@@ -53,6 +54,10 @@ __all__ = [
     "NarrativeSynthesizer",
     "StoryBuilder",
     # LLM-powered components (domain-agnostic)
+    "LLMBackend",
+    "LLMClient",
+    "LocalLLMBackend",
+    "get_llm_client",
     "LLMSectionGrouper",
     "LLMChartSelector",
     "LLMNarrativeSynthesizer",
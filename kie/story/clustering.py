@@ -0,0 +1,399 @@
+"""
+Concept Clustering
+
+Vectorized text clustering for story section grouping:
+- Sparse (CSR) TF-IDF document-term matrix (or a pluggable local embedding model)
+- Spherical k-means over L2-normalized vectors (cosine similarity)
+- Vectorized assignment of documents to arbitrary theme descriptions
+
+Pure NumPy, so it works without scikit-learn and scales to thousands of
+insights in milliseconds.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+# Words of 4+ letters; shorter tokens rarely carry a theme
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9]{3,}")
+
+STOP_WORDS = frozenset({
+    "about", "above", "after", "again", "against", "also", "among", "because",
+    "been", "before", "being", "below", "between", "both", "compared", "could",
+    "does", "down", "during", "each", "from", "further", "have", "having", "here",
+    "into", "more", "most", "much", "only", "other", "over", "same", "should",
+    "some", "such", "than", "that", "their", "them", "then", "there", "these",
+    "they", "this", "those", "through", "under", "until", "very", "were", "what",
+    "when", "where", "which", "while", "with", "within", "would", "your",
+})
+
+# Corpora smaller than this keep ubiquitous terms (too few documents to judge)
+MIN_DOCS_FOR_MAX_DF = 10
+
+# Embedding model: list of texts -> (n_texts, dim) array
+Embedder = Callable[[list[str]], np.ndarray]
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into normalized terms (lowercase, stop words removed, plural 's' stripped).
+
+    Args:
+        text: Raw text
+
+    Returns:
+        List of terms
+    """
+    terms = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token in STOP_WORDS:
+            continue
+        if len(token) > 4 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    normalized: np.ndarray = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    return normalized
+
+
+class SparseRows:
+    """
+    Compressed sparse row (CSR) matrix with the few operations clustering needs.
+
+    Row i's nonzero values are data[indptr[i]:indptr[i + 1]], in the columns
+    indices[indptr[i]:indptr[i + 1]]. Supports `matrix @ dense`, row
+    selection (mask or indices), any(axis=1), sum/mean(axis=0), and
+    toarray().
+    """
+
+    def __init__(self, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, shape: tuple[int, int]):
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = shape
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored values."""
+        return len(self.data)
+
+    @property
+    def row_ids(self) -> np.ndarray:
+        """Row of each stored value."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def toarray(self) -> np.ndarray:
+        """Dense (n_rows, n_cols) copy."""
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        dense[self.row_ids, self.indices] = self.data
+        return dense
+
+    def __getitem__(self, rows) -> "SparseRows":
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        indptr = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        positions = np.repeat(starts - indptr[:-1], lengths) + np.arange(indptr[-1])
+        return SparseRows(self.data[positions], self.indices[positions], indptr, (len(rows), self.shape[1]))
+
+    def __matmul__(self, dense: np.ndarray) -> np.ndarray:
+        dense = np.asarray(dense)
+        products = self.data.reshape((-1,) + (1,) * (dense.ndim - 1)) * dense[self.indices]
+        out = np.zeros((self.shape[0],) + dense.shape[1:], dtype=products.dtype)
+        nonempty = np.flatnonzero(np.diff(self.indptr))
+        if len(nonempty):
+            out[nonempty] = np.add.reduceat(products, self.indptr[nonempty], axis=0)
+        return out
+
+    def any(self, axis: int = 1) -> np.ndarray:
+        """Rows with at least one nonzero value (axis=1 only)."""
+        if axis != 1:
+            raise ValueError("SparseRows.any supports axis=1 only")
+        return np.bincount(self.row_ids, weights=self.data != 0, minlength=self.shape[0]) > 0
+
+    def sum(self, axis: int = 0) -> np.ndarray:
+        """Column sums (axis=0 only)."""
+        if axis != 0:
+            raise ValueError("SparseRows.sum supports axis=0 only")
+        return np.bincount(self.indices, weights=self.data, minlength=self.shape[1]).astype(self.data.dtype)
+
+    def mean(self, axis: int = 0) -> np.ndarray:
+        """Column means (axis=0 only)."""
+        return self.sum(axis) / max(self.shape[0], 1)
+
+    def row_dots(self, dense_rows: np.ndarray) -> np.ndarray:
+        """Dot product of each row with the same row of a dense matrix."""
+        row_ids = self.row_ids
+        weights = self.data * dense_rows[row_ids, self.indices]
+        return np.bincount(row_ids, weights=weights, minlength=self.shape[0]).astype(self.data.dtype)
+
+    def group_sums(self, groups: np.ndarray, n_groups: int) -> np.ndarray:
+        """Dense (n_groups, n_cols) sums of the rows in each group."""
+        sums = np.zeros((n_groups, self.shape[1]), dtype=self.data.dtype)
+        np.add.at(sums, (groups[self.row_ids], self.indices), self.data)
+        return sums
+
+
+# Document vectors: sparse TF-IDF rows or dense embeddings
+Vectors = SparseRows | np.ndarray
+
+
+def _dense(matrix: Vectors) -> np.ndarray:
+    return matrix.toarray() if isinstance(matrix, SparseRows) else matrix
+
+
+def _row_dots(points: Vectors, rows: np.ndarray) -> np.ndarray:
+    if isinstance(points, SparseRows):
+        return points.row_dots(rows)
+    dots: np.ndarray = (points * rows).sum(axis=1)
+    return dots
+
+
+@dataclass
+class ConceptClusters:
+    """Result of ConceptClusterer.cluster."""
+
+    labels: np.ndarray  # cluster index per document, -1 if the document has no terms
+    concepts: list[str]  # top term per cluster
+    keywords: list[list[str]]  # top terms per cluster
+    similarity: np.ndarray  # cosine similarity of each document to its cluster centroid
+
+
+class ConceptClusterer:
+    """
+    Clusters short texts by shared concepts.
+
+    Example:
+        >>> clusterer = ConceptClusterer()
+        >>> result = clusterer.cluster([ins.text for ins in insights], n_clusters=5)
+        >>> result.concepts
+        ['throughput', 'defect', ...]
+    """
+
+    def __init__(
+        self,
+        max_features: int = 1024,
+        max_df: float = 0.5,
+        max_iter: int = 20,
+        n_init: int = 4,
+        random_state: int = 0,
+        embedder: Embedder | None = None,
+    ):
+        """
+        Initialize concept clusterer.
+
+        Args:
+            max_features: Vocabulary cap (most frequent terms by document frequency)
+            max_df: Ignore terms found in more than this fraction of documents
+                (applied from MIN_DOCS_FOR_MAX_DF documents up; such terms can't separate themes)
+            max_iter: Maximum k-means iterations
+            n_init: Number of k-means runs (best result kept)
+            random_state: Seed for k-means++ initialization
+            embedder: Optional local embedding model used for similarity instead
+                of TF-IDF vectors (TF-IDF is still used to name concepts)
+        """
+        self.max_features = max_features
+        self.max_df = max_df
+        self.max_iter = max_iter
+        self.n_init = n_init
+        self.random_state = random_state
+        self.embedder = embedder
+
+        self.vocabulary: dict[str, int] = {}
+        self.terms: list[str] = []
+        self._idf = np.zeros(0, dtype=np.float32)
+
+    def fit_transform(self, texts: list[str]) -> SparseRows:
+        """
+        Learn the vocabulary and IDF weights and return L2-normalized TF-IDF rows.
+
+        Args:
+            texts: Documents
+
+        Returns:
+            (n_docs, n_terms) sparse float32 matrix
+        """
+        tokenized = [tokenize(text) for text in texts]
+
+        # Document frequency, then keep the most common terms (ties alphabetical)
+        doc_freq: dict[str, int] = {}
+        for terms in tokenized:
+            for term in set(terms):
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+        n_docs = len(texts)
+        if n_docs >= MIN_DOCS_FOR_MAX_DF:
+            doc_freq = {t: f for t, f in doc_freq.items() if f <= self.max_df * n_docs}
+        ranked = sorted(doc_freq, key=lambda t: (-doc_freq[t], t))[: self.max_features]
+        self.terms = sorted(ranked)
+        self.vocabulary = {term: i for i, term in enumerate(self.terms)}
+
+        df = np.array([doc_freq[t] for t in self.terms], dtype=np.float32)
+        self._idf = np.log((1 + n_docs) / (1 + df)) + 1  # smooth IDF
+
+        return self._tfidf(tokenized)
+
+    def transform(self, texts: list[str]) -> SparseRows:
+        """
+        Vectorize texts with the fitted vocabulary (unknown terms ignored).
+
+        Args:
+            texts: Documents
+
+        Returns:
+            (n_docs, n_terms) sparse float32 matrix, L2-normalized
+        """
+        return self._tfidf([tokenize(text) for text in texts])
+
+    def cluster(self, texts: list[str], n_clusters: int) -> ConceptClusters:
+        """
+        Cluster texts with spherical k-means.
+
+        Args:
+            texts: Documents
+            n_clusters: Desired number of clusters (capped at the number of documents)
+
+        Returns:
+            ConceptClusters
+        """
+        tfidf = self.fit_transform(texts)
+        vectors = self._similarity_space(texts, tfidf)
+
+        has_terms = tfidf.any(axis=1)
+        labels = np.full(len(texts), -1, dtype=np.int64)
+        similarity = np.zeros(len(texts), dtype=np.float32)
+        k = min(n_clusters, int(has_terms.sum()))
+        if k == 0:
+            return ConceptClusters(labels, [], [], similarity)
+
+        points = vectors[has_terms]
+        assigned, centroids = self._kmeans(points, k)
+
+        # Drop empty clusters and renumber by size (largest first)
+        sizes = np.bincount(assigned, minlength=k)
+        order = [c for c in np.argsort(-sizes, kind="stable") if sizes[c] > 0]
+        remap = np.full(k, -1, dtype=np.int64)
+        remap[order] = np.arange(len(order))
+        labels[has_terms] = remap[assigned]
+        similarity[has_terms] = _row_dots(points, centroids[assigned])
+
+        # Name clusters by their most distinctive TF-IDF terms (cluster mean
+        # weight above the corpus mean weight)
+        concepts, keywords = [], []
+        corpus_mean = tfidf.mean(axis=0)
+        for cluster in range(len(order)):
+            weights = tfidf[labels == cluster].mean(axis=0) - corpus_mean
+            if len(order) == 1:
+                weights = corpus_mean
+            top = np.argsort(-weights, kind="stable")[:5]
+            top_terms = [self.terms[i] for i in top if weights[i] > 0] or [self.terms[top[0]]]
+            concepts.append(top_terms[0])
+            keywords.append(top_terms)
+
+        return ConceptClusters(labels, concepts, keywords, similarity)
+
+    def assign(self, texts: list[str], theme_texts: list[str], min_similarity: float = 1e-6) -> np.ndarray:
+        """
+        Assign each text to its most similar theme (ties go to the earlier theme).
+
+        Args:
+            texts: Documents (vocabulary is fitted on these)
+            theme_texts: One description per theme (title, keywords, ...)
+            min_similarity: Documents below this similarity to every theme are unassigned
+
+        Returns:
+            Theme index per document, -1 if unassigned
+        """
+        if not texts or not theme_texts:
+            return np.full(len(texts), -1, dtype=np.int64)
+
+        docs = self._similarity_space(texts, self.fit_transform(texts))
+        themes = self._similarity_space(theme_texts, self.transform(theme_texts))
+
+        sims = docs @ _dense(themes).T
+        best = sims.argmax(axis=1)
+        best_sim = sims[np.arange(len(texts)), best]
+        return np.where(best_sim >= min_similarity, best, -1)
+
+    def _tfidf(self, tokenized: list[list[str]]) -> SparseRows:
+        rows, cols = [], []
+        vocabulary = self.vocabulary
+        for row, terms in enumerate(tokenized):
+            for term in terms:
+                col = vocabulary.get(term)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+
+        # Term counts per (document, term), in row-major order
+        n_docs, n_terms = len(tokenized), len(self.terms)
+        flat = np.asarray(rows, dtype=np.int64) * n_terms + np.asarray(cols, dtype=np.int64)
+        keys, counts = np.unique(flat, return_counts=True)
+        doc_ids, indices = keys // max(n_terms, 1), keys % max(n_terms, 1)
+
+        data = counts.astype(np.float32) * self._idf[indices]
+        norms = np.sqrt(np.bincount(doc_ids, weights=data * data, minlength=n_docs)).astype(np.float32)
+        data /= norms[doc_ids]
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(doc_ids, minlength=n_docs)))).astype(np.int64)
+        return SparseRows(data, indices, indptr, (n_docs, n_terms))
+
+    def _similarity_space(self, texts: list[str], tfidf: SparseRows) -> Vectors:
+        if self.embedder is None:
+            return tfidf
+        return _normalize_rows(np.asarray(self.embedder(texts), dtype=np.float32))
+
+    def _kmeans(self, points: Vectors, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Spherical k-means; best of n_init seeded runs by total cosine similarity."""
+        best = None
+        for run in range(self.n_init):
+            centroids = self._init_centroids(points, k, self.random_state + run)
+            assigned = np.zeros(len(points), dtype=np.int64)
+            for iteration in range(self.max_iter):
+                new_assigned = (points @ centroids.T).argmax(axis=1)
+                if iteration > 0 and np.array_equal(new_assigned, assigned):
+                    break
+                assigned = new_assigned
+                centroids = self._update_centroids(points, assigned, centroids)
+
+            score = float(_row_dots(points, centroids[assigned]).sum())
+            if best is None or score > best[0]:
+                best = (score, assigned, centroids)
+
+        assert best is not None  # n_init >= 1
+        return best[1], best[2]
+
+    def _init_centroids(self, points: Vectors, k: int, seed: int) -> np.ndarray:
+        """k-means++ seeding with a fixed seed (deterministic across runs)."""
+        rng = np.random.default_rng(seed)
+        chosen = [int((points @ points.sum(axis=0)).argmax())]  # densest row first
+        closest = points @ _dense(points[[chosen[0]]])[0]
+        for _ in range(1, k):
+            distance = np.clip(1.0 - closest, 0.0, None)
+            total = distance.sum()
+            if total <= 0:
+                break
+            candidate = int(rng.choice(len(points), p=distance / total))
+            chosen.append(candidate)
+            closest = np.maximum(closest, points @ _dense(points[[candidate]])[0])
+        return _dense(points[chosen]).copy()
+
+    def _update_centroids(self, points: Vectors, assigned: np.ndarray, previous: np.ndarray) -> np.ndarray:
+        if isinstance(points, SparseRows):
+            sums = points.group_sums(assigned, len(previous))
+        else:
+            membership = np.zeros((len(points), len(previous)), dtype=points.dtype)
+            membership[np.arange(len(points)), assigned] = 1.0
+            sums = membership.T @ points
+        empty = ~sums.any(axis=1)
+        sums[empty] = previous[empty]
+        return _normalize_rows(sums)
@@ -5,13 +5,61 @@ Surfaces the most impactful numbers from insights for large visual display.
 Ranks KPIs by business relevance and formats for consultant-grade presentation.
 """
 
+import heapq
 import re
-from typing import Any
+from typing import Any, NamedTuple
 
 from kie.story.models import StoryInsight
 from kie.story.models import StoryKPI, KPIType
 from kie.charts.formatting import format_number, format_percentage
 
+# Precompiled extraction patterns
+_DIGIT = re.compile(r'\d')
+_PCT_PATTERN = re.compile(r'(\d+\.?\d*)%')
+_NUMBER_PATTERN = re.compile(r'\b(\d{1,3}(?:,\d{3})+|\d{4,})\b')
+
+# Delta/change patterns ("+8.8 pts", "increased by X") combined into one scan.
+# The alternatives can't overlap, so one finditer finds the same matches as
+# running them separately; candidates are re-ordered by alternative below.
+_DELTA_PATTERN = re.compile(
+    r'(?P<sign>\+|-)\s*(?P<signed>\d+\.?\d*)\s*(?P<unit>pts|points|%|percentage points)'
+    r'|increased by (?P<increased>\d+\.?\d*)%'
+    r'|decreased by (?P<decreased>\d+\.?\d*)%'
+    r'|growth of (?P<growth>\d+\.?\d*)%',
+    re.IGNORECASE,
+)
+_DELTA_ALTERNATIVES = ("signed", "increased", "decreased", "growth")
+
+_LEADING_PUNCT = re.compile(r'^[^\w]+')
+_TRAILING_PUNCT = re.compile(r'[^\w]+$')
+_WHITESPACE = re.compile(r'\s+')
+_FIRST_NUMBER = re.compile(r'(\d+\.?\d*)')
+_LABEL_PATTERNS = [
+    re.compile(r'(?:of|in|for|with|showing|report|rated)\s+([^,\.]{10,60})'),
+    re.compile(r'([A-Z][^,\.]{10,60})'),  # Capitalized phrases
+    re.compile(r'([a-z][^,\.]{10,60})'),  # Any phrase
+]
+
+# Factor 1 of KPI scoring: KPI type weight
+_TYPE_WEIGHTS = {
+    KPIType.HEADLINE: 10.0,
+    KPIType.DELTA: 7.0,
+    KPIType.SUPPORTING: 5.0,
+    KPIType.COUNT: 3.0,
+}
+
+
+class _Candidate(NamedTuple):
+    """KPI candidate with its insight-independent score factors precomputed."""
+
+    value: str
+    label: str
+    kpi_type: KPIType
+    insight_id: str | None
+    type_weight: float
+    magnitude_bonus: float
+    label_bonus: float
+
 
 class KPIExtractor:
     """
@@ -22,11 +70,14 @@ class KPIExtractor:
     - Supporting metrics (context)
     - Delta/change metrics (trends)
     - Count metrics (sample sizes, totals)
+
+    Candidates are cached per insight (ID and text), so section-level
+    extraction over insights already seen by extract_kpis costs no regex work.
     """
 
     def __init__(self):
         """Initialize KPI extractor."""
-        pass
+        self._candidate_cache: dict[tuple[str, str], list[_Candidate]] = {}
 
     def extract_kpis(
         self,
@@ -51,14 +102,57 @@ class KPIExtractor:
         # Extract all candidate KPIs
         candidates = []
         for insight in insights:
-            kpis = self._extract_kpis_from_insight(insight, context_str)
-            candidates.extend(kpis)
-
-        # Rank and deduplicate
-        ranked = self._rank_kpis(candidates, insights)
+            candidates.extend(self._get_candidates(insight))
+
+        # Rank, deduplicate and return top N
+        return self._rank_kpis(candidates, insights, limit=max_kpis, context_str=context_str)
+
+    def _get_candidates(self, insight: StoryInsight) -> list[_Candidate]:
+        """Return cached KPI candidates for an insight, extracting on first use."""
+        key = (insight.insight_id, insight.text)
+        candidates = self._candidate_cache.get(key)
+        if candidates is None:
+            candidates = [
+                self._make_candidate(kpi)
+                for kpi in self._extract_kpis_from_insight(insight, "")
+            ]
+            self._candidate_cache[key] = candidates
+        return candidates
+
+    def _make_candidate(self, kpi: StoryKPI) -> _Candidate:
+        """Precompute the score factors that don't depend on the source insight."""
+        magnitude_bonus = 0.0
+        # Factor 3: Numeric magnitude (for percentages)
+        if '%' in kpi.value:
+            match = _FIRST_NUMBER.search(kpi.value)
+            if match:
+                pct_val = float(match.group(1))
+                # Higher percentages are more impactful (especially >50%)
+                if pct_val >= 70:
+                    magnitude_bonus = 5.0
+                elif pct_val >= 50:
+                    magnitude_bonus = 3.0
+                elif pct_val >= 30:
+                    magnitude_bonus = 1.0
 
-        # Return top N
-        return ranked[:max_kpis]
+        # Factor 4: Label quality (longer, more descriptive = better)
+        label_length = len(kpi.label)
+        if label_length >= 20:
+            label_bonus = 2.0
+        elif label_length >= 10:
+            label_bonus = 1.0
+        else:
+            label_bonus = 0.0
+
+        return _Candidate(
+            value=kpi.value,
+            label=kpi.label,
+            kpi_type=kpi.kpi_type,
+            insight_id=kpi.insight_id,
+            type_weight=_TYPE_WEIGHTS.get(kpi.kpi_type, 1.0),
+            magnitude_bonus=magnitude_bonus,
+            label_bonus=label_bonus,
+        )
 
     def _extract_kpis_from_insight(
         self,
@@ -71,29 +165,24 @@ class KPIExtractor:
         Returns:
             List of StoryKPI candidates
         """
-        kpis = []
+        kpis: list[StoryKPI] = []
         text = insight.text
 
+        # Every pattern needs a digit
+        if not _DIGIT.search(text):
+            return kpis
+
         # Extract percentages
-        pct_matches = re.finditer(r'(\d+\.?\d*)%', text)
-        for match in pct_matches:
+        for match in _PCT_PATTERN.finditer(text):
             value_str = match.group(1)
             value_float = float(value_str)
 
             # Determine if this is a headline KPI (>50% typically means majority)
             kpi_type = KPIType.HEADLINE if value_float >= 50 else KPIType.SUPPORTING
 
-            # Extract label (text around the percentage)
-            start_idx = max(0, match.start() - 50)
-            end_idx = min(len(text), match.end() + 50)
-            context_text = text[start_idx:end_idx]
-
-            # Clean up label
-            label = self._extract_label(context_text, match.group(0))
-
             kpis.append(StoryKPI(
                 value=f"{value_str}%",
-                label=label,
+                label=self._label_for_match(text, match),
                 context=context_str,
                 kpi_type=kpi_type,
                 rank=0,  # Will be set during ranking
@@ -101,69 +190,50 @@ class KPIExtractor:
             ))
 
         # Extract large numbers (for counts, totals)
-        num_matches = re.finditer(r'\b(\d{1,3}(?:,\d{3})+|\d{4,})\b', text)
-        for match in num_matches:
-            num_str = match.group(1).replace(',', '')
-            num_val = int(num_str)
+        for match in _NUMBER_PATTERN.finditer(text):
+            num_val = int(match.group(1).replace(',', ''))
 
             # Only keep substantial numbers (>100)
             if num_val > 100:
-                # Format with smart abbreviation
-                formatted = format_number(num_val, abbreviate=True)
-
-                # Extract label
-                start_idx = max(0, match.start() - 50)
-                end_idx = min(len(text), match.end() + 50)
-                context_text = text[start_idx:end_idx]
-                label = self._extract_label(context_text, match.group(0))
-
                 kpis.append(StoryKPI(
-                    value=formatted,
-                    label=label,
+                    value=format_number(num_val, abbreviate=True),  # Smart abbreviation
+                    label=self._label_for_match(text, match),
                     context=context_str,
                     kpi_type=KPIType.COUNT,
                     rank=0,
                     insight_id=insight.insight_id
                 ))
 
-        # Extract delta/change patterns ("+8.8 pts", "increased by X")
-        delta_patterns = [
-            r'(\+|-)\s*(\d+\.?\d*)\s*(pts|points|%|percentage points)',
-            r'increased by (\d+\.?\d*)%',
-            r'decreased by (\d+\.?\d*)%',
-            r'growth of (\d+\.?\d*)%',
-        ]
+        # Extract delta/change patterns, grouped by alternative
+        delta_matches = sorted(
+            _DELTA_PATTERN.finditer(text),
+            key=lambda m: next(i for i, name in enumerate(_DELTA_ALTERNATIVES) if m.group(name) is not None)
+        )
+        for match in delta_matches:
+            # Extract change value
+            if match.group("sign"):
+                formatted = f"{match.group('sign')}{match.group('signed')} {match.group('unit')}".strip()
+            else:
+                value_str = match.group("increased") or match.group("decreased") or match.group("growth")
+                formatted = f"+{value_str}%"
 
-        for pattern in delta_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Extract change value
-                if match.group(1) in ['+', '-']:
-                    sign = match.group(1)
-                    value_str = match.group(2)
-                    unit = match.group(3) if len(match.groups()) >= 3 else ''
-                    formatted = f"{sign}{value_str} {unit}".strip()
-                else:
-                    value_str = match.group(1)
-                    formatted = f"+{value_str}%"
-
-                # Extract label
-                start_idx = max(0, match.start() - 50)
-                end_idx = min(len(text), match.end() + 50)
-                context_text = text[start_idx:end_idx]
-                label = self._extract_label(context_text, match.group(0))
-
-                kpis.append(StoryKPI(
-                    value=formatted,
-                    label=label,
-                    context=context_str,
-                    kpi_type=KPIType.DELTA,
-                    rank=0,
-                    insight_id=insight.insight_id
-                ))
+            kpis.append(StoryKPI(
+                value=formatted,
+                label=self._label_for_match(text, match),
+                context=context_str,
+                kpi_type=KPIType.DELTA,
+                rank=0,
+                insight_id=insight.insight_id
+            ))
 
         return kpis
 
+    def _label_for_match(self, text: str, match: re.Match) -> str:
+        """Extract the label from the 50 characters around a match."""
+        start_idx = max(0, match.start() - 50)
+        end_idx = min(len(text), match.end() + 50)
+        return self._extract_label(text[start_idx:end_idx], match.group(0))
+
     def _extract_label(self, context_text: str, matched_value: str) -> str:
         """
         Extract descriptive label for a KPI from surrounding text.
@@ -179,22 +249,16 @@ class KPIExtractor:
         text = context_text.replace(matched_value, '').strip()
 
         # Remove leading/trailing punctuation and numbers
-        text = re.sub(r'^[^\w]+', '', text)
-        text = re.sub(r'[^\w]+$', '', text)
+        text = _LEADING_PUNCT.sub('', text)
+        text = _TRAILING_PUNCT.sub('', text)
 
         # Extract meaningful phrase (prefer text after "of", "in", "for")
-        patterns = [
-            r'(?:of|in|for|with|showing|report|rated)\s+([^,\.]{10,60})',
-            r'([A-Z][^,\.]{10,60})',  # Capitalized phrases
-            r'([a-z][^,\.]{10,60})',  # Any phrase
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _LABEL_PATTERNS:
+            match = pattern.search(text)
             if match:
                 label = match.group(1).strip()
                 # Clean up common artifacts
-                label = re.sub(r'\s+', ' ', label)
+                label = _WHITESPACE.sub(' ', label)
                 label = label[:80]  # Max 80 chars
                 return label
 
@@ -203,8 +267,10 @@ class KPIExtractor:
 
     def _rank_kpis(
         self,
-        candidates: list[StoryKPI],
-        insights: list[StoryInsight]
+        candidates: list[_Candidate],
+        insights: list[StoryInsight],
+        limit: int | None = None,
+        context_str: str = ""
     ) -> list[StoryKPI]:
         """
         Rank KPIs by business relevance.
@@ -214,84 +280,65 @@ class KPIExtractor:
         2. Source insight business_value
         3. Source insight confidence
         4. Numeric magnitude (for percentages, higher is more impactful)
+
+        Only the top `limit` distinct values are popped from a heap; ties keep
+        extraction order.
         """
         # Create insight lookup
         insight_map = {i.insight_id: i for i in insights}
 
-        # Score each KPI
-        scored = []
-        for kpi in candidates:
-            score = self._score_kpi(kpi, insight_map)
-            scored.append((score, kpi))
-
-        # Sort by score (descending)
-        scored.sort(key=lambda x: x[0], reverse=True)
+        # Score each KPI (negated for the min-heap; index keeps ties stable)
+        heap = [
+            (-self._score_kpi(candidate, insight_map), index, candidate)
+            for index, candidate in enumerate(candidates)
+        ]
+        heapq.heapify(heap)
 
         # Assign ranks and deduplicate
         seen_values = set()
-        ranked = []
-        rank = 1
+        ranked: list[StoryKPI] = []
+        while heap and (limit is None or len(ranked) < limit):
+            _, _, candidate = heapq.heappop(heap)
 
-        for score, kpi in scored:
             # Skip near-duplicates (same value)
-            if kpi.value in seen_values:
+            if candidate.value in seen_values:
                 continue
 
-            kpi.rank = rank
-            ranked.append(kpi)
-            seen_values.add(kpi.value)
-            rank += 1
+            seen_values.add(candidate.value)
+            ranked.append(StoryKPI(
+                value=candidate.value,
+                label=candidate.label,
+                context=context_str,
+                kpi_type=candidate.kpi_type,
+                rank=len(ranked) + 1,
+                insight_id=candidate.insight_id
+            ))
 
         return ranked
 
     def _score_kpi(
         self,
-        kpi: StoryKPI,
+        candidate: _Candidate,
         insight_map: dict[str, StoryInsight]
     ) -> float:
         """
-        Calculate relevance score for a KPI.
+        Calculate relevance score for a KPI candidate.
 
         Returns:
             Float score (higher = more relevant)
         """
-        score = 0.0
-
         # Factor 1: KPI type weight
-        type_weights = {
-            KPIType.HEADLINE: 10.0,
-            KPIType.DELTA: 7.0,
-            KPIType.SUPPORTING: 5.0,
-            KPIType.COUNT: 3.0,
-        }
-        score += type_weights.get(kpi.kpi_type, 1.0)
+        score = candidate.type_weight
 
         # Factor 2: Source insight quality
-        if kpi.insight_id and kpi.insight_id in insight_map:
-            insight = insight_map[kpi.insight_id]
+        insight = insight_map.get(candidate.insight_id) if candidate.insight_id else None
+        if insight is not None:
             score += insight.business_value * 5.0
             score += insight.confidence * 3.0
 
-        # Factor 3: Numeric magnitude (for percentages)
-        if '%' in kpi.value:
-            try:
-                pct_val = float(re.search(r'(\d+\.?\d*)', kpi.value).group(1))
-                # Higher percentages are more impactful (especially >50%)
-                if pct_val >= 70:
-                    score += 5.0
-                elif pct_val >= 50:
-                    score += 3.0
-                elif pct_val >= 30:
-                    score += 1.0
-            except (AttributeError, ValueError):
-                pass
-
-        # Factor 4: Label quality (longer, more descriptive = better)
-        label_length = len(kpi.label)
-        if label_length >= 20:
-            score += 2.0
-        elif label_length >= 10:
-            score += 1.0
+        # Factors 3 and 4: magnitude and label quality (precomputed)
+        score += candidate.magnitude_bonus
+        score += candidate.label_bonus
 
         return score
 
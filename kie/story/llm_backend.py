@@ -0,0 +1,380 @@
+"""
+LLM Backend Abstraction
+
+Provider-agnostic completion layer used by the LLM-powered story components.
+
+- LLMBackend: minimal provider interface (one prompt in, one response out)
+- LocalLLMBackend: deterministic in-process stand-in (default; used by tests)
+- AnthropicBackend: Claude API (requires the optional `anthropic` package)
+- LLMClient: concurrent fan-out with a concurrency cap, prompt-hash response
+  cache (in memory and optionally on disk), token and latency accounting
+
+The default backend returns empty responses, which every caller treats as
+"no LLM available" and answers with its deterministic heuristic fallback.
+Select a real provider with KIE_LLM_BACKEND=anthropic.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import anthropic
+    HAS_ANTHROPIC = True
+except ImportError:
+    HAS_ANTHROPIC = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_TOKENS = 512
+DEFAULT_ANTHROPIC_MODEL = "claude-sonnet-4-5"
+
+
+@dataclass
+class LLMResponse:
+    """Single completion result."""
+
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency_seconds: float = 0.0
+    cached: bool = False
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)."""
+    return max(1, len(text) // 4) if text else 0
+
+
+class LLMBackend(ABC):
+    """
+    Provider interface.
+
+    Implementations must be thread-safe: LLMClient calls complete() from
+    several worker threads at once.
+    """
+
+    name: str = "base"
+    model: str = ""
+
+    @abstractmethod
+    def complete(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> LLMResponse:
+        """
+        Complete a single prompt.
+
+        Args:
+            prompt: Prompt text
+            max_tokens: Maximum output tokens
+
+        Returns:
+            LLMResponse (latency is filled in by LLMClient)
+        """
+
+
+class LocalLLMBackend(LLMBackend):
+    """
+    Deterministic in-process stand-in for tests and offline use.
+
+    By default it answers every prompt with an empty string so callers use
+    their heuristic fallbacks. A responder function can be supplied to script
+    responses, and a fixed latency to simulate network round-trips.
+    """
+
+    name = "local"
+    model = "local"
+
+    def __init__(self, responder: Callable[[str], str] | None = None, latency: float = 0.0):
+        """
+        Initialize local backend.
+
+        Args:
+            responder: Optional prompt -> response text function
+            latency: Simulated seconds per call
+        """
+        self.responder = responder
+        self.latency = latency
+
+    def complete(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> LLMResponse:
+        """Return the scripted (or empty) response."""
+        if self.latency:
+            time.sleep(self.latency)
+        text = self.responder(prompt) if self.responder else ""
+        return LLMResponse(
+            text=text,
+            input_tokens=estimate_tokens(prompt),
+            output_tokens=estimate_tokens(text),
+        )
+
+
+class AnthropicBackend(LLMBackend):
+    """Claude API backend (requires `pip install anthropic` and ANTHROPIC_API_KEY)."""
+
+    name = "anthropic"
+
+    def __init__(self, model: str | None = None, api_key: str | None = None):
+        """
+        Initialize Anthropic backend.
+
+        Args:
+            model: Model name (default: KIE_LLM_MODEL or DEFAULT_ANTHROPIC_MODEL)
+            api_key: API key (default: ANTHROPIC_API_KEY)
+
+        Raises:
+            ImportError: If the anthropic package is not installed
+        """
+        if not HAS_ANTHROPIC:
+            raise ImportError("AnthropicBackend requires the 'anthropic' package")
+
+        self.model = model or os.getenv("KIE_LLM_MODEL") or DEFAULT_ANTHROPIC_MODEL
+        self._client = anthropic.Anthropic(api_key=api_key) if api_key else anthropic.Anthropic()
+
+    def complete(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> LLMResponse:
+        """Send one message to the Messages API."""
+        message = self._client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        text = "".join(block.text for block in message.content if getattr(block, "type", "") == "text")
+        return LLMResponse(
+            text=text,
+            input_tokens=message.usage.input_tokens,
+            output_tokens=message.usage.output_tokens,
+        )
+
+
+class LLMClient:
+    """
+    Concurrent, cached front end over an LLMBackend.
+
+    Example:
+        >>> client = LLMClient(LocalLLMBackend())
+        >>> responses = client.complete_many(["prompt a", "prompt b"])
+        >>> client.stats()["calls"]
+        2
+    """
+
+    def __init__(
+        self,
+        backend: LLMBackend | None = None,
+        cache_dir: Path | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """
+        Initialize LLM client.
+
+        Args:
+            backend: Provider (default: LocalLLMBackend)
+            cache_dir: Optional directory for on-disk response cache
+            max_concurrency: Maximum in-flight backend calls
+        """
+        self.backend = backend or LocalLLMBackend()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_concurrency = max(1, max_concurrency)
+
+        self._memory_cache: dict[str, LLMResponse] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "errors": 0,
+            "cache_hits": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "latency_seconds": 0.0,
+            "wall_seconds": 0.0,
+        }
+
+    def complete(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> LLMResponse:
+        """
+        Complete one prompt (cached).
+
+        Args:
+            prompt: Prompt text
+            max_tokens: Maximum output tokens
+
+        Returns:
+            LLMResponse
+        """
+        return self.complete_many([prompt], max_tokens)[0]
+
+    def complete_many(self, prompts: list[str], max_tokens: int = DEFAULT_MAX_TOKENS) -> list[LLMResponse]:
+        """
+        Complete several prompts concurrently, in at most max_concurrency calls at a time.
+
+        Identical prompts are sent once; cached prompts are not sent at all.
+        A failed call (rate limit, timeout, network) yields an empty response,
+        so callers fall back to their heuristics; it is counted in stats()
+        and not cached.
+
+        Args:
+            prompts: Prompt texts
+            max_tokens: Maximum output tokens per prompt
+
+        Returns:
+            Responses in the same order as prompts
+        """
+        start = time.perf_counter()
+        keys = [self._cache_key(prompt, max_tokens) for prompt in prompts]
+
+        results: dict[str, LLMResponse] = {}
+        pending: dict[str, str] = {}
+        for key, prompt in zip(keys, prompts, strict=True):
+            if key in results or key in pending:
+                continue
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = prompt
+
+        if pending:
+            def call(item: tuple[str, str]) -> tuple[str, LLMResponse | None]:
+                key, prompt = item
+                call_start = time.perf_counter()
+                try:
+                    response = self.backend.complete(prompt, max_tokens)
+                except Exception as e:
+                    logger.warning(f"LLM call failed ({self.backend.name}): {e}")
+                    return key, None
+                response.latency_seconds = time.perf_counter() - call_start
+                return key, response
+
+            workers = min(self.max_concurrency, len(pending))
+            if workers == 1:
+                completed = [call(item) for item in pending.items()]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    completed = list(pool.map(call, pending.items()))
+
+            for key, response in completed:
+                if response is None:
+                    with self._lock:
+                        self._stats["errors"] += 1
+                    results[key] = LLMResponse(text="")
+                    continue
+                self._record(response)
+                self._cache_put(key, response)
+                results[key] = response
+
+        with self._lock:
+            self._stats["wall_seconds"] += time.perf_counter() - start
+
+        return [results[key] for key in keys]
+
+    def stats(self) -> dict[str, Any]:
+        """Return call, cache, token and latency totals."""
+        with self._lock:
+            return {"backend": self.backend.name, "model": self.backend.model, **self._stats}
+
+    def _record(self, response: LLMResponse) -> None:
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["input_tokens"] += response.input_tokens
+            self._stats["output_tokens"] += response.output_tokens
+            self._stats["latency_seconds"] += response.latency_seconds
+
+    def _cache_key(self, prompt: str, max_tokens: int) -> str:
+        payload = f"{self.backend.name}\0{self.backend.model}\0{max_tokens}\0{prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> LLMResponse | None:
+        response = self._memory_cache.get(key)
+        if response is None and self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.json"
+            try:
+                data = json.loads(path.read_text())
+                response = LLMResponse(
+                    text=data["text"],
+                    input_tokens=data.get("input_tokens", 0),
+                    output_tokens=data.get("output_tokens", 0),
+                )
+                self._memory_cache[key] = response
+            except (OSError, ValueError, KeyError):
+                response = None
+
+        if response is None:
+            return None
+
+        with self._lock:
+            self._stats["cache_hits"] += 1
+        return LLMResponse(
+            text=response.text,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            cached=True,
+        )
+
+    def _cache_put(self, key: str, response: LLMResponse) -> None:
+        self._memory_cache[key] = response
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.json"
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({
+                "text": response.text,
+                "input_tokens": response.input_tokens,
+                "output_tokens": response.output_tokens,
+            }))
+            tmp_path.replace(path)
+        except OSError:
+            pass  # Cache is best-effort
+
+
+def create_backend(name: str | None = None) -> LLMBackend:
+    """
+    Create a backend by name.
+
+    Args:
+        name: "local" or "anthropic" (default: KIE_LLM_BACKEND or "local")
+
+    Returns:
+        LLMBackend (falls back to LocalLLMBackend if the provider is unavailable)
+    """
+    name = (name or os.getenv("KIE_LLM_BACKEND") or "local").lower()
+    if name == "anthropic" and HAS_ANTHROPIC:
+        try:
+            return AnthropicBackend()
+        except Exception:
+            pass  # Missing credentials - stay deterministic
+    return LocalLLMBackend()
+
+
+# Global LLM client
+_global_client: LLMClient | None = None
+
+
+def get_llm_client() -> LLMClient:
+    """
+    Get global LLM client (created from KIE_LLM_BACKEND / KIE_LLM_CACHE_DIR on first use).
+
+    Returns:
+        Global LLMClient
+    """
+    global _global_client
+    if _global_client is None:
+        cache_dir = os.getenv("KIE_LLM_CACHE_DIR")
+        _global_client = LLMClient(create_backend(), cache_dir=Path(cache_dir) if cache_dir else None)
+    return _global_client
+
+
+def set_llm_client(client: LLMClient | None) -> None:
+    """
+    Replace the global LLM client (None resets to environment defaults).
+
+    Args:
+        client: LLMClient to use globally
+    """
+    global _global_client
+    _global_client = client
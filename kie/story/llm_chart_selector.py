@@ -7,9 +7,11 @@ Works for correlation matrices, heatmaps, network graphs, distributions - anythi
 
 import json
 import pandas as pd
-from typing import Any, Literal
+from typing import Any, Literal, get_args
 
+from kie.story.llm_backend import LLMClient, get_llm_client
 from kie.story.models import StoryInsight
+from kie.utils.keyword_classifier import KeywordClassifier
 
 
 # Expanded chart types for ANY domain
@@ -33,6 +35,36 @@ ChartType = Literal[
     "choropleth", "bubble_map"
 ]
 
+# Chart type name -> ChartType (validates names parsed from LLM responses)
+_CHART_TYPES: dict[str, ChartType] = {name: name for name in get_args(ChartType)}
+
+# Insight text keywords by pattern (text-only analysis)
+TEXT_PATTERN_KEYWORDS = {
+    "time_series": ["over time", "trend", "growth", "decline", "trajectory"],
+    "correlation": ["correlation", "relationship", "associated with", "linked to"],
+    "distribution": ["distribution", "spread", "variance", "range"],
+    "composition": ["share", "proportion", "percentage of total", "accounts for"],
+    "comparison": ["higher", "lower", "more", "less", "vs", "versus", "compared"],
+    "flow": ["flow", "from", "to", "transition", "movement"],
+    "hierarchical": ["breakdown", "nested", "category", "subcategory"],
+    "outlier": ["outlier", "anomaly", "unusual", "extreme"],
+    "geographic": ["region", "location", "geographic", "map", "spatial"]
+}
+
+# Insight text cues used alongside data analysis
+DATA_PATTERN_CUES = {
+    "composition": ["share", "proportion"],
+    "comparison": ["higher", "lower", "more", "less", "vs", "versus", "compared"],
+    "flow": ["flow", "from", "to", "between", "connection"],
+    "outlier": ["outlier", "anomaly"],
+}
+
+# Both vocabularies in one classifier, labelled ("text" | "data", pattern)
+_pattern_classifier = KeywordClassifier({
+    **{("text", pattern): keywords for pattern, keywords in TEXT_PATTERN_KEYWORDS.items()},
+    **{("data", pattern): keywords for pattern, keywords in DATA_PATTERN_CUES.items()},
+})
+
 
 class LLMChartSelector:
     """
@@ -41,9 +73,14 @@ class LLMChartSelector:
     No hardcoded decision trees - asks Claude what would best communicate the insight.
     """
 
-    def __init__(self):
-        """Initialize LLM-powered chart selector."""
-        pass
+    def __init__(self, client: LLMClient | None = None):
+        """
+        Initialize LLM-powered chart selector.
+
+        Args:
+            client: LLM client (default: global client)
+        """
+        self.client = client or get_llm_client()
 
     def select_chart_type(
         self,
@@ -75,17 +112,59 @@ class LLMChartSelector:
 
         return chart_type, params
 
+    def select_chart_types(
+        self,
+        insights: list[StoryInsight],
+        data: pd.DataFrame | None = None,
+        x_column: str | None = None,
+        y_columns: list[str] | None = None
+    ) -> list[tuple[ChartType, dict[str, Any]]]:
+        """
+        Select chart types for many insights with concurrent LLM calls.
+
+        Args:
+            insights: Insights being visualized
+            data: Optional DataFrame for analysis (shared by all insights)
+            x_column: Optional X-axis column
+            y_columns: Optional Y-axis columns
+
+        Returns:
+            List of (chart_type, chart_params) in insight order
+        """
+        text_scores = _pattern_classifier.classify_batch([insight.text for insight in insights])
+        analyses = [
+            self._analyze_insight_and_data(insight, data, x_column, y_columns, scores)
+            for insight, scores in zip(insights, text_scores, strict=True)
+        ]
+        responses = self.client.complete_many(
+            [self._build_chart_selection_prompt(analysis) for analysis in analyses]
+        )
+
+        selections = []
+        for analysis, response in zip(analyses, responses, strict=True):
+            chart_type = self._parse_chart_type(response.text) or self._fallback_chart_selection(
+                analysis.get("patterns", []), analysis
+            )
+            selections.append(
+                (chart_type, self._generate_chart_params(chart_type, analysis, x_column, y_columns))
+            )
+
+        return selections
+
     def _analyze_insight_and_data(
         self,
         insight: StoryInsight,
         data: pd.DataFrame | None,
         x_column: str | None,
-        y_columns: list[str] | None
+        y_columns: list[str] | None,
+        text_scores: dict | None = None
     ) -> dict[str, Any]:
         """
         Analyze insight and data to understand what needs to be communicated.
 
         This is domain-agnostic - looks at patterns, not specific business metrics.
+        text_scores are the insight text's pattern keyword scores when already
+        classified in a batch.
         """
         analysis = {
             "insight_text": insight.text,
@@ -101,12 +180,12 @@ class LLMChartSelector:
 
             # Detect patterns
             analysis["patterns"] = self._detect_data_patterns(
-                data, x_column, y_columns, insight.text
+                data, x_column, y_columns, insight.text, text_scores
             )
 
         else:
             # Analyze from insight text only
-            analysis["patterns"] = self._detect_text_patterns(insight.text)
+            analysis["patterns"] = self._detect_text_patterns(insight.text, text_scores)
 
         return analysis
 
@@ -115,7 +194,8 @@ class LLMChartSelector:
         data: pd.DataFrame,
         x_column: str | None,
         y_columns: list[str] | None,
-        insight_text: str
+        insight_text: str,
+        text_scores: dict | None = None
     ) -> list[str]:
         """
         Detect patterns in data that suggest chart types.
@@ -123,6 +203,8 @@ class LLMChartSelector:
         Domain-agnostic pattern detection.
         """
         patterns = []
+        if text_scores is None:
+            text_scores = _pattern_classifier.scores(insight_text)
 
         # Time series detection
         if x_column and self._is_temporal(data[x_column]):
@@ -148,11 +230,11 @@ class LLMChartSelector:
                     patterns.append("distribution")
 
         # Composition detection
-        if "share" in insight_text.lower() or "proportion" in insight_text.lower():
+        if ("data", "composition") in text_scores:
             patterns.append("composition")
 
         # Comparison detection
-        if any(word in insight_text.lower() for word in ["higher", "lower", "more", "less", "vs", "versus", "compared"]):
+        if ("data", "comparison") in text_scores:
             patterns.append("comparison")
 
         # Hierarchical detection
@@ -160,11 +242,11 @@ class LLMChartSelector:
             patterns.append("hierarchical")
 
         # Network/flow detection
-        if any(word in insight_text.lower() for word in ["flow", "from", "to", "between", "connection"]):
+        if ("data", "flow") in text_scores:
             patterns.append("flow")
 
         # Outlier detection
-        if "outlier" in insight_text.lower() or "anomaly" in insight_text.lower():
+        if ("data", "outlier") in text_scores:
             patterns.append("outlier")
 
         # Geographic detection
@@ -173,31 +255,13 @@ class LLMChartSelector:
 
         return patterns
 
-    def _detect_text_patterns(self, text: str) -> list[str]:
+    def _detect_text_patterns(self, text: str, text_scores: dict | None = None) -> list[str]:
         """
         Detect patterns from insight text when no data is available.
         """
-        text_lower = text.lower()
-        patterns = []
-
-        # Pattern keywords
-        pattern_keywords = {
-            "time_series": ["over time", "trend", "growth", "decline", "trajectory"],
-            "correlation": ["correlation", "relationship", "associated with", "linked to"],
-            "distribution": ["distribution", "spread", "variance", "range"],
-            "composition": ["share", "proportion", "percentage of total", "accounts for"],
-            "comparison": ["higher", "lower", "more", "less", "vs", "versus", "compared"],
-            "flow": ["flow", "from", "to", "transition", "movement"],
-            "hierarchical": ["breakdown", "nested", "category", "subcategory"],
-            "outlier": ["outlier", "anomaly", "unusual", "extreme"],
-            "geographic": ["region", "location", "geographic", "map", "spatial"]
-        }
-
-        for pattern, keywords in pattern_keywords.items():
-            if any(kw in text_lower for kw in keywords):
-                patterns.append(pattern)
-
-        return patterns
+        if text_scores is None:
+            text_scores = _pattern_classifier.scores(text)
+        return [pattern for pattern in TEXT_PATTERN_KEYWORDS if ("text", pattern) in text_scores]
 
     def _is_temporal(self, series: pd.Series) -> bool:
         """Check if series contains temporal data."""
@@ -234,11 +298,29 @@ class LLMChartSelector:
         # Build LLM prompt
         prompt = self._build_chart_selection_prompt(analysis)
 
-        # For now, use intelligent fallback (would integrate Claude API here)
-        chart_type = self._fallback_chart_selection(patterns, analysis)
+        # Ask the LLM; use intelligent fallback if unavailable or invalid
+        response = self.client.complete(prompt)
+        chart_type = self._parse_chart_type(response.text) or self._fallback_chart_selection(patterns, analysis)
 
         return chart_type
 
+    def _parse_chart_type(self, text: str) -> ChartType | None:
+        """
+        Parse the chart type from the LLM's JSON response.
+
+        Returns None if the response is empty, malformed, or names an unknown chart type.
+        """
+        if not text.strip():
+            return None
+
+        try:
+            payload = json.loads(text[text.index("{"):text.rindex("}") + 1])
+            chart_type = str(payload.get("chart_type", "")).strip().lower()
+        except (ValueError, AttributeError):
+            return None
+
+        return _CHART_TYPES.get(chart_type)
+
     def _build_chart_selection_prompt(self, analysis: dict[str, Any]) -> str:
         """
         Build prompt for Claude to select optimal chart type.
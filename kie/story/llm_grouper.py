@@ -6,9 +6,14 @@ Works for ANY domain - healthcare, manufacturing, finance, science, literally an
 """
 
 import json
+import math
 from typing import Any
 from collections import defaultdict
 
+import numpy as np
+
+from kie.story.clustering import ConceptClusterer, Embedder
+from kie.story.llm_backend import LLMClient, get_llm_client
 from kie.story.models import StoryInsight, StorySection, StoryKPI
 
 
@@ -20,9 +25,19 @@ class LLMSectionGrouper:
     Works for ANY domain submitted by users.
     """
 
-    def __init__(self):
-        """Initialize LLM-powered section grouper."""
-        pass
+    # Insights summarized in the theme-extraction prompt (token budget)
+    MAX_PROMPT_INSIGHTS = 20
+
+    def __init__(self, client: LLMClient | None = None, embedder: Embedder | None = None):
+        """
+        Initialize LLM-powered section grouper.
+
+        Args:
+            client: LLM client (default: global client)
+            embedder: Optional local embedding model for clustering (default: TF-IDF)
+        """
+        self.client = client or get_llm_client()
+        self.clusterer = ConceptClusterer(embedder=embedder)
 
     def group_insights(
         self,
@@ -101,9 +116,10 @@ class LLMSectionGrouper:
             - description: What this theme represents
             - keywords: Key concepts related to this theme
         """
-        # Prepare insight summaries for LLM
+        # Prepare insight summaries for LLM (representatives of every cluster,
+        # so large catalogs are covered without blowing the token budget)
         insight_summaries = []
-        for ins in insights[:20]:  # Sample first 20 to avoid token limits
+        for ins in self._representative_insights(insights, self.MAX_PROMPT_INSIGHTS):
             insight_summaries.append({
                 "id": ins.insight_id,
                 "text": ins.text[:200],  # First 200 chars
@@ -114,9 +130,40 @@ class LLMSectionGrouper:
         # Create LLM prompt
         prompt = self._build_theme_extraction_prompt(insight_summaries, max_themes)
 
-        # Call LLM (placeholder - would integrate with Claude API)
-        # For now, use intelligent fallback based on categories and text analysis
-        themes = self._fallback_theme_extraction(insights, max_themes)
+        # Call LLM; fall back to text analysis if unavailable or unparseable
+        response = self.client.complete(prompt, max_tokens=1024)
+        themes = self._parse_themes(response.text, max_themes)
+        if not themes:
+            themes = self._fallback_theme_extraction(insights, max_themes)
+
+        return themes
+
+    def _parse_themes(self, text: str, max_themes: int) -> list[dict[str, Any]]:
+        """
+        Parse the theme JSON returned by the LLM.
+
+        Returns an empty list if the response is empty or malformed.
+        """
+        if not text.strip():
+            return []
+
+        try:
+            payload = json.loads(text[text.index("{"):text.rindex("}") + 1])
+            raw_themes = payload.get("themes", [])
+        except (ValueError, AttributeError):
+            return []
+
+        themes = []
+        for theme in raw_themes[:max_themes]:
+            if not isinstance(theme, dict) or not theme.get("title"):
+                continue
+            themes.append({
+                "theme_id": theme.get("theme_id") or f"theme_{len(themes)+1:03d}",
+                "title": str(theme["title"]),
+                "description": str(theme.get("description", "")),
+                "keywords": [str(k) for k in theme.get("keywords", []) if k],
+                "relevance_score": float(theme.get("relevance_score", 0.5)),
+            })
 
         return themes
 
@@ -163,6 +210,38 @@ Analyze the insights and return ONLY the JSON response."""
 
         return prompt
 
+    def _representative_insights(
+        self,
+        insights: list[StoryInsight],
+        limit: int
+    ) -> list[StoryInsight]:
+        """
+        Pick up to `limit` insights covering all concept clusters.
+
+        Takes the most central insight of each cluster in turn (round-robin),
+        so every cluster is represented before any cluster gets a second slot.
+        """
+        if len(insights) <= limit:
+            return list(insights)
+
+        clusters = self.clusterer.cluster(self._cluster_texts(insights), n_clusters=limit)
+        members = []
+        for cluster in range(len(clusters.concepts)):
+            idx = np.flatnonzero(clusters.labels == cluster)
+            members.append(list(idx[np.argsort(-clusters.similarity[idx], kind="stable")]))
+        members.append(list(np.flatnonzero(clusters.labels == -1)))
+
+        chosen: list[int] = []
+        depth = 0
+        while len(chosen) < limit:
+            layer = [m[depth] for m in members if depth < len(m)]
+            if not layer:
+                break
+            chosen.extend(layer[: limit - len(chosen)])
+            depth += 1
+
+        return [insights[i] for i in sorted(chosen)]
+
     def _fallback_theme_extraction(
         self,
         insights: list[StoryInsight],
@@ -174,11 +253,11 @@ Analyze the insights and return ONLY the JSON response."""
         Uses intelligent text analysis and clustering instead of hardcoded keywords.
         """
         # Extract key concepts from insight text and categories
-        concept_clusters = self._cluster_by_concepts(insights)
+        concept_clusters = self._cluster_by_concepts(insights, max_themes)
 
         # Convert clusters to themes
         themes = []
-        for i, (concept, cluster_insights) in enumerate(concept_clusters.items()):
+        for i, (concept, keywords, cluster_insights) in enumerate(concept_clusters):
             if i >= max_themes:
                 break
 
@@ -186,8 +265,10 @@ Analyze the insights and return ONLY the JSON response."""
                 "theme_id": f"theme_{i+1:03d}",
                 "title": self._generate_theme_title(concept, cluster_insights),
                 "description": f"Insights related to {concept}",
-                "keywords": self._extract_keywords_from_cluster(cluster_insights),
-                "relevance_score": sum(ins.business_value for ins in cluster_insights) / len(cluster_insights)
+                "keywords": keywords,
+                "relevance_score": sum(ins.business_value for ins in cluster_insights) / len(cluster_insights),
+                # Cluster membership is already known; no need to re-match keywords
+                "insight_ids": [ins.insight_id for ins in cluster_insights]
             })
 
         # If no natural themes, create single "Key Findings" theme
@@ -202,55 +283,44 @@ Analyze the insights and return ONLY the JSON response."""
 
         return themes
 
+    def _cluster_texts(self, insights: list[StoryInsight]) -> list[str]:
+        """Text used to vectorize each insight (category adds a shared signal)."""
+        return [f"{ins.text} {ins.category}" for ins in insights]
+
     def _cluster_by_concepts(
         self,
-        insights: list[StoryInsight]
-    ) -> dict[str, list[StoryInsight]]:
+        insights: list[StoryInsight],
+        max_clusters: int = 5
+    ) -> list[tuple[str, list[str], list[StoryInsight]]]:
         """
         Cluster insights by extracting natural concepts from text.
 
-        Uses TF-IDF-like approach to find common themes WITHOUT hardcoded keywords.
+        TF-IDF vectors (or embeddings) clustered with spherical k-means; the
+        number of clusters grows with the catalog (~sqrt(n/2), capped at
+        max_clusters). Insights with no usable terms are grouped by category.
+
+        Returns:
+            List of (concept, keywords, insights), largest cluster first
         """
-        # Extract nouns and key phrases from all insights
-        all_text = " ".join(ins.text.lower() for ins in insights)
-
-        # Find repeated concepts (words that appear 2+ times OR appear once with high frequency)
-        word_freq = defaultdict(int)
-        for word in all_text.split():
-            if len(word) > 4:  # Ignore short words
-                word_freq[word] += 1
-
-        # Get top concepts - adjust threshold based on dataset size
-        top_concepts = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        # For small datasets (< 5 insights), allow concepts that appear 1+ times
-        # For larger datasets, require 2+ appearances
-        min_freq = 1 if len(insights) < 5 else 2
-        concept_words = [word for word, freq in top_concepts if freq >= min_freq]
-
-        # Cluster insights by concepts
-        clusters = defaultdict(list)
-        for insight in insights:
-            text_lower = insight.text.lower()
-
-            # Find best matching concept
-            best_concept = None
-            best_score = 0
-
-            for concept in concept_words:
-                if concept in text_lower:
-                    score = text_lower.count(concept)
-                    if score > best_score:
-                        best_score = score
-                        best_concept = concept
-
-            if best_concept:
-                clusters[best_concept].append(insight)
-            else:
-                # Use category as fallback
-                clusters[insight.category].append(insight)
-
-        return dict(clusters)
+        if not insights:
+            return []
+
+        n_clusters = max(1, min(max_clusters, round(math.sqrt(len(insights) / 2))))
+        result = self.clusterer.cluster(self._cluster_texts(insights), n_clusters)
+
+        clusters = []
+        for cluster, (concept, keywords) in enumerate(zip(result.concepts, result.keywords, strict=True)):
+            members = [insights[i] for i in np.flatnonzero(result.labels == cluster)]
+            clusters.append((concept, keywords, members))
+
+        # Use category as fallback
+        by_category = defaultdict(list)
+        for i in np.flatnonzero(result.labels == -1):
+            by_category[insights[i].category].append(insights[i])
+        for category, members in by_category.items():
+            clusters.append((category, [category.lower()], members))
+
+        return clusters
 
     def _generate_theme_title(
         self,
@@ -279,29 +349,6 @@ Analyze the insights and return ONLY the JSON response."""
         else:
             return f"{concept_clean} Analysis"
 
-    def _extract_keywords_from_cluster(
-        self,
-        insights: list[StoryInsight]
-    ) -> list[str]:
-        """
-        Extract key terms that define this cluster.
-        """
-        # Get all unique words from insight text
-        all_words = set()
-        for ins in insights:
-            words = [w.lower() for w in ins.text.split() if len(w) > 4]
-            all_words.update(words)
-
-        # Return top 5 most common
-        word_freq = defaultdict(int)
-        for ins in insights:
-            for word in ins.text.lower().split():
-                if word in all_words:
-                    word_freq[word] += 1
-
-        top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:5]
-        return [word for word, _ in top_words]
-
     def _assign_insights_to_themes(
         self,
         insights: list[StoryInsight],
@@ -309,28 +356,23 @@ Analyze the insights and return ONLY the JSON response."""
         chart_refs: dict[str, str]
     ) -> list[StorySection]:
         """
-        Assign insights to themes based on keyword matching and relevance.
+        Assign each insight to its most similar theme (cosine similarity on keywords).
         """
-        sections = []
-        assigned_ids = set()
-
-        for theme in themes:
-            theme_insights = []
-            theme_keywords = set(kw.lower() for kw in theme["keywords"])
-
-            # Find insights matching this theme
-            for insight in insights:
-                if insight.insight_id in assigned_ids:
-                    continue
+        # Score every insight against every theme in one matrix product
+        theme_texts = [" ".join(theme.get("keywords") or []) or theme["title"] for theme in themes]
+        assignment = self.clusterer.assign(self._cluster_texts(insights), theme_texts)
 
-                text_lower = insight.text.lower()
+        # Themes from clustering carry their members explicitly
+        positions = {ins.insight_id: i for i, ins in enumerate(insights)}
+        for theme_index, theme in enumerate(themes):
+            for insight_id in theme.get("insight_ids", []):
+                if insight_id in positions:
+                    assignment[positions[insight_id]] = theme_index
 
-                # Check if any theme keywords appear in insight
-                matches = sum(1 for kw in theme_keywords if kw in text_lower)
-
-                if matches > 0:
-                    theme_insights.append(insight)
-                    assigned_ids.add(insight.insight_id)
+        sections = []
+        assigned_ids = set()
+        for theme_index, theme in enumerate(themes):
+            theme_insights = [insights[i] for i in np.flatnonzero(assignment == theme_index)]
 
             # Create section if we have insights
             if theme_insights:
@@ -338,6 +380,7 @@ Analyze the insights and return ONLY the JSON response."""
                     theme, theme_insights, chart_refs
                 )
                 sections.append(section)
+                assigned_ids.update(ins.insight_id for ins in theme_insights)
 
         # Handle unassigned insights
         unassigned = [ins for ins in insights if ins.insight_id not in assigned_ids]
@@ -8,6 +8,7 @@ Works for healthcare, manufacturing, finance, science, IoT - literally anything.
 import json
 from typing import Any
 
+from kie.story.llm_backend import LLMClient, get_llm_client
 from kie.story.models import (
     StoryInsight,
     StoryThesis,
@@ -24,14 +25,16 @@ class LLMNarrativeSynthesizer:
     No hardcoded business templates - adapts to ANY data domain.
     """
 
-    def __init__(self, mode: NarrativeMode = NarrativeMode.EXECUTIVE):
+    def __init__(self, mode: NarrativeMode = NarrativeMode.EXECUTIVE, client: LLMClient | None = None):
         """
         Initialize LLM-powered narrative synthesizer.
 
         Args:
             mode: Narrative mode (EXECUTIVE, ANALYST, TECHNICAL)
+            client: LLM client (default: global client)
         """
         self.mode = mode
+        self.client = client or get_llm_client()
 
     def synthesize_executive_summary(
         self,
@@ -58,9 +61,8 @@ class LLMNarrativeSynthesizer:
         prompt = self._build_executive_summary_prompt(thesis, top_kpis, sections, self.mode)
 
         # Use LLM (with intelligent fallback)
-        summary = self._fallback_executive_summary(thesis, top_kpis, sections, self.mode)
-
-        return summary
+        response = self.client.complete(prompt)
+        return response.text.strip() or self._fallback_executive_summary(thesis, top_kpis, sections, self.mode)
 
     def synthesize_key_findings(
         self,
@@ -113,9 +115,48 @@ class LLMNarrativeSynthesizer:
         prompt = self._build_section_narrative_prompt(section, insights, kpis, self.mode)
 
         # Use LLM (with fallback)
-        narrative = self._fallback_section_narrative(section, insights, kpis, self.mode)
+        response = self.client.complete(prompt)
+        return response.text.strip() or self._fallback_section_narrative(section, insights, kpis, self.mode)
+
+    def synthesize_story_narratives(
+        self,
+        thesis: StoryThesis,
+        top_kpis: list[StoryKPI],
+        sections: list[StorySection],
+        section_insights: list[list[StoryInsight]]
+    ) -> tuple[list[str], str]:
+        """
+        Generate all section narratives and the executive summary in one batch.
 
-        return narrative
+        The prompts are independent, so they are sent concurrently: a story
+        with N sections costs one round-trip of latency instead of N + 1.
+
+        Args:
+            thesis: Core story thesis
+            top_kpis: Top KPIs
+            sections: Story sections (with section KPIs populated)
+            section_insights: Insights for each section, in section order
+
+        Returns:
+            Tuple of (section narratives in section order, executive summary)
+        """
+        prompts = [
+            self._build_section_narrative_prompt(section, insights, section.kpis, self.mode)
+            for section, insights in zip(sections, section_insights, strict=True)
+        ]
+        prompts.append(self._build_executive_summary_prompt(thesis, top_kpis, sections, self.mode))
+
+        responses = self.client.complete_many(prompts)
+
+        narratives = [
+            response.text.strip() or self._fallback_section_narrative(section, insights, section.kpis, self.mode)
+            for response, section, insights in zip(responses[:-1], sections, section_insights, strict=True)
+        ]
+        summary = responses[-1].text.strip() or self._fallback_executive_summary(
+            thesis, top_kpis, sections, self.mode
+        )
+
+        return narratives, summary
 
     def _build_executive_summary_prompt(
         self,
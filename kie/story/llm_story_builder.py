@@ -5,6 +5,7 @@ Enhanced story builder that uses Claude LLM for domain-agnostic story generation
 Works for ANY data type - healthcare, manufacturing, finance, IoT, literally anything.
 """
 
+import logging
 import uuid
 from datetime import datetime
 from typing import Any
@@ -16,10 +17,13 @@ from kie.story.models import (
 )
 from kie.story.thesis_extractor import ThesisExtractor
 from kie.story.kpi_extractor import KPIExtractor
+from kie.story.llm_backend import LLMClient, get_llm_client
 from kie.story.llm_grouper import LLMSectionGrouper
 from kie.story.llm_narrative_synthesizer import LLMNarrativeSynthesizer
 from kie.story.llm_chart_selector import LLMChartSelector
 
+logger = logging.getLogger(__name__)
+
 
 class LLMStoryBuilder:
     """
@@ -34,7 +38,8 @@ class LLMStoryBuilder:
         narrative_mode: NarrativeMode = NarrativeMode.EXECUTIVE,
         use_llm_grouping: bool = True,
         use_llm_narrative: bool = True,
-        use_llm_charts: bool = True
+        use_llm_charts: bool = True,
+        llm_client: LLMClient | None = None
     ):
         """
         Initialize LLM-powered story builder.
@@ -44,11 +49,13 @@ class LLMStoryBuilder:
             use_llm_grouping: Use LLM for section grouping (vs rule-based)
             use_llm_narrative: Use LLM for narrative synthesis (vs templates)
             use_llm_charts: Use LLM for chart selection (vs heuristics)
+            llm_client: LLM client shared by all LLM components (default: global client)
         """
         self.narrative_mode = narrative_mode
         self.use_llm_grouping = use_llm_grouping
         self.use_llm_narrative = use_llm_narrative
         self.use_llm_charts = use_llm_charts
+        self.llm_client = llm_client or get_llm_client()
 
         # Initialize components
         self.thesis_extractor = ThesisExtractor()  # Already domain-agnostic
@@ -56,21 +63,21 @@ class LLMStoryBuilder:
 
         # Choose grouper (LLM vs rule-based)
         if use_llm_grouping:
-            self.section_grouper = LLMSectionGrouper()
+            self.section_grouper = LLMSectionGrouper(client=self.llm_client)
         else:
             from kie.story.section_grouper import SectionGrouper
             self.section_grouper = SectionGrouper()
 
         # Choose narrative synthesizer (LLM vs template)
         if use_llm_narrative:
-            self.narrative_synthesizer = LLMNarrativeSynthesizer(narrative_mode)
+            self.narrative_synthesizer = LLMNarrativeSynthesizer(narrative_mode, client=self.llm_client)
         else:
             from kie.story.narrative_synthesizer import NarrativeSynthesizer
             self.narrative_synthesizer = NarrativeSynthesizer(narrative_mode)
 
         # Chart selector (LLM vs heuristic)
         if use_llm_charts:
-            self.chart_selector = LLMChartSelector()
+            self.chart_selector = LLMChartSelector(client=self.llm_client)
         else:
             from kie.story.chart_selector import ChartSelector
             self.chart_selector = ChartSelector()
@@ -102,6 +109,7 @@ class LLMStoryBuilder:
             raise ValueError("Cannot build story with no insights")
 
         chart_refs = chart_refs or {}
+        llm_stats_before = self.llm_client.stats()
 
         # Step 1: Extract thesis (domain-agnostic pattern detection)
         thesis = self.thesis_extractor.extract_thesis(
@@ -134,31 +142,35 @@ class LLMStoryBuilder:
             )
             section.kpis = section_kpis
 
-        # Step 5: Synthesize narratives (LLM-powered or template-based)
-        for section in sections:
-            section_insights = [ins for ins in insights if ins.insight_id in section.insight_ids]
-
-            # Check if using LLM narrative synthesizer (3 args) or rule-based (2 args)
-            if self.use_llm_narrative:
-                section.narrative_text = self.narrative_synthesizer.synthesize_section_narrative(
-                    section,
-                    section_insights,
-                    section.kpis
-                )
-            else:
-                # Rule-based synthesizer only takes 2 args (section, insights)
+        # Step 5+6: Synthesize section narratives and executive summary
+        insights_by_section = [
+            [ins for ins in insights if ins.insight_id in section.insight_ids]
+            for section in sections
+        ]
+        if self.use_llm_narrative:
+            # LLM synthesizer fans out all prompts concurrently (one round-trip)
+            narratives, executive_summary = self.narrative_synthesizer.synthesize_story_narratives(
+                thesis,
+                top_kpis,
+                sections,
+                insights_by_section
+            )
+            for section, narrative in zip(sections, narratives, strict=True):
+                section.narrative_text = narrative
+        else:
+            # Rule-based synthesizer only takes 2 args (section, insights)
+            for section, section_insight_list in zip(sections, insights_by_section, strict=True):
                 section.narrative_text = self.narrative_synthesizer.synthesize_section_narrative(
                     section,
-                    section_insights
+                    section_insight_list
                 )
 
-        # Step 6: Generate executive summary
-        executive_summary = self.narrative_synthesizer.synthesize_executive_summary(
-            thesis,
-            top_kpis,
-            sections,
-            insights
-        )
+            executive_summary = self.narrative_synthesizer.synthesize_executive_summary(
+                thesis,
+                top_kpis,
+                sections,
+                insights
+            )
 
         # Step 7: Generate key findings
         key_findings = self.narrative_synthesizer.synthesize_key_findings(
@@ -166,7 +178,17 @@ class LLMStoryBuilder:
             max_findings=5
         )
 
-        # Step 8: Build manifest
+        # Step 8: Chart type per insight (LLM selector fans out all prompts at once;
+        # the heuristic selector needs the chart data, which isn't available here)
+        chart_types = {}
+        if self.use_llm_charts:
+            selections = self.chart_selector.select_chart_types(insights)
+            chart_types = {
+                insight.insight_id: chart_type
+                for insight, (chart_type, _params) in zip(insights, selections, strict=True)
+            }
+
+        # Step 9: Build manifest
         story_id = f"story_{project_name.replace(' ', '').replace('-', '')[:20].lower()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
         manifest = StoryManifest(
@@ -188,8 +210,29 @@ class LLMStoryBuilder:
                     "grouping": self.use_llm_grouping,
                     "narrative": self.use_llm_narrative,
                     "charts": self.use_llm_charts
-                }
+                },
+                "chart_types": chart_types,
+                "llm_usage": self._llm_usage_since(llm_stats_before)
             }
         )
 
         return manifest
+
+    def _llm_usage_since(self, before: dict[str, Any]) -> dict[str, Any]:
+        """
+        Token and call totals accrued by this build.
+
+        Latency is logged rather than returned: the usage is stored in the
+        manifest, which must not change from run to run.
+        """
+        after = self.llm_client.stats()
+        usage = {"backend": after["backend"], "model": after["model"]}
+        for key in ("calls", "cache_hits", "input_tokens", "output_tokens"):
+            usage[key] = after[key] - before[key]
+        logger.debug(
+            "Story LLM calls: %d (%.3fs latency, %.3fs wall)",
+            usage["calls"],
+            after["latency_seconds"] - before["latency_seconds"],
+            after["wall_seconds"] - before["wall_seconds"],
+        )
+        return usage
@@ -10,6 +10,15 @@ import pandas as pd
 
 from kie.tables.schema import TableConfig
 
+# Rows per chunk when writing CSV
+CSV_CHUNK_ROWS = 50_000
+
+# Tables at least this long are written with openpyxl write-only mode
+STREAMING_EXCEL_MIN_ROWS = 100_000
+
+# Rows converted per slice when streaming Excel
+EXCEL_STREAM_CHUNK_ROWS = 10_000
+
 
 class TableExporter:
     """Export tables to multiple formats."""
@@ -35,28 +44,10 @@ class TableExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to DataFrame
-        df = pd.DataFrame(config.data)
-
-        # Filter to visible columns (handle empty DataFrame)
-        visible_cols = [col.key for col in config.columns if not col.hidden]
-        if len(df) > 0:
-            df = df[visible_cols]
-        else:
-            # Empty DataFrame - create with correct columns
-            df = pd.DataFrame(columns=visible_cols)
+        df = self._prepare_frame(config, include_totals)
 
-        # Rename columns to display names
-        rename_map = {col.key: col.header for col in config.columns if not col.hidden}
-        df = df.rename(columns=rename_map)
-
-        # Add totals row if needed
-        if include_totals and config.show_totals_row:
-            totals_row = self._calculate_totals(config)
-            df = pd.concat([df, pd.DataFrame([totals_row])], ignore_index=True)
-
-        # Save
-        df.to_csv(output_path, index=False)
+        # Write in row chunks so pandas never formats the whole table at once
+        df.to_csv(output_path, index=False, chunksize=CSV_CHUNK_ROWS)
         return output_path
 
     def to_excel(
@@ -66,6 +57,7 @@ class TableExporter:
         sheet_name: str = "Data",
         include_totals: bool = True,
         style_headers: bool = True,
+        streaming: bool | None = None,
     ) -> Path:
         """
         Export table to Excel with formatting.
@@ -76,6 +68,9 @@ class TableExporter:
             sheet_name: Excel sheet name
             include_totals: Include totals row
             style_headers: Apply KDS styling to headers
+            streaming: Use openpyxl write-only mode (rows are flushed to disk
+                as they are written). Defaults to True for tables with at
+                least STREAMING_EXCEL_MIN_ROWS rows.
 
         Returns:
             Path to saved file
@@ -83,25 +78,20 @@ class TableExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to DataFrame
-        df = pd.DataFrame(config.data)
+        df = self._prepare_frame(config, include_totals)
 
-        # Filter to visible columns (handle empty DataFrame)
-        visible_cols = [col.key for col in config.columns if not col.hidden]
-        if len(df) > 0:
-            df = df[visible_cols]
-        else:
-            # Empty DataFrame - create with correct columns
-            df = pd.DataFrame(columns=visible_cols)
-
-        # Rename columns
-        rename_map = {col.key: col.header for col in config.columns if not col.hidden}
-        df = df.rename(columns=rename_map)
+        if streaming is None:
+            streaming = len(df) >= STREAMING_EXCEL_MIN_ROWS
 
-        # Add totals row
-        if include_totals and config.show_totals_row:
-            totals_row = self._calculate_totals(config)
-            df = pd.concat([df, pd.DataFrame([totals_row])], ignore_index=True)
+        if streaming:
+            self._write_excel_streaming(
+                df,
+                output_path,
+                sheet_name=sheet_name,
+                style_headers=style_headers,
+                bold_last_row=include_totals and config.show_totals_row,
+            )
+            return output_path
 
         # Write to Excel with formatting
         with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
@@ -109,7 +99,7 @@ class TableExporter:
 
             # Style if requested
             if style_headers:
-                self._style_excel(writer, sheet_name, config)
+                self._style_excel(writer, sheet_name, config, df)
 
         return output_path
 
@@ -144,25 +134,7 @@ class TableExporter:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to DataFrame
-        df = pd.DataFrame(config.data)
-
-        # Filter to visible columns (handle empty DataFrame)
-        visible_cols = [col.key for col in config.columns if not col.hidden]
-        if len(df) > 0:
-            df = df[visible_cols]
-        else:
-            # Empty DataFrame - create with correct columns
-            df = pd.DataFrame(columns=visible_cols)
-
-        # Rename columns
-        rename_map = {col.key: col.header for col in config.columns if not col.hidden}
-        df = df.rename(columns=rename_map)
-
-        # Add totals row
-        if include_totals and config.show_totals_row:
-            totals_row = self._calculate_totals(config)
-            df = pd.concat([df, pd.DataFrame([totals_row])], ignore_index=True)
+        df = self._prepare_frame(config, include_totals)
 
         # Determine page orientation based on column count
         page_size = landscape(letter) if len(df.columns) > 6 else letter
@@ -261,18 +233,53 @@ class TableExporter:
         doc.build(story)
         return output_path
 
-    def _calculate_totals(self, config: TableConfig) -> dict:
+    def _prepare_frame(self, config: TableConfig, include_totals: bool) -> pd.DataFrame:
+        """
+        Build the export frame: visible columns, display headers, totals row.
+
+        Args:
+            config: TableConfig
+            include_totals: Include totals row if enabled
+
+        Returns:
+            DataFrame ready for export
+        """
+        # Convert to DataFrame
+        data = pd.DataFrame(config.data)
+
+        # Filter to visible columns (handle empty DataFrame)
+        visible_cols = [col.key for col in config.columns if not col.hidden]
+        if len(data) > 0:
+            df = data[visible_cols]
+        else:
+            # Empty DataFrame - create with correct columns
+            df = pd.DataFrame(columns=visible_cols)
+
+        # Rename columns to display names
+        rename_map = {col.key: col.header for col in config.columns if not col.hidden}
+        df = df.rename(columns=rename_map)
+
+        # Add totals row if needed
+        if include_totals and config.show_totals_row:
+            totals_row = self._calculate_totals(config, data)
+            df = pd.concat([df, pd.DataFrame([totals_row])], ignore_index=True)
+
+        return df
+
+    def _calculate_totals(self, config: TableConfig, df: pd.DataFrame | None = None) -> dict:
         """
         Calculate totals row.
 
         Args:
             config: TableConfig
+            df: Already-materialized config.data (built if None)
 
         Returns:
             Dictionary with totals
         """
         totals = {}
-        df = pd.DataFrame(config.data)
+        if df is None:
+            df = pd.DataFrame(config.data)
 
         for col in config.columns:
             if col.footer_aggregate:
@@ -299,7 +306,98 @@ class TableExporter:
 
         return totals
 
-    def _style_excel(self, writer, sheet_name: str, config: TableConfig):
+    def _column_widths(self, df: pd.DataFrame) -> list[int]:
+        """
+        Compute Excel column widths from string lengths, column-wise.
+
+        Args:
+            df: Export frame (display headers as columns)
+
+        Returns:
+            Width per column (longest value or header + 2, capped at 50)
+        """
+        widths = []
+        for position in range(df.shape[1]):
+            max_length = len(str(df.columns[position]))
+            values = df.iloc[:, position].dropna()
+            if len(values) > 0:
+                max_length = max(max_length, int(values.astype(str).str.len().max()))
+            widths.append(min(max_length + 2, 50))
+        return widths
+
+    def _write_excel_streaming(
+        self,
+        df: pd.DataFrame,
+        output_path: Path,
+        sheet_name: str,
+        style_headers: bool,
+        bold_last_row: bool,
+    ) -> None:
+        """
+        Write Excel with openpyxl write-only mode.
+
+        Rows are serialized to the sheet as they are appended, so the
+        workbook never holds the full table as cell objects.
+
+        Args:
+            df: Export frame
+            output_path: Output file path
+            sheet_name: Sheet name
+            style_headers: Apply KDS styling to headers and widths
+            bold_last_row: Bold the final (totals) row
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment as ExcelAlignment
+        from openpyxl.styles import Font, PatternFill
+        from openpyxl.utils import get_column_letter
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(sheet_name)
+
+        # Column widths must be set before the first row is written
+        if style_headers:
+            for position, width in enumerate(self._column_widths(df), start=1):
+                worksheet.column_dimensions[get_column_letter(position)].width = width
+
+        headers = [str(col) for col in df.columns]
+        if style_headers:
+            header_fill = PatternFill(start_color="7823DC", end_color="7823DC", fill_type="solid")
+            header_font = Font(bold=True, color="FFFFFF", name="Inter")
+            header_alignment = ExcelAlignment(horizontal="left", vertical="center")
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(worksheet, value=header)
+                cell.fill = header_fill
+                cell.font = header_font
+                cell.alignment = header_alignment
+                header_row.append(cell)
+            worksheet.append(header_row)
+        else:
+            worksheet.append(headers)
+
+        last_idx = len(df) - 1
+        totals_font = Font(bold=True, name="Inter")
+
+        # Convert one slice at a time so the frame is never copied whole
+        for start in range(0, len(df), EXCEL_STREAM_CHUNK_ROWS):
+            chunk = df.iloc[start:start + EXCEL_STREAM_CHUNK_ROWS]
+            # Missing values become empty cells, matching DataFrame.to_excel
+            body = chunk.astype(object).where(chunk.notna(), None)
+            for row_idx, row in enumerate(body.itertuples(index=False, name=None), start=start):
+                if style_headers and bold_last_row and row_idx == last_idx:
+                    styled = []
+                    for value in row:
+                        cell = WriteOnlyCell(worksheet, value=value)
+                        cell.font = totals_font
+                        styled.append(cell)
+                    worksheet.append(styled)
+                else:
+                    worksheet.append(row)
+
+        workbook.save(output_path)
+
+    def _style_excel(self, writer, sheet_name: str, config: TableConfig, df: pd.DataFrame):
         """
         Apply KDS styling to Excel worksheet.
 
@@ -307,9 +405,11 @@ class TableExporter:
             writer: ExcelWriter
             sheet_name: Sheet name
             config: TableConfig
+            df: Frame that was written (used for column widths)
         """
         from openpyxl.styles import Alignment as ExcelAlignment
         from openpyxl.styles import Font, PatternFill
+        from openpyxl.utils import get_column_letter
 
         worksheet = writer.sheets[sheet_name]
 
@@ -323,20 +423,9 @@ class TableExporter:
             cell.font = header_font
             cell.alignment = ExcelAlignment(horizontal="left", vertical="center")
 
-        # Auto-adjust column widths
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+        # Auto-adjust column widths (computed from the frame, not cell-by-cell)
+        for position, width in enumerate(self._column_widths(df), start=1):
+            worksheet.column_dimensions[get_column_letter(position)].width = width
 
         # Style totals row if present
         if config.show_totals_row:
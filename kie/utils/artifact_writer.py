@@ -0,0 +1,354 @@
+"""
+Background Artifact Writer
+
+Moves artifact serialization and file I/O off the caller's thread:
+- One background thread fed by a bounded queue (callers block when it is full)
+- Atomic writes (temp file + rename), so readers never see partial files
+- Fast JSON encoding via kie.utils.json_codec
+- Unchanged content is not rewritten (keeps mtimes, saves round-trips on
+  network-mounted project folders)
+- flush() is a barrier: it returns once every queued write is on disk and
+  re-raises the first write error
+- Fork-safe: no writer lock is held across os.fork(), and a forked child
+  starts with an empty queue and its own thread on first write
+
+Callers that hand objects to the writer must not mutate them afterwards;
+serialization happens on the writer thread.
+
+Example:
+    >>> writer = get_artifact_writer()
+    >>> writer.write_json(charts_dir / "chart.json", config.to_dict())
+    >>> writer.write_text(report_path, markdown)
+    >>> writer.flush()  # before returning from the command/skill
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import queue
+import threading
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from kie.utils.json_codec import dumps_bytes
+
+# Queued writes before write_*() calls start blocking
+DEFAULT_MAX_PENDING = 256
+
+# Remembered content hashes (one per artifact path)
+MAX_TRACKED_HASHES = 20000
+
+# Writers to make fork-safe (see _before_fork)
+_live_writers: "weakref.WeakSet[ArtifactWriter]" = weakref.WeakSet()
+_locked_for_fork: list["ArtifactWriter"] = []
+
+Payload = bytes | Callable[[], bytes]
+
+
+def serialize_artifact(
+    obj: Any,
+    fmt: str,
+    indent: int | None = 2,
+    sort_keys: bool = True,
+    default: Callable[[Any], Any] | None = str,
+) -> bytes:
+    """
+    Serialize an artifact object.
+
+    Args:
+        obj: Object to serialize
+        fmt: "json", "yaml" or "text"
+        indent: JSON indentation
+        sort_keys: Sort YAML mapping keys (yaml.dump default)
+        default: JSON fallback serializer for unsupported types
+
+    Returns:
+        UTF-8 encoded content
+
+    Raises:
+        ValueError: If fmt is not supported
+    """
+    if fmt == "json":
+        return dumps_bytes(obj, indent=indent, default=default)
+    if fmt == "yaml":
+        text: str = yaml.dump(obj, default_flow_style=False, sort_keys=sort_keys)
+        return text.encode("utf-8")
+    if fmt == "text":
+        return str(obj).encode("utf-8")
+    raise ValueError(f"Unsupported artifact format: {fmt}")
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class ArtifactWriter:
+    """
+    Single background thread that writes artifacts in submission order.
+
+    Example:
+        >>> writer = ArtifactWriter()
+        >>> writer.write_json(Path("outputs/plan.json"), plan)
+        >>> writer.flush()
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING, skip_unchanged: bool = True):
+        """
+        Initialize artifact writer (the thread starts on first write).
+
+        Args:
+            max_pending: Bounded queue size
+            skip_unchanged: Don't rewrite files whose content is unchanged
+        """
+        self.skip_unchanged = skip_unchanged
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self._hashes: dict[str, tuple[bytes, int]] = {}  # path -> (digest, mtime_ns) as written
+        self._pending: dict[str, int] = {}
+        self._errors: list[BaseException] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stats = {"queued": 0, "written": 0, "skipped": 0, "bytes": 0}
+        _live_writers.add(self)
+
+    def write_bytes(self, path: Path | str, data: Payload, on_written: Callable[[Path], None] | None = None) -> Path:
+        """
+        Queue a write of raw bytes.
+
+        Args:
+            path: Destination file
+            data: Content, or a function producing it on the writer thread
+            on_written: Called with the path once the content is on disk
+
+        Returns:
+            Destination path
+        """
+        path = Path(path)
+        key = str(path)
+        self._ensure_thread()
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + 1
+            self._stats["queued"] += 1
+        self._queue.put((path, data, on_written))
+        return path
+
+    def write_text(self, path: Path | str, text: str, on_written: Callable[[Path], None] | None = None) -> Path:
+        """Queue a UTF-8 text write (e.g. markdown)."""
+        return self.write_bytes(path, lambda: text.encode("utf-8"), on_written)
+
+    def write_json(
+        self,
+        path: Path | str,
+        obj: Any,
+        indent: int | None = 2,
+        default: Callable[[Any], Any] | None = str,
+        fast: bool = True,
+        on_written: Callable[[Path], None] | None = None,
+    ) -> Path:
+        """
+        Queue a JSON write (serialized on the writer thread).
+
+        Args:
+            path: Destination file
+            obj: JSON-serializable object (must not be mutated afterwards)
+            indent: Indentation (None for compact)
+            default: Fallback serializer for unsupported types
+            fast: Use the fast encoder; False keeps stdlib output exactly
+                (e.g. NaN stays NaN instead of null)
+            on_written: Called with the path once the content is on disk
+
+        Returns:
+            Destination path
+        """
+        if fast:
+            return self.write_bytes(path, lambda: serialize_artifact(obj, "json", indent=indent, default=default), on_written)
+        return self.write_bytes(
+            path, lambda: json.dumps(obj, indent=indent, default=default).encode("utf-8"), on_written
+        )
+
+    def write_yaml(
+        self,
+        path: Path | str,
+        obj: Any,
+        sort_keys: bool = True,
+        on_written: Callable[[Path], None] | None = None,
+    ) -> Path:
+        """Queue a YAML write (serialized on the writer thread)."""
+        return self.write_bytes(path, lambda: serialize_artifact(obj, "yaml", sort_keys=sort_keys), on_written)
+
+    def is_pending(self, path: Path | str) -> bool:
+        """Whether a write to path is queued or in progress."""
+        with self._lock:
+            return self._pending.get(str(Path(path)), 0) > 0
+
+    def flush(self) -> None:
+        """
+        Block until every queued write has finished.
+
+        Raises:
+            Exception: First write or serialization error since the last flush
+        """
+        if self._thread is not None:
+            self._queue.join()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def shutdown(self) -> None:
+        """
+        Finish queued writes and stop the writer thread.
+
+        Errors stay pending for flush(); a later write starts a new thread.
+        """
+        with self._lock:
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(None)
+        thread.join()
+        with self._lock:
+            if self._thread is thread:
+                self._thread = None
+
+    def stats(self) -> dict[str, int]:
+        """Return queued, written, skipped and byte counters."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _reset_after_fork(self) -> None:
+        """In a forked child: drop the parent's queue, thread and locks."""
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._thread = None
+        self._pending = {}
+        self._errors = []
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="kie-artifact-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:  # shutdown()
+                self._queue.task_done()
+                return
+            path, data, on_written = item
+            try:
+                self._write(path, data() if callable(data) else data)
+                if on_written is not None:
+                    on_written(path)
+            except BaseException as e:  # surfaced by flush()
+                with self._lock:
+                    self._errors.append(e)
+            finally:
+                with self._lock:
+                    key = str(path)
+                    self._pending[key] -= 1
+                    if not self._pending[key]:
+                        del self._pending[key]
+                self._queue.task_done()
+
+    def _write(self, path: Path, data: bytes) -> None:
+        key = str(path)
+        digest = _digest(data)
+
+        if self.skip_unchanged and self._is_unchanged(path, key, data, digest):
+            with self._lock:
+                self._stats["skipped"] += 1
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        mtime_ns = path.stat().st_mtime_ns
+
+        with self._lock:
+            if len(self._hashes) >= MAX_TRACKED_HASHES:
+                self._hashes.clear()
+            self._hashes[key] = (digest, mtime_ns)
+            self._stats["written"] += 1
+            self._stats["bytes"] += len(data)
+
+    def _is_unchanged(self, path: Path, key: str, data: bytes, digest: bytes) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_size != len(data):
+            return False
+        with self._lock:
+            known = self._hashes.get(key)
+        if known is not None and known[1] == stat.st_mtime_ns:
+            return known[0] == digest
+        # Not written by us (or edited since): compare with what's on disk
+        try:
+            return path.read_bytes() == data
+        except OSError:
+            return False
+
+
+def _before_fork() -> None:
+    # Hold every writer lock so the writer thread can't own one at fork time
+    _locked_for_fork[:] = list(_live_writers)
+    for writer in _locked_for_fork:
+        writer._lock.acquire()
+
+
+def _after_fork_in_parent() -> None:
+    for writer in _locked_for_fork:
+        writer._lock.release()
+    _locked_for_fork.clear()
+
+
+def _after_fork_in_child() -> None:
+    # The writer thread doesn't exist in the child; start clean
+    for writer in _locked_for_fork:
+        writer._reset_after_fork()
+    _locked_for_fork.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork, after_in_parent=_after_fork_in_parent, after_in_child=_after_fork_in_child
+    )
+
+
+# Global artifact writer
+_global_writer: ArtifactWriter | None = None
+
+
+def get_artifact_writer() -> ArtifactWriter:
+    """
+    Get global artifact writer (flushed automatically at interpreter exit).
+
+    Returns:
+        Global ArtifactWriter
+    """
+    global _global_writer
+    if _global_writer is None:
+        _global_writer = ArtifactWriter()
+        atexit.register(_global_writer.flush)
+    return _global_writer
+
+
+def set_artifact_writer(writer: ArtifactWriter | None) -> None:
+    """
+    Replace the global artifact writer (None resets it).
+
+    Args:
+        writer: ArtifactWriter to use globally
+    """
+    global _global_writer
+    _global_writer = writer
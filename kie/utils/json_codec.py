@@ -0,0 +1,62 @@
+"""
+Fast JSON Encoding
+
+Uses orjson when it is installed and falls back to the standard library.
+orjson also serializes NumPy arrays and scalars natively, so chart data
+built from DataFrames does not need per-value conversion.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_bytes(
+    obj: Any, indent: int | None = None, default: Callable[[Any], Any] | None = None
+) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: None for compact output, otherwise indentation width
+        default: Fallback serializer for unsupported types (e.g. str)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if HAS_ORJSON and indent in (None, 2):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except (orjson.JSONEncodeError, TypeError):
+            # e.g. integers beyond 64 bits - let the stdlib handle it
+            pass
+
+    return json.dumps(obj, indent=indent, default=default, ensure_ascii=False).encode("utf-8")
+
+
+def dumps(
+    obj: Any, indent: int | None = None, default: Callable[[Any], Any] | None = None
+) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: None for compact output, otherwise indentation width
+        default: Fallback serializer for unsupported types (e.g. str)
+
+    Returns:
+        JSON string
+    """
+    return dumps_bytes(obj, indent=indent, default=default).decode("utf-8")
@@ -0,0 +1,143 @@
+"""
+Keyword Text Classification
+
+Skills route insights by keyword taxonomies ("trend" words → line chart,
+"driver" words → scatter, ...). Checking each text against each keyword
+list with any(kw in text ...) costs O(texts × keywords). A
+KeywordClassifier compiles a whole taxonomy into one regex that finds every
+keyword occurrence in a single scan, so a batch of texts is classified in
+O(total text length):
+
+- Matching is case-insensitive substring matching, exactly like
+  kw in text.lower() (overlapping keywords and keywords that are prefixes of
+  other keywords are all found)
+- Results are multi-label scores: label -> number of distinct keywords found
+
+Example:
+    >>> classifier = KeywordClassifier({"trend": ["over time", "growth"], "comparison": ["vs", "higher"]})
+    >>> classifier.scores("Revenue growth is higher in the North")
+    {'trend': 1, 'comparison': 1}
+    >>> classifier.first_match("Sales vs target", ["trend", "comparison"])
+    'comparison'
+"""
+
+import re
+from bisect import bisect_right
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import Any
+
+# Joins batch texts; keywords never contain it, so matches can't span two texts
+_SEPARATOR = "\x00"
+
+
+class KeywordClassifier:
+    """
+    Multi-label keyword classifier compiled from a taxonomy (label -> keywords).
+    """
+
+    def __init__(self, taxonomy: Mapping[Any, Iterable[str]]):
+        """
+        Compile a taxonomy.
+
+        Args:
+            taxonomy: Label -> keywords (matched case-insensitively as substrings).
+                Label order is kept for first_match() and labels().
+        """
+        self.labels_in_order = list(taxonomy)
+        keyword_labels: dict[str, set[Hashable]] = {}
+        for label, keywords in taxonomy.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword or _SEPARATOR in keyword:
+                    raise ValueError(f"Invalid keyword for {label!r}: {keyword!r}")
+                keyword_labels.setdefault(keyword, set()).add(label)
+
+        # The regex reports one keyword per position: the longest. Every
+        # shorter keyword matching at that position is a prefix of it, so
+        # each keyword carries the keywords that are its prefixes.
+        self._prefix_keywords: dict[str, tuple[str, ...]] = {
+            keyword: tuple(other for other in keyword_labels if keyword.startswith(other))
+            for keyword in keyword_labels
+        }
+        self._keyword_labels = keyword_labels
+
+        alternatives = "|".join(re.escape(k) for k in sorted(keyword_labels, key=len, reverse=True))
+        # Zero-width lookahead so overlapping occurrences are all reported
+        self._pattern = re.compile(f"(?=({alternatives}))") if keyword_labels else None
+
+    def scores(self, text: str) -> dict[Hashable, int]:
+        """
+        Multi-label scores of one text.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Label -> number of distinct keywords of that label found (matched labels only)
+        """
+        return self.classify_batch([text])[0]
+
+    def classify_batch(self, texts: Sequence[str]) -> list[dict[Hashable, int]]:
+        """
+        Multi-label scores of many texts in one scan.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            Scores per text, in input order (see scores())
+        """
+        found: list[set[str]] = [set() for _ in texts]
+        if self._pattern is None or not texts:
+            return [{} for _ in texts]
+
+        # Lowercase before computing offsets (lowercasing can change lengths)
+        lowered = [text.lower() for text in texts]
+        starts = []
+        offset = 0
+        for text in lowered:
+            starts.append(offset)
+            offset += len(text) + len(_SEPARATOR)
+
+        joined = _SEPARATOR.join(lowered)
+        for match in self._pattern.finditer(joined):
+            found[bisect_right(starts, match.start()) - 1].update(self._prefix_keywords[match.group(1)])
+
+        results = []
+        for keywords in found:
+            scores: dict[Hashable, int] = {}
+            for keyword in keywords:
+                for label in self._keyword_labels[keyword]:
+                    scores[label] = scores.get(label, 0) + 1
+            results.append(scores)
+        return results
+
+    def labels(self, text: str) -> list[Hashable]:
+        """
+        Labels with at least one keyword in the text, in taxonomy order.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Matched labels
+        """
+        scores = self.scores(text)
+        return [label for label in self.labels_in_order if label in scores]
+
+    def first_match(self, text: str, order: Iterable[Hashable] | None = None) -> Hashable | None:
+        """
+        First label (in priority order) with a keyword in the text.
+
+        Args:
+            text: Text to classify
+            order: Label priority (default: taxonomy order)
+
+        Returns:
+            Label, or None if no keyword matches
+        """
+        scores = self.scores(text)
+        for label in order if order is not None else self.labels_in_order:
+            if label in scores:
+                return label
+        return None
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+CLI Import-Time Budget Checker
+
+Keeps startup of lightweight commands (/status, /help) fast by measuring
+`python -X importtime -c "import kie.cli"` and failing when the cumulative
+import time of kie.cli exceeds the budget, or when heavy dependencies that
+should only load on dispatch are imported eagerly.
+
+Usage:
+    python scripts/check_import_time.py
+    python scripts/check_import_time.py --budget-ms 150 --runs 5
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Root of the repo
+REPO_ROOT = Path(__file__).parent.parent
+
+DEFAULT_MODULE = "kie.cli"
+DEFAULT_BUDGET_MS = 150.0
+DEFAULT_RUNS = 5
+
+# Modules that must not be imported just to start the CLI
+HEAVY_MODULES = ["pandas", "numpy", "pptx", "pygal", "openpyxl", "kie.data", "kie.insights"]
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_import(module: str) -> tuple[float, set[str]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        Tuple of (cumulative import time in ms, names of all imported modules)
+    """
+    # Measure a warm start: allow bytecode caching even if disabled in this shell
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative_us = 0
+    imported = set()
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        imported.add(name)
+        # Top-level entry (single leading space) for the requested module
+        if name == module and len(indent) == 1:
+            cumulative_us = int(cumulative)
+
+    return cumulative_us / 1000, imported
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Check CLI import-time budget")
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    # Best of N: the first run also pays for bytecode compilation
+    timings = []
+    imported: set[str] = set()
+    for _ in range(max(args.runs, 1)):
+        elapsed_ms, imported = measure_import(args.module)
+        timings.append(elapsed_ms)
+    best_ms = min(timings)
+
+    heavy = [m for m in HEAVY_MODULES if m in imported]
+
+    print(f"import {args.module}: {best_ms:.1f} ms (best of {len(timings)}, budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if best_ms > args.budget_ms:
+        print(f"❌ Import time exceeds budget by {best_ms - args.budget_ms:.1f} ms")
+        failed = True
+    if heavy:
+        print(f"❌ Heavy modules imported at startup: {', '.join(heavy)}")
+        failed = True
+
+    if failed:
+        print()
+        print("Move heavy imports into the functions that use them, or declare")
+        print("new skills lazily in kie/skills/__init__.py.")
+        sys.exit(1)
+
+    print("✅ Import-time budget met")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
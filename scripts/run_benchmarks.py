@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark Runner
+
+Times DataLoader.load, EDA.analyze, InsightEngine.auto_extract_comprehensive,
+/go --full, ChartRenderer.render_charts, analyze-stage skills and the PPTX
+build on synthetic datasets, saves the results as JSON and compares them
+with the stored baseline (benchmarks/baseline.json, quick shapes). Timings
+are machine-specific: re-record the baseline with --save-baseline when
+benchmarking on different hardware.
+
+Usage:
+    python scripts/run_benchmarks.py                       # quick shapes, compare with baseline
+    python scripts/run_benchmarks.py --shapes 1m_10 10m_10 --cases data_load eda_analyze
+    python scripts/run_benchmarks.py --save-baseline       # record a new baseline
+    python scripts/run_benchmarks.py --threshold 0.1       # fail on >10% slowdowns
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+# Root of the repo
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from kie.benchmarks import (  # noqa: E402
+    ALL_CASES,
+    QUICK_SHAPES,
+    SHAPES,
+    compare_results,
+    format_report,
+    load_results,
+    results_document,
+    run_shape,
+    save_results,
+)
+from kie.benchmarks.cases import DEFAULT_PIPELINE_MAX_ROWS  # noqa: E402
+from kie.benchmarks.harness import DEFAULT_REPEAT, DEFAULT_THRESHOLD  # noqa: E402
+
+DEFAULT_BASELINE = REPO_ROOT / "benchmarks" / "baseline.json"
+DEFAULT_OUTPUT = REPO_ROOT / "benchmarks" / "results" / "latest.json"
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run KIE pipeline benchmarks")
+    parser.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=QUICK_SHAPES)
+    parser.add_argument("--cases", nargs="+", choices=ALL_CASES, default=None)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--pipeline-max-rows", type=int, default=DEFAULT_PIPELINE_MAX_ROWS)
+    parser.add_argument("--workspace", type=Path, default=None, help="Reuse generated datasets across runs")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="kie-bench-") as tmp:
+        workspace = args.workspace or Path(tmp)
+        results = []
+        for name in args.shapes:
+            print(f"▶ {name}", flush=True)
+            results.extend(run_shape(
+                SHAPES[name],
+                workspace,
+                cases=args.cases,
+                repeat=args.repeat,
+                pipeline_max_rows=args.pipeline_max_rows,
+            ))
+
+    document = results_document(results, metadata={
+        "shapes": args.shapes,
+        "cases": args.cases or ALL_CASES,
+        "repeat": args.repeat,
+    })
+    save_results(document, args.output)
+    current = {result.name: result for result in results}
+
+    if args.save_baseline:
+        save_results(document, args.baseline)
+        print(format_report(current))
+        print(f"\n✅ Baseline saved to {args.baseline}")
+        sys.exit(0)
+
+    baseline = load_results(args.baseline) if args.baseline.exists() else None
+    print(format_report(current, baseline))
+    print(f"\nResults saved to {args.output}")
+
+    failed = [result.name for result in results if result.status == "error"]
+    if failed:
+        print(f"❌ Benchmark cases failed: {', '.join(failed)}")
+
+    if baseline is None:
+        print(f"No baseline at {args.baseline} (record one with --save-baseline)")
+        sys.exit(1 if failed else 0)
+
+    regressions = compare_results(current, baseline, threshold=args.threshold)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"   {regression.name}: {regression.baseline:.3f}s → {regression.current:.3f}s ({regression.ratio:.2f}x)")
+        sys.exit(1)
+
+    print(f"✅ No regressions above {args.threshold:.0%}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Tests for the shared aggregation cache.
+"""
+
+import pandas as pd
+import pytest
+
+from kie.data.aggregation import AggregationCache
+
+
+@pytest.fixture
+def sales():
+    return pd.DataFrame(
+        {
+            "region": ["North", "South", "North", "East", "South"],
+            "segment": ["A", "A", "B", "B", "A"],
+            "revenue": [100.0, 200.0, 50.0, 75.0, 25.0],
+        }
+    )
+
+
+def test_aggregate_matches_groupby(sales):
+    cache = AggregationCache()
+
+    result = cache.aggregate(sales, "region", "revenue", "sum")
+
+    pd.testing.assert_series_equal(result, sales.groupby("region")["revenue"].sum())
+
+
+def test_repeat_request_is_cache_hit(sales):
+    cache = AggregationCache()
+
+    cache.aggregate(sales, "region", "revenue", "sum")
+    cache.aggregate(sales, "region", "revenue", "sum")
+    cache.aggregate(sales, "region", "revenue", "mean")
+
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 2}
+
+
+def test_equal_content_shares_entries(sales):
+    cache = AggregationCache()
+
+    cache.aggregate(sales, "region", "revenue", "sum")
+    cache.aggregate(sales.copy(), "region", "revenue", "sum")
+
+    assert cache.hits == 1
+
+
+def test_changed_content_misses(sales):
+    cache = AggregationCache()
+    changed = sales.copy()
+    changed.loc[0, "revenue"] = 999.0
+
+    first = cache.aggregate(sales, "region", "revenue", "sum")
+    second = cache.aggregate(changed, "region", "revenue", "sum")
+
+    assert cache.misses == 2
+    assert first["North"] == 150.0
+    assert second["North"] == 1049.0
+
+
+def test_results_are_copies(sales):
+    cache = AggregationCache()
+
+    result = cache.aggregate(sales, "region", "revenue", "sum")
+    result["North"] = -1
+
+    assert cache.aggregate(sales, "region", "revenue", "sum")["North"] == 150.0
+
+
+def test_filters_and_multiple_keys(sales):
+    cache = AggregationCache()
+
+    result = cache.aggregate(sales, ["region", "segment"], "revenue", "sum", filters={"segment": ["A"]})
+
+    expected = sales[sales["segment"] == "A"].groupby(["region", "segment"])["revenue"].sum()
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_filter_values_keep_their_type():
+    cache = AggregationCache()
+    mixed = pd.DataFrame({"tier": [1, "1", 1], "revenue": [10.0, 20.0, 30.0], "region": ["N", "N", "S"]})
+
+    by_int = cache.aggregate(mixed, "region", "revenue", "sum", filters={"tier": [1]})
+    by_str = cache.aggregate(mixed, "region", "revenue", "sum", filters={"tier": ["1"]})
+
+    assert cache.misses == 2
+    assert by_int.to_dict() == {"N": 10.0, "S": 30.0}
+    assert by_str.to_dict() == {"N": 20.0}
+
+
+def test_lru_eviction(sales):
+    cache = AggregationCache(max_entries=2)
+
+    cache.aggregate(sales, "region", "revenue", "sum")
+    cache.aggregate(sales, "segment", "revenue", "sum")
+    cache.aggregate(sales, "region", "revenue", "sum")  # refresh region
+    cache.aggregate(sales, "region", "revenue", "max")  # evicts segment
+
+    assert cache.stats()["entries"] == 2
+    cache.aggregate(sales, "region", "revenue", "sum")
+    assert cache.hits == 2
+    cache.aggregate(sales, "segment", "revenue", "sum")
+    assert cache.misses == 4
+
+
+def test_disk_persistence(sales, tmp_path):
+    AggregationCache(persist_dir=tmp_path).aggregate(sales, "region", "revenue", "sum")
+
+    fresh = AggregationCache(persist_dir=tmp_path)
+    result = fresh.aggregate(sales, "region", "revenue", "sum")
+
+    assert fresh.misses == 0
+    assert result["South"] == 225.0
+
+
+def test_unsupported_aggregation(sales):
+    with pytest.raises(ValueError, match="Unsupported aggregation"):
+        AggregationCache().aggregate(sales, "region", "revenue", "mode")
@@ -0,0 +1,108 @@
+"""
+Tests for the parsed-artifact cache shared by skills
+
+Tests cover:
+- Artifacts are parsed once while unchanged, re-parsed after edits
+- Views are read-only; thaw() returns a mutable copy
+- Published artifacts are served without reading the file
+- Views serialize like plain dicts/lists
+- SkillContexts of a run share the run's cache
+"""
+
+import copy
+import json
+import os
+
+import pytest
+import yaml
+
+from kie.run_context import run_context
+from kie.skills.artifact_cache import ArtifactCache, thaw
+from kie.skills.base import SkillContext
+
+
+def test_load_parses_once(tmp_path):
+    path = tmp_path / "triage.json"
+    path.write_text(json.dumps({"top_insights": [{"id": "a"}]}))
+    cache = ArtifactCache()
+
+    first = cache.load(path)
+    second = cache.load(path)
+
+    assert first is second
+    assert first == {"top_insights": [{"id": "a"}]}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_edited_file_is_reparsed(tmp_path):
+    path = tmp_path / "intent.yaml"
+    path.write_text(yaml.dump({"objective": "Grow revenue"}))
+    cache = ArtifactCache()
+    assert cache.load(path)["objective"] == "Grow revenue"
+
+    path.write_text(yaml.dump({"objective": "Cut costs"}))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.load(path)["objective"] == "Cut costs"
+    assert cache.misses == 2
+
+
+def test_views_are_read_only(tmp_path):
+    path = tmp_path / "plan.json"
+    path.write_text(json.dumps({"specifications": [{"chart": "bar"}]}))
+    plan = ArtifactCache().load(path)
+
+    with pytest.raises(TypeError, match="read-only"):
+        plan["specifications"] = []
+    with pytest.raises(TypeError):
+        plan["specifications"].append({})
+    with pytest.raises(TypeError):
+        plan["specifications"][0].update(chart="line")
+
+    mutable = thaw(plan)
+    mutable["specifications"][0]["chart"] = "line"
+    assert copy.deepcopy(plan)["specifications"][0] == {"chart": "bar"}
+    assert plan["specifications"][0]["chart"] == "bar"
+
+
+def test_views_serialize_like_plain_data(tmp_path):
+    path = tmp_path / "plan.json"
+    data = {"a": [1, {"b": None}], "c": "x"}
+    path.write_text(json.dumps(data))
+    view = ArtifactCache().load(path)
+
+    assert json.loads(json.dumps(view)) == data
+    assert yaml.safe_load(yaml.safe_dump(view)) == data
+
+
+def test_published_artifact_skips_disk_read(tmp_path, monkeypatch):
+    path = tmp_path / "visual_qc.json"
+    output = {"charts": [], "summary": {"client_ready": 0}}
+    path.write_text(json.dumps(output))
+    cache = ArtifactCache()
+    cache.publish(path, output)
+
+    monkeypatch.setattr(json, "load", lambda f: pytest.fail("artifact re-read from disk"))
+
+    assert cache.load(path) == output
+    assert cache.misses == 0
+
+
+def test_missing_and_unsupported_artifacts(tmp_path):
+    cache = ArtifactCache()
+    with pytest.raises(FileNotFoundError):
+        cache.load(tmp_path / "missing.json")
+    with pytest.raises(ValueError):
+        cache.load(tmp_path / "notes.md")
+
+
+def test_skill_contexts_share_run_cache(tmp_path):
+    outside = SkillContext(project_root=tmp_path, current_stage="analyze")
+    with run_context(tmp_path) as run:
+        first = SkillContext(project_root=tmp_path, current_stage="analyze")
+        second = SkillContext(project_root=tmp_path, current_stage="build")
+
+    assert first.artifact_cache is run.artifact_cache
+    assert second.artifact_cache is run.artifact_cache
+    assert outside.artifact_cache is not run.artifact_cache
@@ -0,0 +1,159 @@
+"""
+Tests for the background artifact writer
+
+Tests cover:
+- Atomic writes land once flush() returns
+- Unchanged content is not rewritten
+- Bounded queue accepts more writes than its size
+- Write errors surface at the flush barrier
+- Charts written through the writer match synchronous output
+"""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from kie.charts import ChartFactory
+from kie.utils.artifact_writer import ArtifactWriter, get_artifact_writer, set_artifact_writer
+from kie.utils.json_codec import HAS_ORJSON
+
+
+@pytest.fixture
+def writer():
+    writer = ArtifactWriter(max_pending=4)
+    yield writer
+    writer.flush()
+
+
+def test_writes_land_after_flush(tmp_path, writer):
+    written = []
+    path = tmp_path / "outputs" / "plan.json"
+
+    writer.write_json(path, {"b": 1, "a": [1, 2]}, on_written=written.append)
+    writer.write_text(tmp_path / "report.md", "# Report\n")
+    writer.write_yaml(tmp_path / "profile.yaml", {"rows": 4})
+    writer.flush()
+
+    assert json.loads(path.read_text()) == {"b": 1, "a": [1, 2]}
+    assert (tmp_path / "report.md").read_text() == "# Report\n"
+    assert (tmp_path / "profile.yaml").read_text() == "rows: 4\n"
+    assert written == [path]
+    assert not writer.is_pending(path)
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_unchanged_content_is_not_rewritten(tmp_path, writer):
+    path = tmp_path / "chart.json"
+    writer.write_json(path, {"data": [1, 2, 3]})
+    writer.flush()
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    writer.write_json(path, {"data": [1, 2, 3]})
+    writer.flush()
+    assert path.stat().st_mtime_ns == 1_000_000_000
+    assert writer.stats()["skipped"] == 1
+
+    writer.write_json(path, {"data": [4]})
+    writer.flush()
+    assert json.loads(path.read_text()) == {"data": [4]}
+    assert writer.stats()["written"] == 2
+
+
+def test_bounded_queue_drains(tmp_path, writer):
+    for i in range(50):
+        writer.write_text(tmp_path / f"table_{i}.csv", f"value\n{i}\n")
+    writer.flush()
+
+    assert len(list(tmp_path.glob("table_*.csv"))) == 50
+    assert writer.stats()["queued"] == 50
+
+
+def test_errors_surface_at_flush(tmp_path, writer):
+    def fail() -> bytes:
+        raise RuntimeError("serialization failed")
+
+    writer.write_bytes(tmp_path / "bad.json", fail)
+    writer.write_text(tmp_path / "good.md", "ok")
+
+    with pytest.raises(RuntimeError, match="serialization failed"):
+        writer.flush()
+    assert (tmp_path / "good.md").read_text() == "ok"
+    writer.flush()  # error reported once
+
+
+def test_nan_kept_with_stdlib_encoding(tmp_path, writer):
+    writer.write_json(tmp_path / "fast.json", {"skew": float("nan")})
+    writer.write_json(tmp_path / "exact.json", {"skew": float("nan")}, fast=False)
+    writer.flush()
+
+    if HAS_ORJSON:
+        assert json.loads((tmp_path / "fast.json").read_text()) == {"skew": None}
+    assert (tmp_path / "exact.json").read_text() == json.dumps({"skew": float("nan")}, indent=2)
+
+
+def test_chart_through_writer_matches_sync(tmp_path, writer):
+    config = ChartFactory.bar(
+        data=pd.DataFrame({"region": ["North", "South"], "revenue": [1200.0, 800.0]}),
+        x="region",
+        y=["revenue"],
+        title="Revenue by Region",
+    )
+
+    sync_path = config.to_svg(tmp_path / "sync" / "chart.svg")
+    async_path = config.to_svg(tmp_path / "async" / "chart.svg", writer=writer)
+    writer.flush()
+
+    assert async_path.name == sync_path.name == "chart.svg"
+    assert (tmp_path / "async" / "chart.json").read_bytes() == (tmp_path / "sync" / "chart.json").read_bytes()
+    # Pygal embeds a random chart id, so compare SVG structure only
+    assert async_path.read_text().startswith("<?xml")
+    assert abs(len(async_path.read_bytes()) - len(sync_path.read_bytes())) < 64
+
+
+def test_shutdown_stops_thread(tmp_path, writer):
+    writer.write_json(tmp_path / "a.json", {"a": 1})
+    thread = writer._thread
+
+    writer.shutdown()
+
+    assert not thread.is_alive()
+    assert json.loads((tmp_path / "a.json").read_text()) == {"a": 1}
+    writer.write_json(tmp_path / "b.json", {"b": 2})  # Restarts on demand
+    writer.flush()
+    assert json.loads((tmp_path / "b.json").read_text()) == {"b": 2}
+    writer.shutdown()
+
+
+def _write_in_child(writer, path):
+    writer.write_json(path, {"child": True})
+    writer.flush()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_forked_child_gets_fresh_writer(tmp_path, writer):
+    import multiprocessing
+
+    for i in range(50):
+        writer.write_json(tmp_path / f"parent_{i}.json", {"i": i})
+    child = multiprocessing.get_context("fork").Process(
+        target=_write_in_child, args=(writer, tmp_path / "child.json")
+    )
+    child.start()
+    child.join(timeout=30)
+    writer.flush()
+
+    assert child.exitcode == 0
+    assert json.loads((tmp_path / "child.json").read_text()) == {"child": True}
+    assert json.loads((tmp_path / "parent_49.json").read_text()) == {"i": 49}
+
+
+def test_global_writer():
+    writer = ArtifactWriter()
+    set_artifact_writer(writer)
+    try:
+        assert get_artifact_writer() is writer
+    finally:
+        set_artifact_writer(None)
+    assert get_artifact_writer() is not writer
@@ -0,0 +1,93 @@
+"""
+Tests for the multi-project batch runner
+
+Tests cover:
+- Project directory and glob resolution
+- Commands run in every project with per-project logs and an aggregated report
+- Projects exceeding the wall-clock limit are stopped and reported
+- Report aggregation and the CLI entrypoint
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from kie.commands.batch import (
+    BatchRunner,
+    ProjectOutcome,
+    ResourceLimits,
+    batch_cli,
+    build_report,
+    resolve_project_roots,
+)
+
+
+@pytest.fixture
+def projects(tmp_path):
+    roots = []
+    for name in ["client_a", "client_b", "client_c"]:
+        root = tmp_path / "clients" / name
+        root.mkdir(parents=True)
+        roots.append(root)
+    (tmp_path / "clients" / "notes.txt").write_text("not a project")
+    return roots
+
+
+def test_resolve_project_roots(projects, tmp_path):
+    pattern = str(tmp_path / "clients" / "*")
+
+    assert resolve_project_roots([pattern]) == projects
+    assert resolve_project_roots([str(projects[1]), pattern]) == [projects[1], projects[0], projects[2]]
+    assert resolve_project_roots([str(tmp_path / "missing")]) == []
+
+
+def test_runs_commands_in_every_project(projects, tmp_path):
+    runner = BatchRunner(commands=["status"], workers=2, log_dir=tmp_path / "logs")
+
+    report = runner.run(projects)
+
+    assert report["success"]
+    assert report["statuses"]["succeeded"] == 3
+    assert [outcome["project_root"] for outcome in report["outcomes"]] == [str(root) for root in projects]
+    assert report["command_timings"]["status"]["runs"] == 3
+    for outcome in report["outcomes"]:
+        assert outcome["commands"][0]["success"]
+        assert "/status" in open(outcome["log_path"]).read()
+
+
+def test_timeout_stops_project(projects):
+    runner = BatchRunner(commands=["go --full"], workers=1, limits=ResourceLimits(timeout_seconds=0.01))
+
+    report = runner.run(projects[:1])
+
+    assert not report["success"]
+    assert report["outcomes"][0]["status"] == "timeout"
+
+
+def test_build_report_aggregates_timings():
+    outcomes = [
+        ProjectOutcome("a", "succeeded", 4.0, [{"command": "go --full", "success": True, "seconds": 4.0}]),
+        ProjectOutcome("b", "failed", 2.0, [{"command": "go --full", "success": False, "seconds": 2.0}]),
+        ProjectOutcome("c", "crashed", 1.0),
+    ]
+
+    report = build_report(outcomes, ["go --full"], workers=2, started_at=datetime.now(), wall_seconds=4.0)
+
+    assert report["statuses"] == {"succeeded": 1, "failed": 1, "timeout": 0, "crashed": 1}
+    assert report["command_timings"]["go --full"] == {
+        "runs": 2, "failures": 1, "total_seconds": 6.0, "max_seconds": 4.0
+    }
+    assert report["speedup"] == 1.75
+    assert not report["success"]
+
+
+def test_batch_cli_writes_report(projects, tmp_path, capsys):
+    report_path = tmp_path / "batch_report.json"
+
+    exit_code = batch_cli([str(projects[0]), "-c", "status", "--report", str(report_path)])
+
+    assert exit_code == 0
+    assert json.loads(report_path.read_text())["statuses"]["succeeded"] == 1
+    assert (projects[0] / "project_state" / "batch_run.log").exists()
+    assert "KIE BATCH RUN" in capsys.readouterr().out
@@ -0,0 +1,123 @@
+"""
+Tests for the pipeline benchmark harness
+
+Tests cover:
+- Synthetic datasets are deterministic and have the requested shape
+- Results round-trip through JSON
+- Baseline comparison (threshold and noise floor)
+- Case failures are recorded, not raised
+- Stage and pipeline cases run on a small dataset
+- Pipeline commands that stop early or render no charts fail their case
+"""
+
+import pytest
+
+from kie.benchmarks import (
+    ALL_CASES,
+    CaseResult,
+    DatasetShape,
+    compare_results,
+    format_report,
+    generate_dataset,
+    load_results,
+    results_document,
+    run_shape,
+    save_results,
+    time_case,
+)
+from kie.benchmarks.cases import _require_success
+
+TINY = DatasetShape("tiny", rows=200, columns=8, categorical=2, datetime=True)
+
+
+def test_generated_dataset_shape_and_determinism():
+    df = generate_dataset(TINY)
+
+    assert df.shape == (200, 8)
+    assert list(df.columns[:3]) == ["region", "product", "date"]
+    assert df["product"].nunique() <= TINY.cardinality
+    assert generate_dataset(TINY).equals(df)
+    assert not generate_dataset(TINY, seed=1).equals(df)
+
+
+def test_wide_and_high_cardinality_shapes():
+    wide = generate_dataset(DatasetShape("wide", rows=50, columns=300, categorical=4))
+    assert wide.shape == (50, 300)
+    assert "metric_295" in wide.columns
+
+    high = generate_dataset(DatasetShape("high", rows=5000, categorical=2, cardinality=100_000))
+    assert high["product"].nunique() > 4000
+
+
+def test_results_round_trip(tmp_path):
+    results = [CaseResult("tiny/data_load", timings=[0.2, 0.1, 0.3]), CaseResult("tiny/go_full", "error", error="boom")]
+    path = save_results(results_document(results, metadata={"repeat": 3}), tmp_path / "results.json")
+
+    loaded = load_results(path)
+
+    assert loaded["tiny/data_load"].best == 0.1
+    assert loaded["tiny/data_load"].median == 0.2
+    assert loaded["tiny/go_full"].status == "error"
+
+
+def test_compare_results_threshold_and_noise_floor():
+    baseline = {
+        "a": CaseResult("a", timings=[1.0]),
+        "b": CaseResult("b", timings=[1.0]),
+        "c": CaseResult("c", timings=[0.001]),
+        "d": CaseResult("d", status="error"),
+    }
+    current = {
+        "a": CaseResult("a", timings=[1.5]),    # 50% slower
+        "b": CaseResult("b", timings=[1.1]),    # within threshold
+        "c": CaseResult("c", timings=[0.003]),  # 3x but below noise floor
+        "d": CaseResult("d", timings=[9.0]),    # no baseline timing
+        "e": CaseResult("e", timings=[9.0]),    # new case
+    }
+
+    regressions = compare_results(current, baseline, threshold=0.2)
+
+    assert [r.name for r in regressions] == ["a"]
+    assert regressions[0].ratio == pytest.approx(1.5)
+    assert compare_results(current, baseline, threshold=0.05)[-1].name == "b"
+    assert "+50%" in format_report(current, baseline)
+
+
+def test_time_case_records_errors():
+    def fail():
+        raise RuntimeError("bad data")
+
+    result = time_case("tiny/eda_analyze", fail, repeat=3)
+
+    assert result.status == "error"
+    assert result.error == "RuntimeError: bad data"
+    assert result.best is None
+
+
+def test_run_shape(tmp_path):
+    results = {r.name: r for r in run_shape(TINY, tmp_path, repeat=1)}
+
+    assert list(results) == [f"tiny/{case}" for case in ALL_CASES]
+    for case in ALL_CASES:
+        assert results[f"tiny/{case}"].status == "ok", results[f"tiny/{case}"].error
+        assert len(results[f"tiny/{case}"].timings) == 1
+
+
+@pytest.mark.parametrize("result", [
+    {"success": False, "message": "bad spec"},
+    {"success": True, "blocked_at": "build", "message": "No charts found"},
+    {"charts_rendered": 0, "charts": []},
+])
+def test_require_success_rejects_incomplete_runs(result):
+    with pytest.raises(RuntimeError):
+        _require_success(result)
+
+
+def test_pipeline_cases_skipped_above_row_limit(tmp_path):
+    results = run_shape(TINY, tmp_path, cases=["data_load", "go_full", "pptx_build"], repeat=1, pipeline_max_rows=100)
+
+    assert [(r.name, r.status) for r in results] == [
+        ("tiny/data_load", "ok"),
+        ("tiny/go_full", "skipped"),
+        ("tiny/pptx_build", "skipped"),
+    ]
@@ -0,0 +1,80 @@
+"""
+Tests for chart number formatting
+
+Tests cover:
+- Vectorized formatters match the scalar formatters exactly
+- Edge values (negative zero, NaN, infinity, bucket boundaries)
+- Series input keeps its index
+- Scalar memoization of hot values
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kie.charts.formatting import (
+    format_axis_labels,
+    format_currencies,
+    format_currency,
+    format_number,
+    format_numbers,
+    format_percentage,
+    format_percentages,
+)
+
+EDGE_VALUES = [0.0, -0.0, float("nan"), float("inf"), -float("inf"), 999.94, 999.95, 1000, -1234.5, 999_999.99, 1e9, 42, -7]
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(7)
+    return EDGE_VALUES + rng.uniform(-5e9, 5e9, 2000).tolist() + rng.uniform(-2000, 2000, 2000).tolist()
+
+
+@pytest.mark.parametrize("precision", [0, 1, 2])
+@pytest.mark.parametrize("abbreviate", [True, False])
+def test_format_numbers_matches_scalar(values, precision, abbreviate):
+    expected = [format_number(v, precision=precision, prefix="$", suffix="x", abbreviate=abbreviate) for v in values]
+
+    assert format_numbers(values, precision=precision, prefix="$", suffix="x", abbreviate=abbreviate) == expected
+    assert format_numbers(np.array(values), precision=precision, prefix="$", suffix="x", abbreviate=abbreviate) == expected
+
+
+@pytest.mark.parametrize("multiply_by_100", [True, False])
+def test_format_percentages_matches_scalar(values, multiply_by_100):
+    expected = [format_percentage(v, precision=1, multiply_by_100=multiply_by_100) for v in values]
+
+    assert format_percentages(values, precision=1, multiply_by_100=multiply_by_100) == expected
+
+
+def test_negative_zero_is_not_merged_with_zero():
+    assert format_numbers([0.0, -0.0], abbreviate=False) == ["0", "-0"]
+    assert format_number(0.0, abbreviate=False) == "0"
+    assert format_number(-0.0, abbreviate=False) == "-0"
+
+
+def test_series_input_keeps_index():
+    series = pd.Series([1500.0, None, 2_500_000.0], index=["a", "b", "c"], name="revenue")
+
+    labels = format_currencies(series)
+
+    assert labels.tolist() == ["$1.5K", "$nan", "$2.5M"]
+    assert labels.index.tolist() == ["a", "b", "c"]
+    assert labels.name == "revenue"
+
+
+def test_axis_labels():
+    assert format_axis_labels([1_500_000, 2_000_000], axis_type="currency") == ["$1.5M", "$2.0M"]
+    assert format_axis_labels([0.25], axis_type="percentage") == ["25.0%"]
+    assert format_axis_labels(["Q1"], axis_type="time") == ["Q1"]
+
+
+def test_scalar_formatters_are_memoized():
+    from kie.charts.formatting import _format_number_cached
+
+    _format_number_cached.cache_clear()
+    for _ in range(3):
+        assert format_currency(1234567) == "$1.2M"
+
+    info = _format_number_cached.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
@@ -0,0 +1,111 @@
+"""
+Tests for the shared chart config index
+
+Tests cover:
+- Summaries (point counts, series stats, label lengths, palette)
+- Only new or changed charts are parsed on refresh
+- Brand validation and visual QC share one parse per chart
+- Process-pool summaries match serial ones
+"""
+
+import json
+import os
+
+import pytest
+
+from kie.brand.validator import BrandValidator
+from kie.charts import index as chart_index_module
+from kie.charts.index import ChartIndex, get_chart_index
+from kie.skills.base import SkillContext
+from kie.skills.visual_qc import VisualQCSkill
+
+
+def _chart(values, fill="#7823DC"):
+    return {
+        "type": "bar",
+        "data": [{"x": f"Region {i}", "revenue": value} for i, value in enumerate(values)],
+        "config": {
+            "xAxis": {"label": "Region", "axisLine": False, "tickLine": False},
+            "yAxis": {"label": "Revenue", "axisLine": False, "tickLine": False},
+            "bars": [{"dataKey": "revenue", "fill": fill, "label": {}}],
+            "fontFamily": "Inter",
+        },
+    }
+
+
+@pytest.fixture
+def charts_dir(tmp_path):
+    charts = tmp_path / "outputs" / "charts"
+    charts.mkdir(parents=True)
+    (charts / "a__bar.json").write_text(json.dumps(_chart([10, 20, 30])))
+    (charts / "b__bar.json").write_text(json.dumps(_chart([900, 950, 1000])))
+    (charts / "broken.json").write_text("{not json")
+    return charts
+
+
+def test_summaries(charts_dir):
+    index = ChartIndex(charts_dir).refresh()
+
+    assert [s.chart_id for s in index.summaries()] == ["a__bar.json", "b__bar.json", "broken.json"]
+    summary = index.get("a__bar.json")
+    assert summary.data_points == 3
+    assert summary.data_keys == {"x", "revenue"}
+    assert (summary.value_min, summary.value_max, summary.value_mean) == (10, 30, 20)
+    assert summary.series["revenue"].count == 3
+    assert summary.max_label_length == len("Region 0")
+    assert summary.palette == ["#7823DC"]
+    assert index.get("broken.json").error
+
+
+def test_refresh_parses_only_changed_charts(charts_dir):
+    index = ChartIndex(charts_dir).refresh()
+    assert index.parsed == 3
+
+    index.refresh()
+    assert index.parsed == 3
+
+    path = charts_dir / "a__bar.json"
+    path.write_text(json.dumps(_chart([1, 2, 3, 4])))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (charts_dir / "b__bar.json").unlink()
+
+    index.refresh()
+    assert index.parsed == 4
+    assert index.get("a__bar.json").data_points == 4
+    assert "b__bar.json" not in index
+
+
+def test_validation_and_qc_share_index(charts_dir, tmp_path):
+    result = BrandValidator(strict=False).validate_directory(charts_dir)
+    index = get_chart_index(charts_dir)
+    parsed = index.parsed
+
+    assert result["files_checked"] == 2
+    assert result["compliant"]
+    assert "broken.json: Invalid JSON" in result["warnings"]
+
+    internal = tmp_path / "outputs" / "internal"
+    internal.mkdir()
+    (internal / "visualization_plan.json").write_text(json.dumps({"specifications": []}))
+    qc = VisualQCSkill().execute(SkillContext(project_root=tmp_path, current_stage="build"))
+    charts = {c["chart_ref"]: c for c in json.loads((internal / "visual_qc.json").read_text())["charts"]}
+
+    assert qc.success
+    assert index.parsed == parsed
+    assert charts["a__bar.json"]["visual_quality"] == "client_ready"
+    assert "Potentially truncated Y-axis" in charts["b__bar.json"]["issues"]
+    assert charts["broken.json"]["visual_quality"] == "internal_only"
+
+
+def test_parallel_summaries_match_serial(charts_dir, monkeypatch):
+    for i in range(6):
+        (charts_dir / "nested").mkdir(exist_ok=True)
+        (charts_dir / "nested" / f"c{i}.json").write_text(json.dumps(_chart(range(i + 1))))
+    serial = ChartIndex(charts_dir, workers=1).refresh().summaries()
+    monkeypatch.setattr(chart_index_module, "MIN_PARALLEL_CHARTS", 2)
+
+    parallel = ChartIndex(charts_dir, workers=2).refresh().summaries()
+
+    assert parallel == serial
+    assert "nested/c5.json" in [s.chart_id for s in parallel]
@@ -18,6 +18,7 @@ import pandas as pd
 import pytest
 
 from kie.charts.renderer import ChartRenderer
+from kie.data.aggregation import get_aggregation_cache
 
 
 @pytest.fixture
@@ -363,3 +364,46 @@ def test_deterministic_output_on_repeat(temp_project, sample_data, viz_plan_with
     # Verify metadata from results match
     assert result1["charts"][0]["insight_id"] == result2["charts"][0]["insight_id"]
     assert result1["charts"][0]["visualization_type"] == result2["charts"][0]["visualization_type"]
+
+
+def test_parallel_render_matches_serial(temp_project, sample_data):
+    """Test that parallel rendering produces the same charts as serial rendering."""
+    viz_plan = {
+        "specifications": [
+            {
+                "insight_id": f"insight_{i}",
+                "insight_title": f"Revenue view {i}",
+                "visualization_required": True,
+                "visuals": [
+                    {"visualization_type": "bar", "x_axis": "Region", "y_axis": "Revenue", "pattern_role": "main"},
+                    {"visualization_type": "pareto", "x_axis": "Region", "y_axis": "Revenue", "pattern_role": "pareto"},
+                ],
+            }
+            for i in range(3)
+        ]
+    }
+    viz_plan_path = temp_project / "outputs" / "internal" / "visualization_plan.json"
+    viz_plan_path.parent.mkdir(parents=True, exist_ok=True)
+    viz_plan_path.write_text(json.dumps(viz_plan))
+
+    renderer = ChartRenderer(temp_project)
+    get_aggregation_cache().clear()
+
+    serial = renderer.render_charts(data_file=sample_data, validate=False)
+    serial_data = {
+        c["filename"]: json.loads(Path(c["path"]).read_text())["data"] for c in serial["charts"]
+    }
+
+    parallel = renderer.render_charts(data_file=sample_data, validate=False, workers=2)
+    parallel_data = {
+        c["filename"]: json.loads(Path(c["path"]).read_text())["data"] for c in parallel["charts"]
+    }
+
+    assert [c["filename"] for c in parallel["charts"]] == [c["filename"] for c in serial["charts"]]
+    assert parallel_data == serial_data
+    assert parallel["render_timings"]["workers"] == 2
+    # Both visuals for all three insights share one Region/Revenue aggregation,
+    # and the parallel run reuses it from the shared cache
+    assert serial["render_timings"]["aggregations_computed"] == 1
+    assert parallel["render_timings"]["aggregations_computed"] == 0
+    assert all(c["render_seconds"] >= 0 for c in parallel["charts"])
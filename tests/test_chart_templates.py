@@ -0,0 +1,87 @@
+"""
+Tests for compiled chart config templates and fast JSON serialization.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from kie.base import RechartsConfig
+from kie.charts.builders.bar import BarChartBuilder
+from kie.charts.schema import AxisConfig, BarChartConfig, BarConfig, LegendConfig, TooltipConfig
+from kie.charts.templates import chart_config, display_records, model_fragment
+from kie.utils.json_codec import dumps
+
+
+def test_model_fragment_matches_model_dump():
+    expected = AxisConfig(dataKey="Region").model_dump(exclude_none=True)
+
+    assert model_fragment(AxisConfig, dataKey="Region") == expected
+    # Cached copies are independent
+    fragment = model_fragment(AxisConfig, dataKey="Region")
+    fragment["tick"]["fontSize"] = 99
+    assert model_fragment(AxisConfig, dataKey="Region") == expected
+
+
+def test_chart_config_matches_model_dump_after_template_compiled():
+    static = {"layout": "horizontal", "legend": LegendConfig(), "tooltip": TooltipConfig()}
+
+    def expected(title, subtitle, key):
+        return BarChartConfig(
+            **static,
+            title=title,
+            subtitle=subtitle,
+            xAxis=AxisConfig(dataKey=key),
+            yAxis=AxisConfig(dataKey="value"),
+            bars=[BarConfig(dataKey=key, fill="#7823DC")],
+        ).model_dump(exclude_none=True)
+
+    for title, subtitle, key in [("First", None, "a"), ("Second", "Sub", "b"), (None, None, "c")]:
+        config = chart_config(
+            BarChartConfig,
+            static=static,
+            title=title,
+            subtitle=subtitle,
+            xAxis=model_fragment(AxisConfig, dataKey=key),
+            yAxis=model_fragment(AxisConfig, dataKey="value"),
+            bars=[model_fragment(BarConfig, dataKey=key, fill="#7823DC")],
+        )
+        assert config == expected(title, subtitle, key)
+
+
+def test_display_records_dataframe_and_list_agree():
+    df = pd.DataFrame({"region": ["N", "S"], "revenue": [1, 2], "other": [3, 4]})
+    rename = {"region": "Region", "revenue": "Revenue"}
+
+    assert display_records(df, rename) == display_records(df.to_dict("records"), rename)
+    assert display_records(df, rename)[0] == {"Region": "N", "Revenue": 1, "other": 3}
+
+
+def test_bar_builder_output_stable_across_calls():
+    df = pd.DataFrame({"region": ["N", "S"], "revenue": [1200, 980]})
+
+    first = BarChartBuilder().build(df, x_key="region", y_keys="revenue", title="A").to_dict()
+    second = BarChartBuilder().build(df, x_key="region", y_keys="revenue", title="B").to_dict()
+
+    assert first["config"]["title"] == "A"
+    assert second["config"]["title"] == "B"
+    first["config"].pop("title")
+    second["config"].pop("title")
+    assert first["config"] == second["config"]
+
+
+def test_json_codec_handles_numpy_values():
+    payload = {"values": np.array([1.5, 2.5]), "count": np.int64(3), "label": "Café"}
+
+    assert json.loads(dumps(payload)) == {"values": [1.5, 2.5], "count": 3, "label": "Café"}
+
+
+def test_recharts_config_to_json_roundtrip(tmp_path):
+    config = RechartsConfig(chart_type="bar", data=[{"x": "a", "y": 1}], config={"k": 1})
+    path = tmp_path / "chart.json"
+
+    json_str = config.to_json(path)
+
+    assert json.loads(json_str) == config.to_dict()
+    assert json.loads(path.read_text()) == config.to_dict()
@@ -0,0 +1,115 @@
+"""
+Tests for the code simplifier's single-pass analyzer
+
+Tests cover:
+- All metrics are collected in one traversal
+- Per-file results are cached by content hash
+- Process-pool analysis matches serial analysis
+"""
+
+import json
+import textwrap
+
+import pytest
+
+from kie.skills import code_simplifier
+from kie.skills.base import SkillContext
+from kie.skills.code_simplifier import CodeSimplifierSkill
+
+SOURCE = textwrap.dedent('''
+    import os
+    import sys
+    from typing import Any
+
+
+    def configure(self, a, b, c, d, e, f):
+        if a:
+            for x in b:
+                while c:
+                    with d:
+                        if e and f or x:
+                            return sys.argv
+                    if d or e:
+                        continue
+        return [[y for y in row] for row in b]
+
+
+    class Settings:
+        def timeout(self):
+            return 42
+''')
+
+
+@pytest.fixture
+def project(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(4):
+        (src / f"module_{i}.py").write_text(SOURCE + f"\nVERSION = {i}\n")
+    return tmp_path
+
+
+def _run(project, workers=1):
+    context = SkillContext(
+        project_root=project,
+        current_stage="build",
+        metadata={"target_path": str(project / "src"), "workers": workers},
+    )
+    result = CodeSimplifierSkill().execute(context)
+    assert result.success, result.errors
+    return result, json.loads((project / "outputs" / "internal" / "code_simplifier_report.json").read_text())
+
+
+def test_single_pass_metrics(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text(SOURCE)
+
+    analysis = CodeSimplifierSkill()._analyze_file(path, tmp_path)
+    found = {(issue.issue_type, issue.line_number) for issue in analysis.issues}
+
+    assert (analysis.function_count, analysis.class_count) == (2, 1)
+    assert ("deep_nesting", 12) in found
+    assert ("too_many_params", 7) in found
+    assert ("complex_comprehension", 16) in found
+    assert ("potentially_unused_import", 2) in found  # os
+    assert ("potentially_unused_import", 4) in found  # Any
+    assert ("magic_number", 21) in found
+    assert not any(t == "potentially_unused_import" and line == 3 for t, line in found)  # sys is used
+    assert [issue.issue_type for issue in analysis.issues if issue.line_number == 7] == [
+        "too_many_params", "high_cognitive_complexity"
+    ]
+
+
+def test_unchanged_files_come_from_cache(project, monkeypatch):
+    result, first = _run(project)
+    assert result.evidence["files_from_cache"] == 0
+
+    analyzed = []
+    original = CodeSimplifierSkill._analyze_source
+    monkeypatch.setattr(
+        CodeSimplifierSkill,
+        "_analyze_source",
+        lambda self, path, root, content: analyzed.append(path.name) or original(self, path, root, content),
+    )
+
+    result, second = _run(project)
+    assert result.evidence["files_from_cache"] == 4
+    assert analyzed == []
+    assert second["all_issues"] == first["all_issues"]
+
+    (project / "src" / "module_2.py").write_text("def f():\n    return 7\n")
+    result, third = _run(project)
+    assert analyzed == ["module_2.py"]
+    assert result.evidence["files_from_cache"] == 3
+    assert third["files_analyzed"] == 4
+
+
+def test_parallel_matches_serial(project, monkeypatch):
+    _, serial = _run(project, workers=1)
+    (project / "outputs" / "internal" / "code_simplifier_cache.json").unlink()
+    monkeypatch.setattr(code_simplifier, "MIN_PARALLEL_FILES", 2)
+
+    _, parallel = _run(project, workers=2)
+
+    assert parallel["files"] == serial["files"]
+    assert parallel["all_issues"] == serial["all_issues"]
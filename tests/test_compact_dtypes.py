@@ -0,0 +1,107 @@
+"""
+Tests for compact dtype loading
+
+Tests cover:
+- Numeric downcasting is opt-in and keeps every value
+- Default compaction keeps derived arithmetic exact
+- Low-cardinality text becomes categorical, date-like text is parsed
+- Date formats are cached per value shape
+- Opt-in compact loads report memory saved and keep the schema
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kie.data import CompactOptions, DataLoader, compact_dtypes
+from kie.data import compact as compact_module
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 2_000
+    return pd.DataFrame({
+        "region": rng.choice(["North", "South", "East"], size=n),
+        "order_date": pd.date_range("2024-01-01", periods=n, freq="h").strftime("%Y-%m-%d %H:%M"),
+        "units": rng.integers(-50, 500, size=n),
+        "price": rng.integers(1, 100, size=n) * 0.25,
+        "revenue": rng.gamma(2.0, 100.0, size=n),
+        "customer": [f"C{i:05d}" for i in range(n)],
+    })
+
+
+def test_compact_dtypes(df):
+    compact, report = compact_dtypes(df, CompactOptions(downcast_numeric=True))
+
+    assert isinstance(compact["region"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(compact["order_date"])
+    assert compact["units"].dtype == np.int16
+    assert compact["price"].dtype == np.float32
+    assert compact["revenue"].dtype == np.float64  # float32 would round values
+    assert not isinstance(compact["customer"].dtype, pd.CategoricalDtype)
+    assert report.saved_bytes > 0
+    assert set(report.conversions) == {"region", "order_date", "units", "price"}
+    for col in ["units", "price", "revenue"]:
+        assert (compact[col].astype(float) == df[col]).all()
+    assert (compact["region"].astype(str) == df["region"]).all()
+
+
+def test_default_keeps_arithmetic_exact():
+    df = pd.DataFrame({"price": [300, 250], "units": [200, 150], "rate": [0.1, 0.25]})
+
+    compact, report = compact_dtypes(df)
+
+    assert report.conversions == {}
+    pd.testing.assert_series_equal(compact["price"] * compact["units"], df["price"] * df["units"])
+    pd.testing.assert_series_equal(compact["price"] * compact["rate"], df["price"] * df["rate"])
+
+
+def test_ambiguous_dates_stay_text():
+    values = pd.Series(["01/02/2024", "31/01/2024", "not a date"] * 5)
+
+    compact, _ = compact_dtypes(pd.DataFrame({"when": values}), CompactOptions(category_ratio=0))
+
+    assert not pd.api.types.is_datetime64_any_dtype(compact["when"])
+
+
+def test_date_format_cached_by_shape():
+    compact_module._date_format_cache.clear()
+
+    assert compact_module._date_format("2024-03-15") == "%Y-%m-%d"
+    assert compact_module._date_format("1999-12-31") == "%Y-%m-%d"
+    assert compact_module._date_format("12345") is None
+    assert list(compact_module._date_format_cache) == ["9999-99-99", "99999"]
+
+
+def test_compact_load(df, tmp_path):
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    default = DataLoader()
+    default.load(path)
+    loader = DataLoader()
+    loaded = loader.load(path, compact=True)
+
+    assert default.compact_report is None
+    assert loader.compact_report.saved_ratio > 0.3
+    assert loader.info()["compact"]["saved_mb"] > 0
+    assert "Compact dtypes" in loader.get_summary()
+    assert loader.schema.numeric_columns == default.schema.numeric_columns
+    assert loader.schema.datetime_columns == ["order_date"]
+    assert "region" in loader.schema.categorical_columns
+    assert loaded["units"].sum() == df["units"].sum()
+
+
+def test_compact_load_from_environment(df, tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    monkeypatch.setenv("KIE_COMPACT_LOAD", "1")
+
+    loader = DataLoader()
+    loader.load(path)
+    uncompacted = DataLoader()
+    uncompacted.load(path, compact=False)
+
+    assert loader.compact_report is not None
+    assert uncompacted.compact_report is None
@@ -9,6 +9,7 @@ Tests cover the 4-Tier Intelligence System:
 
 Plus:
 - Phase 5: Human Override (column_mapping bypass)
+- Precomputed column features and memoized mappings
 - Schema inference
 - Entity/category detection
 - File format auto-detection
@@ -522,6 +523,55 @@ class TestHumanOverride:
         assert mapping["y"] == "Revenue_M"
 
 
+# --- Column Features & Memoization Tests ---
+
+
+class TestColumnFeatures:
+    """Test the per-column feature table and mapping memo."""
+
+    def test_feature_table(self, sample_business_data):
+        """Features are computed once, at schema inference."""
+        loader = DataLoader()
+        loader.last_loaded = sample_business_data
+        loader._infer_schema()
+
+        features = loader.column_features
+        assert list(features.index) == list(sample_business_data.columns)
+        assert features.at["Company_ID", "is_id"]
+        assert features.at["Profit_Margin_Pct", "is_percentage"]
+        assert features.at["Revenue_M", "is_growth"]
+        assert features.at["Region", "cardinality"] == 5
+        revenue = sample_business_data["Revenue_M"]
+        assert features.at["Revenue_M", "cv"] == pytest.approx(revenue.std() / revenue.mean())
+
+    def test_mapping_is_memoized(self, sample_business_data):
+        """Repeated requests reuse the memoized mapping (returned as a copy)."""
+        loader = DataLoader()
+        loader.last_loaded = sample_business_data
+        loader._infer_schema()
+
+        first = loader.suggest_column_mapping(["revenue", "category"])
+        first["revenue"] = "changed"
+        second = loader.suggest_column_mapping(["revenue", "category"])
+
+        assert second == {"revenue": "Revenue_M", "category": "Company_Name"}
+        assert len(loader._mapping_memo) == 1
+        assert loader.suggest_column_mapping(["value"], objective_text="reduce cost") == {"value": "Cost_M"}
+        assert len(loader._mapping_memo) == 2
+
+    def test_features_rebuilt_when_schema_changes(self, sample_business_data):
+        """A frame swapped in without re-inferring the schema gets fresh features."""
+        loader = DataLoader()
+        loader.last_loaded = sample_business_data
+        loader._infer_schema()
+        loader.suggest_column_mapping(["revenue"])
+
+        loader.last_loaded = sample_business_data.head(3)
+        loader.suggest_column_mapping(["revenue"])
+
+        assert loader._features_hash == DataLoader._schema_hash(loader.last_loaded)
+
+
 # --- Integration Tests ---
 
 
@@ -0,0 +1,98 @@
+"""
+Tests for Excel ingestion
+
+Tests cover:
+- A1-style range parsing
+- Sheet and range selection
+- Conversions are cached by workbook content and invalidated when it changes
+- DataLoader routes Excel files through the cached reader
+- The cache belongs to the workbook's project, not the working directory
+"""
+
+import pandas as pd
+import pytest
+
+from kie.data import DataLoader
+from kie.data import excel as excel_module
+from kie.data.excel import parse_cell_range, read_excel
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "project" / "data" / "client.xlsx"
+    path.parent.mkdir(parents=True)
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"note": ["cover sheet"]}).to_excel(writer, sheet_name="Cover", index=False)
+        pd.DataFrame({
+            "Region": ["North", "South", "East", "West"],
+            "Revenue": [100.0, 200.0, 150.0, 175.0],
+            "Units": [10, 20, 15, 17],
+        }).to_excel(writer, sheet_name="Sales", index=False, startrow=2, startcol=1)
+    return path
+
+
+def test_parse_cell_range():
+    assert parse_cell_range("B3:D6") == {"skiprows": 2, "usecols": "B:D", "nrows": 3}
+    assert parse_cell_range("$b$3:$d") == {"skiprows": 2, "usecols": "B:D"}
+    assert parse_cell_range("A1") == {"skiprows": 0}
+    with pytest.raises(ValueError):
+        parse_cell_range("B6:D3")
+    with pytest.raises(ValueError):
+        parse_cell_range("3B")
+
+
+def test_sheet_and_range_selection(workbook):
+    df = read_excel(workbook, sheet="Sales", cell_range="B3:D5", use_cache=False)
+
+    assert list(df.columns) == ["Region", "Revenue", "Units"]
+    assert df["Region"].tolist() == ["North", "South"]
+    assert read_excel(workbook, use_cache=False)["note"].tolist() == ["cover sheet"]
+
+
+def test_conversion_is_cached(workbook, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    first = read_excel(workbook, sheet="Sales", cell_range="B3:D7", cache_dir=cache_dir)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("workbook parsed again")
+
+    monkeypatch.setattr(excel_module.pd, "read_excel", fail)
+    second = read_excel(workbook, sheet="Sales", cell_range="B3:D7", cache_dir=cache_dir)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_cache_invalidated_when_workbook_changes(workbook, tmp_path):
+    cache_dir = tmp_path / "cache"
+    read_excel(workbook, sheet="Cover", cache_dir=cache_dir)
+    pd.DataFrame({"note": ["updated"]}).to_excel(workbook, sheet_name="Cover", index=False)
+
+    assert read_excel(workbook, sheet="Cover", cache_dir=cache_dir)["note"].tolist() == ["updated"]
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_loader_uses_project_cache(workbook, tmp_path, monkeypatch):
+    project = workbook.parent.parent
+    (project / "project_state").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    loader = DataLoader()
+    df = loader.load(workbook, sheet="Sales", cell_range="B3:D7")
+
+    assert loader.schema.numeric_columns == ["Revenue", "Units"]
+    assert len(df) == 4
+    assert any((project / excel_module.EXCEL_CACHE_DIR).iterdir())
+    assert not (tmp_path / "project_state").exists()
+
+
+def test_no_cache_outside_a_project(workbook, tmp_path, monkeypatch):
+    # A project in the working directory doesn't adopt other workbooks
+    elsewhere = tmp_path / "elsewhere"
+    (elsewhere / "project_state").mkdir(parents=True)
+    monkeypatch.chdir(elsewhere)
+
+    assert excel_module.project_cache_dir(workbook) is None
+    read_excel(workbook, sheet="Sales")
+
+    assert not (elsewhere / excel_module.EXCEL_CACHE_DIR).exists()
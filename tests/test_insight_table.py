@@ -0,0 +1,151 @@
+"""
+Tests for the columnar InsightTable and once-per-run catalog loading
+
+Tests cover:
+- ID, type, severity, category and tag indexes
+- Vectorized ranking matches InsightEngine ordering
+- Attribute and evidence frames
+- Catalog memoization and binary cache invalidation
+"""
+
+import json
+import time
+
+import pytest
+
+from kie.insights import (
+    Evidence,
+    Insight,
+    InsightCatalog,
+    InsightCategory,
+    InsightEngine,
+    InsightSeverity,
+    InsightTable,
+    InsightType,
+    load_catalog,
+)
+from kie.insights.table import clear_catalog_cache
+
+TYPES = [InsightType.COMPARISON, InsightType.TREND, InsightType.OUTLIER]
+SEVERITIES = [InsightSeverity.KEY, InsightSeverity.SUPPORTING, InsightSeverity.CONTEXT]
+
+
+def _insights(n: int) -> list[Insight]:
+    return [
+        Insight(
+            id=f"insight_{i:05d}",
+            headline=f"Headline {i}",
+            supporting_text=f"Supporting text {i}",
+            insight_type=TYPES[i % 3],
+            severity=SEVERITIES[(i // 3) % 3],
+            category=InsightCategory.RECOMMENDATION if i % 7 == 0 else InsightCategory.FINDING,
+            evidence=[Evidence("chart", f"charts/chart_{i}.json", i)],
+            tags=["revenue"] if i % 2 == 0 else ["cost", "region"],
+            confidence=0.5 + (i % 5) / 10,
+            statistical_significance=0.2 if i % 4 == 0 else None,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def catalog():
+    return InsightCatalog(
+        generated_at="2026-01-01T00:00:00",
+        business_question="What drives revenue?",
+        insights=_insights(60),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_catalog_cache()
+    yield
+    clear_catalog_cache()
+
+
+def test_indexes_match_linear_scans(catalog):
+    table = catalog.table()
+
+    assert table.get("insight_00042") is catalog.insights[42]
+    assert table.get("missing") is None
+    assert table.by_type(InsightType.TREND) == catalog.get_by_type(InsightType.TREND)
+    assert table.by_severity("key") == catalog.get_key_insights()
+    assert table.by_tag("region") == [i for i in catalog.insights if "region" in i.tags]
+    assert table.select(severity=InsightSeverity.KEY, tag="revenue", category="finding") == [
+        i for i in catalog.insights
+        if i.severity == InsightSeverity.KEY and "revenue" in i.tags and i.category == InsightCategory.FINDING
+    ]
+
+
+def test_table_rebuilt_when_insights_change(catalog):
+    first = catalog.table()
+    assert catalog.table() is first
+
+    catalog.insights.append(_insights(1)[0])
+    assert catalog.table() is not first
+    assert len(catalog.table()) == 61
+
+
+def test_ranking_matches_engine_order(catalog):
+    def score(insight):
+        severity = {InsightSeverity.KEY: 3, InsightSeverity.SUPPORTING: 2, InsightSeverity.CONTEXT: 1}
+        category = {InsightCategory.FINDING: 1.2, InsightCategory.IMPLICATION: 1.1, InsightCategory.RECOMMENDATION: 1.0}
+        bonus = 1.1 if insight.is_statistically_significant else 1.0
+        return severity[insight.severity] * category[insight.category] * insight.confidence * bonus
+
+    expected = sorted(catalog.insights, key=score, reverse=True)
+
+    assert InsightTable(catalog.insights).ranked() == expected
+    assert InsightEngine().rank_insights(catalog.insights) == expected
+
+
+def test_frames(catalog):
+    table = catalog.table()
+
+    assert list(table.frame["id"]) == [i.id for i in catalog.insights]
+    assert table.frame["severity"].value_counts()["key"] == len(catalog.get_key_insights())
+    assert table.frame["statistical_significance"].isna().sum() == 45
+    assert len(table.evidence) == 60
+    assert table.evidence.iloc[3]["reference"] == "charts/chart_3.json"
+
+
+def test_slide_sequence_scales():
+    insights = _insights(10000)
+    catalog = InsightCatalog(
+        generated_at="2026-01-01T00:00:00",
+        business_question="Q",
+        insights=insights,
+        narrative_arc={"key_findings": [i.id for i in insights if i.severity == InsightSeverity.KEY]},
+    )
+
+    start = time.perf_counter()
+    slides = InsightEngine().to_slide_sequence(catalog)
+    elapsed = time.perf_counter() - start
+
+    assert len(slides) == 1 + len(catalog.get_key_insights())
+    assert elapsed < 1.0
+
+
+def test_load_catalog_memoizes_and_persists_binary(tmp_path, catalog, monkeypatch):
+    path = tmp_path / "insights_catalog.json"
+    path.write_text(json.dumps(catalog.to_dict()))
+    binary = tmp_path / "state" / "insights_catalog.pkl"
+
+    first = load_catalog(path, binary_cache=binary)
+    assert load_catalog(path, binary_cache=binary) is first
+    assert binary.exists()
+
+    # A fresh process reads the binary copy without parsing JSON
+    clear_catalog_cache()
+    with monkeypatch.context() as m:
+        m.setattr(InsightCatalog, "from_dict", classmethod(lambda cls, data: pytest.fail("JSON parsed")))
+        restored = load_catalog(path, binary_cache=binary)
+    assert [i.id for i in restored.insights] == [i.id for i in catalog.insights]
+
+    # Editing the catalog invalidates both caches
+    catalog.insights = catalog.insights[:5]
+    path.write_text(json.dumps(catalog.to_dict()))
+    reloaded = load_catalog(path, binary_cache=binary)
+    assert len(reloaded.insights) == 5
+    assert reloaded.get_by_id("insight_00003").headline == "Headline 3"
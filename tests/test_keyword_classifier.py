@@ -0,0 +1,91 @@
+"""
+Tests for the shared keyword classifier
+
+Tests cover:
+- Scores match plain substring matching (overlapping and prefix keywords)
+- Batch classification matches per-text classification
+- First-match priority order
+- Planner routing and metric classification use the shared engine
+"""
+
+import random
+
+import pytest
+
+from kie.insights.intelligence import MetricSemantics, MetricType
+from kie.skills.visualization_planner import INSIGHT_KEYWORDS, VisualizationPlannerSkill
+from kie.utils.keyword_classifier import KeywordClassifier
+
+
+@pytest.fixture
+def classifier():
+    return KeywordClassifier({
+        "trend": ["over time", "growth", "year"],
+        "comparison": ["vs", "versus", "higher", "lower"],
+        "concentration": ["concentration", "concentrat"],
+    })
+
+
+def _substring_scores(taxonomy, text):
+    scores = {}
+    for label, keywords in taxonomy.items():
+        found = {kw.lower() for kw in keywords if kw.lower() in text.lower()}
+        if found:
+            scores[label] = len(found)
+    return scores
+
+
+def test_scores(classifier):
+    assert classifier.scores("Revenue GROWTH is higher versus last year") == {"trend": 2, "comparison": 2}
+    assert classifier.scores("Customer concentration") == {"concentration": 2}
+    assert classifier.scores("Nothing to see") == {}
+
+
+def test_matches_substring_semantics():
+    rng = random.Random(7)
+    alphabet = "abcvs %É"
+    taxonomy = {
+        label: ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(5)]
+        for label in range(6)
+    }
+    classifier = KeywordClassifier(taxonomy)
+    texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(200)]
+
+    assert classifier.classify_batch(texts) == [_substring_scores(taxonomy, text) for text in texts]
+
+
+def test_batch_matches_single(classifier):
+    texts = ["growth vs plan", "", "lower concentration", "İstanbul growth"]
+
+    assert classifier.classify_batch(texts) == [classifier.scores(text) for text in texts]
+
+
+def test_first_match_order(classifier):
+    text = "Concentration is higher over time"
+
+    assert classifier.labels(text) == ["trend", "comparison", "concentration"]
+    assert classifier.first_match(text) == "trend"
+    assert classifier.first_match(text, ["concentration", "trend"]) == "concentration"
+    assert classifier.first_match("unrelated") is None
+
+
+def test_planner_keyword_fallback():
+    planner = VisualizationPlannerSkill()
+
+    assert planner._infer_visualization_type({}, "Sales by region", "") == [("map", "concentration", "primary")]
+    assert planner._infer_visualization_type({}, "Growth by region", "") == [("line", "trend", "primary")]
+    assert planner._infer_visualization_type({}, "Headcount", "") == [("bar", "comparison", "primary")]
+    assert planner._should_visualize(0.85, "North is 20% higher", [{"value": 1}])
+    assert not planner._should_visualize(0.85, "North exists", [{"value": 1}])
+    assert "sequential_change" in INSIGHT_KEYWORDS
+
+
+def test_metric_classification():
+    semantics = MetricSemantics()
+    contexts = semantics.classify_metrics(["gross_margin", "Revenue", "churn_risk", "widgets"])
+
+    assert [c.metric_type for c in contexts] == [
+        MetricType.FINANCIAL_RATE, MetricType.ABSOLUTE_FINANCIAL, MetricType.RISK, MetricType.UNKNOWN
+    ]
+    assert semantics.classify_metric("Revenue").unit == "currency"
+    assert contexts[3].interpretation_rules == {}
@@ -0,0 +1,81 @@
+"""
+Tests for lazy skill registration and CLI startup imports
+
+Tests cover:
+- Built-in skill declarations mirror the skill classes
+- Lazy skills are imported only when looked up or dispatched
+- Registration order is preserved across eager and lazy skills
+- Importing the CLI does not pull in heavy dependencies
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from kie.skills import _BUILTIN_SKILLS, LazySkillSpec, Skill, SkillRegistry, SkillResult
+
+
+class _EagerSkill(Skill):
+    skill_id = "eager_test"
+    description = "Eager test skill"
+    stage_scope = ["eda"]
+
+    def execute(self, context):
+        return SkillResult(success=True)
+
+
+@pytest.mark.parametrize("skill_id,class_name,module,stage_scope", _BUILTIN_SKILLS)
+def test_builtin_declarations_match_classes(skill_id, class_name, module, stage_scope):
+    skill_cls = getattr(importlib.import_module(f"kie.skills.{module}"), class_name)
+    skill = skill_cls()
+
+    assert skill.skill_id == skill_id
+    assert list(skill.stage_scope) == stage_scope
+
+
+def test_lazy_skill_loaded_on_stage_dispatch():
+    registry = SkillRegistry()
+    registry.register_lazy(LazySkillSpec("client_pack", "kie.skills.client_pack:ClientPackSkill", ("preview",)))
+    registry.register_lazy(LazySkillSpec("eda_review", "kie.skills.eda_review:EDAReviewSkill", ("eda",)))
+
+    assert not registry.is_loaded("client_pack")
+    assert [s.skill_id for s in registry.get_skills_for_stage("eda")] == ["eda_review"]
+    assert registry.is_loaded("eda_review")
+    assert not registry.is_loaded("client_pack")
+
+    assert registry.get_skill("client_pack").skill_id == "client_pack"
+    assert registry.is_loaded("client_pack")
+
+
+def test_registration_order_and_duplicates():
+    registry = SkillRegistry()
+    registry.register_lazy(LazySkillSpec("eda_review", "kie.skills.eda_review:EDAReviewSkill", ("eda",)))
+    registry.register(_EagerSkill())
+
+    assert [s.skill_id for s in registry.get_skills_for_stage("eda")] == ["eda_review", "eager_test"]
+    assert [m["skill_id"] for m in registry.list_skills()] == ["eda_review", "eager_test"]
+
+    with pytest.raises(ValueError):
+        registry.register_lazy(LazySkillSpec("eager_test", "kie.skills.eda_review:EDAReviewSkill", ("eda",)))
+
+
+def test_disabled_lazy_skill_not_imported():
+    registry = SkillRegistry()
+    registry.register_lazy(LazySkillSpec("eda_review", "kie.skills.eda_review:EDAReviewSkill", ("eda",)))
+    registry.disable_skill("eda_review")
+
+    assert registry.get_skills_for_stage("eda") == []
+    assert not registry.is_loaded("eda_review")
+
+
+def test_cli_import_does_not_load_heavy_modules():
+    heavy = ["pandas", "pptx", "kie.data", "kie.insights", "kie.powerpoint", "kie.skills.eda_synthesis"]
+    code = (
+        "import sys, kie.cli, kie.skills; "
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert proc.stdout.strip() == ""
@@ -0,0 +1,118 @@
+"""
+Tests for the indexed evidence ledger store
+
+Tests cover:
+- Saved ledgers are stored and exported as YAML
+- Lookup by run_id and time-range/command queries
+- YAML ledgers written by hand or by older versions are imported once
+- YAML export can be disabled and regenerated on demand
+- Readers (run story, insight triage) use the store
+"""
+
+import yaml
+
+from kie.consultant.run_story import RunStoryGenerator
+from kie.observability.evidence_ledger import create_ledger
+from kie.observability.ledger_store import LedgerStore, get_ledger_store
+
+
+def _entry(run_id, timestamp, command="analyze", outputs=None):
+    return {
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "command": command,
+        "outputs": outputs or [],
+        "success": True,
+    }
+
+
+def test_save_stores_and_exports(tmp_path):
+    ledger_dir = tmp_path / "evidence_ledger"
+    ledger = create_ledger("eda")
+    ledger.outputs.append({"path": "outputs/eda_profile.json", "hash": "abc"})
+
+    path = ledger.save(ledger_dir)
+
+    assert path == ledger_dir / f"{ledger.run_id}.yaml"
+    assert yaml.safe_load(path.read_text()) == ledger.to_dict()
+    assert get_ledger_store(ledger_dir).get(ledger.run_id) == ledger.to_dict()
+
+
+def test_queries(tmp_path):
+    store = LedgerStore(tmp_path)
+    store.append(_entry("c", "2026-03-01T00:00:00Z", "build"))
+    store.append(_entry("a", "2026-01-01T00:00:00Z", "eda"))
+    store.append(_entry("b", "2026-02-01T00:00:00Z"))
+
+    assert len(store) == 3
+    assert store.run_ids() == ["a", "b", "c"]
+    assert [e["run_id"] for e in store.query(since="2026-02-01T00:00:00Z")] == ["b", "c"]
+    assert [e["run_id"] for e in store.query(until="2026-02-01T00:00:00Z")] == ["a"]
+    assert [e["run_id"] for e in store.query(command="build")] == ["c"]
+    assert store.get("missing") is None
+
+    # Re-saving a run replaces its entry
+    store.append({**_entry("b", "2026-02-01T00:00:00Z"), "success": False})
+    assert store.get("b")["success"] is False
+    assert len(store) == 3
+
+
+def test_hand_written_yaml_imported_once(tmp_path, monkeypatch):
+    ledger_dir = tmp_path / "evidence_ledger"
+    ledger_dir.mkdir()
+    (ledger_dir / "legacy_run.yaml").write_text(yaml.dump(_entry("legacy_run", "2025-12-01T00:00:00Z")))
+    (ledger_dir / "intent_capture_events.yaml").write_text(yaml.dump([{"event": "captured"}]))
+
+    store = LedgerStore(ledger_dir)
+    assert store.run_ids() == ["legacy_run"]
+
+    parsed = []
+    original = yaml.safe_load
+    monkeypatch.setattr(yaml, "safe_load", lambda f: parsed.append(f) or original(f))
+    (ledger_dir / "another.yaml").write_text(yaml.dump({"command": "eda", "timestamp": "2026-01-01T00:00:00Z"}))
+
+    assert store.run_ids() == ["legacy_run", "another"]
+    assert LedgerStore(ledger_dir).get("another")["command"] == "eda"
+    assert len(parsed) == 1
+
+
+def test_yaml_export_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("KIE_LEDGER_YAML", "0")
+    ledger_dir = tmp_path / "evidence_ledger"
+    ledger = create_ledger("analyze")
+
+    path = ledger.save(ledger_dir)
+
+    assert path.name == "ledger.sqlite3"
+    assert not list(ledger_dir.glob("*.yaml"))
+
+    exported = get_ledger_store(ledger_dir).export_all(tmp_path / "export")
+    assert [p.name for p in exported] == [f"{ledger.run_id}.yaml"]
+    assert yaml.safe_load(exported[0].read_text())["command"] == "analyze"
+
+
+def test_run_story_reads_store(tmp_path):
+    ledger_dir = tmp_path / "project_state" / "evidence_ledger"
+    store = get_ledger_store(ledger_dir)
+    store.append(_entry("old", "2026-01-01T00:00:00Z", "eda"))
+    store.append(_entry("new", "2026-02-01T00:00:00Z", "analyze"))
+
+    generator = RunStoryGenerator(tmp_path)
+
+    assert [e["run_id"] for e in generator._collect_ledger_entries(None)] == ["old", "new"]
+    assert [e["run_id"] for e in generator._collect_ledger_entries("2026-01-15")] == ["new"]
+
+
+def test_triage_hashes_by_run_id(tmp_path):
+    from kie.skills.insight_triage import InsightTriageSkill
+
+    ledger_dir = tmp_path / "evidence_ledger"
+    for i in range(50):
+        get_ledger_store(ledger_dir).append(
+            _entry(f"run_{i}", f"2026-01-01T00:00:{i:02d}Z", outputs=[{"path": f"out_{i}.json", "hash": f"h{i}"}])
+        )
+
+    hashes = InsightTriageSkill()._get_artifact_hashes("run_7", ledger_dir)
+
+    assert hashes == {"out_7.json": "h7"}
+    assert InsightTriageSkill()._get_artifact_hashes("unknown", ledger_dir) == {}
@@ -0,0 +1,171 @@
+"""
+Tests for the LLM backend abstraction
+
+Tests cover:
+- Deterministic local stand-in drives heuristic fallbacks
+- Prompt-hash cache (memory and disk) and deduplication
+- Concurrent fan-out under a concurrency cap
+- Token and latency accounting
+- Scripted responses flow into grouper, chart selector and narratives
+"""
+
+import json
+import time
+
+import pytest
+
+from kie.story import LLMStoryBuilder, NarrativeMode, StoryInsight, StorySection, StoryThesis
+from kie.story.llm_backend import LLMClient, LocalLLMBackend
+from kie.story.llm_chart_selector import LLMChartSelector
+from kie.story.llm_grouper import LLMSectionGrouper
+from kie.story.llm_narrative_synthesizer import LLMNarrativeSynthesizer
+
+
+@pytest.fixture
+def insights():
+    return [
+        StoryInsight(
+            insight_id=f"ins_{i:03d}",
+            text=f"Throughput in line {i} increased {10 + i}% after retooling",
+            category="operations",
+            confidence=0.9,
+            business_value=0.5 + i / 20,
+            actionability=0.7,
+        )
+        for i in range(6)
+    ]
+
+
+def _section(i: int, insight_ids: list[str]) -> StorySection:
+    return StorySection(
+        section_id=f"section_{i:03d}",
+        title=f"Theme {i}",
+        subtitle=None,
+        thesis=f"Thesis {i}",
+        insight_ids=insight_ids,
+        chart_refs=[],
+        kpis=[],
+        narrative_text="",
+        order=i,
+    )
+
+
+def test_local_backend_is_deterministic():
+    client = LLMClient(LocalLLMBackend())
+
+    first = client.complete("same prompt")
+    second = client.complete("same prompt")
+
+    assert first.text == second.text == ""
+    assert second.cached
+    assert client.stats()["calls"] == 1
+    assert client.stats()["cache_hits"] == 1
+
+
+def test_disk_cache_survives_new_client(tmp_path):
+    backend = LocalLLMBackend(responder=lambda prompt: prompt.upper())
+    LLMClient(backend, cache_dir=tmp_path).complete("hello")
+
+    fresh = LLMClient(backend, cache_dir=tmp_path)
+    response = fresh.complete("hello")
+
+    assert response.text == "HELLO"
+    assert response.cached
+    assert fresh.stats()["calls"] == 0
+
+
+def test_complete_many_is_concurrent_and_deduplicated():
+    backend = LocalLLMBackend(responder=lambda prompt: f"re: {prompt}", latency=0.2)
+    client = LLMClient(backend, max_concurrency=12)
+    prompts = [f"section {i}" for i in range(12)] + ["section 0"]
+
+    start = time.perf_counter()
+    responses = client.complete_many(prompts)
+    elapsed = time.perf_counter() - start
+
+    assert [r.text for r in responses] == [f"re: {p}" for p in prompts]
+    assert client.stats()["calls"] == 12
+    assert elapsed < 0.2 * 4  # ~one round-trip, not twelve
+
+
+def test_token_and_latency_accounting():
+    client = LLMClient(LocalLLMBackend(responder=lambda prompt: "x" * 40, latency=0.01))
+
+    client.complete_many(["a" * 400, "b" * 400])
+    stats = client.stats()
+
+    assert stats["input_tokens"] == 200
+    assert stats["output_tokens"] == 20
+    assert stats["latency_seconds"] >= 0.02
+    assert stats["backend"] == "local"
+
+
+def test_story_narratives_use_one_batch():
+    backend = LocalLLMBackend(
+        responder=lambda prompt: "LLM summary." if "executive summary" in prompt else "LLM narrative.",
+        latency=0.1,
+    )
+    client = LLMClient(backend, max_concurrency=16)
+    synthesizer = LLMNarrativeSynthesizer(NarrativeMode.EXECUTIVE, client=client)
+    thesis = StoryThesis(title="T", hook="H", summary="S", implication="I", confidence=0.8)
+    sections = [_section(i, []) for i in range(12)]
+
+    start = time.perf_counter()
+    narratives, summary = synthesizer.synthesize_story_narratives(thesis, [], sections, [[] for _ in sections])
+    elapsed = time.perf_counter() - start
+
+    assert narratives == ["LLM narrative."] * 12
+    assert summary == "LLM summary."
+    assert client.stats()["calls"] == 13
+    assert elapsed < 0.1 * 4
+
+
+def test_scripted_themes_and_chart_type(insights):
+    themes = {"themes": [{"title": "Line Retooling", "keywords": ["throughput", "retooling"]}]}
+    client = LLMClient(LocalLLMBackend(responder=lambda prompt: json.dumps(themes)))
+
+    extracted = LLMSectionGrouper(client=client)._extract_themes_via_llm(insights)
+    assert [t["title"] for t in extracted] == ["Line Retooling"]
+
+    chart_client = LLMClient(LocalLLMBackend(responder=lambda prompt: '{"chart_type": "waterfall"}'))
+    selector = LLMChartSelector(client=chart_client)
+    assert [c for c, _ in selector.select_chart_types(insights[:3])] == ["waterfall"] * 3
+
+
+def test_invalid_llm_output_falls_back(insights):
+    client = LLMClient(LocalLLMBackend(responder=lambda prompt: '{"chart_type": "not_a_chart"}'))
+
+    chart_type, _ = LLMChartSelector(client=client).select_chart_type(insights[0])
+    expected, _ = LLMChartSelector(client=LLMClient()).select_chart_type(insights[0])
+
+    assert chart_type == expected
+
+
+def test_failed_calls_fall_back(insights):
+    def responder(prompt):
+        raise TimeoutError("rate limited")
+
+    client = LLMClient(LocalLLMBackend(responder=responder))
+
+    responses = client.complete_many(["a", "b", "a"])
+    chart_types = LLMChartSelector(client=client).select_chart_types(insights[:2])
+    expected = LLMChartSelector(client=LLMClient()).select_chart_types(insights[:2])
+
+    assert [r.text for r in responses] == ["", "", ""]
+    assert [c for c, _ in chart_types] == [c for c, _ in expected]
+    assert client.stats()["errors"] == 4
+    assert client.stats()["calls"] == 0
+    assert client.complete("a").text == ""  # Failures are not cached
+
+
+def test_story_builder_reports_llm_usage(insights):
+    client = LLMClient(LocalLLMBackend())
+    builder = LLMStoryBuilder(llm_client=client)
+
+    manifest = builder.build_story(insights, project_name="Plant Ops")
+
+    usage = manifest.metadata["llm_usage"]
+    assert usage["backend"] == "local"
+    assert usage["calls"] >= len(manifest.sections) + 1 + len(insights)
+    assert "latency_seconds" not in usage and "wall_seconds" not in usage
+    assert list(manifest.metadata["chart_types"]) == [insight.insight_id for insight in insights]
@@ -19,6 +19,7 @@ from kie.observability import (
     create_ledger,
 )
 from kie.observability.evidence_ledger import (
+    FileFingerprintCache,
     capture_environment,
     compute_file_hash,
     read_rails_stage,
@@ -87,6 +88,64 @@ def test_compute_file_hash_missing(tmp_path):
     assert file_hash is None
 
 
+def test_compute_file_hash_matches_sha256(tmp_path):
+    """Test chunked hashing matches a one-shot SHA-256 digest."""
+    import hashlib
+
+    test_file = tmp_path / "large.bin"
+    payload = bytes(range(256)) * 20000  # > 1 read chunk
+    test_file.write_bytes(payload)
+
+    assert compute_file_hash(test_file) == hashlib.sha256(payload).hexdigest()
+
+
+def test_fingerprint_cache_skips_unchanged_files(tmp_path):
+    """Test unchanged files are served from cache and changes are detected."""
+    cache = FileFingerprintCache()
+    test_file = tmp_path / "data.csv"
+    test_file.write_text("a,b\n1,2\n")
+
+    first = cache.get_hash(test_file)
+    assert cache.get_hash(test_file) == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    test_file.write_text("a,b\n1,3\n")
+    assert cache.get_hash(test_file) != first
+    assert cache.misses == 2
+
+
+def test_fingerprint_cache_persists(tmp_path):
+    """Test cache entries survive a save/load round trip."""
+    test_file = tmp_path / "chart.json"
+    test_file.write_text("{}")
+    cache_path = tmp_path / "project_state" / "fingerprint_cache.json"
+
+    cache = FileFingerprintCache()
+    digest = cache.get_hash(test_file)
+    cache.save(cache_path)
+
+    reloaded = FileFingerprintCache()
+    reloaded.load(cache_path)
+    assert reloaded.get_hash(test_file) == digest
+    assert (reloaded.hits, reloaded.misses) == (1, 0)
+
+
+def test_fingerprint_cache_hash_many(tmp_path):
+    """Test parallel hashing preserves order and tolerates missing files."""
+    cache = FileFingerprintCache()
+    files = []
+    for i in range(5):
+        path = tmp_path / f"out{i}.txt"
+        path.write_text(f"content{i}")
+        files.append(path)
+    files.insert(2, tmp_path / "missing.txt")
+
+    hashes = cache.hash_many(files)
+
+    assert hashes[2] is None
+    assert hashes[:2] + hashes[3:] == [compute_file_hash(p) for p in files if p.exists()]
+
+
 def test_record_artifacts(tmp_path):
     """Test record_artifacts adds files to ledger."""
     ledger = create_ledger("test")
@@ -0,0 +1,117 @@
+"""
+Tests for PowerPointChartEmbedder data binding
+
+Tests cover:
+- Records, DataFrame and NumPy structured-array input produce identical charts
+- Missing values are bound as empty points
+- Bulk table rendering (text, header, striping)
+- Table pagination across slides
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pptx import Presentation
+
+from kie.powerpoint import PowerPointChartEmbedder, SlideBuilder
+from kie.powerpoint.chart_embedder import iter_table_pages
+
+RECORDS = [
+    {"region": "North", "revenue": 120.0, "cost": 80.0},
+    {"region": "South", "revenue": 135.0, "cost": 90.0},
+    {"region": "East", "revenue": 118.0, "cost": 75.0},
+]
+
+
+@pytest.fixture
+def slide():
+    prs = Presentation()
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def _chart_values(chart):
+    return [list(series.values) for series in chart.plots[0].series]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        RECORDS,
+        pd.DataFrame(RECORDS),
+        pd.DataFrame(RECORDS).to_records(index=False),
+        {"region": ["North", "South", "East"], "revenue": [120.0, 135.0, 118.0], "cost": [80.0, 90.0, 75.0]},
+    ],
+    ids=["records", "dataframe", "structured_array", "mapping"],
+)
+def test_bar_chart_accepts_tabular_inputs(slide, data):
+    embedder = PowerPointChartEmbedder()
+    chart = embedder.embed_bar_chart(slide, data, x_key="region", y_keys=["revenue", "cost"])
+
+    assert list(chart.plots[0].categories) == ["North", "South", "East"]
+    assert _chart_values(chart) == [[120.0, 135.0, 118.0], [80.0, 90.0, 75.0]]
+
+
+def test_missing_values_bound_as_empty_points(slide):
+    embedder = PowerPointChartEmbedder()
+    df = pd.DataFrame({"month": ["Jan", "Feb", "Mar"], "sales": [1.0, np.nan, 3.0]})
+
+    chart = embedder.embed_line_chart(slide, df, x_key="month", y_keys=["sales"])
+
+    assert _chart_values(chart) == [[1.0, None, 3.0]]
+
+
+def test_table_bulk_rows(slide):
+    embedder = PowerPointChartEmbedder()
+    df = pd.DataFrame(RECORDS + [{"region": "A & B <West>", "revenue": 1.5, "cost": 2.0}])
+
+    table = embedder.embed_table(slide, df, ["region", "revenue", "missing_col"])
+
+    assert len(table.rows) == 5
+    assert len(table.columns) == 3
+    assert table.cell(0, 0).text == "Region"
+    assert table.cell(1, 0).text == "North"
+    assert table.cell(1, 1).text == "120.0"
+    assert table.cell(4, 0).text == "A & B <West>"
+    assert table.cell(1, 2).text == ""
+
+    # Even data rows (2, 4) are striped, odd rows are not
+    assert table.cell(2, 0)._tc.tcPr.find(
+        "{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill"
+    ) is not None
+    assert table.cell(1, 0)._tc.tcPr.find(
+        "{http://schemas.openxmlformats.org/drawingml/2006/main}solidFill"
+    ) is None
+
+
+def test_table_missing_and_none_cells(slide):
+    embedder = PowerPointChartEmbedder()
+
+    records = [{"a": 1, "b": "x"}, {"a": 2}, {"a": None, "b": float("nan")}]
+
+    table = embedder.embed_table(slide, records, ["a", "b"])
+
+    assert [[table.cell(row, col).text for col in range(2)] for row in range(1, 4)] == [
+        ["1", "x"], ["2", ""], ["", ""]
+    ]
+
+
+def test_iter_table_pages_splits_rows():
+    df = pd.DataFrame({"x": range(35)})
+
+    pages = list(iter_table_pages(df, rows_per_page=15))
+
+    assert [len(p) for p in pages] == [15, 15, 5]
+    assert pages[2]["x"].tolist() == list(range(30, 35))
+
+
+def test_add_table_slides_paginates(tmp_path):
+    builder = SlideBuilder()
+    df = pd.DataFrame({"item": [f"row {i}" for i in range(40)], "value": range(40)})
+
+    slides = builder.add_table_slides("Appendix", df, ["item", "value"], rows_per_slide=15)
+
+    assert len(slides) == 3
+    assert len(builder.prs.slides) == 3
+    builder.save(tmp_path / "appendix.pptx")
+    reopened = Presentation(str(tmp_path / "appendix.pptx"))
+    assert len(reopened.slides) == 3
@@ -0,0 +1,175 @@
+"""
+Tests for the in-process run context used by /go --full
+
+Tests cover:
+- Data files load once per run, callers get private copies
+- Artifacts are readable immediately and written in the background
+- Edits made outside the run invalidate live artifacts
+- Helpers fall back to plain disk I/O without an active context
+- Full mode loads the data file once across stages
+"""
+
+import json
+import threading
+from datetime import datetime
+
+import pandas as pd
+import pytest
+import yaml
+
+from kie.commands.handler import CommandHandler
+from kie.data import DataLoader
+from kie.run_context import (
+    RunContext,
+    get_run_context,
+    load_data,
+    read_artifact,
+    run_context,
+    write_artifact,
+)
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "sales.csv"
+    pd.DataFrame({
+        "region": ["North", "South", "East", "West"] * 25,
+        "revenue": [float(i * 10) for i in range(100)],
+    }).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def count_loads(monkeypatch):
+    calls = []
+    original = DataLoader.load
+
+    def load(self, path, *args, **kwargs):
+        calls.append(path)
+        return original(self, path, *args, **kwargs)
+
+    monkeypatch.setattr(DataLoader, "load", load)
+    return calls
+
+
+def test_data_loaded_once_per_run(tmp_path, data_file, count_loads):
+    with run_context(tmp_path) as ctx:
+        loader_a, df_a = load_data(data_file)
+        loader_b, df_b = load_data(data_file)
+
+        assert len(count_loads) == 1
+        assert ctx.stats()["data_hits"] == 1
+
+        # Each caller gets its own frame and schema
+        df_a["margin"] = df_a["revenue"] * 0.1
+        loader_a.schema.columns.append("margin")
+        assert "margin" not in df_b.columns
+        assert "margin" not in loader_b.schema.columns
+        assert loader_b.last_loaded is df_b
+
+    assert get_run_context() is None
+
+
+def test_changed_data_file_is_reloaded(tmp_path, data_file, count_loads):
+    ctx = RunContext(tmp_path)
+    ctx.load_data(data_file)
+
+    pd.DataFrame({"region": ["North"], "revenue": [1.0]}).to_csv(data_file, index=False)
+    _, df = ctx.load_data(data_file)
+
+    assert len(count_loads) == 2
+    assert len(df) == 1
+    ctx.close()
+
+
+def test_artifacts_live_and_written_in_background(tmp_path):
+    plan_path = tmp_path / "outputs" / "visualization_plan.json"
+    profile_path = tmp_path / "outputs" / "eda_profile.yaml"
+    plan = {"specifications": [{"insight_id": "i1"}]}
+    written = []
+
+    with run_context(tmp_path) as ctx:
+        write_artifact(plan_path, plan, on_written=written.append)
+        write_artifact(profile_path, {"rows": 4, "columns": 2}, fmt="yaml")
+
+        assert read_artifact(plan_path) is plan  # no disk round-trip
+        ctx.flush()
+        assert written == [plan_path]
+        assert read_artifact(plan_path) is plan
+
+    assert json.loads(plan_path.read_text()) == plan
+    assert yaml.safe_load(profile_path.read_text()) == {"columns": 2, "rows": 4}
+
+
+def test_closed_contexts_stop_writer_threads(tmp_path):
+    def writer_threads():
+        return [t for t in threading.enumerate() if t.name == "kie-artifact-writer"]
+
+    before = len(writer_threads())
+    for i in range(5):
+        with run_context(tmp_path):
+            write_artifact(tmp_path / "outputs" / f"plan_{i}.json", {"run": i})
+
+    assert len(writer_threads()) == before
+    assert json.loads((tmp_path / "outputs" / "plan_4.json").read_text()) == {"run": 4}
+
+
+def test_external_edit_invalidates_live_artifact(tmp_path):
+    path = tmp_path / "outputs" / "visualization_plan.json"
+
+    with run_context(tmp_path) as ctx:
+        ctx.write_artifact(path, {"version": 1})
+        ctx.flush()
+        path.write_text(json.dumps({"version": 2, "edited": True}))
+
+        assert ctx.read_artifact(path) == {"version": 2, "edited": True}
+
+
+def test_helpers_without_context_use_disk(tmp_path, data_file):
+    path = tmp_path / "plan.json"
+
+    write_artifact(path, {"a": 1})
+    assert path.exists()
+    assert read_artifact(path) == {"a": 1}
+
+    loader, df = load_data(data_file)
+    assert loader.schema.row_count == len(df) == 100
+
+
+def test_full_mode_loads_data_once(tmp_path, count_loads):
+    for d in ["data", "outputs", "project_state", "exports"]:
+        (tmp_path / d).mkdir()
+    (tmp_path / "project_state" / "spec.yaml").write_text(yaml.dump({
+        "project_name": "Run Context",
+        "client_name": "Test Client",
+        "objective": "Grow revenue",
+        "project_type": "analytics",
+        "data_source": "sales.csv",
+    }))
+    pd.DataFrame({
+        "region": ["North", "South", "East", "West"] * 30,
+        "product": ["A", "B", "C"] * 40,
+        "revenue": [100.0 + (i * 37) % 900 for i in range(120)],
+        "cost": [50.0 + (i * 13) % 400 for i in range(120)],
+    }).to_csv(tmp_path / "data" / "sales.csv", index=False)
+    (tmp_path / "project_state" / "rails_state.json").write_text(json.dumps({
+        "completed_stages": ["startkie", "spec"],
+        "current_stage": "spec",
+        "workflow_started": True,
+        "last_updated": datetime.now().isoformat(),
+    }))
+
+    from kie.preferences import OutputPreferences
+    from kie.state.intent import capture_intent
+
+    capture_intent(tmp_path, "Grow revenue")
+    OutputPreferences(tmp_path).set_theme("light")
+
+    result = CommandHandler(tmp_path).handle_go(full=True)
+
+    stages = [s["stage"] for s in result.get("stages_executed", [])]
+    assert stages[:2] == ["eda", "analyze"]
+    assert len(count_loads) == 1
+    assert (tmp_path / "outputs" / "internal" / "eda_profile.json").exists()
+    assert (tmp_path / "outputs" / "internal" / "insights_catalog.json").exists()
+    assert get_run_context() is None
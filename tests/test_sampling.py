@@ -0,0 +1,144 @@
+"""
+Tests for deterministic sampling
+
+Tests cover:
+- Stratified samples are seeded, proportional and keep small strata
+- Reservoir samples don't depend on chunking
+- Confidence intervals (finite population correction)
+- Tolerant analyses sample only when a policy is active and record the sample
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kie.data.sampling import (
+    ReservoirSampler,
+    SamplingPolicy,
+    is_sampling_tolerant,
+    mean_confidence_interval,
+    set_sampling_policy,
+    stratified_sample,
+)
+from kie.insights.engine import InsightEngine
+from kie.insights.statistical import StatisticalAnalyzer
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(1)
+    n = 50_000
+    return pd.DataFrame({
+        "region": rng.choice(["North", "South", "Tiny"], p=[0.7, 0.299, 0.001], size=n),
+        "revenue": rng.gamma(2.0, 100.0, size=n),
+    })
+
+
+@pytest.fixture(autouse=True)
+def no_global_policy():
+    set_sampling_policy(None)
+    yield
+    set_sampling_policy(None)
+
+
+def test_stratified_sample(df):
+    sample, info = stratified_sample(df, 1_000, strata=["region"], seed=3)
+    again, _ = stratified_sample(df, 1_000, strata=["region"], seed=3)
+    other, _ = stratified_sample(df, 1_000, strata=["region"], seed=4)
+
+    assert sample.index.equals(again.index)
+    assert not sample.index.equals(other.index)
+    assert sample.index.is_monotonic_increasing
+    assert info.method == "stratified"
+    assert info.population_rows == len(df)
+    population, sampled = info.stratum_sizes["Tiny"]
+    assert sampled == min(population, 30)
+    # The floor comes out of n; the rest is shared proportionally
+    assert len(sample) == 1_000
+    north_share = info.stratum_sizes["North"][0] / (len(df) - population)
+    assert info.stratum_sizes["North"][1] == pytest.approx(north_share * (1_000 - sampled), abs=1)
+    assert sample["region"].value_counts().to_dict() == {key: sizes[1] for key, sizes in info.stratum_sizes.items()}
+    assert "stratum_sizes" not in info.to_dict()
+    assert info.to_dict()["n_strata"] == 3
+
+
+def test_many_strata_fall_back_to_random(df):
+    df = df.assign(customer=np.arange(len(df)) % 5_000)
+
+    sample, info = stratified_sample(df, 1_000, strata=["customer"], seed=3)
+
+    assert len(sample) == 1_000
+    assert info.method == "random"
+    assert info.stratum_sizes == {}
+
+
+def test_small_input_is_not_sampled(df):
+    sample, info = stratified_sample(df.head(100), 1_000)
+
+    assert len(sample) == 100
+    assert not info.is_sampled
+
+
+def test_reservoir_independent_of_chunking(df):
+    coarse = ReservoirSampler(500, seed=9)
+    fine = ReservoirSampler(500, seed=9)
+    for start in range(0, len(df), 7_000):
+        coarse.add(df.iloc[start:start + 7_000])
+    for start in range(0, len(df), 333):
+        fine.add(df.iloc[start:start + 333])
+
+    sample, info = coarse.sample()
+
+    assert sample.index.equals(fine.sample()[0].index)
+    assert len(sample) == 500
+    assert (info.population_rows, info.method) == (len(df), "reservoir")
+
+
+def test_mean_confidence_interval(df):
+    sample, info = stratified_sample(df, 2_000, seed=1)
+
+    mean, low, high = mean_confidence_interval(sample["revenue"], info.population_rows)
+
+    assert low < df["revenue"].mean() < high
+    assert low < mean < high
+    assert mean_confidence_interval(df["revenue"], len(df))[1:] == (df["revenue"].mean(),) * 2
+
+
+def test_analyses_declare_tolerance():
+    assert is_sampling_tolerant(StatisticalAnalyzer.compare_groups)
+    assert is_sampling_tolerant(StatisticalAnalyzer.describe)
+    assert not is_sampling_tolerant(StatisticalAnalyzer.detect_outliers)
+
+
+def test_compare_groups_on_sample(df):
+    exact = StatisticalAnalyzer().compare_groups(df, "revenue", "region")
+    sampled = StatisticalAnalyzer(sampling=SamplingPolicy(max_rows=2_000)).compare_groups(df, "revenue", "region")
+
+    assert "sample" not in exact
+    assert sampled["sample"]["sample_rows"] < 2_100
+    assert sampled["leader"] == exact["leader"]
+    for name, group in sampled["groups"].items():
+        assert group["count"] == exact["groups"][name]["count"]
+        low, high = group["sum_ci"]
+        assert low <= exact["groups"][name]["sum"] <= high
+
+
+def test_compare_many_groups_uses_every_row(df):
+    df = df.assign(customer=(np.arange(len(df)) % 5_000).astype(str))
+
+    result = StatisticalAnalyzer(sampling=SamplingPolicy(max_rows=2_000)).compare_groups(df, "revenue", "customer")
+
+    assert "sample" not in result
+    assert result["n_groups"] == 5_000
+    assert result["total"] == pytest.approx(df["revenue"].sum())
+
+
+def test_insights_record_sample(df):
+    set_sampling_policy(SamplingPolicy(max_rows=2_000))
+
+    insights = InsightEngine().auto_extract(df, "revenue", group_column="region", is_override=True)
+
+    sampled = [insight for insight in insights if insight.sampling]
+    assert sampled
+    assert sampled[0].sampling["population_rows"] == len(df)
+    assert sampled[0].to_dict()["sampling"]["intervals"]
@@ -0,0 +1,129 @@
+"""
+Tests for vectorized concept clustering used by LLMSectionGrouper
+
+Tests cover:
+- Tokenization and sparse TF-IDF vectors
+- Spherical k-means separates distinct topics
+- Vectorized theme assignment
+- Pluggable embedding model
+- Grouper covers large catalogs without truncation
+"""
+
+import time
+from collections import Counter
+
+import numpy as np
+
+from kie.story import StoryInsight
+from kie.story.clustering import ConceptClusterer, SparseRows, tokenize
+from kie.story.llm_grouper import LLMSectionGrouper
+
+TOPICS = {
+    "churn": ["customer churn rose", "subscriber retention fell", "churn in enterprise accounts"],
+    "supply": ["supplier lead times increased", "inventory stockouts at warehouses", "freight logistics delays"],
+    "pricing": ["price elasticity in premium tier", "discount depth eroded margin", "pricing power in regions"],
+}
+
+
+def _catalog(n: int) -> list[StoryInsight]:
+    topics = list(TOPICS)
+    insights = []
+    for i in range(n):
+        topic = topics[i % len(topics)]
+        phrase = TOPICS[topic][(i // len(topics)) % 3]
+        insights.append(StoryInsight(
+            insight_id=f"ins_{i:05d}",
+            text=f"{phrase.capitalize()} by {i % 40 + 1}% in segment {i % 11}",
+            category=topic,
+            confidence=0.8,
+            business_value=(i % 10) / 10,
+            actionability=0.6,
+        ))
+    return insights
+
+
+def test_tokenize_normalizes_terms():
+    assert tokenize("Customers and the Suppliers with losses") == ["customer", "supplier", "losse"]
+    assert tokenize("Risk is up") == ["risk"]
+
+
+def test_tfidf_rows_are_normalized():
+    clusterer = ConceptClusterer()
+    sparse = clusterer.fit_transform(["alpha beta gamma", "beta delta", ""])
+    matrix = sparse.toarray()
+
+    assert matrix.shape == (3, len(clusterer.terms))
+    assert sparse.nnz == 5
+    np.testing.assert_allclose(np.linalg.norm(matrix[:2], axis=1), 1.0, rtol=1e-5)
+    assert not matrix[2].any()
+    assert sparse.any(axis=1).tolist() == [True, True, False]
+
+
+def test_sparse_rows_match_dense():
+    rng = np.random.default_rng(0)
+    dense = np.where(rng.random((40, 25)) < 0.1, rng.random((40, 25)), 0).astype(np.float32)
+    dense[[3, 17]] = 0
+    rows, cols = np.nonzero(dense)
+    sparse = SparseRows(
+        dense[rows, cols], cols, np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=40)))), dense.shape
+    )
+    other = rng.random((25, 4)).astype(np.float32)
+    groups = rng.integers(0, 3, size=40)
+    mask = rng.random(40) < 0.5
+
+    np.testing.assert_allclose(sparse @ other, dense @ other, rtol=1e-5)
+    np.testing.assert_allclose(sparse[mask].toarray(), dense[mask])
+    np.testing.assert_allclose(sparse.mean(axis=0), dense.mean(axis=0), rtol=1e-5)
+    np.testing.assert_allclose(sparse.row_dots(dense), (dense * dense).sum(axis=1), rtol=1e-5)
+    np.testing.assert_allclose(
+        sparse.group_sums(groups, 3), [dense[groups == g].sum(axis=0) for g in range(3)], rtol=1e-5
+    )
+
+
+def test_cluster_separates_topics():
+    insights = _catalog(300)
+    result = ConceptClusterer().cluster([f"{i.text} {i.category}" for i in insights], n_clusters=3)
+
+    for cluster in range(len(result.concepts)):
+        members = [insights[i].category for i in np.flatnonzero(result.labels == cluster)]
+        assert len(Counter(members)) == 1
+    assert sorted(result.concepts) == sorted(TOPICS)
+
+
+def test_assign_prefers_most_similar_theme():
+    clusterer = ConceptClusterer()
+    labels = clusterer.assign(
+        ["inventory stockouts rose", "pricing power improved", "nothing relevant here"],
+        ["supplier inventory", "pricing discount"],
+    )
+
+    assert labels.tolist() == [0, 1, -1]
+
+
+def test_pluggable_embedder():
+    def embed(texts):
+        return np.array([[1.0, 0.0] if "north" in t else [0.0, 1.0] for t in texts])
+
+    result = ConceptClusterer(embedder=embed).cluster(
+        ["north sales", "north margin", "south sales", "south margin"], n_clusters=2
+    )
+
+    assert result.labels[0] == result.labels[1] != result.labels[2] == result.labels[3]
+
+
+def test_grouper_scales_without_truncation():
+    insights = _catalog(3000)
+    grouper = LLMSectionGrouper()
+
+    start = time.perf_counter()
+    sections = grouper.group_insights(insights, {}, min_section_size=2)
+    elapsed = time.perf_counter() - start
+
+    grouped = [iid for section in sections for iid in section.insight_ids]
+    assert sorted(grouped) == sorted(ins.insight_id for ins in insights)
+    assert elapsed < 2.0
+
+    # Prompt sample covers every topic, not just the first 20 insights
+    sample = grouper._representative_insights(insights, grouper.MAX_PROMPT_INSIGHTS)
+    assert len(sample) == grouper.MAX_PROMPT_INSIGHTS
+    assert {ins.category for ins in sample} == set(TOPICS)
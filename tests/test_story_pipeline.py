@@ -140,6 +140,34 @@ class TestKPIExtraction:
         top_kpi = kpis[0]
         assert top_kpi.insight_id in ["ins_002", "ins_001", "ins_005"]  # High-value insights
 
+    def test_section_kpis_reuse_cached_candidates(self, sample_insights):
+        """Section extraction should reuse per-insight candidates without aliasing KPIs."""
+        from kie.story.kpi_extractor import KPIExtractor
+
+        extractor = KPIExtractor()
+        top_kpis = extractor.extract_kpis(sample_insights, max_kpis=5, context_str="n=511 growers")
+        cached = dict(extractor._candidate_cache)
+
+        section_kpis = extractor.extract_section_kpis(sample_insights[:2], max_kpis=3, context_str="Price")
+
+        # No new extraction work, and section ranks don't leak into top KPIs
+        assert extractor._candidate_cache == cached
+        assert [kpi.rank for kpi in top_kpis] == [1, 2, 3, 4, 5]
+        assert all(kpi.context == "n=511 growers" for kpi in top_kpis)
+        assert [kpi.rank for kpi in section_kpis] == [1, 2, 3]
+        assert all(kpi.context == "Price" for kpi in section_kpis)
+
+    def test_edited_insight_text_is_re_extracted(self, sample_insights):
+        """Candidates are keyed on insight text, so edits are picked up."""
+        from kie.story.kpi_extractor import KPIExtractor
+
+        extractor = KPIExtractor()
+        insight = sample_insights[0]
+        assert extractor.extract_kpis([insight], max_kpis=1)[0].value == "68.7%"
+
+        insight.text = "91.2% of growers report being very satisfied."
+        assert extractor.extract_kpis([insight], max_kpis=1)[0].value == "91.2%"
+
 
 class TestSectionGrouping:
     """Test insight grouping into sections."""
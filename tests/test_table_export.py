@@ -626,3 +626,62 @@ def test_export_very_long_strings(temp_dir):
 
     df_excel = pd.read_excel(result["excel"])
     assert len(df_excel["Long Text"].iloc[0]) == 10000
+
+
+# ===== Streaming Export Tests =====
+
+
+def test_excel_streaming_export_matches_styling(table_config_with_totals, temp_dir):
+    """Test write-only Excel export keeps header, width and totals styling."""
+    exporter = TableExporter()
+    output_path = temp_dir / "streamed.xlsx"
+
+    result = exporter.to_excel(table_config_with_totals, output_path, streaming=True)
+
+    wb = load_workbook(result)
+    ws = wb.active
+
+    assert ws["A1"].fill.start_color.rgb == "007823DC"
+    assert ws["A1"].font.bold is True
+    assert ws.column_dimensions["A"].width >= 8
+
+    totals_cell = ws[f"A{ws.max_row}"]
+    assert totals_cell.value == "Total"
+    assert totals_cell.font.bold is True
+
+    df = pd.read_excel(result)
+    assert len(df) == 5
+
+
+def test_excel_streaming_export_with_nulls(temp_dir):
+    """Test write-only Excel export writes missing values as empty cells."""
+    data = pd.DataFrame({"name": ["A", None, "C"], "value": [1.0, None, 3.0]})
+    config = TableBuilder().build(data, title="Nulls")
+
+    result = TableExporter().to_excel(config, temp_dir / "nulls.xlsx", streaming=True)
+
+    df = pd.read_excel(result)
+    assert df["Value"].isna().tolist() == [False, True, False]
+    assert df["Name"].tolist()[0] == "A"
+
+
+def test_excel_streaming_export_across_chunks(table_config_with_totals, temp_dir, monkeypatch):
+    """Test write-only Excel export gives the same rows when written in small slices."""
+    monkeypatch.setattr("kie.tables.export.EXCEL_STREAM_CHUNK_ROWS", 2)
+    exporter = TableExporter()
+
+    streamed = exporter.to_excel(table_config_with_totals, temp_dir / "chunked.xlsx", streaming=True)
+    regular = exporter.to_excel(table_config_with_totals, temp_dir / "regular.xlsx", streaming=False)
+
+    pd.testing.assert_frame_equal(pd.read_excel(streamed), pd.read_excel(regular))
+    ws = load_workbook(streamed).active
+    assert ws[f"A{ws.max_row}"].font.bold is True
+    assert ws[f"A{ws.max_row - 1}"].font.bold is not True
+
+
+def test_column_widths_from_string_lengths():
+    """Test column widths use the longest value or header, capped at 50."""
+    exporter = TableExporter()
+    df = pd.DataFrame({"Id": [1, 22, 333], "Note": ["x" * 80, None, "y"]})
+
+    assert exporter._column_widths(df) == [5, 50]